@@ -23,6 +23,7 @@ from ..integrations.export import (
     export_to_excel,
     export_to_json,
     export_to_long_sql,
+    export_to_ndjson,
     export_to_parquet,
     export_to_sql,
     export_to_sql_by_form,
@@ -38,6 +39,7 @@ __all__ = [
     "export_to_excel",
     "export_to_json",
     "export_to_long_sql",
+    "export_to_ndjson",
     "export_to_parquet",
     "export_to_sql",
     "export_to_sql_by_form",
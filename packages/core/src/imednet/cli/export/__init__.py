@@ -6,6 +6,7 @@ import argparse
 import importlib.util
 import sys
 from pathlib import Path
+from typing import Literal
 
 from ...sdk import ImednetSDK
 from ..decorators import with_sdk
@@ -91,6 +92,43 @@ def setup_parser(subparsers: argparse._SubParsersAction) -> None:  # type: ignor
         func=lambda args: export_json_cmd(study_key=args.study_key, path=args.path)
     )
 
+    # ndjson
+    ndjson_parser = sub.add_parser("ndjson", help="Export study records as newline-delimited JSON.")
+    ndjson_parser.add_argument("study_key", help=STUDY_KEY_ARG)
+    ndjson_parser.add_argument("path", type=Path, help="Destination NDJSON file.")
+    ndjson_parser.add_argument(
+        "--compression", choices=["gzip", "zstd"], help="Compress every output file."
+    )
+    ndjson_parser.add_argument(
+        "--max-bytes",
+        type=int,
+        help="Start a new file once the current one reaches this many bytes.",
+    )
+
+    @with_sdk
+    def export_ndjson_cmd(
+        sdk: ImednetSDK,
+        study_key: str,
+        path: Path,
+        compression: Literal["gzip", "zstd"] | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        from .. import export_to_ndjson
+
+        with fetching_status("records for NDJSON export", study_key):
+            export_to_ndjson(
+                sdk, study_key, str(path), compression=compression, max_bytes=max_bytes
+            )
+
+    ndjson_parser.set_defaults(
+        func=lambda args: export_ndjson_cmd(
+            study_key=args.study_key,
+            path=args.path,
+            compression=args.compression,
+            max_bytes=args.max_bytes,
+        )
+    )
+
     # duckdb
     ddb_parser = sub.add_parser("duckdb", help="Export study records to a DuckDB table.")
     ddb_parser.add_argument("study_key", help=STUDY_KEY_ARG)
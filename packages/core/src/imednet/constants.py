@@ -14,6 +14,7 @@ __all__ = [  # noqa: RUF022
     "DEFAULT_PAGE_SIZE",
     "LARGE_PAGE_SIZE",
     "MAX_SQLITE_COLUMNS",
+    "MAX_EXCEL_ROWS",
     "TERMINAL_JOB_STATES",
     # HTTP Headers
     "HEADER_ACCEPT",
@@ -53,6 +54,12 @@ When exporting data to SQLite, tables exceeding this limit must be split
 into multiple tables.
 """
 
+MAX_EXCEL_ROWS = 1_048_576
+"""Maximum number of rows, including the header, in an Excel worksheet.
+
+Excel exports continue on a new worksheet once a sheet reaches this limit.
+"""
+
 # Job States
 TERMINAL_JOB_STATES = frozenset({"COMPLETED", "SUCCESS", "FAILED", "CANCELLED", ""})
 """Job states that indicate the job has finished processing.
@@ -1,6 +1,6 @@
 """Integration helpers for exporting study data."""
 
-from .dispatcher import export, register_tabular_target
+from .dispatcher import SinkOutcome, export, export_async, export_fanout, register_tabular_target
 from .export import (
     export_to_csv,
     export_to_duckdb,
@@ -8,13 +8,22 @@ from .export import (
     export_to_excel,
     export_to_json,
     export_to_long_sql,
+    export_to_ndjson,
     export_to_parquet,
     export_to_sql,
     export_to_sql_by_form,
 )
+from .export_pipeline import ExportPipelineConfig
 from .parquet import export_to_hive_parquet, hive_parquet_query
 from .parquet_engine import PartitionedStorageEngine, PyArrowDatasetPartitionedStorageEngine
-from .sink_base import ExportSink, SinkConfig
+from .sink_base import (
+    AsyncExportSink,
+    BatchCheckpointStore,
+    DeadLetterStore,
+    ExportSink,
+    SinkConfig,
+    SyncSinkAdapter,
+)
 
 # Register standard tabular targets
 register_tabular_target("csv", export_to_csv)
@@ -23,6 +32,7 @@ register_tabular_target("duckdb_by_form", export_to_duckdb_by_form)
 register_tabular_target("excel", export_to_excel)
 register_tabular_target("json", export_to_json)
 register_tabular_target("long_sql", export_to_long_sql)
+register_tabular_target("ndjson", export_to_ndjson)
 register_tabular_target("parquet", export_to_parquet)
 register_tabular_target("sql", export_to_sql)
 register_tabular_target("sql_by_form", export_to_sql_by_form)
@@ -31,6 +41,9 @@ register_tabular_target("hive_parquet", export_to_hive_parquet)
 __all__ = [  # noqa: RUF022
     # Unified entry point
     "export",
+    "export_async",
+    "export_fanout",
+    "SinkOutcome",
     # Tabular path
     "export_to_csv",
     "export_to_duckdb",
@@ -39,13 +52,19 @@ __all__ = [  # noqa: RUF022
     "export_to_hive_parquet",
     "export_to_json",
     "export_to_long_sql",
+    "export_to_ndjson",
     "export_to_parquet",
     "export_to_sql_by_form",
     "export_to_sql",
     "hive_parquet_query",
+    "ExportPipelineConfig",
     "PartitionedStorageEngine",
     "PyArrowDatasetPartitionedStorageEngine",
     # Shared sink base
     "SinkConfig",
     "ExportSink",
+    "AsyncExportSink",
+    "SyncSinkAdapter",
+    "DeadLetterStore",
+    "BatchCheckpointStore",
 ]
@@ -4,14 +4,153 @@ This module provides a single entry point `export()` for all data persistence ta
 supporting both tabular procedural functions and object-oriented sink classes.
 """
 
+import asyncio
 import dataclasses
+import logging
+import queue
 import threading
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Callable, Iterable, Mapping, Sequence
 from typing import Any, cast
 
-from imednet.integrations.sink_base import ExportSink, SinkConfig, apply_quality_gate, iter_batches
+from imednet.integrations.sink_base import (
+    AsyncExportSink,
+    ExportSink,
+    SinkConfig,
+    SyncSinkAdapter,
+    aapply_quality_gate,
+    aiter_batches,
+    apply_quality_gate,
+    iter_batches,
+)
 from imednet.sdk import ImednetSDK
 
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+async def _awrite_batches(
+    sink: AsyncExportSink, records: AsyncIterable[Any], study_key: str, max_pending: int
+) -> int:
+    """Write ``records`` to ``sink`` batch by batch, keeping up to ``max_pending`` writes open.
+
+    With ``max_pending`` at zero each batch is written before the next one
+    is fetched. Otherwise writes run as tasks while fetching continues, and
+    the fetch waits once ``max_pending`` writes are unfinished.
+    """
+    total = 0
+    pending: set[asyncio.Task[int]] = set()
+    try:
+        index = 0
+        async for batch in aiter_batches(records, sink.next_batch_size):
+            batch_id = f"{study_key}/records/{index}"
+            index += 1
+            if not max_pending:
+                total += await sink.write_batch_checkpointed(batch, batch_id=batch_id)
+                continue
+            pending.add(
+                asyncio.create_task(sink.write_batch_checkpointed(batch, batch_id=batch_id))
+            )
+            if len(pending) >= max_pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                total += sum(task.result() for task in done)
+        for task in asyncio.as_completed(pending):
+            total += await task
+        pending = set()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return total
+
+
+@dataclasses.dataclass
+class SinkOutcome:
+    """Result of one sink in a fan-out export.
+
+    Parameters
+    ----------
+    target:
+        Target identifier the sink was registered under.
+    written:
+        Records the sink reported as written.
+    batches:
+        Batches the sink completed.
+    skipped_batches:
+        Batches skipped because a failed earlier export had committed them;
+        they are not counted in ``written`` or ``batches``.
+    exception:
+        Exception that stopped the sink, or ``None`` when every batch was
+        written. Batches after a failure are not sent to the sink.
+    failed_batch_id:
+        ``batch_id`` of the batch that failed, when the failure happened
+        while writing.
+    """
+
+    target: str
+    written: int = 0
+    batches: int = 0
+    skipped_batches: int = 0
+    exception: BaseException | None = None
+    failed_batch_id: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the sink wrote every batch and closed cleanly."""
+        return self.exception is None
+
+
+class _FanOutWorker(threading.Thread):
+    """Feed batches from a bounded queue into one sink on its own thread.
+
+    The queue holds at most ``max_pending`` batches, so a slow sink blocks
+    the producer once it falls that far behind. After a failure the worker
+    keeps draining the queue without writing, so the remaining sinks are
+    never blocked by one that has stopped.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        sink_class: type[ExportSink],
+        config: SinkConfig,
+        max_pending: int,
+        aborted: threading.Event,
+    ) -> None:
+        super().__init__(name=f"imednet-export-{target}", daemon=True)
+        self.outcome = SinkOutcome(target)
+        self.batches: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._sink_class = sink_class
+        self._config = config
+        self._aborted = aborted
+
+    def run(self) -> None:
+        item: Any = None
+        try:
+            with self._sink_class(config=self._config) as sink:
+                while (item := self.batches.get()) is not _END:
+                    batch_id, batch = item
+                    self.outcome.failed_batch_id = batch_id
+                    skipped = len(sink.skipped_batches)
+                    self.outcome.written += sink.write_batch_checkpointed(batch, batch_id=batch_id)
+                    if len(sink.skipped_batches) > skipped:
+                        self.outcome.skipped_batches += 1
+                    else:
+                        self.outcome.batches += 1
+                    self.outcome.failed_batch_id = None
+                if self._aborted.is_set():
+                    raise RuntimeError("Export aborted before all batches were fetched")
+        except Exception as exc:
+            self.outcome.exception = exc
+            logger.warning(
+                "Export to %s stopped after %d batches: %s",
+                self.outcome.target,
+                self.outcome.batches,
+                exc,
+            )
+            while item is not _END:
+                item = self.batches.get()
+
 
 class ExportRegistry:
     """Central registry mapping target types to their implementations."""
@@ -22,6 +161,11 @@ class ExportRegistry:
         "snowflake": "imednet_sinks.warehouse:SnowflakeExportSink",
     }
 
+    _LAZY_ASYNC_SINKS = {  # noqa: RUF012
+        "mongodb": "imednet_sinks.document:AsyncMongoDbExportSink",
+        "neo4j": "imednet_sinks.graph:AsyncNeo4jExportSink",
+    }
+
     _LAZY_CONFIGS = {  # noqa: RUF012
         "mongodb": "imednet_sinks.document:MongoDbSinkConfig",
         "neo4j": "imednet_sinks.graph:Neo4jSinkConfig",
@@ -32,6 +176,7 @@ class ExportRegistry:
         """Initialize an empty ExportRegistry."""
         self._tabular_targets: dict[str, Callable[..., Any]] = {}
         self._sink_targets: dict[str, type[ExportSink]] = {}
+        self._async_sink_targets: dict[str, type[AsyncExportSink]] = {}
         self._config_targets: dict[str, type[SinkConfig]] = {}
         self._lock = threading.RLock()
 
@@ -45,6 +190,11 @@ class ExportRegistry:
         with self._lock:
             self._sink_targets[target_type] = sink_class
 
+    def register_async_sink(self, target_type: str, sink_class: type[AsyncExportSink]) -> None:
+        """Register an asynchronous sink class for a target type."""
+        with self._lock:
+            self._async_sink_targets[target_type] = sink_class
+
     def get_tabular(self, target_type: str) -> Callable[..., Any] | None:
         """Retrieve a registered tabular function, or None if not found."""
         with self._lock:
@@ -73,6 +223,26 @@ class ExportRegistry:
 
             return None
 
+    def get_async_sink(self, target_type: str) -> type[AsyncExportSink] | None:
+        """Retrieve a registered asynchronous sink class, or None if not found."""
+        with self._lock:
+            if target_type in self._async_sink_targets:
+                return self._async_sink_targets[target_type]
+
+            if target_type in self._LAZY_ASYNC_SINKS:
+                module_path, class_name = self._LAZY_ASYNC_SINKS[target_type].split(":")
+                try:
+                    import importlib
+
+                    module = importlib.import_module(module_path)  # nosem
+                    sink_class = getattr(module, class_name)
+                    self._async_sink_targets[target_type] = sink_class
+                    return cast(type[AsyncExportSink], sink_class)
+                except (ImportError, AttributeError):
+                    return None
+
+            return None
+
     def get_config_class(self, target_type: str) -> type[SinkConfig]:
         """Retrieve a registered config class, or SinkConfig as default."""
         with self._lock:
@@ -93,6 +263,178 @@ class ExportRegistry:
 
             return SinkConfig
 
+    def _sink_config(
+        self, target: str, study_key: str, config: SinkConfig | None, kwargs: dict[str, Any]
+    ) -> SinkConfig:
+        """Return ``config`` or build the target's config class from ``kwargs``."""
+        if config is not None:
+            return config
+        config_class = self.get_config_class(target)
+        valid_fields = {f.name for f in dataclasses.fields(config_class)}
+        config_kwargs = {k: v for k, v in kwargs.items() if k in valid_fields}
+        return config_class(study_key=study_key, **config_kwargs)
+
+    def export(
+        self,
+        target: str,
+        sdk: ImednetSDK,
+        study_key: str,
+        *,
+        config: SinkConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Export ``study_key`` to ``target``; see :func:`export`."""
+        tabular_func = self.get_tabular(target)
+        if tabular_func is not None:
+            return tabular_func(sdk, study_key, **kwargs)
+
+        sink_class = self.get_sink(target)
+        if sink_class is None:
+            raise ValueError(f"Unsupported export target: {target!r}")
+        cfg = self._sink_config(target, study_key, config, kwargs)
+
+        records = sdk.records.list(study_key=study_key, record_data_filter=None)
+        if isinstance(records, AsyncIterable):
+            raise TypeError(
+                "The SDK returns records asynchronously; use export_async() with an async SDK."
+            )
+        return self._write_records(sink_class, sdk, cfg, records)
+
+    @staticmethod
+    def _write_records(
+        sink_class: type[ExportSink], sdk: Any, cfg: SinkConfig, records: Iterable[Any]
+    ) -> int:
+        """Quality-gate ``records`` and write them to a new sink batch by batch."""
+        filtered_records = apply_quality_gate(sdk, cfg.study_key, records, cfg)
+
+        total_written = 0
+
+        # Instantiate sink class using ONLY the configured config object
+        with sink_class(config=cfg) as sink:
+            for index, batch in enumerate(iter_batches(filtered_records, sink.next_batch_size)):
+                total_written += sink.write_batch_checkpointed(
+                    batch, batch_id=f"{cfg.study_key}/records/{index}"
+                )
+
+        return total_written
+
+    async def export_async(
+        self,
+        target: str,
+        sdk: Any,
+        study_key: str,
+        *,
+        config: SinkConfig | None = None,
+        max_pending_batches: int = 0,
+        **kwargs: Any,
+    ) -> Any:
+        """Export ``study_key`` to ``target`` from a sync or async SDK; see :func:`export_async`."""
+        tabular_func = self.get_tabular(target)
+        if tabular_func is not None:
+            return await asyncio.to_thread(tabular_func, sdk, study_key, **kwargs)
+
+        if max_pending_batches < 0:
+            raise ValueError("max_pending_batches must not be negative")
+        async_class = self.get_async_sink(target)
+        sink_class = self.get_sink(target)
+        if sink_class is None and async_class is None:
+            raise ValueError(f"Unsupported export target: {target!r}")
+        cfg = self._sink_config(target, study_key, config, kwargs)
+
+        records = sdk.records.list(study_key=study_key, record_data_filter=None)
+        if not isinstance(records, AsyncIterable) and sink_class is not None:
+            # A synchronous SDK fetches pages while it is iterated; keep that off the loop.
+            return await asyncio.to_thread(self._write_records, sink_class, sdk, cfg, records)
+        filtered_records = aapply_quality_gate(sdk, study_key, records, cfg)
+
+        sink: AsyncExportSink
+        if async_class is not None:
+            sink = async_class(config=cfg)
+        else:
+            assert sink_class is not None
+            # Sync sinks connect in their constructor; keep that off the loop too.
+            sink = SyncSinkAdapter(await asyncio.to_thread(sink_class, config=cfg))
+        async with sink:
+            return await _awrite_batches(sink, filtered_records, study_key, max_pending_batches)
+
+    def export_fanout(
+        self,
+        targets: Sequence[str],
+        sdk: ImednetSDK,
+        study_key: str,
+        *,
+        configs: Mapping[str, SinkConfig] | None = None,
+        max_pending_batches: int = 2,
+        **kwargs: Any,
+    ) -> dict[str, SinkOutcome]:
+        """Export ``study_key`` to several sink targets from a single fetch.
+
+        Records are fetched and quality-gated once. Each batch is then handed
+        to every sink, and each sink writes on its own thread, so the sinks
+        load concurrently. ``SinkConfig`` fields in ``kwargs`` (``batch_size``
+        and the quality-gate settings) apply to the shared fetch; sink configs
+        come from ``configs`` or are built from ``kwargs`` as in :func:`export`.
+
+        Sinks fail independently: each retries with its own config and a sink
+        that raises stops receiving batches while the others carry on. A sink
+        more than ``max_pending_batches`` behind pauses the fetch until it
+        catches up, so memory stays bounded by the slowest sink.
+
+        Returns:
+        -------
+        dict[str, SinkOutcome]
+            Outcome per target, in the order of ``targets``.
+
+        Raises:
+        -------
+        ValueError
+            If a target is repeated, not a registered sink, or
+            ``max_pending_batches`` is not positive.
+        """
+        if len(set(targets)) != len(targets):
+            raise ValueError("Fan-out targets must be unique")
+        if max_pending_batches < 1:
+            raise ValueError("max_pending_batches must be positive")
+        configs = configs or {}
+        sinks: dict[str, tuple[type[ExportSink], SinkConfig]] = {}
+        for target in targets:
+            sink_class = self.get_sink(target)
+            if sink_class is None:
+                raise ValueError(f"Unsupported sink target for fan-out: {target!r}")
+            sinks[target] = (
+                sink_class,
+                self._sink_config(target, study_key, configs.get(target), kwargs),
+            )
+        gate_fields = {f.name for f in dataclasses.fields(SinkConfig)}
+        gate = SinkConfig(
+            study_key=study_key, **{k: v for k, v in kwargs.items() if k in gate_fields}
+        )
+
+        aborted = threading.Event()
+        workers = [
+            _FanOutWorker(target, sink_class, cfg, max_pending_batches, aborted)
+            for target, (sink_class, cfg) in sinks.items()
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            records = sdk.records.list(study_key=study_key, record_data_filter=None)
+            filtered_records = apply_quality_gate(sdk, study_key, records, gate)
+            for index, batch in enumerate(iter_batches(filtered_records, gate.batch_size)):
+                item = (f"{study_key}/records/{index}", batch)
+                for worker in workers:
+                    worker.batches.put(item)
+        except BaseException:
+            aborted.set()
+            raise
+        finally:
+            for worker in workers:
+                worker.batches.put(_END)
+            for worker in workers:
+                worker.join()
+
+        return {worker.outcome.target: worker.outcome for worker in workers}
+
 
 # Global registry instance
 _registry = ExportRegistry()
@@ -108,6 +450,15 @@ def register_sink_target(target_type: str, sink_class: type[ExportSink]) -> None
     _registry.register_sink(target_type, sink_class)
 
 
+def register_async_sink_target(target_type: str, sink_class: type[AsyncExportSink]) -> None:
+    """Register an asynchronous sink class for a target type.
+
+    :func:`export_async` prefers it over a synchronous sink registered for
+    the same target.
+    """
+    _registry.register_async_sink(target_type, sink_class)
+
+
 def export(
     target: str,
     sdk: ImednetSDK,
@@ -121,6 +472,16 @@ def export(
     Routes the export request to either a tabular function or a sink class
     based on the target identifier.
 
+    Sink exports stream: records are quality-gated as they are fetched and
+    each batch is written as soon as it is full, so memory is bounded by one
+    batch and the sink receives data while later pages are still loading.
+
+    With ``checkpoint_path`` set in the sink configuration, each committed
+    batch is checkpointed and a rerun after a failure skips the batches
+    already committed.  Skipped batches do not count towards the total; the
+    sink logs how many it skipped, and fan-out outcomes report them in
+    ``SinkOutcome.skipped_batches``.  A clean export clears the checkpoints.
+
     Args:
         target: The target destination type (e.g., 'csv', 'snowflake', 'mongodb').
         sdk: Authenticated SDK instance used to fetch study records.
@@ -134,33 +495,96 @@ def export(
 
     Raises:
         ValueError: If the target type is not registered or unsupported.
+        TypeError: If ``sdk`` lists records asynchronously; use
+            :func:`export_async` instead.
     """
-    # 1. Try tabular path
-    tabular_func = _registry.get_tabular(target)
-    if tabular_func is not None:
-        return tabular_func(sdk, study_key, **kwargs)
-
-    # 2. Try sink path
-    sink_class = _registry.get_sink(target)
-    if sink_class is not None:
-        if config is not None:
-            cfg = config
-        else:
-            config_class = _registry.get_config_class(target)
-            valid_fields = {f.name for f in dataclasses.fields(config_class)}
-            config_kwargs = {k: v for k, v in kwargs.items() if k in valid_fields}
-            cfg = config_class(study_key=study_key, **config_kwargs)
+    return _registry.export(target, sdk, study_key, config=config, **kwargs)
 
-        records = sdk.records.list(study_key=study_key, record_data_filter=None)
-        filtered_records = list(apply_quality_gate(sdk, study_key, records, cfg))
 
-        total_written = 0
+async def export_async(
+    target: str,
+    sdk: Any,
+    study_key: str,
+    *,
+    config: SinkConfig | None = None,
+    max_pending_batches: int = 0,
+    **kwargs: Any,
+) -> Any:
+    """Asynchronous counterpart of :func:`export`.
 
-        # Instantiate sink class using ONLY the configured config object
-        with sink_class(config=cfg) as sink:
-            for index, batch in enumerate(iter_batches(filtered_records, cfg.batch_size)):
-                total_written += sink.write_batch(batch, batch_id=f"{study_key}/records/{index}")
+    With an :class:`~imednet.sdk.AsyncImednetSDK`, record pages are consumed
+    as an async iterator and written by an
+    :class:`~imednet.integrations.sink_base.AsyncExportSink`: the target's
+    asynchronous sink when one is registered (MongoDB and Neo4j have
+    built-in ones), otherwise its synchronous sink run on worker threads
+    through :class:`~imednet.integrations.sink_base.SyncSinkAdapter`.
+    Exports from a synchronous SDK, and tabular targets, run as in
+    :func:`export` on a worker thread.
 
-        return total_written
+    Args:
+        target: The target destination type (e.g., 'csv', 'snowflake', 'mongodb').
+        sdk: SDK instance used to fetch study records.
+        study_key: Study identifier to export.
+        config: Optional sink configuration (for sink-based targets).
+        max_pending_batches: Batch writes that may still be running while
+            later pages are fetched. ``0`` writes each batch before fetching
+            more.
+        **kwargs: Target-specific configuration parameters.
+
+    Returns:
+        For tabular targets: Typically None.
+        For sink targets: The total number of records successfully written.
+
+    Raises:
+        ValueError: If the target type is not registered or unsupported, or
+            ``max_pending_batches`` is negative.
+    """
+    return await _registry.export_async(
+        target,
+        sdk,
+        study_key,
+        config=config,
+        max_pending_batches=max_pending_batches,
+        **kwargs,
+    )
+
+
+def export_fanout(
+    targets: Sequence[str],
+    sdk: ImednetSDK,
+    study_key: str,
+    *,
+    configs: Mapping[str, SinkConfig] | None = None,
+    max_pending_batches: int = 2,
+    **kwargs: Any,
+) -> dict[str, SinkOutcome]:
+    """Export a study to several sink targets concurrently from one fetch.
+
+    Each batch is fetched and quality-gated once and written to every sink
+    on a thread per sink. A failing sink does not stop the others, and a
+    slow sink holds back the fetch once ``max_pending_batches`` batches are
+    waiting for it.
 
-    raise ValueError(f"Unsupported export target: {target!r}")
+    Args:
+        targets: Sink target identifiers (e.g., ``["snowflake", "mongodb"]``).
+        sdk: Authenticated SDK instance used to fetch study records.
+        study_key: Study identifier to export.
+        configs: Optional sink configuration per target.
+        max_pending_batches: Batches queued per sink before the fetch waits.
+        **kwargs: Sink configuration parameters; ``batch_size`` and the
+            quality-gate settings apply to the shared fetch.
+
+    Returns:
+        The :class:`SinkOutcome` of each target, keyed by target.
+
+    Raises:
+        ValueError: If a target is repeated or is not a registered sink.
+    """
+    return _registry.export_fanout(
+        targets,
+        sdk,
+        study_key,
+        configs=configs,
+        max_pending_batches=max_pending_batches,
+        **kwargs,
+    )
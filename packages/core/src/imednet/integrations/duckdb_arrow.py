@@ -0,0 +1,218 @@
+"""Typed Arrow batches and streaming DuckDB loads for tabular exports.
+
+DuckDB exports convert parsed record rows straight into Arrow record batches
+instead of building pandas frames of ``object`` columns for DuckDB to scan:
+
+* :func:`arrow_columns` derives the output columns from variable metadata -
+  record metadata first, then one column per variable typed with
+  :func:`~imednet.utils.arrow.arrow_type_for_variable`, named and
+  de-duplicated exactly like the DataFrame exports;
+* :func:`rows_to_batch` masks PHI and converts every column in one Arrow
+  call. A column whose values do not fit its declared type losslessly (free
+  text in a numeric variable, say) is kept as text rather than coerced;
+* :func:`load_batches` registers each batch with DuckDB, which scans the Arrow
+  buffers without copying them, and appends it to a typed table inside one
+  transaction. Columns that a later batch had to keep as text are widened.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from imednet.utils.arrow import arrow_type_for_variable
+from imednet.utils.security import global_sensitivity_registry, mask_clinical_phi
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - exercised when optional dependency is absent
+    pa: Any = None  # type: ignore[no-redef]
+    pc: Any = None  # type: ignore[no-redef]
+
+META_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("recordId", "int64"),
+    ("subjectKey", "string"),
+    ("visitId", "int64"),
+    ("formId", "int64"),
+    ("recordStatus", "string"),
+    ("dateCreated", "string"),
+)
+
+DUCKDB_BATCH_ALIAS = "df"
+
+_MASKED_VALUE = "***MASKED***"
+
+# Python types each Arrow type accepts without a lossy conversion; ``bool``
+# is excluded from the numeric types because it subclasses ``int``.
+_NATIVE_KINDS: dict[str, frozenset[type]] = {
+    "int64": frozenset({int, type(None)}),
+    "double": frozenset({int, float, type(None)}),
+    "bool": frozenset({bool, type(None)}),
+    "string": frozenset({str, type(None)}),
+}
+
+_DUCKDB_TYPES = {"int64": "BIGINT", "double": "DOUBLE", "bool": "BOOLEAN", "string": "VARCHAR"}
+
+
+@dataclass(frozen=True)
+class ArrowColumn:
+    """One exported column: the parsed-row key it reads and its output field."""
+
+    source: str
+    field: Any
+    sensitive: bool = False
+
+
+def quote_duckdb_identifier(name: str) -> str:
+    """Return ``name`` quoted as a DuckDB identifier."""
+    escaped_name = name.replace('"', '""')
+    return f'"{escaped_name}"'
+
+
+def arrow_columns(
+    variables: Iterable[Any],
+    *,
+    use_labels: bool = False,
+    variable_whitelist: Sequence[str] | None = None,
+) -> list[ArrowColumn]:
+    """Return the typed output columns for rows parsed from ``variables``.
+
+    Columns follow :meth:`RecordMapper._build_dataframe`: record metadata,
+    then variables in order, renamed to their labels when ``use_labels`` is
+    set. Output names that repeat case-insensitively keep their first column.
+    Columns flagged as sensitive are masked wholesale and therefore typed as
+    text.
+    """
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for DuckDB exports. Install with "
+            "\"pip install 'imednet[export]'\"."
+        )
+    sources: list[tuple[str, str, Any]] = [
+        (name, name, getattr(pa, type_name)()) for name, type_name in META_COLUMNS
+    ]
+    seen_keys = {name for name, _ in META_COLUMNS}
+    for var in variables:
+        key = var.variable_name
+        if key is None or key in seen_keys:
+            continue
+        if variable_whitelist is not None and key not in variable_whitelist:
+            continue
+        seen_keys.add(key)
+        name = var.label if use_labels and var.label is not None else key
+        sources.append(
+            (key, str(name), arrow_type_for_variable(getattr(var, "variable_type", None)))
+        )
+
+    columns = []
+    seen_names: set[str] = set()
+    for source, name, arrow_type in sources:
+        if name.lower() in seen_names:
+            continue
+        seen_names.add(name.lower())
+        sensitive = global_sensitivity_registry.is_sensitive(name)
+        field = pa.field(name, pa.string() if sensitive else arrow_type)
+        columns.append(ArrowColumn(source, field, sensitive))
+    return columns
+
+
+def _text(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(mask_clinical_phi(value), default=str)
+    return str(value)
+
+
+def _column_array(values: list[Any], target: Any) -> Any:
+    """Convert ``values`` to ``target`` losslessly, falling back to text."""
+    native = _NATIVE_KINDS.get(str(target))
+    kinds = set(map(type, values))
+    if native is not None and kinds <= native:
+        return pa.array(values, type=target)
+    text = pa.array([_text(v) for v in values], type=pa.string())
+    if pa.types.is_string(target):
+        return text
+    try:
+        # Empty strings are missing values in typed columns.
+        return pc.cast(pc.if_else(pc.equal(text, ""), None, text), target)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return text
+
+
+def rows_to_batch(rows: Sequence[dict[str, Any]], columns: Sequence[ArrowColumn]) -> Any:
+    """Convert parsed record rows into one masked Arrow record batch.
+
+    Each column takes its declared type when every value converts without
+    loss; otherwise it is emitted as text, with containers serialised as JSON
+    after PHI masking.
+    """
+    arrays = []
+    fields = []
+    for column in columns:
+        if column.sensitive:
+            array = pa.array([_MASKED_VALUE] * len(rows), type=pa.string())
+        else:
+            values = [row.get(column.source) for row in rows]
+            array = _column_array(values, column.field.type)
+        arrays.append(array)
+        fields.append(column.field.with_type(array.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _widened(current: Any, incoming: Any) -> Any:
+    """Return the column type that holds both ``current`` and ``incoming`` values."""
+    if pa.types.is_null(current):
+        return incoming if str(incoming) in _DUCKDB_TYPES else pa.string()
+    if (pa.types.is_integer(current) or pa.types.is_floating(current)) and (
+        pa.types.is_integer(incoming) or pa.types.is_floating(incoming)
+    ):
+        return pa.float64()
+    return pa.string()
+
+
+def load_batches(conn: Any, table_name: str, batches: Iterable[Any]) -> int:
+    """Replace ``table_name`` with ``batches`` in one transaction.
+
+    The first batch creates the table with its Arrow types and later batches
+    are appended; only one batch is registered with DuckDB at a time. When a
+    later batch carries a column as another type, the table column is
+    widened first (integers to doubles, anything else to text). Nothing is
+    created when ``batches`` is empty. Returns the number of rows loaded.
+    """
+    target = quote_duckdb_identifier(table_name)
+    source = quote_duckdb_identifier(DUCKDB_BATCH_ALIAS)
+    types: dict[str, Any] | None = None
+    loaded = 0
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        for batch in batches:
+            table = batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+            if types is None:
+                conn.register(DUCKDB_BATCH_ALIAS, table)
+                conn.execute(f"CREATE OR REPLACE TABLE {target} AS SELECT * FROM {source}")
+                types = {field.name: field.type for field in table.schema}
+            else:
+                for field in table.schema:
+                    current = types.get(field.name)
+                    if current is None or current == field.type or pa.types.is_null(field.type):
+                        continue
+                    widened = _widened(current, field.type)
+                    if widened != current:
+                        conn.execute(
+                            f"ALTER TABLE {target} ALTER {quote_duckdb_identifier(field.name)} "
+                            f"TYPE {_DUCKDB_TYPES[str(widened)]}"
+                        )
+                        types[field.name] = widened
+                conn.register(DUCKDB_BATCH_ALIAS, table)
+                conn.execute(f"INSERT INTO {target} SELECT * FROM {source}")
+            conn.unregister(DUCKDB_BATCH_ALIAS)
+            loaded += table.num_rows
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return loaded
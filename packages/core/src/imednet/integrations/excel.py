@@ -0,0 +1,228 @@
+"""Constant-memory Excel workbooks for tabular exports.
+
+:class:`StreamingExcelWriter` appends DataFrame chunks to openpyxl
+*write-only* workbooks. Write-only worksheets stream every row to a temporary
+file as it is appended, so memory stays bounded by the chunk being written
+rather than by the size of the workbook:
+
+* a worksheet that reaches the row limit (:data:`~imednet.constants.MAX_EXCEL_ROWS`
+  by default, header included) continues on a new worksheet named
+  ``"<sheet> (2)"``, ``"<sheet> (3)"`` and so on, each repeating the header;
+* with ``max_sheets`` set, a workbook that holds that many worksheets is
+  saved and writing continues in ``<stem>_2.xlsx``, ``<stem>_3.xlsx``, ...
+  next to the requested path.
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import os
+import re
+from collections.abc import Collection
+from pathlib import Path
+from typing import Any
+
+from imednet.constants import MAX_EXCEL_ROWS
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - exercised when optional dependency is absent
+    pd: Any = None  # type: ignore[no-redef]
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:  # pragma: no cover - exercised when optional dependency is absent
+    Workbook: Any = None  # type: ignore[no-redef]
+    ILLEGAL_CHARACTERS_RE: Any = None  # type: ignore[no-redef]
+
+MAX_SHEET_NAME_LENGTH = 31
+
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+_CELL_TYPES = (
+    str,
+    bool,
+    int,
+    float,
+    decimal.Decimal,
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+)
+
+
+def excel_sheet_name(name: str, taken: Collection[str] = (), *, part: int = 1) -> str:
+    """Return a valid worksheet title for ``name`` not already in ``taken``.
+
+    Characters Excel rejects are replaced with ``_`` and the title is cut to
+    31 characters. Continuation sheets (``part`` above one) end in
+    ``" (<part>)"``. Titles are compared case-insensitively, like Excel does;
+    a clash gains a ``_<n>`` suffix before the part number.
+    """
+    base = _INVALID_SHEET_CHARS.sub("_", str(name)).strip("'") or "Sheet"
+    suffix = f" ({part})" if part > 1 else ""
+    lowered = {title.lower() for title in taken}
+    title = base[: MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+    clash = 1
+    while title.lower() in lowered:
+        clash += 1
+        marker = f"_{clash}{suffix}"
+        title = base[: MAX_SHEET_NAME_LENGTH - len(marker)] + marker
+    return title
+
+
+def _cell(value: Any) -> Any:
+    """Return ``value`` as something openpyxl writes, like :meth:`DataFrame.to_excel`."""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.isoformat()
+    if value is None or isinstance(value, _CELL_TYPES):
+        return value
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds() / 86400
+    return str(value)
+
+
+class _Sheet:
+    """Writing state of one logical sheet, which may span several worksheets."""
+
+    def __init__(self, name: str, header: list[str]) -> None:
+        self.name = name
+        self.header = header
+        self.part = 0
+        self.worksheet: Any = None
+        self.rows = 0
+
+
+class StreamingExcelWriter:
+    """Write DataFrame chunks to write-only workbooks, splitting at the row limit.
+
+    Parameters
+    ----------
+    path:
+        Destination workbook. Further workbooks, when ``max_sheets`` is
+        reached, are written next to it as ``<stem>_2<suffix>`` and so on.
+    max_rows:
+        Rows per worksheet including the header. Defaults to Excel's limit.
+    max_sheets:
+        Worksheets per workbook, or ``None`` to keep every sheet in one
+        workbook.
+
+    Use the writer as a context manager: workbooks are saved when the block
+    exits normally, while an error discards the workbooks written so far.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_rows: int = MAX_EXCEL_ROWS,
+        max_sheets: int | None = None,
+    ) -> None:
+        """Validate the limits; no workbook is created until the first write."""
+        if Workbook is None or pd is None:
+            raise ImportError(
+                "pandas and openpyxl are required for Excel export. Install with "
+                "\"pip install 'imednet[export]'\"."
+            )
+        if not 2 <= max_rows <= MAX_EXCEL_ROWS:
+            raise ValueError(f"max_rows must be between 2 and {MAX_EXCEL_ROWS}")
+        if max_sheets is not None and max_sheets < 1:
+            raise ValueError("max_sheets must be at least 1")
+        self.path = path
+        self.max_rows = max_rows
+        self.max_sheets = max_sheets
+        self.paths: list[str] = []
+        self._workbook: Any = None
+        self._titles: list[str] = []
+        self._sheets: dict[str, _Sheet] = {}
+
+    def __enter__(self) -> StreamingExcelWriter:
+        """Return the writer."""
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        """Save the workbooks, or discard them when the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_frame(self, sheet: str, df: pd.DataFrame) -> int:
+        """Append the rows of ``df`` to the logical sheet ``sheet``.
+
+        The first frame written to a sheet fixes its header; later frames for
+        the same sheet must carry the same columns. An empty frame still
+        creates the sheet. Returns the number of rows written.
+        """
+        state = self._sheets.get(sheet)
+        columns = [str(c) for c in df.columns]
+        if state is None:
+            state = self._sheets[sheet] = _Sheet(sheet, columns)
+        elif columns and columns != state.header:
+            raise ValueError(f"Columns of sheet {sheet!r} changed between chunks")
+        if state.worksheet is None:
+            self._next_worksheet(state)
+
+        values = df.astype(object).where(df.notna(), None)
+        written = 0
+        for row in values.itertuples(index=False, name=None):
+            if state.rows >= self.max_rows:
+                self._next_worksheet(state)
+            state.worksheet.append([_cell(value) for value in row])
+            state.rows += 1
+            written += 1
+        return written
+
+    def _next_worksheet(self, state: _Sheet) -> None:
+        """Open the next worksheet of ``state``, rolling the workbook over if full."""
+        if self._workbook is None or (
+            self.max_sheets is not None and len(self._titles) >= self.max_sheets
+        ):
+            self._next_workbook()
+        state.part += 1
+        title = excel_sheet_name(state.name, self._titles, part=state.part)
+        self._titles.append(title)
+        state.worksheet = self._workbook.create_sheet(title)
+        state.rows = 0
+        if state.header:
+            state.worksheet.append(state.header)
+            state.rows = 1
+
+    def _next_workbook(self) -> None:
+        self._save()
+        self._workbook = Workbook(write_only=True)
+        self._titles = []
+        for state in self._sheets.values():
+            state.worksheet = None
+        path = Path(self.path)
+        index = len(self.paths) + 1
+        self.paths.append(
+            str(path if index == 1 else path.with_name(f"{path.stem}_{index}{path.suffix}"))
+        )
+
+    def _save(self) -> None:
+        if self._workbook is not None:
+            self._workbook.save(self.paths[-1])
+            self._workbook = None
+
+    def close(self) -> list[str]:
+        """Save the open workbook and return the paths of all workbooks written.
+
+        A writer that received no frames saves one empty worksheet, so the
+        destination always exists.
+        """
+        if not self.paths:
+            self._next_worksheet(_Sheet("Sheet1", []))
+        self._save()
+        return list(self.paths)
+
+    def abort(self) -> None:
+        """Discard the open workbook and delete the workbooks already saved."""
+        self._workbook = None
+        for path in self.paths[:-1]:
+            if os.path.exists(path):
+                os.remove(path)
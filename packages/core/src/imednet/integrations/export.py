@@ -3,11 +3,18 @@
 
 from __future__ import annotations
 
+import csv
 import hashlib
+import inspect
+import itertools
 import json
+import logging
 import os
-from collections.abc import Sequence
-from dataclasses import dataclass, field
+import pickle
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from importlib import import_module
 from pathlib import Path
@@ -15,26 +22,36 @@ from typing import Any, Literal, cast
 
 from imednet.core.operations.executor import UniversalExecutor
 from imednet.errors import ExportBatchError
-from imednet.integrations.sink_base import ExportSink, SinkConfig, apply_quality_gate
+from imednet.integrations.duckdb_arrow import (
+    META_COLUMNS,
+    arrow_columns,
+    load_batches,
+    rows_to_batch,
+)
+from imednet.integrations.excel import StreamingExcelWriter
+from imednet.integrations.export_pipeline import ExportPipelineConfig, iter_pipelined
+from imednet.integrations.long_sql import iter_long_batches, write_long_table
+from imednet.integrations.ndjson import NDJSONCompression, NDJSONWriter
+from imednet.integrations.sink_base import (
+    _DEFAULT_BATCH_SIZE,
+    ExportSink,
+    SinkConfig,
+    apply_quality_gate,
+    batch_digest,
+)
 
 try:
     import pandas as pd
 except ImportError:
     pd = None  # type: ignore[assignment]
-from imednet.constants import MAX_SQLITE_COLUMNS
-from imednet.utils import sanitize_csv_formula
-from imednet.utils.security import global_sensitivity_registry, mask_clinical_phi
+from imednet.constants import MAX_EXCEL_ROWS, MAX_SQLITE_COLUMNS
+from imednet.utils.dates import parse_iso_datetime
+from imednet.utils.pandas import mask_clinical_phi_frame, sanitize_csv_formula_frame
 
 from .. import ImednetClient
 from ..sdk import ImednetSDK
 
-
-def _quote_duckdb_identifier(name: str) -> str:
-    escaped_name = name.replace('"', '""')
-    return f'"{escaped_name}"'
-
-
-_DUCKDB_DF_ALIAS = "df"
+logger = logging.getLogger(__name__)
 
 
 def _record_mapper() -> Any:
@@ -51,21 +68,7 @@ def _record_mapper() -> Any:
 
 def _mask_df(df: pd.DataFrame) -> pd.DataFrame:
     """Mask sensitive fields in the DataFrame based on the global registry."""
-    sensitive_cols = [
-        col for col in df.columns if global_sensitivity_registry.is_sensitive(str(col))
-    ]
-    for col in sensitive_cols:
-        df[col] = "***MASKED***"
-
-    try:
-        object_cols = df.drop(columns=sensitive_cols).select_dtypes(include=[object, "str"]).columns
-    except TypeError:
-        object_cols = df.drop(columns=sensitive_cols).select_dtypes(include=[object]).columns
-
-    for col in object_cols:
-        df[col] = df[col].apply(mask_clinical_phi)
-
-    return df
+    return mask_clinical_phi_frame(df)
 
 
 def _to_sql_with_chunking(
@@ -121,6 +124,232 @@ def _records_df(
     return df
 
 
+class _FormRecordSpool:
+    """Records of a study routed to their forms and spilled to disk in chunks.
+
+    Each form keeps at most ``chunk_size`` records in memory; a full chunk is
+    pickled to one shared temporary file and read back when the form is
+    written, so routing a study never holds all of its records at once.
+    """
+
+    def __init__(self, form_ids: Iterable[int | None], chunk_size: int) -> None:
+        self._chunk_size = max(chunk_size, 1)
+        self._pending: dict[int | None, list[Any]] = {form_id: [] for form_id in form_ids}
+        self._offsets: dict[int | None, list[int]] = {form_id: [] for form_id in self._pending}
+        self._file = tempfile.TemporaryFile()  # noqa: SIM115 - closed by close()
+
+    def add(self, record: Any) -> None:
+        """Route ``record`` to its form, spilling the form's chunk when full."""
+        pending = self._pending.get(record.form_id)
+        if pending is None:
+            return
+        pending.append(record)
+        if len(pending) >= self._chunk_size:
+            self._file.seek(0, os.SEEK_END)
+            self._offsets[record.form_id].append(self._file.tell())
+            pickle.dump(pending, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._pending[record.form_id] = []
+
+    def iter_chunks(self, form_id: int | None) -> Iterator[list[Any]]:
+        """Yield the chunks routed to ``form_id`` in arrival order, then release them."""
+        for offset in self._offsets.pop(form_id, []):
+            self._file.seek(offset)
+            yield pickle.load(self._file)  # noqa: S301 - written by this process
+        pending = self._pending.pop(form_id, [])
+        if pending:
+            yield pending
+
+    def close(self) -> None:
+        """Delete the spool file."""
+        self._file.close()
+
+
+def _route_form_records(
+    sdk: ImednetSDK,
+    mapper: Any,
+    study_key: str,
+    *,
+    variable_whitelist: list[str] | None = None,
+    form_whitelist: list[int] | None = None,
+    chunk_size: int = _DEFAULT_BATCH_SIZE,
+) -> tuple[list[Any], dict[int | None, list[Any]], _FormRecordSpool]:
+    """Return ``(forms, variables_by_form, spool)`` for a study.
+
+    Forms, variables and records are each fetched once per study and records
+    are routed to their form by ``form_id`` as they arrive, in a
+    :class:`_FormRecordSpool` of ``chunk_size`` record chunks. Nothing else is
+    fetched when no form matches ``form_whitelist``. The caller closes the
+    spool.
+    """
+    forms = [
+        form
+        for form in sdk.forms.list(study_key=study_key)
+        if form.form_id is not None
+        and form.form_key is not None
+        and (form_whitelist is None or form.form_id in form_whitelist)
+    ]
+    spool = _FormRecordSpool((form.form_id for form in forms), chunk_size)
+    if not forms:
+        return [], {}, spool
+
+    _form_filter: dict[str, Any] = {"formIds": form_whitelist} if form_whitelist else {}
+    variables_by_form: dict[int | None, list[Any]] = {}
+    for v in sdk.variables.list(study_key=study_key, **_form_filter):
+        if v.form_id is not None:
+            variables_by_form.setdefault(v.form_id, []).append(v)
+
+    extra_filters: dict[str, Any] = dict(_form_filter)
+    if variable_whitelist:
+        extra_filters["variableNames"] = variable_whitelist
+    try:
+        for record in mapper._iter_records(study_key, extra_filters=extra_filters or None):
+            spool.add(record)
+    except BaseException:
+        spool.close()
+        raise
+    return forms, variables_by_form, spool
+
+
+def _iter_form_frames(
+    sdk: ImednetSDK,
+    study_key: str,
+    *,
+    use_labels_as_columns: bool = False,
+    variable_whitelist: list[str] | None = None,
+    form_whitelist: list[int] | None = None,
+    batch_size: int | None = None,
+    pipeline: ExportPipelineConfig | None = None,
+) -> Iterator[tuple[Any, pd.DataFrame]]:
+    """Yield ``(form, DataFrame)`` pairs built from a single pass over the study.
+
+    Records are routed to their form by :func:`_route_form_records`. Each
+    frame keeps the column order of :meth:`RecordMapper._build_dataframe` with
+    duplicate columns removed and sensitive values masked. With
+    ``batch_size`` set, a form's records are parsed that many at a time and
+    the form yields one frame per chunk; a form without records always
+    yields one empty frame. With ``pipeline`` set, frames are built on a
+    bounded worker pool while the caller writes earlier ones; frames are
+    still yielded in form order.
+    """
+    mapper = _record_mapper()(sdk)
+    forms, variables_by_form, spool = _route_form_records(
+        sdk,
+        mapper,
+        study_key,
+        variable_whitelist=variable_whitelist,
+        form_whitelist=form_whitelist,
+        chunk_size=batch_size or _DEFAULT_BATCH_SIZE,
+    )
+    models: dict[Any, tuple[list[str], dict[str, str], Any]] = {}
+
+    def _form_model(form: Any) -> tuple[list[str], dict[str, str], Any]:
+        if form.form_id not in models:
+            variables = variables_by_form.get(form.form_id, [])
+            variable_keys = [
+                v.variable_name
+                for v in variables
+                if variable_whitelist is None or v.variable_name in variable_whitelist
+            ]
+            label_map = {
+                v.variable_name: v.label for v in variables if v.variable_name in variable_keys
+            }
+            record_model = mapper._build_record_model(variable_keys, label_map)
+            models[form.form_id] = (variable_keys, label_map, record_model)
+        return models[form.form_id]
+
+    def _chunks() -> Iterator[tuple[Any, list[Any]]]:
+        for form in forms:
+            chunks = spool.iter_chunks(form.form_id)
+            if batch_size is None:
+                chunks = iter([list(itertools.chain.from_iterable(chunks))])
+            empty = True
+            for records in chunks:
+                empty = False
+                yield form, records
+            if empty:
+                yield form, []
+
+    def _transform(item: tuple[Any, list[Any]]) -> tuple[Any, pd.DataFrame]:
+        form, records = item
+        variable_keys, label_map, record_model = _form_model(form)
+        rows, _ = mapper._parse_records(records, record_model)
+        df = mapper._build_dataframe(rows, variable_keys, label_map, use_labels_as_columns)
+        if isinstance(df, pd.DataFrame):
+            df.columns = df.columns.astype(str)
+            df = df.loc[:, ~df.columns.str.lower().duplicated()]
+            df = _mask_df(df)
+        return form, df
+
+    try:
+        if pipeline is not None:
+            yield from iter_pipelined(_chunks(), _transform, pipeline)
+        else:
+            yield from map(_transform, _chunks())
+    finally:
+        spool.close()
+
+
+def _iter_form_batches(
+    sdk: ImednetSDK,
+    study_key: str,
+    *,
+    use_labels_as_columns: bool = False,
+    variable_whitelist: list[str] | None = None,
+    form_whitelist: list[int] | None = None,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    pipeline: ExportPipelineConfig | None = None,
+) -> Iterator[tuple[Any, Any]]:
+    """Yield ``(form, record batch)`` pairs typed from each form's variables.
+
+    The Arrow counterpart of :func:`_iter_form_frames`: a form's records are
+    parsed ``batch_size`` at a time and converted with
+    :func:`~imednet.integrations.duckdb_arrow.rows_to_batch`, so no DataFrame
+    is built. Batches are yielded one at a time, grouped by form in form
+    order; forms without parsed rows yield nothing. With ``pipeline`` set,
+    each chunk is converted on the worker pool, so at most
+    ``max_pending_batches`` batches are held at once.
+    """
+    mapper = _record_mapper()(sdk)
+    forms, variables_by_form, spool = _route_form_records(
+        sdk,
+        mapper,
+        study_key,
+        variable_whitelist=variable_whitelist,
+        form_whitelist=form_whitelist,
+        chunk_size=batch_size,
+    )
+
+    def _chunks() -> Iterator[tuple[Any, list[Any], Any, list[Any]]]:
+        for form in forms:
+            variables = variables_by_form.get(form.form_id, [])
+            columns = arrow_columns(
+                variables, use_labels=use_labels_as_columns, variable_whitelist=variable_whitelist
+            )
+            variable_keys = [column.source for column in columns[len(META_COLUMNS) :]]
+            label_map = {
+                v.variable_name: v.label for v in variables if v.variable_name in variable_keys
+            }
+            record_model = mapper._build_record_model(variable_keys, label_map)
+            for records in spool.iter_chunks(form.form_id):
+                yield form, columns, record_model, records
+
+    def _transform(item: tuple[Any, list[Any], Any, list[Any]]) -> tuple[Any, Any]:
+        form, columns, record_model, records = item
+        rows, _ = mapper._parse_records(records, record_model)
+        return form, rows_to_batch(rows, columns) if rows else None
+
+    try:
+        if pipeline is not None:
+            converted = iter_pipelined(_chunks(), _transform, pipeline)
+        else:
+            converted = map(_transform, _chunks())
+        for form, batch in converted:
+            if batch is not None:
+                yield form, batch
+    finally:
+        spool.close()
+
+
 def _prepare_export_df(
     sdk: ImednetSDK,
     study_key: str,
@@ -144,45 +373,188 @@ def _prepare_export_df(
     return df
 
 
+def _unify_arrow_schemas(pa: Any, schemas: Sequence[Any]) -> Any:
+    """Return one schema every chunk schema can be cast to.
+
+    Types are promoted permissively (``null`` to any type, ``int64`` to
+    ``double``). Columns whose chunks disagree in ways Arrow cannot promote
+    fall back to ``string``.
+    """
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        fields = []
+        for name in schemas[0].names:
+            per_chunk = [pa.schema([schema.field(name)]) for schema in schemas]
+            try:
+                fields.append(pa.unify_schemas(per_chunk, promote_options="permissive")[0])
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fields.append(pa.field(name, pa.string()))
+        return pa.schema(fields)
+
+
+def _parquet_writer_options(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``export_to_parquet`` keyword arguments ParquetWriter accepts.
+
+    Raises:
+    -------
+    TypeError
+        For keywords :class:`pyarrow.parquet.ParquetWriter` does not take,
+        such as the pandas-only ``partition_cols``, for ``filesystem``, or for
+        an ``engine`` other than ``"pyarrow"``.
+    """
+    try:
+        pq = import_module("pyarrow.parquet")
+    except ImportError as error:
+        raise ImportError(
+            "pyarrow is required for Parquet exports. Install with "
+            "\"pip install 'imednet[export]'\"."
+        ) from error
+    options = dict(kwargs)
+    engine = options.pop("engine", None)
+    if engine not in (None, "auto", "pyarrow"):
+        raise TypeError(f"export_to_parquet() only writes with pyarrow, got engine={engine!r}")
+    accepted = set(inspect.signature(pq.ParquetWriter).parameters) - {
+        "where",
+        "schema",
+        "filesystem",
+        "options",
+    }
+    unsupported = sorted(set(options) - accepted)
+    if unsupported:
+        raise TypeError(
+            "export_to_parquet() got keyword arguments pyarrow.parquet.ParquetWriter "
+            f"does not accept: {', '.join(unsupported)}"
+        )
+    return options
+
+
+class _ParquetBatchWriter:
+    """Write record batches to a Parquet file, one row group per batch.
+
+    Batches are written as they arrive under the schema of the first one,
+    which :func:`_iter_tabular_batches` types from variable metadata. Should
+    a later batch keep a column as text that did not fit its declared type,
+    the row groups written so far are rewritten once under the widened schema
+    (see :func:`_unify_arrow_schemas`). The file is assembled next to
+    ``path`` and moved into place by :meth:`commit`.
+    """
+
+    def __init__(self, path: str, **options: Any) -> None:
+        self._pa = import_module("pyarrow")
+        self._pq = import_module("pyarrow.parquet")
+        self._path = path
+        self._options = options
+        self._dir = tempfile.TemporaryDirectory(
+            prefix="imednet-parquet-", dir=os.path.dirname(os.path.abspath(path))
+        )
+        self._part = 0
+        self._target = ""
+        self._schema: Any = None
+        self._writer: Any = None
+
+    def __enter__(self) -> _ParquetBatchWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _open(self, schema: Any) -> None:
+        self._part += 1
+        self._target = os.path.join(self._dir.name, f"part-{self._part}.parquet")
+        self._writer = self._pq.ParquetWriter(self._target, schema, **self._options)
+        self._schema = schema
+
+    def _widen(self, schema: Any) -> None:
+        self._writer.close()
+        written = self._target
+        self._open(_unify_arrow_schemas(self._pa, [self._schema, schema]))
+        parquet_file = self._pq.ParquetFile(written)
+        for i in range(parquet_file.num_row_groups):
+            self._writer.write_table(parquet_file.read_row_group(i).cast(self._schema))
+        parquet_file.close()
+        os.remove(written)
+
+    def write(self, batch: Any) -> None:
+        schema = batch.schema.remove_metadata()
+        if self._writer is None:
+            self._open(schema)
+        elif not schema.equals(self._schema):
+            self._widen(schema)
+        self._writer.write_table(self._pa.Table.from_batches([batch]).cast(self._schema))
+
+    def commit(self) -> None:
+        if self._writer is None:
+            self._pq.write_table(self._pa.table({}), self._path, **self._options)
+            return
+        self._writer.close()
+        self._writer = None
+        os.replace(self._target, self._path)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._dir.cleanup()
+
+
 def export_to_parquet(
     sdk: ImednetSDK,
     study_key: str,
     path: str,
     *,
     use_labels_as_columns: bool = False,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    pipeline: ExportPipelineConfig | None = None,
     **kwargs: Any,
 ) -> None:
     """Export study records to a Parquet file.
 
     All exports now inherit StudyConfiguration rules by default.
 
+    Records are converted to Arrow record batches typed from the study's
+    variable metadata, ``batch_size`` at a time, and each batch is written
+    as its own row group as soon as it is built, so memory use is bounded
+    by a single chunk rather than the whole study.
+
     Parameters
     ----------
     use_labels_as_columns:
         When ``True``, variable labels are used for column names instead of
         variable names.
+    batch_size:
+        Number of records per chunk and Parquet row group.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation overlap with writing in
+        bounded background stages.
+    **kwargs:
+        Forwarded to :class:`pyarrow.parquet.ParquetWriter` (e.g.
+        ``compression``). ``DataFrame.to_parquet`` options such as
+        ``partition_cols`` are not supported; ``engine`` is accepted only
+        as ``"pyarrow"``.
+
+    Raises:
+    -------
+    TypeError
+        If ``kwargs`` holds a keyword ``ParquetWriter`` does not accept.
     """
-    df = _prepare_export_df(
-        sdk,
-        study_key,
+    options = _parquet_writer_options(kwargs)
+    config = TabularSinkConfig(
+        study_key=study_key,
+        batch_size=batch_size,
         use_labels_as_columns=use_labels_as_columns,
+        pipeline=pipeline,
     )
-    df.to_parquet(path, index=False, **kwargs)
+    with _ParquetBatchWriter(path, **options) as writer:
+        for _, batch in _iter_tabular_batches(sdk, study_key, config):
+            writer.write(batch)
+        writer.commit()
 
 
 def _sanitize_df(df: pd.DataFrame) -> pd.DataFrame:
     """Sanitize DataFrame string columns to prevent CSV injection."""
-    # Explicitly include "str" to avoid Pandas 3.0 warning about object dtype
-    # including strings implicitly. Use a try/except block to handle older Pandas versions
-    # (e.g. 2.3.3) where "str" raises a TypeError.
-    try:
-        cols = df.select_dtypes(include=[object, "str"])
-    except TypeError:
-        cols = df.select_dtypes(include=[object])
-
-    for col in cols:
-        df[col] = df[col].apply(sanitize_csv_formula)
-    return df
+    return sanitize_csv_formula_frame(df)
 
 
 @dataclass
@@ -195,6 +567,157 @@ class TabularSinkConfig(SinkConfig):
     variable_whitelist: list[str] | None = None
     form_whitelist: list[int] | None = None
     pandas_kwargs: dict[str, Any] = field(default_factory=dict)
+    pipeline: ExportPipelineConfig | None = None
+    incremental: bool = False
+
+
+_RUN_BATCH_SUFFIX = "tabular/run"
+
+
+class _IncrementalUnsupportedError(Exception):
+    """Raised when a destination cannot absorb an incremental delta."""
+
+
+def _as_utc(value: Any) -> datetime | None:
+    """Return an ISO string or datetime as an aware UTC datetime."""
+    if isinstance(value, str) and value:
+        try:
+            value = parse_iso_datetime(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _modified_at(record: Any) -> datetime | None:
+    """Return a record's ``date_modified`` as an aware UTC datetime."""
+    return _as_utc(getattr(record, "date_modified", None))
+
+
+def _stamped_at(record: Any) -> str | None:
+    """Return a record's ``date_modified`` as the server stamped it."""
+    value = getattr(record, "date_modified", None)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value if isinstance(value, str) and value else None
+
+
+@dataclass
+class _ChangeTracker:
+    """Track the ``dateModified`` high-water mark of a tabular export run.
+
+    ``since`` and ``settled`` describe the previous run: records stamped after
+    ``since``, or stamped exactly ``since`` with content other than the
+    checksum ``settled`` holds for their id, are treated as changed. A record
+    modified again within the watermark's second is therefore exported again.
+    Without a previous run every record is changed. ``since_raw`` is the
+    watermark exactly as the server stamped it, which is what the
+    ``dateModified`` filter is sent with.
+    """
+
+    since: datetime | None = None
+    since_raw: str | None = None
+    settled: dict[str, str] = field(default_factory=dict)
+    high_water_mark: datetime | None = None
+    high_water_mark_raw: str | None = None
+    boundary: dict[Any, str] = field(default_factory=dict)
+    changed_ids: set[Any] = field(default_factory=set)
+
+    @classmethod
+    def resume(cls, run: dict[str, Any] | None) -> _ChangeTracker:
+        """Build a tracker continuing from a manifest run entry."""
+        since = _as_utc(run.get("high_water_mark")) if run else None
+        if run is None or since is None:
+            return cls()
+        settled = dict(run.get("boundary_checksums") or {})
+        boundary = {
+            record_id: settled[str(record_id)]
+            for record_id in run.get("boundary_record_ids") or ()
+            if str(record_id) in settled
+        }
+        since_raw = run.get("high_water_mark_raw") or run.get("high_water_mark")
+        return cls(
+            since=since,
+            since_raw=since_raw,
+            settled=settled,
+            high_water_mark=since,
+            high_water_mark_raw=since_raw,
+            boundary=boundary,
+        )
+
+    @property
+    def incremental(self) -> bool:
+        """Whether the run only exports records changed since ``since``."""
+        return self.since is not None
+
+    def is_changed(self, record: Any) -> bool:
+        """Return whether ``record`` changed since the previous run."""
+        if self.since is None:
+            return True
+        modified = _modified_at(record)
+        if modified is None:
+            return True
+        if modified == self.since:
+            record_id = getattr(record, "record_id", None)
+            return self.settled.get(str(record_id)) != batch_digest([record])
+        return modified > self.since
+
+    def select(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Yield changed records while advancing the high-water mark."""
+        for record in records:
+            if not self.is_changed(record):
+                continue
+            record_id = getattr(record, "record_id", None)
+            self.changed_ids.add(record_id)
+            modified = _modified_at(record)
+            if modified is not None:
+                if self.high_water_mark is None or modified > self.high_water_mark:
+                    self.high_water_mark = modified
+                    self.high_water_mark_raw = _stamped_at(record)
+                    self.boundary = {record_id: batch_digest([record])}
+                elif modified == self.high_water_mark:
+                    self.boundary[record_id] = batch_digest([record])
+            yield record
+
+    def manifest_fields(self) -> dict[str, Any]:
+        """Return the run-entry fields that let the next run resume."""
+        return {
+            "mode": "incremental" if self.incremental else "full",
+            "high_water_mark": (
+                self.high_water_mark.isoformat() if self.high_water_mark is not None else None
+            ),
+            "high_water_mark_raw": self.high_water_mark_raw,
+            "boundary_record_ids": sorted(self.boundary, key=str),
+            "boundary_checksums": {
+                str(record_id): digest for record_id, digest in self.boundary.items()
+            },
+        }
+
+
+def _last_manifest_run(
+    manifest_path: str | None, batch_id: str, destination: str
+) -> dict[str, Any] | None:
+    """Return the latest run entry for ``destination`` in a tabular manifest."""
+    if not manifest_path or not os.path.exists(manifest_path):
+        return None
+    last = None
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("batch_id") == batch_id and entry.get("destination") == destination:
+                last = entry
+    return last
+
+
+def _run_checksum(checksums: Sequence[str]) -> str:
+    """Combine the batch checksums of a run into one digest."""
+    return hashlib.sha256("".join(checksums).encode("utf-8")).hexdigest()
 
 
 class TabularCSVSink(ExportSink):
@@ -206,6 +729,10 @@ class TabularCSVSink(ExportSink):
         self.path = path
         self._is_first_batch = True
         self._cfg = config
+        self._batch_checksums: list[str] = []
+        self._rows_loaded = 0
+        self._header: list[str] | None = None
+        self._delta_path: str | None = None
 
     def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
         """Write a batch of records to the sink."""
@@ -218,18 +745,22 @@ class TabularCSVSink(ExportSink):
                 return 0
             df = pd.DataFrame(records)
 
+        if self._delta_path is not None and [str(c) for c in df.columns] != self._header:
+            raise _IncrementalUnsupportedError(f"columns of {self.path!r} changed")
+
         def execute_export() -> int:
             mode = "w" if self._is_first_batch else "a"
-            header = self._is_first_batch
+            header = self._is_first_batch and self._delta_path is None
 
             csv_str = df.to_csv(index=False, header=header, **self._cfg.pandas_kwargs)
             checksum = hashlib.sha256(csv_str.encode('utf-8')).hexdigest()
 
-            with open(self.path, mode=mode, encoding="utf-8") as f:
+            with open(self._delta_path or self.path, mode=mode, encoding="utf-8") as f:
                 f.write(csv_str)
 
             rows_loaded = len(df)
             self._append_manifest(batch_id, rows_loaded, checksum)
+            self._batch_checksums.append(checksum)
             return rows_loaded
 
         executor = UniversalExecutor(
@@ -243,6 +774,7 @@ class TabularCSVSink(ExportSink):
         try:
             loaded = executor.execute(execute_export)
             self._is_first_batch = False
+            self._rows_loaded += loaded
             return loaded
         except Exception as exc:
             raise ExportBatchError(
@@ -250,7 +782,7 @@ class TabularCSVSink(ExportSink):
                 batch_id=batch_id,
             ) from exc
 
-    def _append_manifest(self, batch_id: str, row_count: int, checksum: str) -> None:
+    def _append_manifest(self, batch_id: str, row_count: int, checksum: str, **extra: Any) -> None:
         if not self._cfg.manifest_path:
             return
         entry = {
@@ -259,15 +791,97 @@ class TabularCSVSink(ExportSink):
             "row_count": row_count,
             "checksum": checksum,
             "loaded_at": datetime.now(tz=timezone.utc).isoformat(),
+            **extra,
         }
         with open(self._cfg.manifest_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(entry) + os.linesep)
 
+    def _previous_run(self, study_key: str) -> dict[str, Any] | None:
+        """Return the last run entry if the existing file can take a delta.
+
+        Merging rewrites rows keyed by the leading ``recordId`` column, so
+        custom ``pandas_kwargs`` (separators, quoting, ...) disable it.
+        """
+        if self._cfg.pandas_kwargs or not os.path.exists(self.path):
+            return None
+        run = _last_manifest_run(
+            self._cfg.manifest_path, f"{study_key}/{_RUN_BATCH_SUFFIX}", self.path
+        )
+        if run is None:
+            return None
+        with open(self.path, encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), None)
+        if not header or header[0] != "recordId":
+            return None
+        self._header = header
+        return run
+
+    def _begin_run(self, tracker: _ChangeTracker) -> None:
+        """Reset per-run state; incremental runs write to a side file."""
+        self._discard_delta()
+        self._is_first_batch = True
+        self._batch_checksums = []
+        self._rows_loaded = 0
+        if tracker.incremental:
+            fd, self._delta_path = tempfile.mkstemp(
+                suffix=".csv", dir=os.path.dirname(os.path.abspath(self.path))
+            )
+            os.close(fd)
+
+    def _finish_run(self, study_key: str, tracker: _ChangeTracker) -> None:
+        """Merge any delta into the file and record the run in the manifest."""
+        if self._delta_path is not None:
+            if not tracker.changed_ids:
+                logger.info("No records changed since %s; %s left as is", tracker.since, self.path)
+                return
+            self._merge_delta({str(i) for i in tracker.changed_ids})
+        self._append_manifest(
+            f"{study_key}/{_RUN_BATCH_SUFFIX}",
+            self._rows_loaded,
+            _run_checksum(self._batch_checksums),
+            **tracker.manifest_fields(),
+        )
+
+    def _merge_delta(self, changed_ids: set[str]) -> None:
+        """Replace the file with its unchanged rows followed by the delta rows."""
+        delta_path = cast(str, self._delta_path)
+        fd, merged_path = tempfile.mkstemp(
+            suffix=".csv", dir=os.path.dirname(os.path.abspath(self.path))
+        )
+        try:
+            with (
+                os.fdopen(fd, "w", encoding="utf-8", newline="") as out,
+                open(self.path, encoding="utf-8", newline="") as previous,
+            ):
+                # pandas writes CSV through the csv module with the same dialect.
+                writer = csv.writer(out, lineterminator=os.linesep)
+                rows = csv.reader(previous)
+                writer.writerow(next(rows))
+                writer.writerows(row for row in rows if row and row[0] not in changed_ids)
+                with open(delta_path, encoding="utf-8", newline="") as delta:
+                    shutil.copyfileobj(delta, out)
+            os.replace(merged_path, self.path)
+        except BaseException:
+            if os.path.exists(merged_path):
+                os.unlink(merged_path)
+            raise
+        finally:
+            self._discard_delta()
+
+    def _discard_delta(self) -> None:
+        if self._delta_path is not None:
+            if os.path.exists(self._delta_path):
+                os.unlink(self._delta_path)
+            self._delta_path = None
+
     def flush(self) -> None:
         pass
 
     def close(self) -> None:
-        pass
+        self._discard_delta()
+
+
+_DELETE_CHUNK = 500
 
 
 class TabularSQLSink(ExportSink):
@@ -281,6 +895,11 @@ class TabularSQLSink(ExportSink):
         self._is_first_batch = True
         self._cfg = config
         self._initial_if_exists = self._cfg.pandas_kwargs.pop("if_exists", "replace")
+        self._batch_checksums: list[str] = []
+        self._rows_loaded = 0
+        self._table_columns: set[str] = set()
+        self._incremental = False
+        self._written_ids: set[Any] = set()
 
     def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
         """Write a batch of records to the sink."""
@@ -293,22 +912,35 @@ class TabularSQLSink(ExportSink):
                 return 0
             df = pd.DataFrame(records)
 
+        if self._incremental and {str(c) for c in df.columns} != self._table_columns:
+            raise _IncrementalUnsupportedError(f"columns of table {self.table!r} changed")
+
         def execute_export() -> int:
             if_exists = self._initial_if_exists if self._is_first_batch else "append"
 
             df_str = df.to_csv(index=False)
             checksum = hashlib.sha256(df_str.encode('utf-8')).hexdigest()
 
-            _to_sql_with_chunking(
-                df,
-                self.table,
-                self.engine,
-                if_exists=cast(Literal["fail", "replace", "append", "delete_rows"], if_exists),
-                **self._cfg.pandas_kwargs,
-            )
+            if self._incremental:
+                record_ids = df["recordId"].tolist()
+                with self.engine.begin() as conn:
+                    self._delete_records(conn, record_ids)
+                    _to_sql_with_chunking(
+                        df, self.table, conn, if_exists="append", **self._cfg.pandas_kwargs
+                    )
+                self._written_ids.update(record_ids)
+            else:
+                _to_sql_with_chunking(
+                    df,
+                    self.table,
+                    self.engine,
+                    if_exists=cast(Literal["fail", "replace", "append", "delete_rows"], if_exists),
+                    **self._cfg.pandas_kwargs,
+                )
 
             rows_loaded = len(df)
             self._append_manifest(batch_id, rows_loaded, checksum)
+            self._batch_checksums.append(checksum)
             return rows_loaded
 
         executor = UniversalExecutor(
@@ -322,6 +954,7 @@ class TabularSQLSink(ExportSink):
         try:
             loaded = executor.execute(execute_export)
             self._is_first_batch = False
+            self._rows_loaded += loaded
             return loaded
         except Exception as exc:
             raise ExportBatchError(
@@ -329,7 +962,7 @@ class TabularSQLSink(ExportSink):
                 batch_id=batch_id,
             ) from exc
 
-    def _append_manifest(self, batch_id: str, row_count: int, checksum: str) -> None:
+    def _append_manifest(self, batch_id: str, row_count: int, checksum: str, **extra: Any) -> None:
         if not self._cfg.manifest_path:
             return
         entry = {
@@ -338,10 +971,64 @@ class TabularSQLSink(ExportSink):
             "row_count": row_count,
             "checksum": checksum,
             "loaded_at": datetime.now(tz=timezone.utc).isoformat(),
+            **extra,
         }
         with open(self._cfg.manifest_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(entry) + os.linesep)
 
+    def _previous_run(self, study_key: str) -> dict[str, Any] | None:
+        """Return the last run entry if the existing table can take a delta."""
+        if self._cfg.pandas_kwargs.get("schema"):
+            return None
+        run = _last_manifest_run(
+            self._cfg.manifest_path, f"{study_key}/{_RUN_BATCH_SUFFIX}", self.table
+        )
+        if run is None:
+            return None
+        from sqlalchemy import inspect
+
+        inspector = inspect(self.engine)
+        if not inspector.has_table(self.table):
+            return None
+        self._table_columns = {c["name"] for c in inspector.get_columns(self.table)}
+        if "recordId" not in self._table_columns:
+            return None
+        return run
+
+    def _begin_run(self, tracker: _ChangeTracker) -> None:
+        """Reset per-run state; incremental runs upsert into the table."""
+        self._is_first_batch = True
+        self._batch_checksums = []
+        self._rows_loaded = 0
+        self._incremental = tracker.incremental
+        self._written_ids = set()
+
+    def _finish_run(self, study_key: str, tracker: _ChangeTracker) -> None:
+        """Drop rows of changed records that no longer export; record the run."""
+        if self._incremental:
+            if not tracker.changed_ids:
+                logger.info("No records changed since %s; %s left as is", tracker.since, self.table)
+                return
+            stale = [i for i in tracker.changed_ids if i not in self._written_ids]
+            if stale:
+                with self.engine.begin() as conn:
+                    self._delete_records(conn, stale)
+        self._append_manifest(
+            f"{study_key}/{_RUN_BATCH_SUFFIX}",
+            self._rows_loaded,
+            _run_checksum(self._batch_checksums),
+            **tracker.manifest_fields(),
+        )
+
+    def _delete_records(self, conn: Any, record_ids: Sequence[Any]) -> None:
+        import sqlalchemy as sa
+
+        record_id: sa.ColumnClause[Any] = sa.column("recordId")
+        table = sa.table(self.table, record_id)
+        for start in range(0, len(record_ids), _DELETE_CHUNK):
+            chunk = record_ids[start : start + _DELETE_CHUNK]
+            conn.execute(table.delete().where(record_id.in_(chunk)))
+
     def flush(self) -> None:
         """Flush the sink."""
 
@@ -349,13 +1036,84 @@ class TabularSQLSink(ExportSink):
         """Close the sink."""
 
 
-def _tabular_export(
+def _iter_record_chunks(
+    sdk: Any,
+    mapper: Any,
+    study_key: str,
+    config: TabularSinkConfig,
+    tracker: _ChangeTracker | None = None,
+) -> Iterator[tuple[int, list[Any]]]:
+    """Yield ``(batch_index, records)`` chunks of ``config.batch_size`` records.
+
+    Whitelists become API filters, the quality gate is applied and, with a
+    ``tracker``, only records it reports as changed are kept.
+    """
+    extra_filters = {}
+    if config.variable_whitelist is not None:
+        extra_filters["variableNames"] = config.variable_whitelist
+    if config.form_whitelist is not None:
+        extra_filters["formIds"] = config.form_whitelist  # type: ignore
+    if tracker is not None and tracker.since_raw is not None:
+        extra_filters["dateModified"] = (">=", tracker.since_raw)  # type: ignore
+
+    raw_records = mapper._iter_records(
+        study_key,
+        visit_key=None,
+        extra_filters=extra_filters or None,
+    )
+    if tracker is not None:
+        # Cached loaders ignore the date filter, so changes are also checked here.
+        raw_records = tracker.select(raw_records)
+
+    iterator = iter(apply_quality_gate(sdk, study_key, raw_records, config))
+    for i in itertools.count():
+        chunk = list(itertools.islice(iterator, config.batch_size))
+        if not chunk:
+            return
+        yield i, chunk
+
+
+def _map_chunks(
+    chunks: Iterable[tuple[int, list[Any]]],
+    transform: Callable[[tuple[int, list[Any]]], tuple[int, Any]],
+    pipeline: ExportPipelineConfig | None,
+) -> Iterator[tuple[int, Any]]:
+    """Apply ``transform`` to every chunk, pipelined when ``pipeline`` is set.
+
+    Results that are ``None`` (chunks without rows) are skipped.
+    """
+    results = (
+        iter_pipelined(chunks, transform, pipeline)
+        if pipeline is not None
+        else map(transform, chunks)
+    )
+    for i, result in results:
+        if result is not None:
+            yield i, result
+
+
+def _iter_tabular_frames(
     sdk: Any,
     study_key: str,
-    sink: ExportSink,
     config: TabularSinkConfig,
     sanitize: bool = False,
-) -> None:
+    tracker: _ChangeTracker | None = None,
+) -> Iterator[tuple[int, pd.DataFrame]]:
+    """Yield ``(batch_index, DataFrame)`` pairs of ``config.batch_size`` records.
+
+    Every frame carries the same column set with labels, case-insensitive
+    de-duplication and masking applied, so callers can write each chunk as it
+    arrives instead of materialising the whole study. Batch indexes of
+    chunks that produce no rows are skipped.
+
+    When ``config.pipeline`` is set, fetching and transformation run on
+    background threads (see :mod:`imednet.integrations.export_pipeline`)
+    while the caller writes earlier frames; frames are still yielded in batch
+    order.
+
+    ``tracker`` restricts the frames to records it reports as changed and
+    follows their ``dateModified`` high-water mark.
+    """
     mapper = _record_mapper()(sdk)
     variable_keys, label_map = mapper._fetch_variable_metadata(
         study_key,
@@ -366,48 +1124,102 @@ def _tabular_export(
         return
 
     record_model = mapper._build_record_model(variable_keys, label_map)
-    extra_filters = {}
+
+    def _transform(item: tuple[int, list[Any]]) -> tuple[int, pd.DataFrame | None]:
+        i, chunk = item
+        rows, _ = mapper._parse_records(chunk, record_model)
+        df = mapper._build_dataframe(rows, variable_keys, label_map, config.use_labels_as_columns)
+        if df.empty:
+            return i, None
+
+        # Deduplicate columns (case-insensitive) as legacy _records_df did
+        dup_mask = df.columns.str.lower().duplicated()
+        df = df.loc[:, ~dup_mask]
+
+        df = _mask_df(df)
+        if sanitize:
+            df = _sanitize_df(df)
+        return i, df
+
+    chunks = _iter_record_chunks(sdk, mapper, study_key, config, tracker)
+    yield from _map_chunks(chunks, _transform, config.pipeline)
+
+
+def _iter_tabular_batches(
+    sdk: Any,
+    study_key: str,
+    config: TabularSinkConfig,
+) -> Iterator[tuple[int, Any]]:
+    """Yield ``(batch_index, RecordBatch)`` pairs of ``config.batch_size`` records.
+
+    The Arrow counterpart of :func:`_iter_tabular_frames`: columns, labels,
+    de-duplication and masking match the frames, but every batch shares one
+    schema typed from the study's variable metadata (see
+    :mod:`imednet.integrations.duckdb_arrow`) and no DataFrame is built.
+    """
+    mapper = _record_mapper()(sdk)
+    filters: dict[str, Any] = {}
     if config.variable_whitelist is not None:
-        extra_filters["variableNames"] = config.variable_whitelist
+        filters["variableNames"] = config.variable_whitelist
     if config.form_whitelist is not None:
-        extra_filters["formIds"] = config.form_whitelist  # type: ignore
+        filters["formIds"] = config.form_whitelist
+    variables = list(sdk.get_variables(study_key=study_key, **filters))
+    if not variables:
+        logger.warning("No variables found for study '%s'; nothing to export.", study_key)
+        return
 
-    raw_records = mapper._iter_records(
-        study_key,
-        visit_key=None,
-        extra_filters=extra_filters or None,
-    )
+    columns = arrow_columns(variables, use_labels=config.use_labels_as_columns)
+    variable_keys = [column.source for column in columns[len(META_COLUMNS) :]]
+    label_map = {v.variable_name: v.label for v in variables if v.variable_name in variable_keys}
+    record_model = mapper._build_record_model(variable_keys, label_map)
 
-    filtered_records = apply_quality_gate(sdk, study_key, raw_records, config)
+    def _transform(item: tuple[int, list[Any]]) -> tuple[int, Any]:
+        i, chunk = item
+        rows, _ = mapper._parse_records(chunk, record_model)
+        return i, rows_to_batch(rows, columns) if rows else None
 
-    import itertools
-    from collections.abc import Iterator
+    chunks = _iter_record_chunks(sdk, mapper, study_key, config)
+    yield from _map_chunks(chunks, _transform, config.pipeline)
 
-    def _chunk_iterator(iterator: Iterator[Any], size: int) -> Iterator[list[Any]]:
-        while True:
-            chunk = list(itertools.islice(iterator, size))
-            if not chunk:
-                break
-            yield chunk
 
-    with sink:
-        for i, chunk in enumerate(_chunk_iterator(iter(filtered_records), config.batch_size)):
-            rows, _ = mapper._parse_records(chunk, record_model)
-            df = mapper._build_dataframe(
-                rows, variable_keys, label_map, config.use_labels_as_columns
-            )
-            if df.empty:
-                continue
+def _tabular_export(
+    sdk: Any,
+    study_key: str,
+    sink: TabularCSVSink | TabularSQLSink,
+    config: TabularSinkConfig,
+    sanitize: bool = False,
+) -> None:
+    """Stream tabular frames into ``sink`` and record the run in its manifest.
 
-            # Deduplicate columns (case-insensitive) as legacy _records_df did
-            dup_mask = df.columns.str.lower().duplicated()
-            df = df.loc[:, ~dup_mask]
+    With ``config.incremental`` and a previous run of the same destination in
+    the manifest, only records modified since that run's ``dateModified``
+    high-water mark are fetched and merged into the destination. Without a
+    usable previous run, or when the destination's columns changed, a full
+    export runs instead.
+    """
+    run = sink._previous_run(study_key) if config.incremental else None
+    try:
+        _write_tabular_run(sdk, study_key, sink, config, _ChangeTracker.resume(run), sanitize)
+    except _IncrementalUnsupportedError as exc:
+        logger.info("Incremental export of %s not possible (%s); exporting in full", study_key, exc)
+        _write_tabular_run(sdk, study_key, sink, config, _ChangeTracker(), sanitize)
 
-            df = _mask_df(df)
-            if sanitize:
-                df = _sanitize_df(df)
 
+def _write_tabular_run(
+    sdk: Any,
+    study_key: str,
+    sink: TabularCSVSink | TabularSQLSink,
+    config: TabularSinkConfig,
+    tracker: _ChangeTracker,
+    sanitize: bool,
+) -> None:
+    sink._begin_run(tracker)
+    with sink:
+        for i, df in _iter_tabular_frames(
+            sdk, study_key, config, sanitize=sanitize, tracker=tracker
+        ):
             sink.write_batch(df, batch_id=f"{study_key}/tabular/{i}")
+        sink._finish_run(study_key, tracker)
 
 
 def export_to_csv(
@@ -416,6 +1228,8 @@ def export_to_csv(
     path: str,
     *,
     use_labels_as_columns: bool = False,
+    pipeline: ExportPipelineConfig | None = None,
+    incremental: bool = False,
     **kwargs: Any,
 ) -> None:
     """Export study records to a CSV file.
@@ -427,6 +1241,16 @@ def export_to_csv(
     use_labels_as_columns:
         When ``True``, variable labels are used for column names instead of
         variable names.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation overlap with writing in
+        bounded background stages.
+    incremental:
+        When ``True`` and the manifest records a previous run for this
+        file, only records modified since that run's ``dateModified``
+        high-water mark are fetched and their rows replaced in the file.
+        Records hard-deleted upstream are never removed from the file; run
+        a full export to drop them.
     """
     config = kwargs.pop("config", None)
     if not isinstance(config, TabularSinkConfig):
@@ -436,7 +1260,14 @@ def export_to_csv(
             pandas_kwargs=kwargs,
             use_labels_as_columns=use_labels_as_columns,
             quality_gate_enabled=True,
+            pipeline=pipeline,
+            incremental=incremental,
         )
+    else:
+        if pipeline is not None:
+            config = replace(config, pipeline=pipeline)
+        if incremental:
+            config = replace(config, incremental=True)
 
     sink = TabularCSVSink(path, config)
     _tabular_export(sdk, study_key, sink, config, sanitize=True)
@@ -448,25 +1279,152 @@ def export_to_excel(
     path: str,
     *,
     use_labels_as_columns: bool = False,
+    by_form: bool = False,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    max_rows: int = MAX_EXCEL_ROWS,
+    max_sheets: int | None = None,
+    pipeline: ExportPipelineConfig | None = None,
     **kwargs: Any,
 ) -> None:
     """Export study records to an Excel workbook.
 
     All exports now inherit StudyConfiguration rules by default.
 
+    Rows are streamed into a write-only workbook ``batch_size`` records at a
+    time (see :mod:`imednet.integrations.excel`), so memory does not grow
+    with the size of the study. A sheet that reaches ``max_rows`` continues
+    on a new sheet with the same header.
+
     Parameters
     ----------
     use_labels_as_columns:
         When ``True``, variable labels are used for column names instead of
         variable names.
+    by_form:
+        When ``True``, each form is written to its own sheet named after
+        ``form.form_key``.
+    batch_size:
+        Number of records per chunk written to the workbook.
+    max_rows:
+        Rows per sheet, header included. Defaults to Excel's limit of
+        1,048,576 rows.
+    max_sheets:
+        Sheets per workbook. When set, further sheets go to workbooks named
+        ``<stem>_2.xlsx``, ``<stem>_3.xlsx`` and so on next to ``path``.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation overlap with writing in
+        bounded background stages.
+    **kwargs:
+        ``sheet_name`` names the sheet of a single-sheet export (default
+        ``"Sheet1"``). ``engine`` and ``index`` are accepted for
+        compatibility with :meth:`pandas.DataFrame.to_excel` and ignored.
+
+    Raises:
+    -------
+    TypeError
+        If other keyword arguments are given.
     """
-    df = _prepare_export_df(
-        sdk,
-        study_key,
-        use_labels_as_columns=use_labels_as_columns,
-        sanitize=True,
-    )
-    df.to_excel(path, index=False, **kwargs)
+    sheet_name = str(kwargs.pop("sheet_name", "Sheet1"))
+    kwargs.pop("engine", None)
+    kwargs.pop("index", None)
+    if kwargs:
+        raise TypeError(f"Unsupported Excel export options: {', '.join(sorted(kwargs))}")
+
+    with StreamingExcelWriter(path, max_rows=max_rows, max_sheets=max_sheets) as writer:
+        if by_form:
+            for form, df in _iter_form_frames(
+                sdk,
+                study_key,
+                use_labels_as_columns=use_labels_as_columns,
+                batch_size=batch_size,
+                pipeline=pipeline,
+            ):
+                writer.write_frame(str(form.form_key), _sanitize_df(df))
+            return
+
+        config = TabularSinkConfig(
+            study_key=study_key,
+            batch_size=batch_size,
+            use_labels_as_columns=use_labels_as_columns,
+            pipeline=pipeline,
+        )
+        written = False
+        for _, df in _iter_tabular_frames(sdk, study_key, config, sanitize=True):
+            writer.write_frame(sheet_name, df)
+            written = True
+        if not written:
+            writer.write_frame(sheet_name, pd.DataFrame())
+
+
+def _load_enrichment_pipeline(study_key: str) -> Any | None:
+    """Return the study's latest ``EnrichmentPipeline`` or ``None`` when unavailable."""
+    try:
+        from importlib.metadata import entry_points
+
+        config_version_stores = list(
+            entry_points(group="imednet.stores", name="ConfigVersionStore")
+        )
+        if not config_version_stores:
+            raise ImportError("ConfigVersionStore plugin not found.")
+
+        config_version_store_cls = config_version_stores[0].load()
+        enrichment_pipeline_cls = import_module(
+            "imednet.integrations.enrichment"
+        ).EnrichmentPipeline
+
+        store = config_version_store_cls()
+        history = store.get_history(study_key)
+        if not history:
+            return None
+        latest_commit = history[-1]["commit_id"]
+        config = store.rollback_config(study_key, latest_commit)
+        return enrichment_pipeline_cls(config)
+    except Exception as e:
+        logger.warning(f"Could not apply EnrichmentPipeline: {e}")
+        return None
+
+
+def _enrich(pipeline: Any | None, data: Any) -> Any:
+    """Run ``data`` through ``pipeline``, returning it unchanged on failure."""
+    if pipeline is None:
+        return data
+    try:
+        return pipeline.process(data)
+    except Exception as e:
+        logger.warning(f"Could not apply EnrichmentPipeline: {e}")
+        return data
+
+
+def _write_json_array(f: Any, items: Iterable[Any], **kwargs: Any) -> None:
+    """Write ``items`` to ``f`` as a JSON array one element at a time.
+
+    The output is identical to ``json.dump(list(items), f, **kwargs)`` without
+    holding the list in memory.
+    """
+    indent = kwargs.get("indent")
+    separators = kwargs.get("separators")
+    if indent is None:
+        item_separator = separators[0] if separators else ", "
+        opener, delimiter, closer = "[", item_separator, "]"
+        newline_indent = None
+    else:
+        if not isinstance(indent, str):
+            indent = " " * indent
+        item_separator = separators[0] if separators else ","
+        newline_indent = "\n" + indent
+        opener, delimiter, closer = "[" + newline_indent, item_separator + newline_indent, "\n]"
+
+    empty = True
+    for item in items:
+        text = json.dumps(item, **kwargs)
+        if newline_indent is not None:
+            # json escapes newlines inside strings, so these are layout only.
+            text = text.replace("\n", newline_indent)
+        f.write(opener if empty else delimiter)
+        f.write(text)
+        empty = False
+    f.write("[]" if empty else closer)
 
 
 def export_to_json(
@@ -476,12 +1434,17 @@ def export_to_json(
     *,
     use_labels_as_columns: bool = False,
     hierarchical: bool = False,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    pipeline: ExportPipelineConfig | None = None,
     **kwargs: Any,
 ) -> None:
     """Export study records to a JSON file.
 
     All exports now inherit StudyConfiguration rules by default.
 
+    Flat exports are streamed: records are processed in ``batch_size``
+    chunks and appended to the output array as they are enriched.
+
     Parameters
     ----------
     use_labels_as_columns:
@@ -489,56 +1452,115 @@ def export_to_json(
         variable names.
     hierarchical:
         When ``True``, generates a nested tree (Subject > Visit > Form) suitable
-        for Veeva Vault integrations instead of a flat tabular layout.
+        for Veeva Vault integrations instead of a flat tabular layout. The
+        tree is built in memory before it is written.
+    batch_size:
+        Number of records per chunk for flat exports.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation of flat exports overlap with
+        writing in bounded background stages.
     """
-    import json
-    import logging
-
-    logger = logging.getLogger(__name__)
+    enrichment = _load_enrichment_pipeline(study_key)
+    if enrichment is not None:
+        logger.info("Enrichment pipeline triggered")
 
     if hierarchical:
         mapper = _record_mapper()(sdk)
         data = mapper.build_hierarchy(study_key, use_labels_as_keys=use_labels_as_columns)
+        with open(path, "w") as f:
+            json.dump(_enrich(enrichment, data), f, **kwargs)
     else:
-        df = _prepare_export_df(
-            sdk,
-            study_key,
+        config = TabularSinkConfig(
+            study_key=study_key,
+            batch_size=batch_size,
             use_labels_as_columns=use_labels_as_columns,
+            pipeline=pipeline,
         )
-        import pandas as pd
 
-        # Explicitly handle missing values when converting to dict
-        data = df.where(pd.notnull(df), None).to_dict(orient="records")
+        def _rows() -> Iterator[Any]:
+            for _, df in _iter_tabular_frames(sdk, study_key, config):
+                # Explicitly handle missing values when converting to dict
+                chunk = df.where(pd.notnull(df), None).to_dict(orient="records")
+                yield from _enrich(enrichment, chunk)
 
-    try:
-        from importlib.metadata import entry_points
+        with open(path, "w") as f:
+            _write_json_array(f, _rows(), **kwargs)
 
-        config_version_stores = list(
-            entry_points(group="imednet.stores", name="ConfigVersionStore")
-        )
-        if not config_version_stores:
-            raise ImportError("ConfigVersionStore plugin not found.")
+    if enrichment is not None:
+        logger.info("Enrichment pipeline completed successfully")
 
-        config_version_store_cls = config_version_stores[0].load()
-        enrichment_pipeline_cls = import_module(
-            "imednet.integrations.enrichment"
-        ).EnrichmentPipeline
 
-        store = config_version_store_cls()
-        history = store.get_history(study_key)
-        if history:
-            latest_commit = history[-1]["commit_id"]
-            config = store.rollback_config(study_key, latest_commit)
-
-            logger.info("Enrichment pipeline triggered")
-            pipeline = enrichment_pipeline_cls(config)
-            data = pipeline.process(data)
-            logger.info("Enrichment pipeline completed successfully")
-    except Exception as e:
-        logger.warning(f"Could not apply EnrichmentPipeline: {e}")
+def export_to_ndjson(
+    sdk: ImednetSDK,
+    study_key: str,
+    path: str,
+    *,
+    use_labels_as_columns: bool = False,
+    compression: NDJSONCompression | None = None,
+    max_bytes: int | None = None,
+    compresslevel: int | None = None,
+    sanitize: bool = True,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    pipeline: ExportPipelineConfig | None = None,
+) -> list[str]:
+    """Export study records as newline-delimited JSON, one record per line.
+
+    All exports now inherit StudyConfiguration rules by default.
+
+    Records are processed in ``batch_size`` chunks and each row is written
+    as soon as its chunk is masked, sanitised and enriched, so neither the
+    study nor the output is held in memory (see
+    :mod:`imednet.integrations.ndjson`).
+
+    Parameters
+    ----------
+    use_labels_as_columns:
+        When ``True``, variable labels are used for keys instead of variable
+        names.
+    compression:
+        ``"gzip"`` or ``"zstd"`` to compress every file. ``"zstd"`` requires
+        the optional ``zstandard`` package.
+    max_bytes:
+        Rotate to ``<stem>_2<suffixes>``, ``<stem>_3<suffixes>``, ... once a
+        file reaches this size on disk.
+    compresslevel:
+        Compression level forwarded to the compressor.
+    sanitize:
+        When ``True`` (the default), string values that spreadsheet tools
+        would evaluate as formulas are prefixed with ``'`` as in the CSV and
+        Excel exports.
+    batch_size:
+        Number of records per chunk.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation overlap with writing in
+        bounded background stages.
+
+    Returns:
+    -------
+    list[str]
+        The files written, in order.
+    """
+    enrichment = _load_enrichment_pipeline(study_key)
+    if enrichment is not None:
+        logger.info("Enrichment pipeline triggered")
 
-    with open(path, "w") as f:
-        json.dump(data, f, **kwargs)
+    config = TabularSinkConfig(
+        study_key=study_key,
+        batch_size=batch_size,
+        use_labels_as_columns=use_labels_as_columns,
+        pipeline=pipeline,
+    )
+    with NDJSONWriter(
+        path, compression=compression, max_bytes=max_bytes, compresslevel=compresslevel
+    ) as writer:
+        for _, df in _iter_tabular_frames(sdk, study_key, config, sanitize=sanitize):
+            chunk = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+            writer.write_rows(_enrich(enrichment, chunk))
+    if enrichment is not None:
+        logger.info("Enrichment pipeline completed successfully")
+    return writer.paths
 
 
 def export_to_sql(
@@ -551,6 +1573,8 @@ def export_to_sql(
     use_labels_as_columns: bool = False,
     variable_whitelist: list[str] | None = None,
     form_whitelist: list[int] | None = None,
+    pipeline: ExportPipelineConfig | None = None,
+    incremental: bool = False,
     **kwargs: Any,
 ) -> None:
     """Export study records to a SQL table.
@@ -562,6 +1586,16 @@ def export_to_sql(
     use_labels_as_columns:
         When ``True``, variable labels are used for column names instead of
         variable names.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation overlap with writing in
+        bounded background stages.
+    incremental:
+        When ``True`` and the manifest records a previous run for this
+        table, only records modified since that run's ``dateModified``
+        high-water mark are fetched; their rows are deleted and re-inserted.
+        Records hard-deleted upstream are never removed from the table; run
+        a full export to drop them.
     """
     from sqlalchemy import create_engine
 
@@ -576,7 +1610,14 @@ def export_to_sql(
             variable_whitelist=variable_whitelist,
             form_whitelist=form_whitelist,
             quality_gate_enabled=True,
+            pipeline=pipeline,
+            incremental=incremental,
         )
+    else:
+        if pipeline is not None:
+            config = replace(config, pipeline=pipeline)
+        if incremental:
+            config = replace(config, incremental=True)
 
     engine = create_engine(conn_str)
     sink = TabularSQLSink(table, engine, config)
@@ -592,11 +1633,18 @@ def export_to_duckdb(
     use_labels_as_columns: bool = False,
     variable_whitelist: list[str] | None = None,
     form_whitelist: list[int] | None = None,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    pipeline: ExportPipelineConfig | None = None,
 ) -> None:
-    """Export study records to a DuckDB table using native DataFrame registration.
+    """Export study records to a DuckDB table using native Arrow registration.
 
     All exports now inherit StudyConfiguration rules by default.
 
+    Records are converted straight into Arrow record batches typed from the
+    study's variable metadata and streamed into the table, which DuckDB
+    reads without a pandas round trip (see
+    :mod:`imednet.integrations.duckdb_arrow`).
+
     Parameters
     ----------
     sdk:
@@ -608,11 +1656,18 @@ def export_to_duckdb(
     table_name:
         Name of the destination DuckDB table.
     use_labels_as_columns:
-        When ``True``, variable labels are used for DataFrame column names.
+        When ``True``, variable labels are used for column names.
     variable_whitelist:
         Optional list of variable names to include.
     form_whitelist:
         Optional list of form IDs to include.
+    batch_size:
+        Number of records per chunk. Chunks are appended to the table in a
+        single transaction, so memory is bounded by one chunk.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, fetching and transformation overlap with writing in
+        bounded background stages.
 
     Raises:
     -------
@@ -627,22 +1682,19 @@ def export_to_duckdb(
             "Install with `pip install 'imednet[duckdb]'`."
         ) from error
 
-    df = _prepare_export_df(
-        sdk,
-        study_key,
+    config = TabularSinkConfig(
+        study_key=study_key,
+        batch_size=batch_size,
         use_labels_as_columns=use_labels_as_columns,
         variable_whitelist=variable_whitelist,
         form_whitelist=form_whitelist,
+        pipeline=pipeline,
     )
-
     conn: Any = duckdb.connect(db_path)
     try:
-        conn.register(_DUCKDB_DF_ALIAS, df)
-        conn.execute(
-            f"CREATE OR REPLACE TABLE {_quote_duckdb_identifier(table_name)} "
-            f"AS SELECT * FROM {_quote_duckdb_identifier(_DUCKDB_DF_ALIAS)}"
+        load_batches(
+            conn, table_name, (batch for _, batch in _iter_tabular_batches(sdk, study_key, config))
         )
-        conn.unregister(_DUCKDB_DF_ALIAS)
     finally:
         conn.close()
 
@@ -655,10 +1707,14 @@ def export_to_duckdb_by_form(
     use_labels_as_columns: bool = False,
     variable_whitelist: list[str] | None = None,
     form_whitelist: list[int] | None = None,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    pipeline: ExportPipelineConfig | None = None,
 ) -> None:
     """Export records to separate DuckDB tables for each form.
 
-    Each form is exported to a table named after ``form.form_key``.
+    Each form is exported to a table named after ``form.form_key``. Records
+    are fetched once for the study, routed to their form and loaded as Arrow
+    record batches typed from the form's variables.
 
     Parameters
     ----------
@@ -669,11 +1725,17 @@ def export_to_duckdb_by_form(
     db_path:
         Path to the target ``.duckdb`` database file.
     use_labels_as_columns:
-        When ``True``, variable labels are used for DataFrame column names.
+        When ``True``, variable labels are used for column names.
     variable_whitelist:
         Optional list of variable names to include.
     form_whitelist:
         Optional list of form IDs to include.
+    batch_size:
+        Number of records converted per Arrow record batch.
+    pipeline:
+        Optional :class:`~imednet.integrations.export_pipeline.ExportPipelineConfig`.
+        When given, record batches are built in bounded background stages
+        while earlier batches are loaded.
 
     Raises:
     -------
@@ -690,27 +1752,17 @@ def export_to_duckdb_by_form(
 
     conn: Any = duckdb.connect(db_path)
     try:
-        for form in sdk.forms.list(study_key=study_key):
-            if form.form_id is None or form.form_key is None:
-                continue
-            if form_whitelist is not None and form.form_id not in form_whitelist:
-                continue
-
-            df = _records_df(
-                sdk,
-                study_key,
-                use_labels_as_columns=use_labels_as_columns,
-                variable_whitelist=variable_whitelist,
-                form_whitelist=[form.form_id],
-            )
-            df = _mask_df(df)
-
-            conn.register(_DUCKDB_DF_ALIAS, df)
-            conn.execute(
-                f"CREATE OR REPLACE TABLE {_quote_duckdb_identifier(form.form_key)} "
-                f"AS SELECT * FROM {_quote_duckdb_identifier(_DUCKDB_DF_ALIAS)}"
-            )
-            conn.unregister(_DUCKDB_DF_ALIAS)
+        form_batches = _iter_form_batches(
+            sdk,
+            study_key,
+            use_labels_as_columns=use_labels_as_columns,
+            variable_whitelist=variable_whitelist,
+            form_whitelist=form_whitelist,
+            batch_size=batch_size,
+            pipeline=pipeline,
+        )
+        for form, items in itertools.groupby(form_batches, key=lambda item: item[0]):
+            load_batches(conn, form.form_key, (batch for _, batch in items))
     finally:
         conn.close()
 
@@ -724,56 +1776,27 @@ def export_to_sql_by_form(
     use_labels_as_columns: bool = False,
     variable_whitelist: list[str] | None = None,
     form_whitelist: list[int] | None = None,
+    pipeline: ExportPipelineConfig | None = None,
     **kwargs: Any,
 ) -> None:
-    """Export records to separate SQL tables for each form."""
+    """Export records to separate SQL tables for each form.
+
+    Forms, variables and records are fetched once for the whole study and
+    each record is routed to the table named after its ``form.form_key``.
+    When ``pipeline`` is given, per-form frames are built in bounded
+    background stages while earlier forms are written.
+    """
     from sqlalchemy import create_engine
 
-    mapper = _record_mapper()(sdk)
     engine = create_engine(conn_str)
-    forms = sdk.forms.list(study_key=study_key)
-
-    # Fetch all variables for the study once to avoid N+1 queries
-    _form_filter: dict[str, Any] = {"formIds": form_whitelist} if form_whitelist else {}
-    all_variables = sdk.variables.list(study_key=study_key, **_form_filter)
-    variables_by_form: dict[int, list[Any]] = {}
-    for v in all_variables:
-        if v.form_id is not None:
-            variables_by_form.setdefault(v.form_id, []).append(v)
-
-    for form in forms:
-        if form.form_id is None or form.form_key is None:
-            continue
-        if form_whitelist is not None and form.form_id not in form_whitelist:
-            continue
-        variables = variables_by_form.get(form.form_id, [])
-        variable_keys = [
-            v.variable_name
-            for v in variables
-            if variable_whitelist is None or v.variable_name in variable_whitelist
-        ]
-        label_map = {
-            v.variable_name: v.label for v in variables if v.variable_name in variable_keys
-        }
-        record_model = mapper._build_record_model(variable_keys, label_map)
-        records = mapper._fetch_records(
-            study_key,
-            extra_filters={
-                "formId": form.form_id,
-                **({"variableNames": variable_whitelist} if variable_whitelist else {}),
-            },
-        )
-        rows, _ = mapper._parse_records(records, record_model)
-        df = mapper._build_dataframe(
-            rows,
-            variable_keys,
-            label_map,
-            use_labels_as_columns,
-        )
-        if isinstance(df, pd.DataFrame):
-            dup_mask = df.columns.str.lower().duplicated()
-            df = df.loc[:, ~dup_mask]
-            df = _mask_df(df)
+    for form, df in _iter_form_frames(
+        sdk,
+        study_key,
+        use_labels_as_columns=use_labels_as_columns,
+        variable_whitelist=variable_whitelist,
+        form_whitelist=form_whitelist,
+        pipeline=pipeline,
+    ):
         _to_sql_with_chunking(
             df,
             form.form_key or "",
@@ -791,52 +1814,19 @@ def export_to_long_sql(
     *,
     chunk_size: int = 1000,
 ) -> None:
-    """Export records to a normalized long-format SQL table."""
-    if pd is None:
-        raise ImportError(
-            "pandas is required for export_to_long_sql. Install with "
-            "\"pip install 'imednet[export]'\"."
-        )
+    """Export records to a normalized long-format SQL table.
+
+    Records are streamed from the API (or the record cache), unpivoted into
+    batches of roughly ``chunk_size`` rows and bulk-loaded with the fastest
+    writer available for the target dialect. The table is replaced in a single
+    transaction; see :mod:`imednet.integrations.long_sql` for details.
+    """
     from sqlalchemy import create_engine
 
     engine = create_engine(conn_str)
-    mapper = _record_mapper()(sdk)
-    records = mapper._fetch_records(study_key)
-
-    rows: list[dict[str, Any]] = []
-    first = True
-    for rec in records:
-        timestamp = rec.date_modified
-        for name, value in (rec.record_data or {}).items():
-            if global_sensitivity_registry.is_sensitive(name):
-                masked_value = "***MASKED***"
-            else:
-                masked_value = mask_clinical_phi(value)
-
-            rows.append(
-                {
-                    "record_id": rec.record_id,
-                    "form_id": rec.form_id,
-                    "variable_name": name,
-                    "value": masked_value,
-                    "timestamp": timestamp,
-                }
-            )
-            if len(rows) >= chunk_size:
-                df = pd.DataFrame(rows)
-                df.to_sql(
-                    table_name,
-                    engine,
-                    if_exists="replace" if first else "append",
-                    index=False,
-                )
-                rows = []
-                first = False
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_sql(
-            table_name,
-            engine,
-            if_exists="replace" if first else "append",
-            index=False,
-        )
+    try:
+        mapper = _record_mapper()(sdk)
+        records = mapper._iter_records(study_key)
+        write_long_table(engine, table_name, iter_long_batches(records, chunk_size))
+    finally:
+        engine.dispose()
@@ -0,0 +1,130 @@
+"""Overlapped fetch, transform and write stages for tabular exports.
+
+Sequential exports leave the network, CPU and destination idle in turn: a
+batch is fetched, then parsed and masked, then written before the next fetch
+starts. :func:`iter_pipelined` overlaps the three stages:
+
+* **fetch** - one background thread drains the source iterator (API paging
+  is inherently sequential) and submits each batch for transformation;
+* **transform** - ``ExportPipelineConfig.transform_workers`` threads parse,
+  mask and sanitise batches concurrently;
+* **write** - the calling thread consumes results *in source order*, so sink
+  headers, ``if_exists`` handling and manifest entries match a sequential run.
+
+Backpressure is enforced with a semaphore: at most
+``ExportPipelineConfig.max_pending_batches`` batches are queued or being
+transformed, so memory is bounded by that many batches regardless of how far
+the fetch stage could run ahead of a slow writer.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+
+_POLL_INTERVAL = 0.1
+_DONE = object()
+
+
+@dataclass
+class ExportPipelineConfig:
+    """Stage sizing for pipelined exports.
+
+    Parameters
+    ----------
+    transform_workers:
+        Number of threads that parse, mask and sanitise batches.
+    max_pending_batches:
+        Maximum number of fetched batches that may be queued or in
+        transformation at once. Together with ``SinkConfig.batch_size`` this
+        bounds the memory held by the pipeline.
+    """
+
+    transform_workers: int = 2
+    max_pending_batches: int = 4
+
+    def __post_init__(self) -> None:
+        """Validate stage sizes after initialization."""
+        if self.transform_workers < 1:
+            raise ValueError("transform_workers must be at least 1")
+        if self.max_pending_batches < 1:
+            raise ValueError("max_pending_batches must be at least 1")
+
+
+@dataclass
+class _Failure:
+    error: BaseException
+
+
+def iter_pipelined(
+    source: Iterable[_T],
+    transform: Callable[[_T], _U],
+    config: ExportPipelineConfig,
+) -> Iterator[_U]:
+    """Yield ``transform(item)`` for every item of ``source``, in order.
+
+    ``source`` is consumed on a background thread and ``transform`` runs on a
+    thread pool while the caller handles earlier results. Errors raised by
+    either stage are re-raised in the caller. Closing the returned generator
+    early stops the fetch stage and cancels queued transforms.
+    """
+    slots = threading.Semaphore(config.max_pending_batches)
+    pending: queue.Queue[Any] = queue.Queue()
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(
+        max_workers=config.transform_workers,
+        thread_name_prefix="imednet-export-transform",
+    )
+
+    def _fetch() -> None:
+        iterator = iter(source)
+        try:
+            for item in iterator:
+                while not slots.acquire(timeout=_POLL_INTERVAL):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                pending.put(executor.submit(transform, item))
+        except BaseException as exc:
+            pending.put(_Failure(exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            pending.put(_DONE)
+
+    fetcher = threading.Thread(target=_fetch, name="imednet-export-fetch", daemon=True)
+    fetcher.start()
+    finished = False
+    try:
+        while True:
+            entry = pending.get()
+            if entry is _DONE:
+                finished = True
+                return
+            if isinstance(entry, _Failure):
+                raise entry.error
+            future: Future[_U] = entry
+            try:
+                result = future.result()
+            finally:
+                slots.release()
+            yield result
+    finally:
+        stop.set()
+        while not finished:
+            entry = pending.get()
+            if entry is _DONE:
+                finished = True
+            elif isinstance(entry, Future):
+                entry.cancel()
+        fetcher.join()
+        executor.shutdown(wait=True, cancel_futures=True)
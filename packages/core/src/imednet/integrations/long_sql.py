@@ -0,0 +1,224 @@
+"""Streaming long-format SQL writer used by :func:`export_to_long_sql`.
+
+Records are unpivoted into columnar :class:`LongBatch` objects of
+``(record_id, form_id, variable_name, value, timestamp)`` rows and each batch
+is bulk-loaded through the fastest path the SQLAlchemy dialect offers:
+
+* **SQLite** - one DBAPI ``executemany`` of pre-bound tuples.
+* **PostgreSQL** - ``COPY ... FROM STDIN`` with psycopg 3 or psycopg2.
+* **DuckDB** (``duckdb_engine``) - the batch is registered as an Arrow table
+  and appended with ``INSERT ... SELECT``.
+* **Anything else** - SQLAlchemy ``executemany``, which batches rows into
+  multi-row ``INSERT`` statements via *insertmanyvalues*.
+
+Values are stored as text: strings are kept as-is, containers are serialised
+as JSON after PHI masking and other scalars use ``str()``.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from importlib import import_module
+from itertools import repeat
+from typing import Any
+
+from imednet.utils.security import global_sensitivity_registry, mask_clinical_phi
+
+LONG_COLUMNS = ("record_id", "form_id", "variable_name", "value", "timestamp")
+
+_MASKED_VALUE = "***MASKED***"
+_DUCKDB_BATCH_ALIAS = "imednet_long_batch"
+
+
+@dataclass(slots=True)
+class LongBatch:
+    """Column-oriented batch of long-format rows."""
+
+    record_id: list[Any] = field(default_factory=list)
+    form_id: list[Any] = field(default_factory=list)
+    variable_name: list[str] = field(default_factory=list)
+    value: list[str | None] = field(default_factory=list)
+    timestamp: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Return the number of rows in the batch."""
+        return len(self.variable_name)
+
+    def columns(self) -> tuple[list[Any], ...]:
+        """Return the column lists in :data:`LONG_COLUMNS` order."""
+        return (self.record_id, self.form_id, self.variable_name, self.value, self.timestamp)
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate over the batch as row tuples."""
+        return zip(*self.columns(), strict=True)
+
+
+def _value_text(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(mask_clinical_phi(value), default=str)
+    return str(value)
+
+
+def iter_long_batches(records: Iterable[Any], batch_rows: int) -> Iterator[LongBatch]:
+    """Unpivot ``records`` into masked :class:`LongBatch` objects.
+
+    A batch is emitted once it holds at least ``batch_rows`` rows; a record's
+    variables are never split across batches. Sensitivity lookups are cached
+    per variable name for the duration of the iteration.
+    """
+    if batch_rows < 1:
+        raise ValueError("batch_rows must be at least 1")
+    sensitive: dict[str, bool] = {}
+    batch = LongBatch()
+    for rec in records:
+        data = rec.record_data or {}
+        if not data:
+            continue
+        count = len(data)
+        batch.record_id.extend(repeat(rec.record_id, count))
+        batch.form_id.extend(repeat(rec.form_id, count))
+        batch.timestamp.extend(repeat(rec.date_modified, count))
+        for name, value in data.items():
+            is_sensitive = sensitive.get(name)
+            if is_sensitive is None:
+                is_sensitive = sensitive[name] = global_sensitivity_registry.is_sensitive(name)
+            batch.variable_name.append(name)
+            batch.value.append(_MASKED_VALUE if is_sensitive else _value_text(value))
+        if len(batch) >= batch_rows:
+            yield batch
+            batch = LongBatch()
+    if len(batch):
+        yield batch
+
+
+def long_table(table_name: str, metadata: Any, sample: LongBatch) -> Any:
+    """Build the SQLAlchemy table for ``table_name``.
+
+    The ``timestamp`` column is a timezone-aware ``DateTime`` when the first
+    non-null timestamp of ``sample`` is a :class:`~datetime.datetime` and
+    ``Text`` otherwise.
+    """
+    sa = import_module("sqlalchemy")
+    first = next((ts for ts in sample.timestamp if ts is not None), None)
+    timestamp_type = (
+        sa.DateTime(timezone=first.tzinfo is not None) if isinstance(first, datetime) else sa.Text()
+    )
+    return sa.Table(
+        table_name,
+        metadata,
+        sa.Column("record_id", sa.BigInteger()),
+        sa.Column("form_id", sa.BigInteger()),
+        sa.Column("variable_name", sa.Text()),
+        sa.Column("value", sa.Text()),
+        sa.Column("timestamp", timestamp_type),
+    )
+
+
+def _bound_columns(conn: Any, table: Any, batch: LongBatch) -> list[list[Any]]:
+    """Apply each column type's bind processor, as SQLAlchemy would per row."""
+    bound = []
+    for column, values in zip(table.columns, batch.columns(), strict=True):
+        impl = column.type.dialect_impl(conn.dialect)
+        processor: Callable[[Any], Any] | None = impl.bind_processor(conn.dialect)
+        bound.append(values if processor is None else [processor(v) for v in values])
+    return bound
+
+
+def _insert_statement(conn: Any, table: Any, placeholder: str) -> str:
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(c.name) for c in table.columns)
+    values = ", ".join(repeat(placeholder, len(table.columns)))
+    return f"INSERT INTO {preparer.format_table(table)} ({columns}) VALUES ({values})"
+
+
+def _load_sqlite(conn: Any, table: Any, batch: LongBatch) -> None:
+    rows = list(zip(*_bound_columns(conn, table, batch), strict=True))
+    conn.exec_driver_sql(_insert_statement(conn, table, "?"), rows)
+
+
+def _pg_text_field(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    text = value.isoformat() if isinstance(value, datetime) else str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _load_postgresql(conn: Any, table: Any, batch: LongBatch) -> None:
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(c.name) for c in table.columns)
+    statement = f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN"
+    cursor = conn.connection.driver_connection.cursor()
+    try:
+        if conn.dialect.driver == "psycopg":
+            with cursor.copy(statement) as copy:
+                for row in batch.rows():
+                    copy.write_row(row)
+        else:
+            buffer = io.StringIO()
+            for row in batch.rows():
+                buffer.write("\t".join(_pg_text_field(v) for v in row))
+                buffer.write("\n")
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def _load_duckdb(conn: Any, table: Any, batch: LongBatch) -> None:
+    pa = import_module("pyarrow")
+    arrow_batch = pa.table(dict(zip(LONG_COLUMNS, batch.columns(), strict=True)))
+    raw = conn.connection.driver_connection
+    raw.register(_DUCKDB_BATCH_ALIAS, arrow_batch)
+    try:
+        preparer = conn.dialect.identifier_preparer
+        conn.exec_driver_sql(
+            f"INSERT INTO {preparer.format_table(table)} "
+            f"SELECT * FROM {preparer.quote(_DUCKDB_BATCH_ALIAS)}"
+        )
+    finally:
+        raw.unregister(_DUCKDB_BATCH_ALIAS)
+
+
+def _load_executemany(conn: Any, table: Any, batch: LongBatch) -> None:
+    conn.execute(
+        table.insert(), [dict(zip(LONG_COLUMNS, row, strict=True)) for row in batch.rows()]
+    )
+
+
+def load_long_batch(conn: Any, table: Any, batch: LongBatch) -> None:
+    """Append ``batch`` to ``table`` using the dialect's bulk-load path."""
+    dialect = conn.dialect
+    if dialect.name == "sqlite":
+        _load_sqlite(conn, table, batch)
+    elif dialect.name == "postgresql" and dialect.driver in ("psycopg", "psycopg2"):
+        _load_postgresql(conn, table, batch)
+    elif dialect.name == "duckdb":
+        _load_duckdb(conn, table, batch)
+    else:
+        _load_executemany(conn, table, batch)
+
+
+def write_long_table(engine: Any, table_name: str, batches: Iterable[LongBatch]) -> int:
+    """Replace ``table_name`` with ``batches`` in a single transaction.
+
+    Nothing is created when ``batches`` is empty. Returns the number of rows
+    written.
+    """
+    sa = import_module("sqlalchemy")
+    written = 0
+    table = None
+    with engine.begin() as conn:
+        for batch in batches:
+            if table is None:
+                table = long_table(table_name, sa.MetaData(), batch)
+                table.drop(conn, checkfirst=True)
+                table.create(conn)
+            load_long_batch(conn, table, batch)
+            written += len(batch)
+    return written
@@ -0,0 +1,170 @@
+"""Newline-delimited JSON files with optional compression and size rotation.
+
+:class:`NDJSONWriter` writes one JSON object per line as rows arrive, so
+downstream tools can stream the output without parsing a whole document:
+
+* ``compression="gzip"`` uses :mod:`gzip`; ``compression="zstd"`` needs the
+  optional ``zstandard`` package. Every file is a complete compressed
+  stream;
+* with ``max_bytes`` set, a new file is started whenever the next line
+  would take the current one past ``max_bytes`` of NDJSON, and writing
+  continues in ``<stem>_2<suffixes>``, ``<stem>_3<suffixes>``, ... next to
+  the requested path. The limit applies to the uncompressed text, which
+  is known exactly while compressors buffer their output. Lines are never
+  split, so a single longer line gets a file of its own.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, Literal
+
+NDJSONCompression = Literal["gzip", "zstd"]
+
+COMPRESSION_SUFFIXES: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def rotated_path(path: str, index: int) -> str:
+    """Return the path of file ``index`` (1-based) in a rotated series at ``path``.
+
+    The first file is ``path`` itself; later ones insert ``_<index>`` before
+    the format suffix and any compression suffix, e.g. ``records_2.ndjson.gz``.
+    """
+    if index == 1:
+        return path
+    target = Path(path)
+    suffixes = target.suffix
+    stem = target.stem
+    if suffixes in COMPRESSION_SUFFIXES.values() and Path(stem).suffix:
+        suffixes = Path(stem).suffix + suffixes
+        stem = Path(stem).stem
+    return str(target.with_name(f"{stem}_{index}{suffixes}"))
+
+
+class NDJSONWriter:
+    """Stream JSON lines to one file or a size-rotated series of files.
+
+    Parameters
+    ----------
+    path:
+        Destination of the first file.
+    compression:
+        ``None``, ``"gzip"`` or ``"zstd"``.
+    max_bytes:
+        Uncompressed size each file is kept within, or ``None`` for a
+        single file.
+    compresslevel:
+        Compression level passed to the compressor. Defaults to 6 for gzip
+        and 3 for zstd.
+
+    Use the writer as a context manager: files are completed when the block
+    exits normally, while an error removes every file written so far.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        compression: NDJSONCompression | None = None,
+        max_bytes: int | None = None,
+        compresslevel: int | None = None,
+    ) -> None:
+        """Validate the options; the first file is opened on the first line."""
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported NDJSON compression: {compression!r}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError as error:
+                raise ImportError(
+                    "zstd compression requires the optional 'zstandard' dependency. "
+                    'Install with "pip install zstandard".'
+                ) from error
+            self._zstd: Any = zstandard
+        self.path = path
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+        self.paths: list[str] = []
+        self._raw: Any = None
+        self._stream: Any = None
+        self._size = 0
+
+    def __enter__(self) -> NDJSONWriter:
+        """Return the writer."""
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        """Close the open file, or remove all files when the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, row: Mapping[str, Any]) -> None:
+        """Append ``row`` as one JSON line, rotating first when it would not fit."""
+        line = (json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        if self._stream is None:
+            self._open()
+        elif self.max_bytes is not None and self._size and self._size + len(line) > self.max_bytes:
+            self._close_file()
+            self._open()
+        self._stream.write(line)
+        self._size += len(line)
+
+    def write_rows(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Append every row of ``rows`` and return how many were written."""
+        count = 0
+        for row in rows:
+            self.write(row)
+            count += 1
+        return count
+
+    def _open(self) -> None:
+        path = rotated_path(self.path, len(self.paths) + 1)
+        self.paths.append(path)
+        self._raw = open(path, "wb")  # noqa: SIM115 - closed in _close_file
+        if self.compression == "gzip":
+            level = 6 if self.compresslevel is None else self.compresslevel
+            self._stream = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self._raw, compresslevel=level, mtime=0
+            )
+        elif self.compression == "zstd":
+            level = 3 if self.compresslevel is None else self.compresslevel
+            self._stream = self._zstd.ZstdCompressor(level=level).stream_writer(
+                self._raw, closefd=False
+            )
+        else:
+            self._stream = self._raw
+        self._size = 0
+
+    def _close_file(self) -> None:
+        if self._stream is not None and self._stream is not self._raw:
+            self._stream.close()
+        if self._raw is not None:
+            self._raw.close()
+        self._stream = self._raw = None
+
+    def close(self) -> list[str]:
+        """Complete the open file and return the paths of all files written.
+
+        A writer that received no rows still creates an empty file at
+        ``path``.
+        """
+        if not self.paths:
+            self._open()
+        self._close_file()
+        return list(self.paths)
+
+    def abort(self) -> None:
+        """Close the open file and remove every file written so far."""
+        self._close_file()
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
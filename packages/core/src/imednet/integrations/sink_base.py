@@ -30,7 +30,10 @@ Shared contracts
   :meth:`ExportSink.write_batch` once per batch.  The ``batch_id`` parameter
   is a caller-supplied idempotency key (e.g. ``"<study_key>/<form_key>/<n>"``).
 * **Chunk sizing** – ``SinkConfig.batch_size`` controls the number of records
-  per batch (default 500).
+  per batch (default 500).  With ``SinkConfig.adaptive_batching`` set, each
+  sink tunes its batch size within the policy's bounds from the latency,
+  retries and payload size of the batches it writes; callers ask for the
+  next size with :meth:`ExportSink.next_batch_size`.
 * **Retries** – sinks must honour ``SinkConfig.max_retries`` and use
   ``SinkConfig.retry_backoff`` as the base delay between attempts.
 * **Idempotent writes** – when ``SinkConfig.idempotent`` is ``True`` (default)
@@ -39,6 +42,19 @@ Shared contracts
 * **Error propagation** – transient errors are retried; permanent errors raise
   :class:`~imednet.errors.ExportBatchError` (includes ``batch_id``) or
   :class:`~imednet.errors.ExportConfigurationError`.
+* **Async sinks** – :class:`AsyncExportSink` mirrors the contract with
+  coroutine methods and retries on the event loop; :class:`SyncSinkAdapter`
+  runs a synchronous sink in worker threads so that async pipelines can use
+  any sink.
+* **Dead letters** – with ``SinkConfig.dead_letter_path`` set, a batch that
+  fails with a data error is split until its bad records are isolated; the
+  good records are written and the bad ones kept in a
+  :class:`DeadLetterStore` for :meth:`DeadLetterStore.replay`.
+* **Checkpoints** – with ``SinkConfig.checkpoint_path`` set, callers write
+  through :meth:`ExportSink.write_batch_checkpointed`, which records every
+  committed batch in a :class:`BatchCheckpointStore` keyed by study, sink and
+  :func:`batch_digest`; a rerun after a failure skips the batches already
+  committed, and a clean exit clears the checkpoints of the run.
 * **Logging** – sinks use ``logging.getLogger(__name__)`` and must not log
   raw credentials or full URIs.  Pass URIs through :func:`_redact_uri` before
   logging.
@@ -70,13 +86,33 @@ Public-API exposure rules
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
 import re
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from contextlib import closing
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from importlib import import_module
-from types import TracebackType
+from itertools import islice
+from pathlib import Path
+from types import SimpleNamespace, TracebackType
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -89,6 +125,208 @@ _DEFAULT_BATCH_SIZE = 500
 _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_RETRY_BACKOFF = 1.0
 
+# Adaptive batching ignores resizes smaller than this fraction of the current
+# size, so measurement noise does not make the size jitter around its target.
+_MIN_RESIZE_RATIO = 0.1
+_MAX_DECISIONS = 256
+
+
+@dataclass
+class AdaptiveBatchPolicy:
+    """Bounds and targets for tuning the batch size of a sink while it writes.
+
+    Parameters
+    ----------
+    min_batch_size:
+        Smallest batch size the policy may choose.
+    max_batch_size:
+        Largest batch size the policy may choose.
+    target_latency:
+        Seconds one batch write should take.  Batches are resized towards
+        ``target_latency`` divided by the smoothed write time per record.
+    max_batch_bytes:
+        Upper bound on the serialised payload of one batch, or ``None`` for
+        no bound.
+    growth_factor:
+        Largest factor by which one decision may grow the batch size.
+    shrink_factor:
+        Factor applied to the batch size after a write needed retries.
+    max_error_rate:
+        Smoothed share of failed write attempts above which the batch size
+        is not grown.
+    smoothing:
+        Weight of the newest observation in the moving averages (``0`` to
+        ``1``).
+    """
+
+    min_batch_size: int = 50
+    max_batch_size: int = 5000
+    target_latency: float = 2.0
+    max_batch_bytes: int | None = 8 * 1024 * 1024
+    growth_factor: float = 2.0
+    shrink_factor: float = 0.5
+    max_error_rate: float = 0.1
+    smoothing: float = 0.3
+
+    def __post_init__(self) -> None:
+        """Validate the bounds and factors of the policy."""
+        if self.min_batch_size < 1 or self.max_batch_size < self.min_batch_size:
+            raise ValueError("batch size bounds must satisfy 1 <= min_batch_size <= max_batch_size")
+        if self.target_latency <= 0:
+            raise ValueError("target_latency must be positive")
+        if self.max_batch_bytes is not None and self.max_batch_bytes < 1:
+            raise ValueError("max_batch_bytes must be positive")
+        if self.growth_factor <= 1 or not 0 < self.shrink_factor < 1:
+            raise ValueError("growth_factor must exceed 1 and shrink_factor lie between 0 and 1")
+        if not 0 <= self.max_error_rate <= 1 or not 0 < self.smoothing <= 1:
+            raise ValueError("max_error_rate and smoothing must lie between 0 and 1")
+
+
+@dataclass(frozen=True)
+class BatchSizeDecision:
+    """A batch size change made by :class:`AdaptiveBatchSizer`.
+
+    Parameters
+    ----------
+    batch_id:
+        Batch whose observation led to the change.
+    previous:
+        Batch size before the change.
+    batch_size:
+        Batch size after the change.
+    reason:
+        ``"errors"``, ``"payload"`` or ``"latency"``.
+    seconds_per_record:
+        Smoothed write time per record at the time of the decision.
+    bytes_per_record:
+        Smoothed payload size per record, or ``None`` when not measured.
+    error_rate:
+        Smoothed share of failed write attempts.
+    """
+
+    batch_id: str
+    previous: int
+    batch_size: int
+    reason: str
+    seconds_per_record: float
+    bytes_per_record: float | None
+    error_rate: float
+
+
+class AdaptiveBatchSizer:
+    """Tune a batch size from observed writes according to an :class:`AdaptiveBatchPolicy`.
+
+    After each write the size moves towards the one expected to take
+    ``target_latency``, capped by ``max_batch_bytes``; a write that needed
+    retries shrinks it by ``shrink_factor``.  Growth is limited to
+    ``growth_factor`` per write and paused while the error rate is above
+    ``max_error_rate``.  Changes are logged and kept in :attr:`decisions`
+    (the most recent 256).  Observations may come from several threads.
+    """
+
+    def __init__(self, policy: AdaptiveBatchPolicy, initial: int) -> None:
+        """Start from *initial*, clamped to the bounds of *policy*."""
+        self.policy = policy
+        self.decisions: deque[BatchSizeDecision] = deque(maxlen=_MAX_DECISIONS)
+        self._batch_size = self._clamp(initial)
+        self._seconds_per_record: float | None = None
+        self._bytes_per_record: float | None = None
+        self._error_rate = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def batch_size(self) -> int:
+        """The batch size to use for the next batch."""
+        return self._batch_size
+
+    def restore(self, batch_size: int) -> None:
+        """Continue from *batch_size*, such as one recorded by an earlier run."""
+        with self._lock:
+            self._batch_size = self._clamp(batch_size)
+
+    def _clamp(self, size: float) -> int:
+        return max(self.policy.min_batch_size, min(self.policy.max_batch_size, int(size)))
+
+    def _smooth(self, average: float | None, value: float) -> float:
+        if average is None:
+            return value
+        return average + self.policy.smoothing * (value - average)
+
+    def observe(
+        self,
+        batch_id: str,
+        records: int,
+        seconds: float,
+        *,
+        payload_bytes: int | None = None,
+        attempts: int = 1,
+        failures: int = 0,
+    ) -> BatchSizeDecision | None:
+        """Record one batch write and return the resulting size change, if any.
+
+        Parameters
+        ----------
+        batch_id:
+            Batch that was written.
+        records:
+            Records written; ``0`` when the write failed.
+        seconds:
+            Wall-clock time of the write, retries included.
+        payload_bytes:
+            Serialised size of the batch, when known.
+        attempts:
+            Write attempts made.
+        failures:
+            Attempts that raised.
+        """
+        policy = self.policy
+        with self._lock:
+            previous = self._batch_size
+            self._error_rate = self._smooth(self._error_rate, failures / max(attempts, 1))
+            if records > 0 and failures < attempts:
+                self._seconds_per_record = self._smooth(
+                    self._seconds_per_record, seconds / attempts / records
+                )
+                if payload_bytes is not None:
+                    self._bytes_per_record = self._smooth(
+                        self._bytes_per_record, payload_bytes / records
+                    )
+
+            target = float(previous)
+            reason = "latency"
+            if self._seconds_per_record:
+                target = min(
+                    policy.target_latency / self._seconds_per_record,
+                    previous * policy.growth_factor,
+                )
+            if self._error_rate > policy.max_error_rate:
+                target = min(target, previous)
+            if policy.max_batch_bytes is not None and self._bytes_per_record:
+                by_payload = policy.max_batch_bytes / self._bytes_per_record
+                if by_payload < target:
+                    target, reason = by_payload, "payload"
+            if failures and previous * policy.shrink_factor < target:
+                target, reason = previous * policy.shrink_factor, "errors"
+
+            batch_size = self._clamp(target)
+            if batch_size == previous or (
+                reason == "latency" and abs(batch_size - previous) < previous * _MIN_RESIZE_RATIO
+            ):
+                return None
+            self._batch_size = batch_size
+            decision = BatchSizeDecision(
+                batch_id=batch_id,
+                previous=previous,
+                batch_size=batch_size,
+                reason=reason,
+                seconds_per_record=self._seconds_per_record or 0.0,
+                bytes_per_record=self._bytes_per_record,
+                error_rate=self._error_rate,
+            )
+            self.decisions.append(decision)
+        logger.info("Batch size %d -> %d after %s (%s)", previous, batch_size, batch_id, reason)
+        return decision
+
 
 @dataclass
 class SinkConfig:
@@ -108,6 +346,19 @@ class SinkConfig:
     idempotent:
         When ``True``, sinks use upsert / replace semantics so that replaying
         a batch with the same ``batch_id`` produces no duplicate data.
+    adaptive_batching:
+        Optional :class:`AdaptiveBatchPolicy`.  When set, ``batch_size`` is
+        only the starting size and the sink tunes it while writing.
+    dead_letter_path:
+        Optional path of a SQLite :class:`DeadLetterStore`.  When set, a
+        batch that fails with a data error is split to write its good
+        records, and the records it still cannot write are stored there
+        instead of failing the batch.
+    checkpoint_path:
+        Optional path of a SQLite :class:`BatchCheckpointStore`.  When set,
+        :meth:`ExportSink.write_batch_checkpointed` records each committed
+        batch there and skips batches a failed earlier run already
+        committed; the checkpoints are cleared once an export completes.
     """
 
     study_key: str
@@ -119,6 +370,9 @@ class SinkConfig:
     quality_gate_enabled: bool = False
     min_schema_readiness_score: float = 100.0
     tracer: Any | None = field(default=None, repr=False)
+    adaptive_batching: AdaptiveBatchPolicy | None = None
+    dead_letter_path: str | None = None
+    checkpoint_path: str | None = None
 
     def __post_init__(self):  # type: ignore[no-untyped-def]
         """Validate config properties after initialization."""
@@ -127,11 +381,563 @@ class SinkConfig:
 
 
 # ---------------------------------------------------------------------------
-# Abstract base class
+# Dead-letter and checkpoint stores
 # ---------------------------------------------------------------------------
 
 
-class ExportSink(ABC):
+class _SQLiteStore:
+    """SQLite file holding one table; every call opens its own connection."""
+
+    _schema = ""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open the store at *path*, creating it and its table when missing."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(self._schema)
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        return closing(sqlite3.connect(self.path))
+
+    def _write(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Run *sql* once per row in one transaction and return the rows changed."""
+        with self._lock, self._connect() as conn, conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> list[Any]:
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+
+_DEAD_LETTER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sink TEXT NOT NULL,
+    study_key TEXT NOT NULL,
+    batch_id TEXT NOT NULL,
+    record_type TEXT NOT NULL,
+    record TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    failed_at TEXT NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """One record a sink could not write, as kept by :class:`DeadLetterStore`.
+
+    Parameters
+    ----------
+    id:
+        Row id of the entry in the store.
+    sink:
+        Class name of the sink that failed to write the record.
+    study_key:
+        Study the record belongs to.
+    batch_id:
+        Batch the record was written in.
+    record:
+        The record, decoded from its JSON form.
+    reason:
+        Type and message of the last error writing the record.
+    failed_at:
+        ISO-8601 UTC time the record was stored.
+    """
+
+    id: int
+    sink: str
+    study_key: str
+    batch_id: str
+    record: Any
+    reason: str
+    failed_at: str
+
+
+def _record_payload(record: Any) -> tuple[str, str]:
+    """Return the type tag and the deterministic JSON form of *record*."""
+    if hasattr(record, "model_dump_json"):
+        cls = type(record)
+        return f"{cls.__module__}:{cls.__qualname__}", record.model_dump_json(
+            by_alias=True, exclude_defaults=True
+        )
+    if hasattr(record, "__dict__"):
+        return "object", json.dumps(vars(record), default=str, sort_keys=True)
+    return "json", json.dumps(record, default=str, sort_keys=True)
+
+
+def batch_digest(records: Iterable[Any]) -> str:
+    """Return the SHA-256 hex digest of the content of *records*, in order.
+
+    Records with the same fields give the same digest in every process, so
+    a rerun recognises the batches an earlier run committed.
+    """
+    digest = hashlib.sha256()
+    for record in records:
+        record_type, payload = _record_payload(record)
+        digest.update(f"{record_type}\n{payload}\n".encode())
+    return digest.hexdigest()
+
+
+def _restore_record(record_type: str, record: Any) -> Any:
+    """Rebuild a stored record so that sinks can read it like the original."""
+    if record_type == "json":
+        return record
+    if record_type == "object":
+        return SimpleNamespace(**record)
+    module, _, qualname = record_type.partition(":")
+    cls: Any = getattr(import_module(module), qualname, None)
+    if cls is None:
+        # Models built by ModelEngine report its module but are exported by imednet.models.
+        cls = getattr(import_module("imednet.models"), qualname, None)
+    if not hasattr(cls, "model_validate"):
+        raise TypeError(f"Cannot restore dead letter of type {record_type!r}")
+    return cls.model_validate(record)
+
+
+class DeadLetterStore(_SQLiteStore):
+    """SQLite table of records that sinks could not write, for later replay.
+
+    Sinks configured with ``SinkConfig.dead_letter_path`` add the records
+    they give up on; :meth:`replay` writes them again once the cause is
+    fixed.  Records are stored as JSON: Pydantic models are rebuilt with
+    ``model_validate``, other objects as :class:`types.SimpleNamespace` and
+    dicts and plain values as decoded.
+    Every call opens its own connection, so one store may be shared by the
+    worker threads of a sink.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file; created with its table when missing.
+    """
+
+    _schema = _DEAD_LETTER_SCHEMA
+
+    def add(
+        self,
+        records: Sequence[Any],
+        errors: Sequence[Exception],
+        *,
+        sink: str,
+        study_key: str,
+        batch_id: str,
+    ) -> None:
+        """Store *records* with the error each failed with, in one transaction."""
+        failed_at = datetime.now(tz=timezone.utc).isoformat()
+        rows = [
+            (sink, study_key, batch_id, *_record_payload(record), _describe(error), failed_at)
+            for record, error in zip(records, errors, strict=True)
+        ]
+        self._write(
+            "INSERT INTO dead_letters "
+            "(sink, study_key, batch_id, record_type, record, reason, failed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def entries(self, *, sink: str | None = None, study_key: str | None = None) -> list[DeadLetter]:
+        """Return the stored records, oldest first, optionally for one sink or study."""
+        return [entry for entry, _ in self._select(sink, study_key)]
+
+    def _select(self, sink: str | None, study_key: str | None) -> list[tuple[DeadLetter, str]]:
+        query = (
+            "SELECT id, sink, study_key, batch_id, record, reason, failed_at, record_type "
+            "FROM dead_letters WHERE (? IS NULL OR sink = ?) AND (? IS NULL OR study_key = ?) "
+            "ORDER BY id"
+        )
+        rows = self._query(query, (sink, sink, study_key, study_key))
+        return [
+            (DeadLetter(id_, sink_, study, batch_id, json.loads(record), reason, failed_at), kind)
+            for id_, sink_, study, batch_id, record, reason, failed_at, kind in rows
+        ]
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """Delete the entries with the given row ids."""
+        self._write("DELETE FROM dead_letters WHERE id = ?", [(i,) for i in ids])
+
+    def replay(self, sink: ExportSink, *, batch_size: int | None = None) -> int:
+        """Write the records stored for *sink* again and remove those written.
+
+        Entries are selected by the sink's class name and study key and
+        written in batches of ``batch_size`` (default: the sink's next batch
+        size), each with batch id ``<study_key>/dead-letters/<first row id>``.
+        Each batch is flushed before its entries are removed; records that
+        fail again are dead-lettered anew by a sink that has a store.
+
+        Returns:
+        -------
+        int
+            Number of records the sink reported as written.
+        """
+        selected = self._select(type(sink).__name__, sink.config.study_key)
+        written = 0
+        for chunk in iter_batches(selected, batch_size or sink.next_batch_size):
+            records = [_restore_record(record_type, entry.record) for entry, record_type in chunk]
+            written += sink.write_batch(
+                records, batch_id=f"{sink.config.study_key}/dead-letters/{chunk[0][0].id}"
+            )
+            sink.flush()
+            self.remove(entry.id for entry, _ in chunk)
+        logger.info("Replayed %d dead letters through %s", written, type(sink).__name__)
+        return written
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        count: int = self._query("SELECT COUNT(*) FROM dead_letters")[0][0]
+        return count
+
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_checkpoints (
+    study_key TEXT NOT NULL,
+    sink TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    batch_id TEXT NOT NULL,
+    records INTEGER NOT NULL,
+    next_batch_size INTEGER NOT NULL,
+    committed_at TEXT NOT NULL,
+    PRIMARY KEY (study_key, sink, digest)
+)
+"""
+
+
+@dataclass(frozen=True)
+class BatchCheckpoint:
+    """A batch a sink committed, as kept by :class:`BatchCheckpointStore`.
+
+    Parameters
+    ----------
+    study_key:
+        Study the batch belongs to.
+    sink:
+        Destination the batch was written to, such as
+        ``"mongodb:mongodb://***@host/db.collection"``.
+    digest:
+        :func:`batch_digest` of the records of the batch.
+    batch_id:
+        ``batch_id`` the batch was written with.
+    records:
+        Number of records the sink reported as written.
+    next_batch_size:
+        Batch size the sink asked for after this batch.  It is restored
+        when the batch is skipped, so adaptive batching cuts a rerun into
+        the same batches.
+    committed_at:
+        ISO-8601 UTC time the checkpoint was committed.
+    """
+
+    study_key: str
+    sink: str
+    digest: str
+    batch_id: str
+    records: int
+    next_batch_size: int
+    committed_at: str
+
+
+class BatchCheckpointStore(_SQLiteStore):
+    """SQLite table of the batches sinks committed, for resuming interrupted exports.
+
+    A checkpoint is keyed by study, destination and the digest of the
+    batch content, so a rerun that fetches the same records skips every
+    batch already committed and resumes at the first one that was not,
+    while a batch whose records changed is written again.  Checkpoints only
+    outlive a failed export: a sink clears those of its study and
+    destination when an export completes.  Every call opens its own
+    connection.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file; created with its table when missing.
+    """
+
+    _schema = _CHECKPOINT_SCHEMA
+
+    def get(self, study_key: str, sink: str, digest: str) -> BatchCheckpoint | None:
+        """Return the checkpoint of the batch with *digest*, or ``None``."""
+        rows = self._query(
+            "SELECT * FROM batch_checkpoints WHERE study_key = ? AND sink = ? AND digest = ?",
+            (study_key, sink, digest),
+        )
+        return BatchCheckpoint(*rows[0]) if rows else None
+
+    def commit(self, checkpoints: Iterable[BatchCheckpoint]) -> None:
+        """Record *checkpoints* in one transaction, replacing any with the same key."""
+        self._write(
+            "INSERT OR REPLACE INTO batch_checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [dataclasses.astuple(checkpoint) for checkpoint in checkpoints],
+        )
+
+    def entries(
+        self, *, study_key: str | None = None, sink: str | None = None
+    ) -> list[BatchCheckpoint]:
+        """Return the checkpoints, oldest first, optionally for one study or sink."""
+        rows = self._query(
+            "SELECT * FROM batch_checkpoints WHERE (? IS NULL OR study_key = ?) "
+            "AND (? IS NULL OR sink = ?) ORDER BY rowid",
+            (study_key, study_key, sink, sink),
+        )
+        return [BatchCheckpoint(*row) for row in rows]
+
+    def clear(self, study_key: str, *, sink: str | None = None) -> int:
+        """Forget the checkpoints of *study_key*, optionally for one sink only.
+
+        The next export of the study then writes every batch again.
+
+        Returns:
+        -------
+        int
+            Number of checkpoints removed.
+        """
+        return self._write(
+            "DELETE FROM batch_checkpoints WHERE study_key = ? AND (? IS NULL OR sink = ?)",
+            [(study_key, sink, sink)],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of checkpoints."""
+        count: int = self._query("SELECT COUNT(*) FROM batch_checkpoints")[0][0]
+        return count
+
+
+def _describe(exc: BaseException) -> str:
+    """Return ``"<type>: <message>"`` for *exc*."""
+    return f"{type(exc).__name__}: {exc}"
+
+
+# ---------------------------------------------------------------------------
+# Abstract base classes
+# ---------------------------------------------------------------------------
+
+
+class _SinkBase:
+    """Configuration, adaptive batching and retry plumbing shared by all sinks."""
+
+    def __init__(self, config: SinkConfig) -> None:
+        """Initialize the export sink with a configuration."""
+        self.config: SinkConfig = config
+        self.batch_sizer: AdaptiveBatchSizer | None = None
+        policy = getattr(config, "adaptive_batching", None)
+        if policy is not None:
+            self.batch_sizer = AdaptiveBatchSizer(policy, config.batch_size)
+        self.dead_letters: DeadLetterStore | None = None
+        dead_letter_path = getattr(config, "dead_letter_path", None)
+        if dead_letter_path:
+            self.dead_letters = DeadLetterStore(dead_letter_path)
+        self.checkpoints: BatchCheckpointStore | None = None
+        checkpoint_path = getattr(config, "checkpoint_path", None)
+        if checkpoint_path:
+            self.checkpoints = BatchCheckpointStore(checkpoint_path)
+        self._unconfirmed: list[BatchCheckpoint] = []
+        self._checkpoint_lock = threading.Lock()
+        self.skipped_batches: list[str] = []
+
+    def next_batch_size(self) -> int:
+        """Return the number of records to pass to the next ``write_batch``.
+
+        This is ``config.batch_size`` unless adaptive batching is enabled.
+        """
+        if self.batch_sizer is None:
+            return self.config.batch_size
+        return self.batch_sizer.batch_size
+
+    def _executor(self, operation_name: str, batch_id: str, *, isolating: bool = False) -> Any:
+        """Return a :class:`~imednet.core.operations.executor.UniversalExecutor` for one batch.
+
+        With *isolating* set, the batch's rejected records are split off into
+        the dead-letter store, so data errors (see :meth:`_record_error`) are
+        not retried: the whole batch would fail again.  Only the remaining
+        errors, such as connection failures and timeouts, back off and retry.
+        """
+        from imednet.core.operations.executor import UniversalExecutor
+
+        return UniversalExecutor(
+            retries=self.config.max_retries,
+            backoff_factor=self.config.retry_backoff,
+            tracer=self.config.tracer,
+            operation_name=operation_name,
+            retry_predicate=self._retry_transient if isolating else None,
+            batch_id=batch_id,
+        )
+
+    def _retry_transient(self, retry_state: Any) -> bool:
+        """Return whether a failed attempt should be retried rather than isolated."""
+        outcome = retry_state.outcome
+        if outcome is None or not outcome.failed:
+            return False
+        exc = outcome.exception()
+        return isinstance(exc, Exception) and not self._record_error(exc)
+
+    def _batch_error(self, batch_id: str, exc: Exception) -> Exception:
+        """Return the :class:`~imednet.errors.ExportBatchError` for a batch that failed."""
+        from imednet.errors import ExportBatchError
+
+        return ExportBatchError(
+            f"Batch {batch_id!r} failed after {self.config.max_retries + 1} attempts: {exc}",
+            batch_id=batch_id,
+        )
+
+    def _record_error(self, exc: Exception) -> bool:
+        """Return whether *exc* may be caused by the records rather than the destination.
+
+        Only such errors are isolated by splitting the batch; connection
+        failures, timeouts and an open circuit breaker fail the batch.
+        Sinks refine this with the error types of their driver.
+        """
+        from imednet.core.operations.circuit_breaker import CircuitBreakerError
+
+        return not isinstance(exc, (ConnectionError, TimeoutError, CircuitBreakerError))
+
+    def _isolation_error(self, batch_id: str, exc: Exception) -> Exception | None:
+        """Return the batch error to raise instead of isolating the records *exc* failed."""
+        if self.dead_letters is None or not self._record_error(exc):
+            return self._batch_error(batch_id, exc)
+        return None
+
+    def _dead_letter(
+        self,
+        batch_id: str,
+        total: int,
+        failed: list[tuple[Any, Exception]],
+    ) -> None:
+        """Store the records of *batch_id* that could not be written on their own.
+
+        The destination answered every write of the isolated batch, so its
+        rejections are not counted as outages by the circuit breaker.
+        """
+        from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+        assert self.dead_letters is not None
+        get_global_circuit_breaker().record_success()
+        records, errors = zip(*failed, strict=True) if failed else ((), ())
+        self.dead_letters.add(
+            records,
+            errors,
+            sink=type(self).__name__,
+            study_key=self.config.study_key,
+            batch_id=batch_id,
+        )
+        logger.warning(
+            "Batch %s: wrote %d of %d records; %d stored in dead letters at %s (first error: %s)",
+            batch_id,
+            total - len(failed),
+            total,
+            len(failed),
+            self.dead_letters.path,
+            _describe(failed[0][1]) if failed else "none",
+        )
+
+    def _checkpoint_name(self) -> str:
+        """Return the destination name checkpoints are kept under.
+
+        Sinks name their destination, so that sync and async sinks writing
+        to the same place share checkpoints; the class name is the default.
+        """
+        return type(self).__name__
+
+    def _durable(self, batch_id: str) -> bool:
+        """Return whether *batch_id* is committed at the destination.
+
+        Sinks that return from ``write_batch`` before the write is done
+        override this; their checkpoints wait until it returns ``True``.
+        """
+        return True
+
+    def _committed(self, records: Sequence[Any], batch_id: str) -> str | None:
+        """Return the digest of a batch to write, or ``None`` if a checkpoint covers it."""
+        assert self.checkpoints is not None
+        digest = batch_digest(records)
+        checkpoint = self.checkpoints.get(self.config.study_key, self._checkpoint_name(), digest)
+        if checkpoint is None:
+            return digest
+        self.skipped_batches.append(batch_id)
+        logger.info(
+            "Skipping batch %s: committed as %s at %s",
+            batch_id,
+            checkpoint.batch_id,
+            checkpoint.committed_at,
+        )
+        if self.batch_sizer is not None:
+            self.batch_sizer.restore(checkpoint.next_batch_size)
+        return None
+
+    def _stage_checkpoint(self, batch_id: str, digest: str, written: int) -> None:
+        """Hold the checkpoint of a written batch until it is durable, then commit."""
+        checkpoint = BatchCheckpoint(
+            study_key=self.config.study_key,
+            sink=self._checkpoint_name(),
+            digest=digest,
+            batch_id=batch_id,
+            records=written,
+            next_batch_size=self.next_batch_size(),
+            committed_at="",
+        )
+        with self._checkpoint_lock:
+            self._unconfirmed.append(checkpoint)
+        self._commit_checkpoints()
+
+    def _commit_checkpoints(self) -> None:
+        """Commit the held checkpoints of batches that are durable."""
+        if self.checkpoints is None:
+            return
+        with self._checkpoint_lock:
+            durable = [c for c in self._unconfirmed if self._durable(c.batch_id)]
+            if not durable:
+                return
+            self._unconfirmed = [c for c in self._unconfirmed if c not in durable]
+        committed_at = datetime.now(tz=timezone.utc).isoformat()
+        self.checkpoints.commit(
+            dataclasses.replace(checkpoint, committed_at=committed_at) for checkpoint in durable
+        )
+
+    def _complete_checkpoints(self) -> None:
+        """Clear the checkpoints of the study at this sink once an export has completed."""
+        if self.checkpoints is None:
+            return
+        with self._checkpoint_lock:
+            self._unconfirmed = []
+        self.checkpoints.clear(self.config.study_key, sink=self._checkpoint_name())
+        if self.skipped_batches:
+            logger.info(
+                "Export of %s resumed: skipped %d batches committed by an earlier run",
+                self.config.study_key,
+                len(self.skipped_batches),
+            )
+
+    def _observe_batch(
+        self,
+        batch_id: str,
+        records: int,
+        seconds: float,
+        *,
+        payload_bytes: int | None = None,
+        attempts: int = 1,
+        failures: int = 0,
+    ) -> None:
+        """Report one batch write to adaptive batching; a no-op when it is disabled."""
+        if self.batch_sizer is not None:
+            self.batch_sizer.observe(
+                batch_id,
+                records,
+                seconds,
+                payload_bytes=payload_bytes,
+                attempts=attempts,
+                failures=failures,
+            )
+
+    def _payload_bytes(self, rows: Sequence[Any]) -> int | None:
+        """Return the JSON size of *rows* when adaptive batching needs it, else ``None``."""
+        if self.batch_sizer is None or self.config.adaptive_batching is None:
+            return None
+        if self.config.adaptive_batching.max_batch_bytes is None:
+            return None
+        return len(json.dumps(list(rows), default=str))
+
+
+class ExportSink(_SinkBase, ABC):
     """Abstract base class for all export sinks.
 
     Subclasses **must** implement :meth:`write_batch`, :meth:`flush`, and
@@ -144,10 +950,6 @@ class ExportSink(ABC):
         all values at their defaults.
     """
 
-    def __init__(self, config: SinkConfig) -> None:
-        """Initialize the export sink with a configuration."""
-        self.config: SinkConfig = config
-
     # ------------------------------------------------------------------
     # Abstract interface
     # ------------------------------------------------------------------
@@ -205,11 +1007,35 @@ class ExportSink(ABC):
         """
         ...
 
+    def write_batch_checkpointed(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write *records* with :meth:`write_batch` unless an earlier run committed them.
+
+        Without ``SinkConfig.checkpoint_path`` this is :meth:`write_batch`.
+        Otherwise a batch whose content a failed earlier export already
+        committed to this destination for the study is skipped, counts as
+        ``0`` and is listed in ``skipped_batches``.  The checkpoint of a new
+        batch is committed as soon as the sink reports it durable, and the
+        checkpoints of the study are cleared when the sink exits cleanly.
+        """
+        if self.checkpoints is None:
+            return self.write_batch(records, batch_id=batch_id)
+        digest = self._committed(records, batch_id)
+        if digest is None:
+            return 0
+        written = self.write_batch(records, batch_id=batch_id)
+        self._stage_checkpoint(batch_id, digest, written)
+        return written
+
     def _execute_with_retry(
         self,
         operation_name: str,
         batch_id: str,
         execute_fn: Callable[[], int],
+        *,
+        payload_bytes: int | None = None,
+        observe: bool = True,
+        records: Sequence[Any] | None = None,
+        write_records: Callable[[Sequence[Any]], int] | None = None,
     ) -> int:
         """Execute a batch operation with configured retries and telemetry.
 
@@ -221,24 +1047,97 @@ class ExportSink(ABC):
             Idempotency key for error reporting and spans.
         execute_fn:
             Callable that performs the export and returns the record count.
+        payload_bytes:
+            Serialised size of the batch, for adaptive batching.
+        observe:
+            Whether the write is reported to adaptive batching.  Sinks that
+            split one batch over several operations pass ``False`` and
+            report the batch themselves with :meth:`_observe_batch`.
+        records:
+            Records still to be written when ``execute_fn`` gives up.
+        write_records:
+            Writes a subset of ``records`` once and returns its count.  With
+            ``records`` and a dead-letter store configured, a batch failing
+            with a data error is split with :meth:`_isolate_failures` straight
+            away, without retrying the whole batch, instead of failing.
         """
-        from imednet.core.operations.executor import UniversalExecutor
-        from imednet.errors import ExportBatchError
+        isolating = self.dead_letters is not None and None not in (records, write_records)
+        executor = self._executor(operation_name, batch_id, isolating=isolating)
+        attempts = 0
 
-        executor = UniversalExecutor(
-            retries=self.config.max_retries,
-            backoff_factor=self.config.retry_backoff,
-            tracer=self.config.tracer,
-            operation_name=operation_name,
-            batch_id=batch_id,
-        )
+        def counted() -> int:
+            nonlocal attempts
+            attempts += 1
+            return execute_fn()
+
+        started = time.perf_counter()
         try:
-            return executor.execute(execute_fn)
+            written: int = executor.execute(counted)
         except Exception as exc:
-            raise ExportBatchError(
-                f"Batch {batch_id!r} failed after {self.config.max_retries + 1} attempts: {exc}",
-                batch_id=batch_id,
-            ) from exc
+            if observe:
+                self._observe_batch(
+                    batch_id,
+                    0,
+                    time.perf_counter() - started,
+                    payload_bytes=payload_bytes,
+                    attempts=attempts,
+                    failures=attempts,
+                )
+            if records is None or write_records is None:
+                raise self._batch_error(batch_id, exc) from exc
+            return self._isolate_failures(batch_id, records, write_records, exc)
+        if observe:
+            self._observe_batch(
+                batch_id,
+                written,
+                time.perf_counter() - started,
+                payload_bytes=payload_bytes,
+                attempts=attempts,
+                failures=attempts - 1,
+            )
+        return written
+
+    def _isolate_failures(
+        self,
+        batch_id: str,
+        records: Sequence[Any],
+        write_records: Callable[[Sequence[Any]], int],
+        exc: Exception,
+    ) -> int:
+        """Write the good *records* of a batch that failed with *exc* and dead-letter the rest.
+
+        The failed records are split in halves and each half is written once,
+        without backoff; halves that fail are split again until single
+        records remain, which go to the dead-letter store.  One bad record
+        in a batch of ``n`` costs about ``2 * log2(n)`` extra writes.
+
+        Raises:
+        -------
+        ~imednet.errors.ExportBatchError
+            When no dead-letter store is configured, or a write fails with an
+            error that is not caused by its records (see :meth:`_record_error`).
+        """
+        error = self._isolation_error(batch_id, exc)
+        if error is not None:
+            raise error from exc
+        written = 0
+        failed: list[tuple[Any, Exception]] = []
+        pending: deque[tuple[Sequence[Any], Exception]] = deque([(records, exc)])
+        while pending:
+            chunk, chunk_exc = pending.popleft()
+            if len(chunk) == 1:
+                failed.append((chunk[0], chunk_exc))
+                continue
+            middle = len(chunk) // 2
+            for half in (chunk[:middle], chunk[middle:]):
+                try:
+                    written += write_records(half)
+                except Exception as half_exc:
+                    if not self._record_error(half_exc):
+                        raise self._batch_error(batch_id, half_exc) from half_exc
+                    pending.append((half, half_exc))
+        self._dead_letter(batch_id, len(records), failed)
+        return written
 
     # ------------------------------------------------------------------
     # Context-manager support
@@ -254,12 +1153,241 @@ class ExportSink(ABC):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit the context manager, flushing and closing the sink."""
+        """Exit the context manager, flushing and closing the sink.
+
+        After a clean export the checkpoints of the study are cleared, so the
+        next export writes every batch.  When the export failed, checkpoints
+        of batches that are durable are committed, so that a rerun resumes
+        after them.
+        """
         try:
             if exc_type is None:
                 self.flush()
+                self._complete_checkpoints()
         finally:
-            self.close()
+            try:
+                self.close()
+            finally:
+                self._commit_checkpoints()
+
+
+class AsyncExportSink(_SinkBase, ABC):
+    """Abstract base class for export sinks driven from an event loop.
+
+    The asynchronous counterpart of :class:`ExportSink` for pipelines built
+    on :class:`~imednet.sdk.AsyncImednetSDK`: :meth:`write_batch`,
+    :meth:`flush` and :meth:`close` are coroutines, retries wait with
+    :func:`asyncio.sleep`, and :meth:`open` connects when the sink is
+    entered with ``async with``.  Synchronous sinks are used through
+    :class:`SyncSinkAdapter`.
+
+    Parameters
+    ----------
+    config:
+        Shared sink configuration.
+    """
+
+    async def open(self) -> None:
+        """Connect to the destination; called when entering ``async with``."""
+
+    @abstractmethod
+    async def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write one batch of records; see :meth:`ExportSink.write_batch`."""
+        ...
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Flush any internal buffers to the destination."""
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release all resources held by this sink; must be idempotent."""
+        ...
+
+    async def write_batch_checkpointed(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write *records* unless an earlier run committed them.
+
+        The asynchronous :meth:`ExportSink.write_batch_checkpointed`.
+        """
+        if self.checkpoints is None:
+            return await self.write_batch(records, batch_id=batch_id)
+        digest = self._committed(records, batch_id)
+        if digest is None:
+            return 0
+        written = await self.write_batch(records, batch_id=batch_id)
+        self._stage_checkpoint(batch_id, digest, written)
+        return written
+
+    async def _aexecute_with_retry(
+        self,
+        operation_name: str,
+        batch_id: str,
+        execute_fn: Callable[[], Awaitable[int]],
+        *,
+        payload_bytes: int | None = None,
+        observe: bool = True,
+        records: Sequence[Any] | None = None,
+        write_records: Callable[[Sequence[Any]], Awaitable[int]] | None = None,
+    ) -> int:
+        """Await a batch operation with configured retries and telemetry.
+
+        The asynchronous counterpart of :meth:`ExportSink._execute_with_retry`,
+        taking coroutine functions instead of callables.
+        """
+        isolating = self.dead_letters is not None and None not in (records, write_records)
+        executor = self._executor(operation_name, batch_id, isolating=isolating)
+        attempts = 0
+
+        async def counted() -> int:
+            nonlocal attempts
+            attempts += 1
+            return await execute_fn()
+
+        started = time.perf_counter()
+        try:
+            written: int = await executor.execute_async(counted)
+        except Exception as exc:
+            if observe:
+                self._observe_batch(
+                    batch_id,
+                    0,
+                    time.perf_counter() - started,
+                    payload_bytes=payload_bytes,
+                    attempts=attempts,
+                    failures=attempts,
+                )
+            if records is None or write_records is None:
+                raise self._batch_error(batch_id, exc) from exc
+            return await self._aisolate_failures(batch_id, records, write_records, exc)
+        if observe:
+            self._observe_batch(
+                batch_id,
+                written,
+                time.perf_counter() - started,
+                payload_bytes=payload_bytes,
+                attempts=attempts,
+                failures=attempts - 1,
+            )
+        return written
+
+    async def _aisolate_failures(
+        self,
+        batch_id: str,
+        records: Sequence[Any],
+        write_records: Callable[[Sequence[Any]], Awaitable[int]],
+        exc: Exception,
+    ) -> int:
+        """Asynchronous :meth:`ExportSink._isolate_failures`."""
+        error = self._isolation_error(batch_id, exc)
+        if error is not None:
+            raise error from exc
+        written = 0
+        failed: list[tuple[Any, Exception]] = []
+        pending: deque[tuple[Sequence[Any], Exception]] = deque([(records, exc)])
+        while pending:
+            chunk, chunk_exc = pending.popleft()
+            if len(chunk) == 1:
+                failed.append((chunk[0], chunk_exc))
+                continue
+            middle = len(chunk) // 2
+            for half in (chunk[:middle], chunk[middle:]):
+                try:
+                    written += await write_records(half)
+                except Exception as half_exc:
+                    if not self._record_error(half_exc):
+                        raise self._batch_error(batch_id, half_exc) from half_exc
+                    pending.append((half, half_exc))
+        self._dead_letter(batch_id, len(records), failed)
+        return written
+
+    async def __aenter__(self) -> AsyncExportSink:
+        """Open the sink and return it."""
+        try:
+            await self.open()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the context manager, flushing and closing the sink.
+
+        Checkpoints are cleared or committed as in :meth:`ExportSink.__exit__`.
+        """
+        try:
+            if exc_type is None:
+                await self.flush()
+                self._complete_checkpoints()
+        finally:
+            try:
+                await self.close()
+            finally:
+                self._commit_checkpoints()
+
+
+class SyncSinkAdapter(AsyncExportSink):
+    """Drive a synchronous :class:`ExportSink` from async code.
+
+    Every call runs on a worker thread with :func:`asyncio.to_thread`, one
+    at a time, so the event loop keeps fetching while the wrapped sink
+    writes.  The adapter shares the wrapped sink's configuration, adaptive
+    batching, dead letters and checkpoints.
+
+    Parameters
+    ----------
+    sink:
+        The sink to wrap.  It is closed when the adapter is closed.
+    """
+
+    def __init__(self, sink: ExportSink) -> None:
+        """Wrap *sink*."""
+        super().__init__(sink.config)
+        self.sink = sink
+        self.batch_sizer = sink.batch_sizer
+        self.dead_letters = sink.dead_letters
+        self.checkpoints = sink.checkpoints
+        self.skipped_batches = sink.skipped_batches
+        self._lock = asyncio.Lock()
+
+    def next_batch_size(self) -> int:
+        """Return the wrapped sink's next batch size."""
+        return self.sink.next_batch_size()
+
+    async def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write *records* with the wrapped sink on a worker thread."""
+        async with self._lock:
+            return await asyncio.to_thread(self.sink.write_batch, records, batch_id=batch_id)
+
+    async def write_batch_checkpointed(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write *records* with the wrapped sink's checkpoints on a worker thread."""
+        async with self._lock:
+            return await asyncio.to_thread(
+                self.sink.write_batch_checkpointed, records, batch_id=batch_id
+            )
+
+    def _commit_checkpoints(self) -> None:
+        """Commit the checkpoints held by the wrapped sink."""
+        self.sink._commit_checkpoints()
+
+    def _complete_checkpoints(self) -> None:
+        """Clear the checkpoints through the wrapped sink."""
+        self.sink._complete_checkpoints()
+
+    async def flush(self) -> None:
+        """Flush the wrapped sink on a worker thread."""
+        async with self._lock:
+            await asyncio.to_thread(self.sink.flush)
+
+    async def close(self) -> None:
+        """Close the wrapped sink on a worker thread."""
+        async with self._lock:
+            await asyncio.to_thread(self.sink.close)
 
 
 # ---------------------------------------------------------------------------
@@ -315,80 +1443,219 @@ def _require_optional_dep(package: str, extras_key: str) -> Any:
         raise
 
 
+# Keys the quality gate reads; pydantic records serialise only these fields.
+_GATE_FIELDS = frozenset({"formKey", "form_key", "formId", "form_id", "data", "record_id"})
+
+
+def _gate_view(record: Any) -> dict[str, Any]:
+    """Return the mapping the quality gate reads form keys and data from."""
+    if hasattr(record, "model_dump"):
+        view: dict[str, Any] = record.model_dump(include=_GATE_FIELDS)
+        return view
+    if hasattr(record, "__dict__"):
+        return {
+            "form_key": getattr(record, "form_key", None),
+            "form_id": getattr(record, "form_id", None),
+            "data": getattr(record, "record_data", {}),
+            "record_id": getattr(record, "record_id", None),
+        }
+    if isinstance(record, dict):
+        return record
+    return {"data": {}}
+
+
+def quality_gate_batch(schema: Any, records: Sequence[Any], config: SinkConfig) -> list[Any]:
+    """Return the records of ``records`` that meet ``config.min_schema_readiness_score``.
+
+    The batch is grouped by form and each group is scored column by column
+    with :func:`~imednet.validation.cache.calculate_readiness_scores`, which
+    gives the same scores as scoring every record on its own. Kept records
+    retain their order; dropped records are logged with the reasons for
+    their score.
+    """
+    from imednet.validation.cache import calculate_readiness_score, calculate_readiness_scores
+
+    views = [_gate_view(record) for record in records]
+    by_form: dict[str, list[int]] = {}
+    for index, view in enumerate(views):
+        fk = view.get("formKey") or view.get("form_key")
+        if not fk:
+            fid = view.get("formId") or view.get("form_id") or 0
+            fk = schema.form_key_from_id(fid)
+        if not fk:
+            logger.info("Dropped record %s: Unknown form", view.get("record_id", "Unknown"))
+            continue
+        by_form.setdefault(fk, []).append(index)
+
+    keep = [False] * len(views)
+    threshold = config.min_schema_readiness_score
+    for fk, indices in by_form.items():
+        rows = [views[index].get("data", {}) or {} for index in indices]
+        for index, data, score in zip(
+            indices, rows, calculate_readiness_scores(schema, fk, rows), strict=True
+        ):
+            if score >= threshold:
+                keep[index] = True
+            elif logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Dropped record %s (Score: %.1f < %.1f). Reasons: %s",
+                    views[index].get("record_id", "Unknown"),
+                    score,
+                    threshold,
+                    "; ".join(calculate_readiness_score(schema, fk, data)[1]),
+                )
+    return [record for record, kept in zip(records, keep, strict=True) if kept]
+
+
 def apply_quality_gate(
     sdk: Any, study_key: str, records: Iterable[Any], config: SinkConfig
 ) -> Iterator[Any]:
-    """Filter records based on minimum schema readiness score if enabled."""
+    """Filter records based on minimum schema readiness score if enabled.
+
+    Records are scored lazily with :func:`quality_gate_batch`, one batch of
+    ``config.batch_size`` records at a time, so the gate never holds more
+    than the batch being scored.
+    """
     if not config.quality_gate_enabled:
         yield from records
         return
 
-    from imednet.validation.cache import SchemaValidator, calculate_readiness_score
+    from imednet.validation.cache import SchemaValidator
 
     validator = SchemaValidator(sdk)
     validator.refresh(study_key)
 
     dropped_count = 0
+    for batch in iter_batches(records, config.batch_size):
+        kept = quality_gate_batch(validator.schema, batch, config)
+        dropped_count += len(batch) - len(kept)
+        yield from kept
 
-    for record in records:
-        if hasattr(record, "model_dump"):
-            rec_dict = record.model_dump()
-        elif hasattr(record, "__dict__"):
-            rec_dict = {
-                "form_key": getattr(record, "form_key", None),
-                "form_id": getattr(record, "form_id", None),
-                "data": getattr(record, "record_data", {}),
-                "record_id": getattr(record, "record_id", None),
-            }
-        elif isinstance(record, dict):
-            rec_dict = record
-        else:
-            rec_dict = {"data": {}}
-
-        fk = rec_dict.get("formKey") or rec_dict.get("form_key")
-        if not fk:
-            fid = rec_dict.get("formId") or rec_dict.get("form_id") or 0
-            fk = validator.schema.form_key_from_id(fid)
+    if dropped_count > 0:
+        logger.info("Quality gate dropped %d records in total.", dropped_count)
 
-        if not fk:
-            logger.info("Dropped record %s: Unknown form", rec_dict.get("record_id", "Unknown"))
-            dropped_count += 1
-            continue
 
-        data = rec_dict.get("data", {})
-        if data is None:
-            data = {}
-        score, reasons = calculate_readiness_score(validator.schema, fk, data)
+async def aapply_quality_gate(
+    sdk: Any,
+    study_key: str,
+    records: AsyncIterable[Any] | Iterable[Any],
+    config: SinkConfig,
+) -> AsyncIterator[Any]:
+    """Asynchronous :func:`apply_quality_gate` over sync or async ``records``.
 
-        if score < config.min_schema_readiness_score:
-            logger.info(
-                "Dropped record %s (Score: %.1f < %.1f). Reasons: %s",
-                rec_dict.get("record_id", "Unknown"),
-                score,
-                config.min_schema_readiness_score,
-                "; ".join(reasons),
-            )
-            dropped_count += 1
-            continue
+    The schema is loaded with :class:`~imednet.validation.cache.AsyncSchemaValidator`
+    when ``sdk`` is asynchronous; a synchronous SDK is queried on a worker
+    thread so the event loop keeps running.
+    """
+    if not config.quality_gate_enabled:
+        async for record in _aiterate(records):
+            yield record
+        return
+
+    from imednet.validation.cache import AsyncSchemaValidator, SchemaValidator
 
-        yield record
+    validator: Any
+    if hasattr(sdk, "async_get_variables"):
+        validator = AsyncSchemaValidator(sdk)
+        await validator.refresh(study_key)
+    else:
+        validator = SchemaValidator(sdk)
+        await asyncio.to_thread(validator.refresh, study_key)
+
+    dropped_count = 0
+    async for batch in aiter_batches(records, config.batch_size):
+        kept = quality_gate_batch(validator.schema, batch, config)
+        dropped_count += len(batch) - len(kept)
+        for record in kept:
+            yield record
 
     if dropped_count > 0:
         logger.info("Quality gate dropped %d records in total.", dropped_count)
 
 
-def iter_batches(records: Sequence[Any], batch_size: int) -> Iterator[Sequence[Any]]:
-    """Yield ``records`` in chunks of ``batch_size``."""
-    if batch_size <= 0:
+async def _aiterate(items: AsyncIterable[Any] | Iterable[Any]) -> AsyncIterator[Any]:
+    """Iterate ``items`` asynchronously whether it is a sync or async iterable."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _batch_size(batch_size: int | Callable[[], int]) -> int:
+    size = batch_size() if callable(batch_size) else batch_size
+    if size <= 0:
         raise ValueError("batch_size must be greater than 0")
-    for start in range(0, len(records), batch_size):
-        yield records[start : start + batch_size]
+    return size
+
+
+def iter_batches(
+    records: Iterable[Any], batch_size: int | Callable[[], int]
+) -> Iterator[Sequence[Any]]:
+    """Yield ``records`` in chunks of ``batch_size``.
+
+    Sequences are sliced. Any other iterable is consumed lazily, one batch
+    at a time, so a batch is yielded as soon as its last record arrives and
+    at most one batch is held in memory.  ``batch_size`` may be a callable,
+    such as :meth:`ExportSink.next_batch_size`, asked before every batch.
+    """
+    size = _batch_size(batch_size)
+    if isinstance(records, Sequence):
+        start = 0
+        while start < len(records):
+            yield records[start : start + size]
+            start += size
+            if callable(batch_size) and start < len(records):
+                size = _batch_size(batch_size)
+        return
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+        if callable(batch_size):
+            size = _batch_size(batch_size)
+
+
+async def aiter_batches(
+    records: AsyncIterable[Any] | Iterable[Any], batch_size: int | Callable[[], int]
+) -> AsyncIterator[list[Any]]:
+    """Asynchronously yield ``records`` in lists of ``batch_size``.
+
+    The asynchronous counterpart of :func:`iter_batches` for async iterables
+    such as the paginated lists of :class:`~imednet.sdk.AsyncImednetSDK`;
+    plain iterables are accepted too.
+    """
+    size = _batch_size(batch_size)
+    batch: list[Any] = []
+    async for record in _aiterate(records):
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+            if callable(batch_size):
+                size = _batch_size(batch_size)
+    if batch:
+        yield batch
 
 
 __all__ = [
+    "AdaptiveBatchPolicy",
+    "AdaptiveBatchSizer",
+    "AsyncExportSink",
+    "BatchCheckpoint",
+    "BatchCheckpointStore",
+    "BatchSizeDecision",
+    "DeadLetter",
+    "DeadLetterStore",
     "ExportSink",
     "SinkConfig",
+    "SyncSinkAdapter",
     "_redact_uri",
     "_require_optional_dep",
+    "aapply_quality_gate",
+    "aiter_batches",
+    "apply_quality_gate",
+    "batch_digest",
     "iter_batches",
+    "quality_gate_batch",
 ]
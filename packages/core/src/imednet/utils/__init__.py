@@ -14,8 +14,13 @@ from .typing import FilterValue, ItemId, JsonDict
 _LAZY_ATTRS: dict[str, tuple[str, str]] = {
     "flatten": ("imednet.utils.serialization", "flatten"),
     "to_arrow_table": ("imednet.utils.arrow", "to_arrow_table"),
+    "ArrowTableBuilder": ("imednet.utils.arrow", "ArrowTableBuilder"),
+    "arrow_schema_for_form": ("imednet.utils.arrow", "arrow_schema_for_form"),
+    "arrow_schema_from_variables": ("imednet.utils.arrow", "arrow_schema_from_variables"),
     "records_to_dataframe": ("imednet.utils.pandas", "records_to_dataframe"),
     "export_records_csv": ("imednet.utils.pandas", "export_records_csv"),
+    "mask_clinical_phi_frame": ("imednet.utils.pandas", "mask_clinical_phi_frame"),
+    "sanitize_csv_formula_frame": ("imednet.utils.pandas", "sanitize_csv_formula_frame"),
     "parse_bool": ("imednet.utils.validators", "parse_bool"),
     "parse_datetime": ("imednet.utils.validators", "parse_datetime"),
     "parse_int_or_default": ("imednet.utils.validators", "parse_int_or_default"),
@@ -42,15 +47,19 @@ def __getattr__(name: str) -> Any:
 
 
 __all__ = [
+    "ArrowTableBuilder",
     "FilterValue",
     "ItemId",
     "JsonDict",
+    "arrow_schema_for_form",
+    "arrow_schema_from_variables",
     "build_filter_string",
     "build_safe_path",
     "configure_json_logging",
     "export_records_csv",
     "flatten",
     "format_iso_datetime",
+    "mask_clinical_phi_frame",
     "parse_bool",
     "parse_datetime",
     "parse_dict_or_default",
@@ -61,6 +70,7 @@ __all__ = [
     "records_to_dataframe",
     "sanitize_base_url",
     "sanitize_csv_formula",
+    "sanitize_csv_formula_frame",
     "to_arrow_table",
     "validate_partition_key",
 ]
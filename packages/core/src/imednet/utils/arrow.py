@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timezone
-from typing import Any, Protocol
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Protocol
 
 from imednet.utils.validators import is_boolean_token, parse_bool
 
 try:
     import pyarrow as pa
+    import pyarrow.compute as pc
 except ImportError:  # pragma: no cover - exercised when optional dependency is absent
     pa: Any = None  # type: ignore[no-redef]
+    pc: Any = None  # type: ignore[no-redef]
+
+if TYPE_CHECKING:
+    from imednet.models.variables import Variable
+    from imednet.validation.cache import BaseSchemaCache
+
+_PYARROW_REQUIRED = "pyarrow is required for {}. Install with \"pip install 'imednet[export]'\"."
+
+# Arrow types for iMednet ``variable_type`` values, mirroring the validators in
+# :mod:`imednet.validation.cache`. Dates and times arrive as text and unknown
+# types fall back to strings.
+_VARIABLE_ARROW_TYPES: dict[str, str] = {
+    "int": "int64",
+    "integer": "int64",
+    "number": "int64",
+    "float": "float64",
+    "decimal": "float64",
+    "bool": "bool_",
+    "boolean": "bool_",
+}
 
 
 class _ModelDumpable(Protocol):
@@ -89,6 +112,222 @@ def _coerce_value(value: Any, target_type: pa.DataType) -> Any:
     return value
 
 
+def _coerce_normalized(values: list[Any], target_type: pa.DataType) -> pa.Array:
+    """Build an array from normalized ``values`` one cell at a time."""
+    coerced_values: list[Any]
+    if pa.types.is_null(target_type):
+        coerced_values = [None] * len(values)
+    elif pa.types.is_timestamp(target_type):
+        coerced_values = [v if isinstance(v, datetime) else None for v in values]
+    elif pa.types.is_boolean(target_type):
+        # Fast path for boolean coercion leveraging core validator
+        coerced_values = []
+        for value in values:
+            if value is None:
+                coerced_values.append(None)
+            elif isinstance(value, str):
+                coerced_values.append(parse_bool(value) if is_boolean_token(value) else None)
+            else:
+                coerced_values.append(bool(value))
+    elif pa.types.is_floating(target_type):
+        coerced_values = []
+        for value in values:
+            if value is None:
+                coerced_values.append(None)
+            else:
+                try:
+                    coerced_values.append(float(value))
+                except (TypeError, ValueError):
+                    coerced_values.append(None)
+    else:
+        coerced_values = values
+    return pa.array(coerced_values, type=target_type)
+
+
+def _coerce_column(values: Sequence[Any], target_type: pa.DataType) -> pa.Array:
+    """Build an array from raw ``values`` by normalizing and coercing each cell."""
+    return _coerce_normalized([_normalize_value(v) for v in values], target_type)
+
+
+def _is_binary_like(target_type: pa.DataType) -> bool:
+    return bool(
+        pa.types.is_string(target_type)
+        or pa.types.is_large_string(target_type)
+        or pa.types.is_binary(target_type)
+        or pa.types.is_large_binary(target_type)
+    )
+
+
+def _column_array(values: Sequence[Any], target_type: pa.DataType) -> pa.Array:
+    """Build an array for a declared column in bulk.
+
+    Values are handed to Arrow's C++ converter in one call and empty strings
+    in string and binary columns are nulled with a compute kernel. Columns the
+    converter rejects (strings in numeric or boolean columns, out-of-range
+    integers, ...), timestamp columns holding non-datetime values and other
+    columns holding empty strings fall back to :func:`_coerce_column`, so the
+    result always matches the per-cell conversion.
+    """
+    if pa.types.is_null(target_type):
+        return pa.nulls(len(values))
+    kinds = set(map(type, values))
+    binary_like = _is_binary_like(target_type)
+    if pa.types.is_timestamp(target_type) and not all(
+        kind is type(None) or issubclass(kind, datetime) for kind in kinds
+    ):
+        return _coerce_column(values, target_type)
+    if str in kinds and not binary_like and "" in values:
+        # Empty strings are nulls; nested types would otherwise accept them.
+        return _coerce_column(values, target_type)
+    try:
+        array = pa.array(values, type=target_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        return _coerce_column(values, target_type)
+    if binary_like and array.null_count < len(array):
+        empty = pc.equal(pc.binary_length(array), 0)
+        if pc.any(empty).as_py():
+            array = pc.if_else(empty, pa.scalar(None, type=target_type), array)
+    return array
+
+
+def _columns(records: Sequence[dict[str, Any]], names: list[str]) -> list[Sequence[Any]]:
+    """Transpose ``records`` into one value sequence per name in ``names``."""
+    if not names:
+        return []
+    if len(names) == 1:
+        return [[record.get(names[0]) for record in records]]
+    getter = itemgetter(*names)
+    rows = []
+    for record in records:
+        try:
+            rows.append(getter(record))
+        except KeyError:
+            rows.append(tuple(record.get(name) for name in names))
+    if not rows:
+        return [[] for _ in names]
+    return list(zip(*rows, strict=True))
+
+
+def _record_batch(records: Sequence[dict[str, Any]], schema: pa.Schema) -> pa.RecordBatch:
+    columns = _columns(records, schema.names)
+    arrays = [
+        _column_array(values, field.type) for values, field in zip(columns, schema, strict=True)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def arrow_type_for_variable(variable_type: str | None) -> pa.DataType:
+    """Return the Arrow type used for an iMednet ``variable_type``.
+
+    Integer, float and boolean variables map to ``int64``, ``float64`` and
+    ``bool``; dates, times, text and unknown types map to ``string``.
+    """
+    if pa is None:
+        raise ImportError(_PYARROW_REQUIRED.format("arrow_type_for_variable"))
+    name = _VARIABLE_ARROW_TYPES.get((variable_type or "").lower(), "string")
+    return getattr(pa, name)()
+
+
+def arrow_schema_from_variables(
+    variables: Iterable[Variable],
+    *,
+    base_fields: Sequence[pa.Field] = (),
+) -> pa.Schema:
+    """Derive an Arrow schema from ``Variable`` metadata.
+
+    Args:
+        variables: Variables in column order. Variables without a name are
+            skipped and repeated names keep their first definition.
+        base_fields: Fields placed before the variable columns, e.g. record
+            metadata such as ``record_id``.
+
+    Returns:
+        A schema with one nullable field per variable.
+    """
+    if pa is None:
+        raise ImportError(_PYARROW_REQUIRED.format("arrow_schema_from_variables"))
+    fields = list(base_fields)
+    seen = {field.name for field in fields}
+    for var in variables:
+        if var.variable_name is None or var.variable_name in seen:
+            continue
+        seen.add(var.variable_name)
+        fields.append(pa.field(var.variable_name, arrow_type_for_variable(var.variable_type)))
+    return pa.schema(fields)
+
+
+def arrow_schema_for_form(
+    cache: BaseSchemaCache[Any],
+    form_key: str,
+    *,
+    base_fields: Sequence[pa.Field] = (),
+) -> pa.Schema:
+    """Derive the Arrow schema of ``form_key`` from a populated schema cache.
+
+    See :func:`arrow_schema_from_variables` for ``base_fields``.
+    """
+    return arrow_schema_from_variables(
+        cache.variables_for_form(form_key).values(), base_fields=base_fields
+    )
+
+
+class ArrowTableBuilder:
+    """Incrementally build a ``pyarrow.Table`` with a declared schema.
+
+    Each :meth:`append` converts one batch of records column by column with
+    Arrow's bulk converters and returns the resulting ``RecordBatch``, so
+    callers can stream batches (e.g. into a ``ParquetWriter``) or collect them
+    with :meth:`build`. Conversion follows the same rules as
+    :func:`to_arrow_table` with an explicit schema.
+
+    Args:
+        schema: Target Arrow schema, e.g. from :func:`arrow_schema_for_form`.
+        keep_batches: When ``False``, appended batches are not retained and
+            :meth:`build` is unavailable; use this when streaming.
+    """
+
+    def __init__(self, schema: pa.Schema, *, keep_batches: bool = True) -> None:
+        """Initialize the builder."""
+        if pa is None:
+            raise ImportError(_PYARROW_REQUIRED.format("ArrowTableBuilder"))
+        self._schema = schema
+        self._keep_batches = keep_batches
+        self._batches: list[pa.RecordBatch] = []
+        self._num_rows = 0
+
+    @property
+    def schema(self) -> pa.Schema:
+        """Return the declared schema."""
+        return self._schema
+
+    @property
+    def num_rows(self) -> int:
+        """Return the number of rows appended so far."""
+        return self._num_rows
+
+    def append(self, data_records: Iterable[dict[str, Any] | _ModelDumpable]) -> pa.RecordBatch:
+        """Convert ``data_records`` and append them as one record batch.
+
+        Raises:
+            TypeError: If a record is not dict-like and does not expose ``model_dump``.
+        """
+        batch = _record_batch([_normalize_record(r) for r in data_records], self._schema)
+        if self._keep_batches:
+            self._batches.append(batch)
+        self._num_rows += batch.num_rows
+        return batch
+
+    def build(self) -> pa.Table:
+        """Return the appended batches as a single table.
+
+        Raises:
+            RuntimeError: If the builder was created with ``keep_batches=False``.
+        """
+        if not self._keep_batches:
+            raise RuntimeError("build() requires keep_batches=True")
+        return pa.Table.from_batches(self._batches, schema=self._schema)
+
+
 def to_arrow_table(
     data_records: list[dict[str, Any] | _ModelDumpable], schema: pa.Schema | None = None
 ) -> pa.Table:
@@ -98,7 +337,8 @@ def to_arrow_table(
         data_records: Record payloads to serialize. Each item must be a dictionary
             or expose a ``model_dump()`` method that returns a dictionary.
         schema: Optional explicit Arrow schema. When provided, output columns follow
-            schema order and types; when omitted, columns and types are inferred.
+            schema order and types and each column is built in bulk (see
+            :class:`ArrowTableBuilder`); when omitted, columns and types are inferred.
             Naive ``datetime`` values are interpreted as UTC.
             When schema inference is used, datetime columns use microsecond precision.
             Boolean strings accept ``true/false``, ``1/0``, ``yes/no``, ``y/n``,
@@ -113,55 +353,20 @@ def to_arrow_table(
         TypeError: If a record is not dict-like and does not expose ``model_dump``.
     """
     if pa is None:
-        raise ImportError(
-            "pyarrow is required for to_arrow_table. Install with \"pip install 'imednet[export]'\"."
-        )
+        raise ImportError(_PYARROW_REQUIRED.format("to_arrow_table"))
 
-    records = [_normalize_record(record) for record in data_records]
+    if schema is not None:
+        builder = ArrowTableBuilder(schema)
+        builder.append(data_records)
+        return builder.build()
 
-    if schema is None:
-        if not records:
-            return pa.table({})
-        column_names = sorted({key for record in records for key in record})
-    else:
-        column_names = list(schema.names)
+    records = [_normalize_record(record) for record in data_records]
+    if not records:
+        return pa.table({})
+    column_names = sorted({key for record in records for key in record})
 
     arrays: list[pa.Array] = []
     for name in column_names:
         values = [_normalize_value(record.get(name)) for record in records]
-        target_type = schema.field(name).type if schema is not None else _infer_type(values)
-
-        # Optimize by avoiding pa.types.* checks in a tight loop
-        coerced_values: list[Any]
-        if pa.types.is_null(target_type):
-            coerced_values = [None] * len(values)
-        elif pa.types.is_timestamp(target_type):
-            coerced_values = [v if isinstance(v, datetime) else None for v in values]
-        elif pa.types.is_boolean(target_type):
-            # Fast path for boolean coercion leveraging core validator
-            coerced_values = []
-            for value in values:
-                if value is None:
-                    coerced_values.append(None)
-                elif isinstance(value, str):
-                    coerced_values.append(parse_bool(value) if is_boolean_token(value) else None)
-                else:
-                    coerced_values.append(bool(value))
-        elif pa.types.is_floating(target_type):
-            coerced_values = []
-            for value in values:
-                if value is None:
-                    coerced_values.append(None)
-                else:
-                    try:
-                        coerced_values.append(float(value))
-                    except (TypeError, ValueError):
-                        coerced_values.append(None)
-        else:
-            coerced_values = [None if v is None else v for v in values]
-
-        arrays.append(pa.array(coerced_values, type=target_type))
-
-    if schema is not None:
-        return pa.Table.from_arrays(arrays, schema=schema)
+        arrays.append(_coerce_normalized(values, _infer_type(values)))
     return pa.Table.from_arrays(arrays, names=column_names)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 try:
@@ -9,11 +10,23 @@ try:
 except ImportError:
     pd: Any = None  # type: ignore[no-redef]
 from ..models.records import Record
-from .security import sanitize_csv_formula
+from .security import global_sensitivity_registry, mask_clinical_phi, sanitize_csv_formula
 
 if TYPE_CHECKING:  # pragma: no cover - only for type checking
     from ..sdk import ImednetSDK
 
+MASKED_VALUE = "***MASKED***"
+
+# ``str.lstrip()`` and the regex ``\s`` class agree on Unicode whitespace, so
+# this matches exactly the strings ``sanitize_csv_formula`` prefixes.
+_CSV_FORMULA_PATTERN = r"\s*[=+\-@]"
+# RE2, used by Arrow, only treats ASCII as ``\s``; spell out every code point
+# for which ``str.isspace()`` is true instead.
+_ARROW_CSV_FORMULA_PATTERN = (
+    r"^[\t-\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]*[=+\-@]"
+)
+
 
 def records_to_dataframe(records: list[Record], *, flatten: bool = False) -> pd.DataFrame:
     """Convert a list of :class:`~imednet.models.records.Record` to a DataFrame.
@@ -57,3 +70,104 @@ def export_records_csv(
     df = df.map(sanitize_csv_formula)
 
     df.to_csv(file_path, index=False)
+
+
+def _object_columns(df: pd.DataFrame) -> list[Any]:
+    """Return the labels of object and string columns in ``df``."""
+    # Explicitly include "str" to avoid Pandas 3.0 warning about object dtype
+    # including strings implicitly. Older Pandas versions (e.g. 2.3.3) raise
+    # a TypeError for "str".
+    try:
+        return list(df.select_dtypes(include=[object, "str"]).columns)
+    except TypeError:
+        return list(df.select_dtypes(include=[object]).columns)
+
+
+def _apply_null_column(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Return ``series.apply(func)`` for a column holding only missing values.
+
+    ``func`` leaves missing values untouched, so only the dtype inferred by
+    :meth:`pandas.Series.apply` can differ. That inference depends on which
+    kinds of missing value are present, which the distinct values capture.
+    """
+    uniques = pd.Series(pd.unique(series.to_numpy(dtype=object)), dtype=object)
+    if uniques.apply(func).dtype == object:
+        return series
+    return series.apply(func)
+
+
+def _mask_series(series: pd.Series) -> pd.Series:
+    """Vectorised ``series.apply(mask_clinical_phi)``."""
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind == "string":
+        # mask_clinical_phi only rewrites containers; strings pass through.
+        return series
+    if kind == "empty":
+        return _apply_null_column(series, mask_clinical_phi)
+    return series.apply(mask_clinical_phi)
+
+
+def _formula_hits(series: pd.Series) -> Any:
+    """Return a boolean mask of the strings ``sanitize_csv_formula`` would prefix."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        pa = None
+    if pa is not None:
+        try:
+            values = pa.array(series.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, UnicodeEncodeError):
+            # e.g. lone surrogates, which cannot be encoded as UTF-8
+            pass
+        else:
+            matches = pc.match_substring_regex(values, _ARROW_CSV_FORMULA_PATTERN)
+            return matches.fill_null(False).to_numpy(zero_copy_only=False)
+    return series.str.match(_CSV_FORMULA_PATTERN, na=False).to_numpy()
+
+
+def _sanitize_series(series: pd.Series) -> pd.Series:
+    """Vectorised ``series.apply(sanitize_csv_formula)``."""
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind == "string":
+        hits = _formula_hits(series)
+        if not hits.any():
+            return series
+        series = series.copy()
+        series[hits] = "'" + series[hits]
+        return series
+    if kind == "empty":
+        return _apply_null_column(series, sanitize_csv_formula)
+    return series.apply(sanitize_csv_formula)
+
+
+def mask_clinical_phi_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Mask PHI in ``df`` column by column.
+
+    Columns flagged by :data:`~imednet.utils.security.global_sensitivity_registry`
+    are replaced wholesale with ``"***MASKED***"``. Remaining object columns
+    give the same result as ``df[col].apply(mask_clinical_phi)``, but columns
+    of plain strings or missing values are resolved without a Python call
+    per cell.
+    """
+    sensitive_cols = [
+        col for col in df.columns if global_sensitivity_registry.is_sensitive(str(col))
+    ]
+    for col in sensitive_cols:
+        df[col] = MASKED_VALUE
+
+    for col in _object_columns(df.drop(columns=sensitive_cols)):
+        df[col] = _mask_series(df[col])
+    return df
+
+
+def sanitize_csv_formula_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply :func:`~imednet.utils.security.sanitize_csv_formula` to ``df`` by column.
+
+    String columns are matched with a single vectorised regular expression and
+    only the offending cells are prefixed, giving the same result as
+    ``df[col].apply(sanitize_csv_formula)`` for every object column.
+    """
+    for col in _object_columns(df):
+        df[col] = _sanitize_series(df[col])
+    return df
@@ -45,6 +45,33 @@ When ``SinkConfig.idempotent`` is ``True`` (default) the sink uses
 re-running an export for the same batch updates existing documents rather
 than inserting duplicates.
 
+Concurrent writes
+-----------------
+Upserts keyed by ``_id`` do not depend on each other, so every batch is sent
+as one *unordered* bulk write. With ``MongoDbSinkConfig.max_in_flight_batches``
+above one, :meth:`MongoDbExportSink.write_batch` hands the bulk write to a
+thread pool and returns once the documents are built, keeping up to that
+many batches in flight; errors are raised by a later ``write_batch`` or by
+:meth:`~MongoDbExportSink.flush`.
+
+When a bulk write fails for some operations only (``BulkWriteError``), the
+successful ones stay written and the retry resends just the failed
+documents, up to ``SinkConfig.max_retries`` times.  With
+``SinkConfig.dead_letter_path`` set, documents that still fail are split
+until the rejected ones (e.g. validation failures or documents over 16 MB)
+are isolated and stored in the dead-letter store; the rest are written.
+
+With ``SinkConfig.checkpoint_path`` set, a concurrent batch is checkpointed
+only once its bulk write has finished, so a rerun after a crash writes every
+batch that was still in flight.
+
+Async pipelines
+---------------
+:class:`AsyncMongoDbExportSink` writes the same documents through PyMongo's
+``AsyncMongoClient`` for exports driven by
+:class:`~imednet.sdk.AsyncImednetSDK`; :func:`imednet.integrations.export_async`
+uses it for the ``"mongodb"`` target.
+
 Usage
 -----
 .. code-block:: python
@@ -68,12 +95,15 @@ Usage
 from __future__ import annotations
 
 import logging
+from collections import deque
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
 from imednet.errors import ExportConfigurationError
 from imednet.integrations.sink_base import (
+    AsyncExportSink,
     ExportSink,
     SinkConfig,
     _redact_uri,
@@ -90,11 +120,16 @@ from dataclasses import dataclass
 
 @dataclass
 class MongoDbSinkConfig(SinkConfig):
-    """Configuration for MongoDB export sink."""
+    """Configuration for MongoDB export sink.
+
+    ``max_in_flight_batches`` above one enables concurrent writes; see
+    *Concurrent writes* in the module documentation.
+    """
 
     uri: str = ""
     database: str = ""
     collection: str = ""
+    max_in_flight_batches: int = 1
 
     def __post_init__(self) -> None:
         """Validate MongoDB config properties after initialization."""
@@ -109,6 +144,8 @@ class MongoDbSinkConfig(SinkConfig):
             or not self.collection.strip()
         ):
             raise ValueError("collection must be a non-empty string")
+        if self.max_in_flight_batches < 1:
+            raise ValueError("max_in_flight_batches must be at least 1")
 
 
 def _make_document_id(study_key: str, record_id: Any) -> str:
@@ -124,6 +161,62 @@ def _post_process_document(doc: dict[str, Any]) -> dict[str, Any]:
     return doc
 
 
+def _write_errors(exc: Exception) -> list[dict[str, Any]] | None:
+    """Return the per-operation errors of a ``BulkWriteError``, else ``None``."""
+    details = getattr(exc, "details", None)
+    if isinstance(details, dict) and details.get("writeErrors"):
+        return list(details["writeErrors"])
+    return None
+
+
+def _connection_failure(exc: Exception) -> bool:
+    """Return whether *exc* is a PyMongo connection failure or timeout."""
+    errors = getattr(_require_optional_dep("pymongo", "mongodb"), "errors", None)
+    failure = getattr(errors, "ConnectionFailure", None)
+    return isinstance(failure, type) and isinstance(exc, failure)
+
+
+class _PendingDocuments:
+    """Records and documents of one batch still to be written, and how many already were."""
+
+    def __init__(self, records: Sequence[Any], docs: list[dict[str, Any]], batch_id: str) -> None:
+        """Start with every record of batch *batch_id* pending."""
+        self.records = list(records)
+        self.docs = docs
+        self.batch_id = batch_id
+        self.written = 0
+
+    def keep_failed(self, exc: Exception) -> None:
+        """Count the writes *exc* reports as done and keep only the failed documents.
+
+        Errors other than a ``BulkWriteError`` leave every document pending.
+        """
+        errors = _write_errors(exc)
+        if errors is None:
+            return
+        failed = sorted({error["index"] for error in errors})
+        self.written += len(self.docs) - len(failed)
+        self.docs = [self.docs[index] for index in failed]
+        # In place: the retry isolates the records of this list if it gives up.
+        self.records[:] = [self.records[index] for index in failed]
+        logger.warning(
+            "Batch %s: %d writes failed (first error code %s); retrying only those",
+            self.batch_id,
+            len(failed),
+            errors[0].get("code"),
+        )
+
+
+def _upserts(pymongo: Any, docs: list[dict[str, Any]]) -> list[Any]:
+    """Return one ``UpdateOne`` upsert per document, keyed by ``_id``."""
+    return [pymongo.UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in docs]
+
+
+def _checkpoint_name(config: MongoDbSinkConfig) -> str:
+    """Return the checkpoint name of the collection *config* writes to."""
+    return f"mongodb:{_redact_uri(config.uri)}/{config.database}.{config.collection}"
+
+
 def _record_to_document(record: Any, study_key: str) -> dict[str, Any]:
     """Wrap a typed ``Record`` model in the standard document envelope."""
     from imednet.integrations.enrichment import CentralizedMapper
@@ -159,7 +252,15 @@ class MongoDbExportSink(ExportSink):
         self._study_key = self.config.study_key
         self._client: Any = None
         self._collection: Any = None
+        self._writer: ThreadPoolExecutor | None = None
+        self._in_flight: deque[Future[int]] = deque()
+        self._unsettled: set[str] = set()
         self._connect()
+        if config.max_in_flight_batches > 1:
+            self._writer = ThreadPoolExecutor(
+                max_workers=config.max_in_flight_batches,
+                thread_name_prefix="imednet-mongodb-write",
+            )
 
     # ------------------------------------------------------------------
     # Connection management
@@ -186,39 +287,103 @@ class MongoDbExportSink(ExportSink):
     # ------------------------------------------------------------------
 
     def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
-        """Write *records* to MongoDB using upsert (idempotent) or insert."""
+        """Write *records* to MongoDB using upsert (idempotent) or insert.
+
+        With concurrent writes enabled the bulk write is queued and the
+        number of documents queued is returned.
+        """
         docs = [_record_to_document(r, self._study_key) for r in records]
         if not docs:
             return 0
 
+        pending = _PendingDocuments(records, docs, batch_id)
+        payload_bytes = self._payload_bytes(docs)
+        if self._writer is None:
+            self._write_pending(pending, payload_bytes)
+            return pending.written
+
+        while self._in_flight and (
+            self._in_flight[0].done() or len(self._in_flight) >= self.config.max_in_flight_batches
+        ):
+            self._in_flight.popleft().result()
+        self._unsettled.add(batch_id)
+        self._in_flight.append(self._writer.submit(self._write_pending, pending, payload_bytes))
+        return len(docs)
+
+    def _write_pending(self, pending: _PendingDocuments, payload_bytes: int | None) -> int:
+        """Write *pending*, resending only failed documents when retried.
+
+        Records that still fail after the retries are isolated and
+        dead-lettered when ``dead_letter_path`` is set.
+        """
+        batch_id = pending.batch_id
+
         def execute_export() -> int:
             """Perform the actual write or upsert operation to MongoDB."""
-            if self.config.idempotent:
-                pymongo = _require_optional_dep("pymongo", "mongodb")
-                ops = [
-                    pymongo.UpdateOne(
-                        {"_id": doc["_id"]},
-                        {"$set": doc},
-                        upsert=True,
-                    )
-                    for doc in docs
-                ]
-                self._collection.bulk_write(ops, ordered=False)
-                written = len(docs)
-            else:
-                result = self._collection.insert_many(docs, ordered=False)
-                written = len(result.inserted_ids)
-
-            logger.debug("Wrote batch %s (%d records)", batch_id, written)
+            try:
+                pending.written += self._send(pending.docs)
+            except Exception as exc:
+                pending.keep_failed(exc)
+                raise
+
+            logger.debug("Wrote batch %s (%d records)", batch_id, pending.written)
+            return pending.written
+
+        def write_records(records: Sequence[Any]) -> int:
+            """Write a subset of the failed records once."""
+            written = self._send([_record_to_document(r, self._study_key) for r in records])
+            pending.written += written
             return written
 
-        return self._execute_with_retry("export_mongodb", batch_id, execute_export)
+        self._execute_with_retry(
+            "export_mongodb",
+            batch_id,
+            execute_export,
+            payload_bytes=payload_bytes,
+            records=pending.records,
+            write_records=write_records,
+        )
+        self._unsettled.discard(batch_id)
+        return pending.written
+
+    def _record_error(self, exc: Exception) -> bool:
+        """Return ``False`` for PyMongo connection failures as well."""
+        return not _connection_failure(exc) and super()._record_error(exc)
+
+    def _checkpoint_name(self) -> str:
+        """Name the collection, shared with :class:`AsyncMongoDbExportSink`."""
+        return _checkpoint_name(self.config)
+
+    def _durable(self, batch_id: str) -> bool:
+        """Return ``False`` while the bulk write of *batch_id* is in flight or failed."""
+        return batch_id not in self._unsettled
+
+    def _send(self, docs: list[dict[str, Any]]) -> int:
+        """Send *docs* as one unordered bulk write and return how many were written."""
+        if self.config.idempotent:
+            pymongo = _require_optional_dep("pymongo", "mongodb")
+            self._collection.bulk_write(_upserts(pymongo, docs), ordered=False)
+            return len(docs)
+        result = self._collection.insert_many(docs, ordered=False)
+        return len(result.inserted_ids)
 
     def flush(self) -> None:
-        """No-op: MongoDB writes are committed per bulk operation."""
+        """Wait for the batches still in flight; a no-op for sequential writes.
+
+        Raises:
+        -------
+        ~imednet.errors.ExportBatchError
+            When a queued batch could not be written.
+        """
+        while self._in_flight:
+            self._in_flight.popleft().result()
 
     def close(self) -> None:
         """Close the underlying PyMongo client."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True, cancel_futures=True)
+            self._writer = None
+        self._in_flight.clear()
         if self._client is not None:
             try:
                 self._client.close()
@@ -227,6 +392,124 @@ class MongoDbExportSink(ExportSink):
                 self._collection = None
 
 
+class AsyncMongoDbExportSink(AsyncExportSink):
+    """Asynchronous :class:`MongoDbExportSink` on PyMongo's ``AsyncMongoClient``.
+
+    Writes the same document envelopes with the same unordered bulk writes
+    and partial-failure retries.  Each :meth:`write_batch` awaits its bulk
+    write, so concurrency comes from the caller keeping several writes open
+    (see ``max_pending_batches`` of :func:`imednet.integrations.export_async`);
+    ``max_in_flight_batches`` does not apply.  The client connects in
+    :meth:`open`, or on the first write.  Requires PyMongo 4.9 or later.
+
+    Parameters
+    ----------
+    config:
+        Mandatory :class:`MongoDbSinkConfig`.
+    """
+
+    def __init__(self, config: MongoDbSinkConfig) -> None:
+        """Initialize the sink; nothing is connected until :meth:`open`."""
+        super().__init__(config)
+        self.config: MongoDbSinkConfig = config
+        self._study_key = config.study_key
+        self._client: Any = None
+        self._collection: Any = None
+
+    async def open(self) -> None:
+        """Create the async client, ping the server and select the collection.
+
+        Raises:
+        -------
+        ~imednet.errors.ExportConfigurationError
+            When the client cannot connect to the server.
+        ImportError
+            When the installed ``pymongo`` has no ``AsyncMongoClient``.
+        """
+        if self._collection is not None:
+            return
+        pymongo = _require_optional_dep("pymongo", "mongodb")
+        if not hasattr(pymongo, "AsyncMongoClient"):
+            raise ImportError(
+                "AsyncMongoDbExportSink requires pymongo>=4.9. "
+                "Install with \"pip install -U 'imednet[mongodb]'\"."
+            )
+        redacted = _redact_uri(self.config.uri)
+        logger.debug("Connecting to MongoDB at %s", redacted)
+        try:
+            self._client = pymongo.AsyncMongoClient(self.config.uri)
+            await self._client.admin.command("ping")
+            self._collection = self._client[self.config.database][self.config.collection]
+        except Exception as exc:
+            await self.close()
+            raise ExportConfigurationError(
+                f"Cannot connect to MongoDB at {redacted}. Driver error type: {type(exc).__name__}"
+            ) from exc
+
+    async def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write *records* to MongoDB using upsert (idempotent) or insert."""
+        docs = [_record_to_document(r, self._study_key) for r in records]
+        if not docs:
+            return 0
+        await self.open()
+        pending = _PendingDocuments(records, docs, batch_id)
+
+        async def execute_export() -> int:
+            """Send the pending documents as one unordered bulk write."""
+            try:
+                pending.written += await self._send(pending.docs)
+            except Exception as exc:
+                pending.keep_failed(exc)
+                raise
+            logger.debug("Wrote batch %s (%d records)", batch_id, pending.written)
+            return pending.written
+
+        async def write_records(subset: Sequence[Any]) -> int:
+            """Write a subset of the failed records once."""
+            written = await self._send([_record_to_document(r, self._study_key) for r in subset])
+            pending.written += written
+            return written
+
+        await self._aexecute_with_retry(
+            "export_mongodb",
+            batch_id,
+            execute_export,
+            payload_bytes=self._payload_bytes(docs),
+            records=pending.records,
+            write_records=write_records,
+        )
+        return pending.written
+
+    def _record_error(self, exc: Exception) -> bool:
+        """Return ``False`` for PyMongo connection failures as well."""
+        return not _connection_failure(exc) and super()._record_error(exc)
+
+    def _checkpoint_name(self) -> str:
+        """Name the collection, shared with :class:`MongoDbExportSink`."""
+        return _checkpoint_name(self.config)
+
+    async def _send(self, docs: list[dict[str, Any]]) -> int:
+        """Send *docs* as one unordered bulk write and return how many were written."""
+        if self.config.idempotent:
+            pymongo = _require_optional_dep("pymongo", "mongodb")
+            await self._collection.bulk_write(_upserts(pymongo, docs), ordered=False)
+            return len(docs)
+        result = await self._collection.insert_many(docs, ordered=False)
+        return len(result.inserted_ids)
+
+    async def flush(self) -> None:
+        """No-op: every write is awaited by :meth:`write_batch`."""
+
+    async def close(self) -> None:
+        """Close the async client."""
+        if self._client is not None:
+            try:
+                await self._client.close()
+            finally:
+                self._client = None
+                self._collection = None
+
+
 def export_to_mongodb(
     sdk: ImednetSDK,
     study_key: str,
@@ -248,13 +531,15 @@ def export_to_mongodb(
         )
 
     records = sdk.records.list(study_key=study_key, record_data_filter=None)
-    filtered_records = list(apply_quality_gate(sdk, study_key, records, config))
+    filtered_records = apply_quality_gate(sdk, study_key, records, config)
 
     total_written = 0
     with MongoDbExportSink(config=config) as sink:
-        for index, batch in enumerate(iter_batches(filtered_records, config.batch_size)):
-            total_written += sink.write_batch(batch, batch_id=f"{study_key}/records/{index}")
+        for index, batch in enumerate(iter_batches(filtered_records, sink.next_batch_size)):
+            total_written += sink.write_batch_checkpointed(
+                batch, batch_id=f"{study_key}/records/{index}"
+            )
     return total_written
 
 
-__all__ = ["MongoDbExportSink", "MongoDbSinkConfig", "export_to_mongodb"]
+__all__ = ["AsyncMongoDbExportSink", "MongoDbExportSink", "MongoDbSinkConfig", "export_to_mongodb"]
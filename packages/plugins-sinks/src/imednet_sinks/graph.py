@@ -33,6 +33,41 @@ When ``SinkConfig.idempotent`` is ``True`` (default) the sink uses
 ``MERGE`` on the node's primary key property so that re-running an export
 for the same batch updates existing nodes rather than creating duplicates.
 
+Parallel writes
+---------------
+By default each batch is written by one transaction that merges nodes and
+relationships row by row. With ``Neo4jSinkConfig.parallel_workers`` above
+one, a batch is written in two phases, each split over that many concurrent
+transactions. Phased writes always ``MERGE``, so they require
+``idempotent=True``:
+
+1. **Nodes** -- the distinct ``Subject``, ``Visit`` and ``Record`` keys of
+   the batch are merged per label, partitioned by a hash of the node key,
+   so no two transactions lock the same node. The ``Study`` node is merged
+   once per sink.
+2. **Relationships** -- once every node of the batch exists, relationships
+   are merged partitioned by their parent node: ``HAS_VISIT`` by subject and
+   ``HAS_RECORD`` by visit, while the ``HAS_SUBJECT`` relationships, which
+   all lock the study node, go in a single transaction.
+
+Each transaction is retried on its own. ``MERGE`` throughput depends on
+uniqueness constraints (or indexes) on the key properties above; creating
+them is left to the database administrator.
+
+Rejected records
+----------------
+With ``SinkConfig.dead_letter_path`` set, a batch that fails with an error
+the driver does not mark as retryable (e.g. a constraint violation) is split
+until the rejected records are isolated; they go to the dead-letter store
+and the rest of the batch is written with the combined statement.
+
+Async pipelines
+---------------
+:class:`AsyncNeo4jExportSink` writes the same graph through the driver's
+``AsyncGraphDatabase`` for exports driven by
+:class:`~imednet.sdk.AsyncImednetSDK`; :func:`imednet.integrations.export_async`
+uses it for the ``"neo4j"`` target.
+
 Usage
 -----
 .. code-block:: python
@@ -56,13 +91,18 @@ Usage
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Sequence
+import time
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any
 
-from imednet.errors import ExportConfigurationError
+from imednet.errors import ExportBatchError, ExportConfigurationError
 from imednet.integrations.sink_base import (
+    AsyncExportSink,
     ExportSink,
     SinkConfig,
     _redact_uri,
@@ -82,11 +122,17 @@ class Neo4jSinkConfig(SinkConfig):
     ----------
     database:
         Target Neo4j database name (default ``"neo4j"``).
+    parallel_workers:
+        Concurrent transactions per write phase. Above one, batches are
+        written in separate node and relationship phases, which requires
+        ``idempotent=True``; see *Parallel writes* in the module
+        documentation.
     """
 
     uri: str = ""
     auth: tuple[str, str] = ("", "")
     database: str = "neo4j"
+    parallel_workers: int = 1
 
     def __post_init__(self) -> None:
         """Validate Neo4j config properties after initialization."""
@@ -95,6 +141,10 @@ class Neo4jSinkConfig(SinkConfig):
             raise ValueError("uri must be a non-empty string")
         if not self.auth or not isinstance(self.auth, tuple) or len(self.auth) != 2:
             raise ValueError("auth must be a tuple of (username, password)")
+        if self.parallel_workers < 1:
+            raise ValueError("parallel_workers must be at least 1")
+        if self.parallel_workers > 1 and not self.idempotent:
+            raise ValueError("parallel_workers above 1 requires idempotent=True")
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +172,113 @@ MATCH (v:Visit {visit_id: row.visit_id, study_key: row.study_key})
 MERGE (v)-[:HAS_RECORD]->(r)
 """
 
+_MERGE_STUDY_CYPHER = """\
+UNWIND $rows AS row
+MERGE (:Study {study_key: row.study_key})
+"""
+
+# Parallel writes: per-label node statements and per-type relationship
+# statements, each paired with the key that partitions its rows.
+_RowKey = Callable[[dict[str, Any]], tuple[Any, ...]]
+
+_MERGE_NODE_STATEMENTS: list[tuple[str, str, _RowKey]] = [
+    (
+        "Subject",
+        """\
+UNWIND $rows AS row
+MERGE (:Subject {subject_key: row.subject_key, study_key: row.study_key})
+""",
+        lambda row: (row["subject_key"],),
+    ),
+    (
+        "Visit",
+        """\
+UNWIND $rows AS row
+MERGE (:Visit {visit_id: row.visit_id, study_key: row.study_key})
+""",
+        lambda row: (row["visit_id"],),
+    ),
+    (
+        "Record",
+        """\
+UNWIND $rows AS row
+MERGE (r:Record {record_id: row.record_id, study_key: row.study_key})
+SET r += row
+""",
+        lambda row: (row["record_id"],),
+    ),
+]
+
+# (name, cypher, key the rows are deduplicated on, key they are partitioned by)
+_MERGE_RELATIONSHIP_STATEMENTS: list[tuple[str, str, _RowKey, _RowKey]] = [
+    (
+        "HAS_SUBJECT",
+        """\
+UNWIND $rows AS row
+MATCH (s:Study {study_key: row.study_key})
+MATCH (su:Subject {subject_key: row.subject_key, study_key: row.study_key})
+MERGE (s)-[:HAS_SUBJECT]->(su)
+""",
+        lambda row: (row["subject_key"],),
+        lambda row: (),
+    ),
+    (
+        "HAS_VISIT",
+        """\
+UNWIND $rows AS row
+MATCH (su:Subject {subject_key: row.subject_key, study_key: row.study_key})
+MATCH (v:Visit {visit_id: row.visit_id, study_key: row.study_key})
+MERGE (su)-[:HAS_VISIT]->(v)
+""",
+        lambda row: (row["subject_key"], row["visit_id"]),
+        lambda row: (row["subject_key"],),
+    ),
+    (
+        "HAS_RECORD",
+        """\
+UNWIND $rows AS row
+MATCH (v:Visit {visit_id: row.visit_id, study_key: row.study_key})
+MATCH (r:Record {record_id: row.record_id, study_key: row.study_key})
+MERGE (v)-[:HAS_RECORD]->(r)
+""",
+        lambda row: (row["visit_id"], row["record_id"]),
+        lambda row: (row["visit_id"],),
+    ),
+]
+
+
+def _distinct(rows: list[dict[str, Any]], key: _RowKey) -> list[dict[str, Any]]:
+    """Return the last row for every distinct *key* of *rows*, in first-seen order."""
+    return list({key(row): row for row in rows}.values())
+
+
+def _partition(rows: list[dict[str, Any]], key: _RowKey, parts: int) -> list[list[dict[str, Any]]]:
+    """Split *rows* into at most *parts* non-empty groups by a stable hash of *key*."""
+    groups: list[list[dict[str, Any]]] = [[] for _ in range(parts)]
+    for row in rows:
+        groups[zlib.crc32(repr(key(row)).encode()) % parts].append(row)
+    return [group for group in groups if group]
+
+
+_Statement = tuple[str, str, list[dict[str, Any]]]
+
+
+def _phased_statements(
+    rows: list[dict[str, Any]], batch_id: str, *, workers: int
+) -> tuple[list[_Statement], list[_Statement]]:
+    """Return the ``(task_id, cypher, rows)`` node and relationship statements of a batch."""
+    nodes = [
+        (f"{batch_id}/{label}/{i}", cypher, part)
+        for label, cypher, key in _MERGE_NODE_STATEMENTS
+        for i, part in enumerate(_partition(_distinct(rows, key), key, workers))
+    ]
+    relationships = [
+        (f"{batch_id}/{name}/{i}", cypher, part)
+        for name, cypher, key, partition_key in _MERGE_RELATIONSHIP_STATEMENTS
+        for i, part in enumerate(_partition(_distinct(rows, key), partition_key, workers))
+    ]
+    return nodes, relationships
+
 
 def _post_process_graph(row: dict[str, Any]) -> dict[str, Any]:
     import json
@@ -130,6 +287,17 @@ def _post_process_graph(row: dict[str, Any]) -> dict[str, Any]:
     return row
 
 
+def _retryable(exc: Exception) -> bool:
+    """Return whether the driver marks *exc* as retryable (e.g. deadlocks, lost connections)."""
+    is_retryable = getattr(exc, "is_retryable", None)
+    return callable(is_retryable) and bool(is_retryable())
+
+
+def _checkpoint_name(config: Neo4jSinkConfig) -> str:
+    """Return the checkpoint name of the database *config* writes to."""
+    return f"neo4j:{_redact_uri(config.uri)}/{config.database}"
+
+
 def _record_to_row(record: Any, study_key: str) -> dict[str, Any]:
     """Convert a typed ``Record`` model to a flat Cypher parameter dict."""
     from imednet.integrations.enrichment import CentralizedMapper
@@ -163,7 +331,14 @@ class Neo4jExportSink(ExportSink):
         self._auth = self.config.auth
         self._study_key = self.config.study_key
         self._driver: Any = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._study_merged = False
         self._connect()
+        if config.parallel_workers > 1:
+            self._pool = ThreadPoolExecutor(
+                max_workers=config.parallel_workers,
+                thread_name_prefix="imednet-neo4j-write",
+            )
 
     # ------------------------------------------------------------------
     # Connection management
@@ -189,6 +364,17 @@ class Neo4jExportSink(ExportSink):
         rows = [_record_to_row(r, self._study_key) for r in records]
         if not rows:
             return 0
+        if self._pool is not None:
+            try:
+                return self._write_phased(rows, batch_id)
+            except ExportBatchError as exc:
+                # Failed phases may have left nodes behind; the combined MERGE rewrites them.
+                cause = exc.__cause__
+                if self.dead_letters is None:
+                    raise
+                if not isinstance(cause, Exception):
+                    raise
+                return self._isolate_failures(batch_id, records, self._write_once, cause)
 
         cypher = _MERGE_RECORD_CYPHER if self.config.idempotent else _CREATE_RECORD_CYPHER
         cfg = self.config if isinstance(self.config, Neo4jSinkConfig) else Neo4jSinkConfig()
@@ -200,13 +386,94 @@ class Neo4jExportSink(ExportSink):
             logger.debug("Wrote batch %s (%d records)", batch_id, len(rows))
             return len(rows)
 
-        return self._execute_with_retry("export_graph", batch_id, execute_export)
+        return self._execute_with_retry(
+            "export_graph",
+            batch_id,
+            execute_export,
+            payload_bytes=self._payload_bytes(rows),
+            records=records,
+            write_records=self._write_once,
+        )
+
+    def _write_once(self, records: Sequence[Any]) -> int:
+        """Write *records* in one transaction with the combined statement, without retries."""
+        rows = [_record_to_row(r, self._study_key) for r in records]
+        cypher = _MERGE_RECORD_CYPHER if self.config.idempotent else _CREATE_RECORD_CYPHER
+        with self._driver.session(database=self.config.database) as session:
+            session.run(cypher, rows=rows)
+        return len(rows)
+
+    def _record_error(self, exc: Exception) -> bool:
+        """Return ``False`` for errors the driver marks as retryable as well."""
+        return not _retryable(exc) and super()._record_error(exc)
+
+    def _checkpoint_name(self) -> str:
+        """Name the database, shared with :class:`AsyncNeo4jExportSink`."""
+        return _checkpoint_name(self.config)
+
+    def _write_phased(self, rows: list[dict[str, Any]], batch_id: str) -> int:
+        """Write *rows* as a node phase followed by a relationship phase."""
+        if not self._study_merged:
+            self._run_retried(
+                f"{batch_id}/Study", _MERGE_STUDY_CYPHER, [{"study_key": self._study_key}]
+            )
+            self._study_merged = True
+
+        nodes, relationships = _phased_statements(
+            rows, batch_id, workers=self.config.parallel_workers
+        )
+        started = time.perf_counter()
+        try:
+            self._run_concurrently(nodes)
+            self._run_concurrently(relationships)
+        except Exception:
+            self._observe_batch(batch_id, 0, time.perf_counter() - started, failures=1)
+            raise
+        self._observe_batch(
+            batch_id,
+            len(rows),
+            time.perf_counter() - started,
+            payload_bytes=self._payload_bytes(rows),
+        )
+        logger.debug(
+            "Wrote batch %s (%d records) in %d node and %d relationship transactions",
+            batch_id,
+            len(rows),
+            len(nodes),
+            len(relationships),
+        )
+        return len(rows)
+
+    def _run_concurrently(self, statements: list[_Statement]) -> None:
+        """Run every ``(task_id, cypher, rows)`` in the pool and wait for all of them."""
+        assert self._pool is not None
+        futures = [
+            self._pool.submit(self._run_retried, task_id, cypher, rows)
+            for task_id, cypher, rows in statements
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def _run_retried(self, task_id: str, cypher: str, rows: list[dict[str, Any]]) -> int:
+        """Run *cypher* over *rows* in its own transaction, retrying on failure."""
+
+        def execute_statement() -> int:
+            """Run one partition of a write phase."""
+            with self._driver.session(database=self.config.database) as session:
+                session.run(cypher, rows=rows)
+            return len(rows)
+
+        return self._execute_with_retry("export_graph", task_id, execute_statement, observe=False)
 
     def flush(self) -> None:
         """No-op: Neo4j writes are committed per transaction."""
 
     def close(self) -> None:
-        """Close the underlying Neo4j driver connection."""
+        """Shut down the write pool and close the underlying Neo4j driver connection."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
         if self._driver is not None:
             try:
                 self._driver.close()
@@ -214,6 +481,166 @@ class Neo4jExportSink(ExportSink):
                 self._driver = None
 
 
+class AsyncNeo4jExportSink(AsyncExportSink):
+    """Asynchronous :class:`Neo4jExportSink` on the driver's ``AsyncGraphDatabase``.
+
+    Writes the same graph with the same statements; with
+    ``parallel_workers`` above one the partitions of each phase run as up to
+    that many concurrent coroutines instead of on a thread pool.  The driver connects
+    in :meth:`open`, or on the first write.
+
+    Parameters
+    ----------
+    config:
+        Mandatory :class:`Neo4jSinkConfig`.
+    """
+
+    def __init__(self, config: Neo4jSinkConfig) -> None:
+        """Initialize the sink; nothing is connected until :meth:`open`."""
+        super().__init__(config)
+        self.config: Neo4jSinkConfig = config
+        self._study_key = config.study_key
+        self._driver: Any = None
+        self._study_merged = False
+        self._slots = asyncio.Semaphore(config.parallel_workers)
+
+    async def open(self) -> None:
+        """Create the async driver and verify connectivity.
+
+        Raises:
+        -------
+        ~imednet.errors.ExportConfigurationError
+            When the driver cannot connect to the database.
+        """
+        if self._driver is not None:
+            return
+        neo4j_mod = _require_optional_dep("neo4j", "neo4j")
+        redacted = _redact_uri(self.config.uri)
+        logger.debug("Connecting to Neo4j at %s", redacted)
+        try:
+            self._driver = neo4j_mod.AsyncGraphDatabase.driver(
+                self.config.uri, auth=self.config.auth
+            )
+            await self._driver.verify_connectivity()
+        except Exception as exc:
+            self._driver = None
+            raise ExportConfigurationError(f"Cannot connect to Neo4j at {redacted}: {exc}") from exc
+
+    async def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
+        """Write *records* to Neo4j using MERGE (idempotent) or CREATE."""
+        rows = [_record_to_row(r, self._study_key) for r in records]
+        if not rows:
+            return 0
+        await self.open()
+        if self.config.parallel_workers > 1:
+            try:
+                return await self._write_phased(rows, batch_id)
+            except ExportBatchError as exc:
+                cause = exc.__cause__
+                if self.dead_letters is None:
+                    raise
+                if not isinstance(cause, Exception):
+                    raise
+                return await self._aisolate_failures(batch_id, records, self._write_once, cause)
+        cypher = _MERGE_RECORD_CYPHER if self.config.idempotent else _CREATE_RECORD_CYPHER
+        return await self._run_retried(
+            batch_id,
+            cypher,
+            rows,
+            payload_bytes=self._payload_bytes(rows),
+            observe=True,
+            records=records,
+        )
+
+    async def _write_once(self, records: Sequence[Any]) -> int:
+        """Write *records* in one transaction with the combined statement, without retries."""
+        rows = [_record_to_row(r, self._study_key) for r in records]
+        cypher = _MERGE_RECORD_CYPHER if self.config.idempotent else _CREATE_RECORD_CYPHER
+        async with self._slots, self._driver.session(database=self.config.database) as session:
+            await session.run(cypher, rows=rows)
+        return len(rows)
+
+    def _record_error(self, exc: Exception) -> bool:
+        """Return ``False`` for errors the driver marks as retryable as well."""
+        return not _retryable(exc) and super()._record_error(exc)
+
+    def _checkpoint_name(self) -> str:
+        """Name the database, shared with :class:`Neo4jExportSink`."""
+        return _checkpoint_name(self.config)
+
+    async def _write_phased(self, rows: list[dict[str, Any]], batch_id: str) -> int:
+        """Write *rows* as a node phase followed by a relationship phase."""
+        if not self._study_merged:
+            await self._run_retried(
+                f"{batch_id}/Study", _MERGE_STUDY_CYPHER, [{"study_key": self._study_key}]
+            )
+            self._study_merged = True
+        nodes, relationships = _phased_statements(
+            rows, batch_id, workers=self.config.parallel_workers
+        )
+        started = time.perf_counter()
+        try:
+            for statements in (nodes, relationships):
+                await asyncio.gather(*(self._run_retried(*statement) for statement in statements))
+        except Exception:
+            self._observe_batch(batch_id, 0, time.perf_counter() - started, failures=1)
+            raise
+        self._observe_batch(
+            batch_id,
+            len(rows),
+            time.perf_counter() - started,
+            payload_bytes=self._payload_bytes(rows),
+        )
+        return len(rows)
+
+    async def _run_retried(
+        self,
+        task_id: str,
+        cypher: str,
+        rows: list[dict[str, Any]],
+        *,
+        payload_bytes: int | None = None,
+        observe: bool = False,
+        records: Sequence[Any] | None = None,
+    ) -> int:
+        """Run *cypher* over *rows* in its own transaction, retrying on failure.
+
+        With *records*, the records behind *rows*, a failure is isolated
+        record by record when dead letters are enabled.
+        """
+
+        async def execute_statement() -> int:
+            """Run the statement in a new session."""
+            async with (
+                self._slots,
+                self._driver.session(database=self.config.database) as session,
+            ):
+                await session.run(cypher, rows=rows)
+            logger.debug("Wrote %s (%d rows)", task_id, len(rows))
+            return len(rows)
+
+        return await self._aexecute_with_retry(
+            "export_graph",
+            task_id,
+            execute_statement,
+            payload_bytes=payload_bytes,
+            observe=observe,
+            records=records,
+            write_records=self._write_once if records is not None else None,
+        )
+
+    async def flush(self) -> None:
+        """No-op: Neo4j writes are committed per transaction."""
+
+    async def close(self) -> None:
+        """Close the async driver."""
+        if self._driver is not None:
+            try:
+                await self._driver.close()
+            finally:
+                self._driver = None
+
+
 def export_to_neo4j(
     sdk: ImednetSDK,
     study_key: str,
@@ -222,7 +649,10 @@ def export_to_neo4j(
     *,
     config: Neo4jSinkConfig | None = None,
 ) -> int:
-    """Export study records to Neo4j using :class:`Neo4jExportSink`."""
+    """Export study records to Neo4j using :class:`Neo4jExportSink`.
+
+    Records are written batch by batch as they are fetched.
+    """
     if config is None:
         config = Neo4jSinkConfig(
             study_key=study_key,
@@ -232,9 +662,11 @@ def export_to_neo4j(
     records = sdk.records.list(study_key=study_key, record_data_filter=None)
     total_written = 0
     with Neo4jExportSink(config=config) as sink:
-        for index, batch in enumerate(iter_batches(list(records), config.batch_size)):
-            total_written += sink.write_batch(batch, batch_id=f"{study_key}/records/{index}")
+        for index, batch in enumerate(iter_batches(records, sink.next_batch_size)):
+            total_written += sink.write_batch_checkpointed(
+                batch, batch_id=f"{study_key}/records/{index}"
+            )
     return total_written
 
 
-__all__ = ["Neo4jExportSink", "Neo4jSinkConfig", "export_to_neo4j"]
+__all__ = ["AsyncNeo4jExportSink", "Neo4jExportSink", "Neo4jSinkConfig", "export_to_neo4j"]
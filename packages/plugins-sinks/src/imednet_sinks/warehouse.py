@@ -23,9 +23,35 @@ After each successful ``COPY INTO``, a manifest entry is appended to
         "batch_id":   "MYSTUDY/FORM1/0",
         "stage_path": "@MY_STAGE/imednet/MYSTUDY/FORM1/batch_0.parquet",
         "row_count":  500,
+        "digest":     "9f86d081884c7d65...",
         "loaded_at":  "2024-01-15T12:00:00Z"
     }
 
+``digest`` is the :func:`~imednet.integrations.sink_base.batch_digest` of the
+batch's records.
+
+Pipelined mode
+--------------
+With ``SnowflakeSinkConfig.pipelined`` set, :meth:`SnowflakeExportSink.write_batch`
+only queues the batch and returns:
+
+* ``parallel_uploads`` threads encode batches to Parquet and ``PUT`` them to
+  the stage concurrently, while the caller prepares further batches;
+* once ``files_per_copy`` files are staged, one ``COPY INTO ... FILES = (...)``
+  loads them all on a loader thread, overlapping with further uploads;
+* the manifest entry of each batch is written only after its ``COPY`` has
+  succeeded, and a batch whose id and digest are already in the manifest is
+  skipped when the export is re-run; a batch whose records changed since is
+  loaded again. Together with ``FORCE = FALSE`` for files loaded just before
+  a crash, every version of a batch is loaded exactly once.
+
+Upload and load errors surface as :class:`~imednet.errors.ExportBatchError`
+from a later :meth:`~SnowflakeExportSink.write_batch` or from
+:meth:`~SnowflakeExportSink.flush`; batches whose load never completed are
+absent from the manifest, so re-running the export loads them.  Likewise,
+with ``SinkConfig.checkpoint_path`` set a batch is checkpointed only after
+its ``COPY`` has succeeded.
+
 Optional dependencies
 ---------------------
 * ``snowflake-connector-python`` (``pip install 'imednet[snowflake]'``)
@@ -69,23 +95,32 @@ import json
 import logging
 import os
 import tempfile
+from collections import deque
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from imednet.errors import ExportConfigurationError
+from imednet.errors import ExportBatchError, ExportConfigurationError
 from imednet.integrations.sink_base import (
     ExportSink,
     SinkConfig,
     _require_optional_dep,
+    batch_digest,
     iter_batches,
 )
 from imednet.sdk import ImednetSDK
 
 logger = logging.getLogger(__name__)
 
+# Snowflake accepts at most this many names in a COPY INTO ... FILES list.
+_MAX_COPY_FILES = 1000
+
+# Pipelined mode keeps this many COPY commands queued before write_batch waits.
+_MAX_PENDING_LOADS = 2
+
 
 @dataclass
 class SnowflakeSinkConfig(SinkConfig):
@@ -117,6 +152,14 @@ class SnowflakeSinkConfig(SinkConfig):
     manifest_path:
         Optional path to a JSON-lines file where each loaded batch is
         recorded.
+    pipelined:
+        Stage batches in the background and load them in groups; see
+        *Pipelined mode* in the module documentation.
+    parallel_uploads:
+        Pipelined mode: number of batches encoded and ``PUT`` concurrently.
+    files_per_copy:
+        Pipelined mode: number of staged files loaded by one ``COPY INTO``
+        (at most 1000, Snowflake's limit for a ``FILES`` list).
     """
 
     account: str = ""
@@ -130,6 +173,27 @@ class SnowflakeSinkConfig(SinkConfig):
     stage_prefix: str = "imednet"
     local_staging_dir: str | os.PathLike[str] | None = None
     manifest_path: str | os.PathLike[str] | None = None
+    pipelined: bool = False
+    parallel_uploads: int = 4
+    files_per_copy: int = 16
+
+    def __post_init__(self) -> None:
+        """Validate pipelined-mode sizes after initialization."""
+        super().__post_init__()  # type: ignore[no-untyped-call]
+        if self.parallel_uploads < 1:
+            raise ValueError("parallel_uploads must be at least 1")
+        if not 1 <= self.files_per_copy <= _MAX_COPY_FILES:
+            raise ValueError(f"files_per_copy must be between 1 and {_MAX_COPY_FILES}")
+
+
+@dataclass
+class _StagedFile:
+    """A batch uploaded to the stage and waiting to be loaded."""
+
+    batch_id: str
+    file_name: str
+    row_count: int
+    digest: str
 
 
 def _records_to_arrow_table(records: Sequence[Any]) -> Any:
@@ -168,7 +232,16 @@ class SnowflakeExportSink(ExportSink):
         self._cfg: SnowflakeSinkConfig = config
         self._conn: Any = None
         self._tmp_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._uploads: ThreadPoolExecutor | None = None
+        self._loader: ThreadPoolExecutor | None = None
+        self._uploading: deque[Future[_StagedFile]] = deque()
+        self._staged: list[_StagedFile] = []
+        self._loading: deque[Future[None]] = deque()
+        self._loaded_digests: dict[str, str] = {}
+        self._queued_digests: dict[str, str] = {}
         self._connect()
+        if config.pipelined:
+            self._start_pipeline()
 
     # ------------------------------------------------------------------
     # Connection management
@@ -225,15 +298,18 @@ class SnowflakeExportSink(ExportSink):
     # ------------------------------------------------------------------
 
     def write_batch(self, records: Sequence[Any], *, batch_id: str) -> int:
-        """Write *records* to Snowflake via Parquet staging + COPY INTO."""
+        """Write *records* to Snowflake via Parquet staging + COPY INTO.
+
+        In pipelined mode the batch is queued for staging and loading and
+        its record count returned straight away; a batch recorded in the
+        manifest with the same records is skipped and counts as ``0``.
+        """
         if not records:
             return 0
+        if self._cfg.pipelined:
+            return self._queue_batch(records, batch_id)
 
-        arrow_table = _records_to_arrow_table(records)
-        safe_batch = batch_id.replace("/", "_").replace(" ", "_")
-        local_path = Path(self._staging_dir) / f"{safe_batch}.parquet"
-        pq = _require_optional_dep("pyarrow.parquet", "snowflake")
-        pq.write_table(arrow_table, str(local_path))
+        safe_batch, local_path = self._write_parquet(records, batch_id)
 
         cfg = self._cfg
         stage_path = f"@{cfg.stage}/{cfg.stage_prefix}/{safe_batch}.parquet"
@@ -243,13 +319,8 @@ class SnowflakeExportSink(ExportSink):
             cur = self._conn.cursor()
             try:
                 cur.execute(f"PUT file://{local_path} @{cfg.stage}/{cfg.stage_prefix}/")  # nosem
-                force_clause = "FORCE = FALSE" if self.config.idempotent else "FORCE = TRUE"
                 cur.execute(
-                    f"COPY INTO {cfg.database}.{cfg.schema}.{cfg.table} "
-                    f"FROM @{cfg.stage}/{cfg.stage_prefix}/{safe_batch}.parquet "
-                    f"FILE_FORMAT = (TYPE = PARQUET) "
-                    f"MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE "
-                    f"{force_clause}"
+                    self._copy_sql(f"FROM @{cfg.stage}/{cfg.stage_prefix}/{safe_batch}.parquet")
                 )  # nosem
                 rows_loaded = len(records)
                 logger.debug(
@@ -258,18 +329,47 @@ class SnowflakeExportSink(ExportSink):
                     rows_loaded,
                     stage_path,
                 )
-                self._append_manifest(batch_id, stage_path, rows_loaded)
+                self._append_manifest(batch_id, stage_path, rows_loaded, batch_digest(records))
                 return rows_loaded
             finally:
                 cur.close()
 
-        return self._execute_with_retry("export_warehouse", batch_id, execute_export)
+        return self._execute_with_retry(
+            "export_warehouse", batch_id, execute_export, payload_bytes=self._file_bytes(local_path)
+        )
 
     def flush(self) -> None:
-        """No-op: each batch is committed individually."""
+        """Wait until every queued batch is staged and loaded (pipelined mode).
+
+        Outside pipelined mode each batch is committed individually and this
+        is a no-op.
+
+        Raises:
+        -------
+        ~imednet.errors.ExportBatchError
+            When a queued batch could not be staged or loaded.
+        """
+        if not self._cfg.pipelined:
+            return
+        while self._uploading:
+            self._collect_upload()
+        self._submit_load()
+        while self._loading:
+            self._loading.popleft().result()
 
     def close(self) -> None:
-        """Close the Snowflake connection and clean up temporary staging files."""
+        """Close the Snowflake connection and clean up temporary staging files.
+
+        In pipelined mode, batches not yet loaded are abandoned; they are not
+        in the manifest and are loaded when the export is run again.
+        """
+        for executor in (self._uploads, self._loader):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self._uploads = self._loader = None
+        self._uploading.clear()
+        self._loading.clear()
+        self._staged = []
         if self._conn is not None:
             try:
                 self._conn.close()
@@ -281,11 +381,169 @@ class SnowflakeExportSink(ExportSink):
             finally:
                 self._tmp_dir = None
 
+    def _checkpoint_name(self) -> str:
+        """Name the destination table."""
+        cfg = self._cfg
+        return f"snowflake:{cfg.account}/{cfg.database}.{cfg.schema}.{cfg.table}"
+
+    def _durable(self, batch_id: str) -> bool:
+        """In pipelined mode, return whether the ``COPY`` of *batch_id* has succeeded."""
+        return not self._cfg.pipelined or (
+            batch_id in self._loaded_digests and batch_id not in self._queued_digests
+        )
+
+    # ------------------------------------------------------------------
+    # Pipelined mode
+    # ------------------------------------------------------------------
+
+    def _start_pipeline(self) -> None:
+        """Create the upload and load threads and read the digests of loaded batches."""
+        cfg = self._cfg
+        self._uploads = ThreadPoolExecutor(
+            max_workers=cfg.parallel_uploads, thread_name_prefix="imednet-snowflake-put"
+        )
+        self._loader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="imednet-snowflake-copy"
+        )
+        if cfg.idempotent and cfg.manifest_path and os.path.exists(cfg.manifest_path):
+            with open(cfg.manifest_path, encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            # Later entries win; entries written before digests were recorded never match.
+            self._loaded_digests = {e["batch_id"]: e.get("digest", "") for e in entries}
+
+    def _queue_batch(self, records: Sequence[Any], batch_id: str) -> int:
+        """Queue *records* for staging, waiting while the pipeline is full.
+
+        A batch whose records are already loaded or queued under *batch_id*
+        is skipped. Changed records under a queued *batch_id* wait for the
+        pipeline to drain first, since both versions share one staged file name.
+        """
+        digest = batch_digest(records)
+        if digest in (self._loaded_digests.get(batch_id), self._queued_digests.get(batch_id)):
+            logger.info("Skipping batch %s: already loaded or queued", batch_id)
+            return 0
+        if batch_id in self._queued_digests:
+            self.flush()
+        while self._uploading and (
+            self._uploading[0].done() or len(self._uploading) >= 2 * self._cfg.parallel_uploads
+        ):
+            self._collect_upload()
+        assert self._uploads is not None
+        self._uploading.append(
+            self._uploads.submit(self._stage_batch, list(records), batch_id, digest)
+        )
+        self._queued_digests[batch_id] = digest
+        return len(records)
+
+    def _stage_batch(self, records: Sequence[Any], batch_id: str, digest: str) -> _StagedFile:
+        """Encode *records* to Parquet and ``PUT`` the file to the stage."""
+        safe_batch, local_path = self._write_parquet(records, batch_id)
+        cfg = self._cfg
+
+        def put() -> int:
+            cur = self._conn.cursor()
+            try:
+                cur.execute(
+                    f"PUT file://{local_path} @{cfg.stage}/{cfg.stage_prefix}/ "
+                    f"AUTO_COMPRESS = FALSE"
+                )  # nosem
+            finally:
+                cur.close()
+            return len(records)
+
+        self._execute_with_retry(
+            "stage_warehouse", batch_id, put, payload_bytes=self._file_bytes(local_path)
+        )
+        return _StagedFile(batch_id, f"{safe_batch}.parquet", len(records), digest)
+
+    def _collect_upload(self) -> None:
+        """Wait for the oldest upload and start a load once enough files are staged."""
+        self._staged.append(self._uploading.popleft().result())
+        if len(self._staged) >= self._cfg.files_per_copy:
+            self._submit_load()
+
+    def _submit_load(self) -> None:
+        """Hand the staged files to the loader thread as one ``COPY INTO``."""
+        while self._loading and (
+            self._loading[0].done() or len(self._loading) >= _MAX_PENDING_LOADS
+        ):
+            self._loading.popleft().result()
+        if not self._staged:
+            return
+        files, self._staged = self._staged, []
+        assert self._loader is not None
+        self._loading.append(self._loader.submit(self._load_files, files))
+
+    def _load_files(self, files: list[_StagedFile]) -> None:
+        """Load *files* with one ``COPY INTO`` and record each batch in the manifest."""
+        cfg = self._cfg
+        names = ", ".join(f"'{f.file_name}'" for f in files)
+        group_id = (
+            files[0].batch_id if len(files) == 1 else f"{files[0].batch_id}..{files[-1].batch_id}"
+        )
+
+        def copy() -> int:
+            cur = self._conn.cursor()
+            try:
+                cur.execute(
+                    self._copy_sql(f"FROM @{cfg.stage}/{cfg.stage_prefix}/ FILES = ({names})")
+                )  # nosem
+            finally:
+                cur.close()
+            return sum(f.row_count for f in files)
+
+        try:
+            rows_loaded = self._execute_with_retry(
+                "export_warehouse", group_id, copy, observe=False
+            )
+        except ExportBatchError:
+            for f in files:
+                self._queued_digests.pop(f.batch_id, None)
+                self._loaded_digests.pop(f.batch_id, None)
+            raise
+        logger.debug("Loaded %d batches (%d rows) in one COPY", len(files), rows_loaded)
+        for f in files:
+            self._append_manifest(
+                f.batch_id, f"@{cfg.stage}/{cfg.stage_prefix}/{f.file_name}", f.row_count, f.digest
+            )
+            self._loaded_digests[f.batch_id] = f.digest
+            self._queued_digests.pop(f.batch_id, None)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _append_manifest(self, batch_id: str, stage_path: str, row_count: int) -> None:
+    def _write_parquet(self, records: Sequence[Any], batch_id: str) -> tuple[str, Path]:
+        """Write *records* to a local Parquet file named after *batch_id*."""
+        arrow_table = _records_to_arrow_table(records)
+        safe_batch = batch_id.replace("/", "_").replace(" ", "_")
+        local_path = Path(self._staging_dir) / f"{safe_batch}.parquet"
+        pq = _require_optional_dep("pyarrow.parquet", "snowflake")
+        pq.write_table(arrow_table, str(local_path))
+        return safe_batch, local_path
+
+    def _file_bytes(self, local_path: Path) -> int | None:
+        """Return the size of a staged Parquet file when adaptive batching needs it."""
+        if self.batch_sizer is None:
+            return None
+        try:
+            return os.path.getsize(local_path)
+        except OSError:
+            return None
+
+    def _copy_sql(self, source: str) -> str:
+        """Return the ``COPY INTO`` statement loading Parquet from *source*."""
+        cfg = self._cfg
+        force_clause = "FORCE = FALSE" if self.config.idempotent else "FORCE = TRUE"
+        return (
+            f"COPY INTO {cfg.database}.{cfg.schema}.{cfg.table} "
+            f"{source} "
+            f"FILE_FORMAT = (TYPE = PARQUET) "
+            f"MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE "
+            f"{force_clause}"
+        )
+
+    def _append_manifest(self, batch_id: str, stage_path: str, row_count: int, digest: str) -> None:
         """Append a manifest entry for the loaded batch (JSON-lines format)."""
         manifest_path = self._cfg.manifest_path
         if not manifest_path:
@@ -294,6 +552,7 @@ class SnowflakeExportSink(ExportSink):
             "batch_id": batch_id,
             "stage_path": stage_path,
             "row_count": row_count,
+            "digest": digest,
             "loaded_at": datetime.now(tz=timezone.utc).isoformat(),
         }
         with open(manifest_path, "a", encoding="utf-8") as f:
@@ -310,12 +569,14 @@ def export_to_snowflake(
     from imednet.integrations.sink_base import apply_quality_gate
 
     records = sdk.records.list(study_key=study_key, record_data_filter=None)
-    filtered_records = list(apply_quality_gate(sdk, study_key, records, config))
+    filtered_records = apply_quality_gate(sdk, study_key, records, config)
 
     total_written = 0
     with SnowflakeExportSink(config=config) as sink:
-        for index, batch in enumerate(iter_batches(filtered_records, config.batch_size)):
-            total_written += sink.write_batch(batch, batch_id=f"{study_key}/records/{index}")
+        for index, batch in enumerate(iter_batches(filtered_records, sink.next_batch_size)):
+            total_written += sink.write_batch_checkpointed(
+                batch, batch_id=f"{study_key}/records/{index}"
+            )
     return total_written
 
 
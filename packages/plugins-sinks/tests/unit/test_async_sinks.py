@@ -0,0 +1,266 @@
+"""Asynchronous MongoDB and Neo4j sinks against in-process stand-ins for the drivers."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from imednet.integrations import export_async
+
+_NODE_RE = re.compile(r"^(?:MERGE|CREATE) \(\w*:(\w+)", re.MULTILINE)
+_REL_RE = re.compile(r"-\[:(\w+)\]->")
+
+
+class FakeBulkWriteError(Exception):
+    """Stand-in for ``pymongo.errors.BulkWriteError``."""
+
+    def __init__(self, write_errors):
+        """Store the per-operation errors like PyMongo does."""
+        super().__init__("batch op errors occurred")
+        self.details = {"writeErrors": write_errors}
+
+
+class AsyncCollection:
+    """Async collection applying upserts, failing the ids in ``fail_once`` once."""
+
+    def __init__(self) -> None:
+        """Create an empty collection."""
+        self.documents: dict[str, dict] = {}
+        self.calls: list[list[str]] = []
+        self.fail_once: set[str] = set()
+
+    async def bulk_write(self, ops, ordered=True):
+        """Apply *ops*, reporting the ids scheduled to fail as write errors."""
+        assert ordered is False
+        await asyncio.sleep(0)
+        self.calls.append([op.filter["_id"] for op in ops])
+        errors = []
+        for index, op in enumerate(ops):
+            doc_id = op.filter["_id"]
+            if doc_id in self.fail_once:
+                self.fail_once.discard(doc_id)
+                errors.append({"index": index, "code": 91})
+            else:
+                self.documents[doc_id] = op.update["$set"]
+        if errors:
+            raise FakeBulkWriteError(errors)
+
+
+class AsyncGraph:
+    """Async Neo4j driver stand-in recording the label or relationship of each statement."""
+
+    def __init__(self) -> None:
+        """Create a graph with no statements run."""
+        self.statements: list[tuple[str, int]] = []
+        self.closed = False
+
+    def module(self) -> ModuleType:
+        """Return a ``neo4j`` stand-in whose async driver runs on this graph."""
+        neo4j = ModuleType("neo4j")
+        neo4j.AsyncGraphDatabase = SimpleNamespace(driver=lambda uri, auth: self)
+        return neo4j
+
+    async def verify_connectivity(self) -> None:
+        """Accept the connection."""
+
+    def session(self, database):
+        """Return an async session running statements on this graph."""
+        return _AsyncSession(self)
+
+    async def close(self) -> None:
+        """Close the driver."""
+        self.closed = True
+
+
+class _AsyncSession:
+    """Async session context manager forwarding ``run`` to the graph."""
+
+    def __init__(self, graph: AsyncGraph) -> None:
+        """Bind the session to *graph*."""
+        self._graph = graph
+
+    async def __aenter__(self) -> _AsyncSession:
+        """Return the session."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the session."""
+
+    async def run(self, cypher: str, rows: list[dict]) -> None:
+        """Record which node or relationship *cypher* writes."""
+        await asyncio.sleep(0)
+        relationships = _REL_RE.findall(cypher)
+        if len(relationships) > 1:
+            name = "ALL"
+        else:
+            name = relationships[0] if relationships else _NODE_RE.search(cypher).group(1)
+        self._graph.statements.append((name, len(rows)))
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(monkeypatch):
+    """Reset the circuit breaker and skip retry waits."""
+    from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+    get_global_circuit_breaker().reset()
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda _seconds: real_sleep(0))
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    """Async collection served through a fake ``pymongo`` module."""
+    import imednet_sinks.document as doc_mod
+
+    fake = AsyncCollection()
+    pymongo = ModuleType("pymongo")
+    pymongo.UpdateOne = lambda filter, update, upsert: SimpleNamespace(
+        filter=filter, update=update, upsert=upsert
+    )
+    pymongo.AsyncMongoClient = lambda uri: _Client(fake)
+    monkeypatch.setattr(doc_mod, "_require_optional_dep", lambda *_: pymongo)
+    return fake
+
+
+class _Client:
+    """Minimal ``AsyncMongoClient`` returning one collection."""
+
+    def __init__(self, collection: AsyncCollection) -> None:
+        """Wrap *collection*."""
+        self.admin = self
+        self._collection = collection
+
+    async def command(self, name):
+        """Answer the ``ping`` of the admin database."""
+        return {"ok": 1}
+
+    def __getitem__(self, name):
+        """Return database ``db`` holding the fake collection as ``col``."""
+        return {"col": self._collection}
+
+    async def close(self) -> None:
+        """Close the client."""
+
+
+def _records(count: int) -> list[SimpleNamespace]:
+    """Helper function to build *count* records over two subjects."""
+    return [
+        SimpleNamespace(
+            record_id=i, form_id=1, visit_id=i % 4, subject_key=f"S{i % 2}", record_data={}
+        )
+        for i in range(count)
+    ]
+
+
+def _sdk(records):
+    """Helper function to build an SDK mock listing *records* asynchronously."""
+
+    async def pages():
+        for record in records:
+            yield record
+
+    sdk = MagicMock()
+    sdk.records.list.return_value = pages()
+    return sdk
+
+
+def test_async_mongodb_export_streams_async_records(collection):
+    """export_async writes to MongoDB with the async sink, several batches in flight."""
+    total = asyncio.run(
+        export_async(
+            "mongodb",
+            _sdk(_records(10)),
+            "STUDY1",
+            uri="mongodb://localhost",
+            database="db",
+            collection="col",
+            batch_size=3,
+            max_pending_batches=2,
+        )
+    )
+
+    assert total == 10
+    assert sorted(collection.documents) == sorted(f"STUDY1/{i}" for i in range(10))
+
+
+def test_async_mongodb_resends_only_failed_writes(collection):
+    """Only the operations reported in ``writeErrors`` are sent again."""
+    from imednet_sinks.document import AsyncMongoDbExportSink, MongoDbSinkConfig
+
+    collection.fail_once = {"STUDY1/2"}
+    config = MongoDbSinkConfig(
+        study_key="STUDY1", uri="mongodb://localhost", database="db", collection="col"
+    )
+
+    async def run():
+        async with AsyncMongoDbExportSink(config) as sink:
+            return await sink.write_batch(_records(4), batch_id="STUDY1/records/0")
+
+    assert asyncio.run(run()) == 4
+    assert collection.calls == [[f"STUDY1/{i}" for i in range(4)], ["STUDY1/2"]]
+
+
+def test_async_mongodb_requires_async_client(monkeypatch):
+    """An older PyMongo without AsyncMongoClient is reported on open."""
+    import imednet_sinks.document as doc_mod
+    from imednet_sinks.document import AsyncMongoDbExportSink, MongoDbSinkConfig
+
+    monkeypatch.setattr(doc_mod, "_require_optional_dep", lambda *_: ModuleType("pymongo"))
+    sink = AsyncMongoDbExportSink(
+        MongoDbSinkConfig(study_key="S", uri="mongodb://x", database="d", collection="c")
+    )
+
+    with pytest.raises(ImportError, match=r"pymongo>=4\.9"):
+        asyncio.run(sink.open())
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Async graph wired into the graph module."""
+    import imednet_sinks.graph as graph_mod
+
+    fake = AsyncGraph()
+    monkeypatch.setattr(graph_mod, "_require_optional_dep", lambda *_: fake.module())
+    return fake
+
+
+def test_async_neo4j_export_writes_one_statement_per_batch(graph):
+    """export_async writes each batch with the combined MERGE statement."""
+    total = asyncio.run(
+        export_async(
+            "neo4j",
+            _sdk(_records(5)),
+            "STUDY1",
+            uri="bolt://localhost",
+            auth=("neo4j", "pw"),
+            batch_size=2,
+        )
+    )
+
+    assert total == 5
+    assert graph.statements == [("ALL", 2), ("ALL", 2), ("ALL", 1)]
+    assert graph.closed
+
+
+def test_async_neo4j_parallel_batches_merge_nodes_first(graph):
+    """Parallel batches run every node statement before any relationship statement."""
+    from imednet_sinks.graph import AsyncNeo4jExportSink, Neo4jSinkConfig
+
+    config = Neo4jSinkConfig(
+        study_key="STUDY1", uri="bolt://localhost", auth=("neo4j", "pw"), parallel_workers=2
+    )
+
+    async def run():
+        async with AsyncNeo4jExportSink(config) as sink:
+            return await sink.write_batch(_records(8), batch_id="STUDY1/records/0")
+
+    assert asyncio.run(run()) == 8
+    names = [name for name, _ in graph.statements]
+    assert names[0] == "Study"
+    last_node = max(i for i, n in enumerate(names) if n in ("Subject", "Visit", "Record"))
+    assert last_node < min(i for i, n in enumerate(names) if n.startswith("HAS_"))
+    assert sum(rows for name, rows in graph.statements if name == "Record") == 8
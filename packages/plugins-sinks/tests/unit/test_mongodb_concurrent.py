@@ -0,0 +1,233 @@
+"""Concurrent and partial-failure writes of MongoDbExportSink."""
+
+from __future__ import annotations
+
+import threading
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from imednet.errors import ExportBatchError
+
+
+class FakeBulkWriteError(Exception):
+    """Stand-in for ``pymongo.errors.BulkWriteError``."""
+
+    def __init__(self, write_errors):
+        """Store the per-operation errors like PyMongo does."""
+        super().__init__("batch op errors occurred")
+        self.details = {"writeErrors": write_errors}
+
+
+class FakeCollection:
+    """Thread-safe collection applying unordered upserts with injectable failures."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Create an empty collection."""
+        self.documents: dict[str, dict] = {}
+        self.calls: list[list[str]] = []
+        self.fail_once: dict[str, int] = {}
+        self.fail_always: set[str] = set()
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def bulk_write(self, ops, ordered=True):
+        """Apply *ops*, failing the ids scheduled to fail with their error code."""
+        assert ordered is False
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append([op.filter["_id"] for op in ops])
+        threading.Event().wait(self.delay)
+        errors = []
+        with self._lock:
+            for index, op in enumerate(ops):
+                doc_id = op.filter["_id"]
+                if doc_id in self.fail_always:
+                    errors.append({"index": index, "code": 121})
+                elif doc_id in self.fail_once:
+                    errors.append({"index": index, "code": self.fail_once.pop(doc_id)})
+                else:
+                    self.documents[doc_id] = op.update["$set"]
+            self.active -= 1
+        if errors:
+            raise FakeBulkWriteError(errors)
+        return SimpleNamespace(upserted_count=len(ops) - len(errors))
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    """Fake collection served through a fake ``pymongo`` module."""
+    import imednet_sinks.document as doc_mod
+
+    from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+    get_global_circuit_breaker().reset()
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    fake = FakeCollection()
+    pymongo = ModuleType("pymongo")
+    pymongo.UpdateOne = lambda filter, update, upsert: SimpleNamespace(
+        filter=filter, update=update, upsert=upsert
+    )
+    pymongo.MongoClient = lambda uri: _Client(fake)
+    monkeypatch.setattr(doc_mod, "_require_optional_dep", lambda *_: pymongo)
+    return fake
+
+
+class _Client:
+    """Minimal ``MongoClient`` returning one collection."""
+
+    def __init__(self, collection: FakeCollection) -> None:
+        """Wrap *collection*."""
+        self.admin = SimpleNamespace(command=lambda name: {"ok": 1})
+        self._collection = collection
+
+    def __getitem__(self, name):
+        """Return database ``db`` holding the fake collection as ``col``."""
+        return {"col": self._collection} if name == "db" else None
+
+    def close(self) -> None:
+        """Close the client."""
+
+
+def _sink(**overrides):
+    """Helper function to build a sink writing to the fake collection."""
+    from imednet_sinks.document import MongoDbExportSink, MongoDbSinkConfig
+
+    values = {"study_key": "STUDY1", "uri": "mongodb://localhost", "database": "db"}
+    values.update({"collection": "col", "retry_backoff": 0.0, **overrides})
+    return MongoDbExportSink(MongoDbSinkConfig(**values))
+
+
+def _records(start: int, count: int) -> list[SimpleNamespace]:
+    """Helper function to build *count* records numbered from *start*."""
+    return [
+        SimpleNamespace(record_id=i, form_id=1, visit_id=1, subject_key="S", record_data={})
+        for i in range(start, start + count)
+    ]
+
+
+def test_partial_failure_resends_only_failed_writes(collection):
+    """Only the operations reported in ``writeErrors`` are sent again."""
+    collection.fail_once = {"STUDY1/1": 11000, "STUDY1/3": 91}
+
+    with _sink() as sink:
+        assert sink.write_batch(_records(0, 4), batch_id="STUDY1/records/0") == 4
+
+    assert collection.calls == [
+        ["STUDY1/0", "STUDY1/1", "STUDY1/2", "STUDY1/3"],
+        ["STUDY1/1", "STUDY1/3"],
+    ]
+    assert sorted(collection.documents) == [f"STUDY1/{i}" for i in range(4)]
+
+
+def test_concurrent_mode_keeps_several_batches_in_flight(collection):
+    """Batches are written concurrently and all land once flushed."""
+    collection.delay = 0.05
+
+    with _sink(max_in_flight_batches=3) as sink:
+        queued = [
+            sink.write_batch(_records(i * 5, 5), batch_id=f"STUDY1/records/{i}") for i in range(6)
+        ]
+
+    assert queued == [5] * 6
+    assert collection.max_active > 1
+    assert len(collection.documents) == 30
+
+
+def test_concurrent_mode_reports_failed_batch(collection):
+    """A batch that keeps failing raises ExportBatchError when the sink is flushed."""
+    collection.fail_always = {"STUDY1/2"}
+
+    sink = _sink(max_in_flight_batches=2)
+    sink.write_batch(_records(0, 3), batch_id="STUDY1/records/0")
+    with pytest.raises(ExportBatchError, match="STUDY1/records/0"):
+        sink.flush()
+    sink.close()
+
+    assert sorted(collection.documents) == ["STUDY1/0", "STUDY1/1"]
+
+
+def test_rejected_documents_go_to_dead_letters(collection, tmp_path):
+    """Documents that keep failing are dead-lettered and the batch still succeeds."""
+    from imednet.integrations.sink_base import DeadLetterStore
+
+    collection.fail_always = {"STUDY1/2", "STUDY1/5"}
+    path = tmp_path / "dead.sqlite"
+
+    with _sink(max_in_flight_batches=2, dead_letter_path=str(path)) as sink:
+        sink.write_batch(_records(0, 4), batch_id="STUDY1/records/0")
+        sink.write_batch(_records(4, 4), batch_id="STUDY1/records/1")
+
+    assert len(collection.documents) == 6
+    entries = DeadLetterStore(path).entries(sink="MongoDbExportSink")
+    assert sorted((e.batch_id, e.record["record_id"]) for e in entries) == [
+        ("STUDY1/records/0", 2),
+        ("STUDY1/records/1", 5),
+    ]
+
+    collection.fail_always.clear()
+    with _sink() as sink:
+        assert DeadLetterStore(path).replay(sink) == 2
+    assert len(collection.documents) == 8
+
+
+def _export_checkpointed(path, batches) -> None:
+    """Helper function to write *batches* concurrently with checkpoints at *path*."""
+    with _sink(max_in_flight_batches=2, checkpoint_path=path) as sink:
+        for i, batch in enumerate(batches):
+            sink.write_batch_checkpointed(batch, batch_id=f"STUDY1/records/{i}")
+
+
+def test_checkpoints_wait_for_in_flight_writes(collection, tmp_path):
+    """A batch whose concurrent write failed is not checkpointed and is written on rerun."""
+    from imednet.integrations.sink_base import BatchCheckpointStore
+
+    path = str(tmp_path / "checkpoints.sqlite")
+    collection.fail_always = {"STUDY1/5"}
+    batches = [_records(i * 3, 3) for i in range(3)]
+
+    with pytest.raises(ExportBatchError, match="STUDY1/records/1"):
+        _export_checkpointed(path, batches)
+    committed = BatchCheckpointStore(path).entries()
+    assert "STUDY1/records/1" not in [c.batch_id for c in committed]
+    assert {c.sink for c in committed} == {"mongodb:mongodb://localhost/db.col"}
+
+    collection.fail_always.clear()
+    collection.calls.clear()
+    _export_checkpointed(path, batches)
+    assert ["STUDY1/3", "STUDY1/4", "STUDY1/5"] in collection.calls
+    assert len(collection.calls) == 3 - len(committed)
+    assert len(BatchCheckpointStore(path)) == 0
+
+
+def test_max_in_flight_batches_is_validated():
+    """At least one batch must be allowed in flight."""
+    from imednet_sinks.document import MongoDbSinkConfig
+
+    with pytest.raises(ValueError, match="max_in_flight_batches"):
+        MongoDbSinkConfig(
+            study_key="S", uri="mongodb://x", database="d", collection="c", max_in_flight_batches=0
+        )
+
+
+def test_concurrent_upserts_with_mongomock(monkeypatch):
+    """Concurrent unordered upserts against mongomock store every record once."""
+    mongomock = pytest.importorskip("mongomock")
+    pymongo = pytest.importorskip("pymongo")
+    import imednet_sinks.document as doc_mod
+
+    client = mongomock.MongoClient()
+    module = ModuleType("pymongo")
+    module.UpdateOne = pymongo.UpdateOne
+    module.MongoClient = lambda uri: client
+    monkeypatch.setattr(doc_mod, "_require_optional_dep", lambda *_: module)
+
+    with _sink(max_in_flight_batches=4) as sink:
+        for i in range(8):
+            sink.write_batch(_records(i * 10, 10), batch_id=f"STUDY1/records/{i}")
+        sink.write_batch(_records(0, 10), batch_id="STUDY1/records/0")
+
+    assert client["db"]["col"].count_documents({}) == 80
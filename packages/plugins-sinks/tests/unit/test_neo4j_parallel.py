@@ -0,0 +1,274 @@
+"""Phased, partitioned writes of Neo4jExportSink against an in-memory graph."""
+
+from __future__ import annotations
+
+import re
+import threading
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from imednet.errors import ExportBatchError
+
+_NODE_RE = re.compile(r"^(?:MERGE|CREATE) \(\w*:(\w+)", re.MULTILINE)
+_REL_RE = re.compile(r"-\[:(\w+)\]->")
+_KEYS = {"Study": "study_key", "Subject": "subject_key", "Visit": "visit_id", "Record": "record_id"}
+_ENDPOINTS = {
+    "HAS_SUBJECT": ("Study", "Subject"),
+    "HAS_VISIT": ("Subject", "Visit"),
+    "HAS_RECORD": ("Visit", "Record"),
+}
+
+
+class FakeGraph:
+    """Thread-safe graph running the phased statements of the sink.
+
+    Relationship statements require both endpoints to exist, as their
+    ``MATCH`` clauses would otherwise silently create nothing.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Create an empty graph."""
+        self.delay = delay
+        self.nodes: dict[str, set] = {label: set() for label in _KEYS}
+        self.relationships: set[tuple] = set()
+        self.calls: list[tuple[str, list[dict]]] = []
+        self.fail: set[str] = set()
+        self.rejected: set[int] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def module(self) -> ModuleType:
+        """Return a ``neo4j`` stand-in whose driver runs statements on this graph."""
+        driver = SimpleNamespace(
+            verify_connectivity=lambda: None,
+            session=lambda database: _Session(self),
+            close=lambda: None,
+        )
+        neo4j = ModuleType("neo4j")
+        neo4j.GraphDatabase = SimpleNamespace(driver=lambda uri, auth: driver)
+        return neo4j
+
+    def run(self, cypher: str, rows: list[dict]) -> None:
+        """Apply one node or relationship statement to the graph.
+
+        Statements touching a record id in ``rejected`` fail like a
+        constraint violation.
+        """
+        if len(_REL_RE.findall(cypher)) > 1:
+            self._run_combined(rows)
+            return
+        rel = _REL_RE.search(cypher)
+        name = rel.group(1) if rel else _NODE_RE.search(cypher).group(1)
+        with self._lock:
+            if name in self.fail:
+                raise RuntimeError(f"deadlock writing {name}")
+            if name == "Record" and self.rejected & {row["record_id"] for row in rows}:
+                raise ValueError("Node already exists with label `Record`")
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append((name, rows))
+        threading.Event().wait(self.delay)
+        with self._lock:
+            self.active -= 1
+            if rel is None:
+                self.nodes[name].update(row[_KEYS[name]] for row in rows)
+                return
+            for row in rows:
+                ends = [(label, row[_KEYS[label]]) for label in _ENDPOINTS[name]]
+                for label, key in ends:
+                    assert key in self.nodes[label], f"{name} before {label} {key}"
+                self.relationships.add((name, *ends))
+
+    def _run_combined(self, rows: list[dict]) -> None:
+        """Apply the single statement merging every node and relationship of *rows*."""
+        with self._lock:
+            self.calls.append(("ALL", rows))
+            if self.rejected & {row["record_id"] for row in rows}:
+                raise ValueError("Node already exists with label `Record`")
+            for row in rows:
+                for label, key in _KEYS.items():
+                    self.nodes[label].add(row[key])
+                for name, labels in _ENDPOINTS.items():
+                    self.relationships.add((name, *[(lb, row[_KEYS[lb]]) for lb in labels]))
+
+
+class _Session:
+    """Session context manager forwarding ``run`` to the graph."""
+
+    def __init__(self, graph: FakeGraph) -> None:
+        """Bind the session to *graph*."""
+        self._graph = graph
+
+    def __enter__(self) -> _Session:
+        """Return the session."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the session."""
+
+    def run(self, cypher: str, rows: list[dict]) -> None:
+        """Run *cypher* with *rows* as parameter."""
+        self._graph.run(cypher, rows)
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """In-memory graph wired into the graph module."""
+    import imednet_sinks.graph as graph_mod
+
+    from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+    get_global_circuit_breaker().reset()
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    fake = FakeGraph()
+    monkeypatch.setattr(graph_mod, "_require_optional_dep", lambda *_: fake.module())
+    return fake
+
+
+def _config(**overrides):
+    """Helper function to build a parallel sink configuration."""
+    from imednet_sinks.graph import Neo4jSinkConfig
+
+    values = {"study_key": "STUDY1", "uri": "bolt://localhost", "auth": ("neo4j", "pw")}
+    values.update({"parallel_workers": 4, "retry_backoff": 0.0, **overrides})
+    return Neo4jSinkConfig(**values)
+
+
+def _records(start: int, count: int) -> list[SimpleNamespace]:
+    """Helper function to build records spread over three subjects with two visits each."""
+    return [
+        SimpleNamespace(
+            record_id=i,
+            form_id=1,
+            visit_id=i % 6,
+            subject_key=f"S{i % 6 // 2}",
+            record_data={"hr": i},
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def test_nodes_are_merged_before_relationships(graph):
+    """Every relationship finds its nodes and the hierarchy is complete."""
+    from imednet_sinks.graph import Neo4jExportSink
+
+    with Neo4jExportSink(_config()) as sink:
+        assert sink.write_batch(_records(0, 24), batch_id="STUDY1/records/0") == 24
+
+    names = [name for name, _ in graph.calls]
+    assert names[0] == "Study"
+    assert max(i for i, n in enumerate(names) if n in _KEYS) < names.index("HAS_SUBJECT")
+    assert graph.nodes["Subject"] == {"S0", "S1", "S2"}
+    assert len(graph.relationships) == 3 + 6 + 24
+
+
+def test_partitions_never_share_a_node(graph):
+    """Concurrent transactions of one label or relationship touch disjoint keys."""
+    from imednet_sinks.graph import Neo4jExportSink
+
+    graph.delay = 0.02
+    with Neo4jExportSink(_config()) as sink:
+        sink.write_batch(_records(0, 40), batch_id="STUDY1/records/0")
+
+    assert graph.max_active > 1
+    parents = {"Record": "record_id", "HAS_VISIT": "subject_key", "HAS_RECORD": "visit_id"}
+    for name, key in parents.items():
+        parts = [{row[key] for row in rows} for call, rows in graph.calls if call == name]
+        assert len(parts) > 1
+        assert sum(len(p) for p in parts) == len(set().union(*parts))
+    assert len([call for call, _ in graph.calls if call == "HAS_SUBJECT"]) == 1
+
+
+def test_study_node_is_merged_once_per_sink(graph):
+    """Later batches only merge their own nodes and relationships."""
+    from imednet_sinks.graph import Neo4jExportSink
+
+    with Neo4jExportSink(_config()) as sink:
+        sink.write_batch(_records(0, 6), batch_id="STUDY1/records/0")
+        sink.write_batch(_records(6, 6), batch_id="STUDY1/records/1")
+
+    assert [name for name, _ in graph.calls].count("Study") == 1
+    assert graph.nodes["Record"] == set(range(12))
+
+
+def test_failed_partition_raises_batch_error(graph):
+    """A partition that keeps failing fails the batch with its task id."""
+    from imednet_sinks.graph import Neo4jExportSink
+
+    graph.fail = {"HAS_SUBJECT"}
+    sink = Neo4jExportSink(_config())
+    with pytest.raises(ExportBatchError, match="STUDY1/records/0/HAS_SUBJECT/0"):
+        sink.write_batch(_records(0, 6), batch_id="STUDY1/records/0")
+    sink.close()
+
+    assert graph.nodes["Record"] == set(range(6))
+
+
+def test_rejected_records_go_to_dead_letters(graph, tmp_path):
+    """A record the database rejects is dead-lettered and the rest of the batch written."""
+    from imednet_sinks.graph import Neo4jExportSink
+
+    from imednet.integrations.sink_base import DeadLetterStore
+
+    graph.rejected = {5}
+    path = tmp_path / "dead.sqlite"
+    with Neo4jExportSink(_config(dead_letter_path=str(path))) as sink:
+        assert sink.write_batch(_records(0, 12), batch_id="STUDY1/records/0") == 11
+
+    assert graph.nodes["Record"] == set(range(12)) - {5}
+    (entry,) = DeadLetterStore(path).entries()
+    assert (entry.batch_id, entry.record["record_id"]) == ("STUDY1/records/0", 5)
+    assert entry.reason.startswith("ValueError: Node already exists")
+
+
+def test_export_to_neo4j_streams_records(graph):
+    """Batches are written while the record iterator is still being consumed."""
+    import imednet_sinks.graph as graph_mod
+
+    consumed = []
+
+    def records():
+        for record in _records(0, 9):
+            consumed.append(record.record_id)
+            if record.record_id == 6:
+                assert graph.nodes["Record"] == {0, 1, 2, 3, 4, 5}
+            yield record
+
+    sdk = SimpleNamespace(records=SimpleNamespace(list=lambda **kwargs: records()))
+    total = graph_mod.export_to_neo4j(sdk, "STUDY1", config=_config(batch_size=3))
+
+    assert total == 9
+    assert consumed == list(range(9))
+
+
+def test_parallel_workers_is_validated():
+    """At least one worker is required."""
+    with pytest.raises(ValueError, match="parallel_workers"):
+        _config(parallel_workers=0)
+
+
+def test_parallel_workers_require_idempotent_writes():
+    """Phased CREATE could not tie relationships to the nodes it created."""
+    with pytest.raises(ValueError, match="requires idempotent=True"):
+        _config(idempotent=False)
+
+
+def test_parallel_batches_feed_adaptive_batching(graph):
+    """A phased batch is observed once as a whole, not per partition."""
+    from imednet_sinks.graph import Neo4jExportSink
+
+    from imednet.integrations.sink_base import AdaptiveBatchPolicy
+
+    policy = AdaptiveBatchPolicy(min_batch_size=1, target_latency=60.0)
+    with Neo4jExportSink(_config(batch_size=24, adaptive_batching=policy)) as sink:
+        sink.write_batch(_records(0, 24), batch_id="STUDY1/records/0")
+
+    (decision,) = sink.batch_sizer.decisions
+    assert (decision.batch_id, decision.previous, decision.batch_size) == (
+        "STUDY1/records/0",
+        24,
+        48,
+    )
+    assert decision.bytes_per_record > 0
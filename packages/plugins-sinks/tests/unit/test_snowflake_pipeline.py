@@ -0,0 +1,280 @@
+"""Pipelined SnowflakeExportSink tests against a local stand-in for the connector."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from imednet.errors import ExportBatchError
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+_PUT_RE = re.compile(r"^PUT file://(\S+) @(\S+)/ AUTO_COMPRESS = FALSE$")
+_COPY_RE = re.compile(r"^COPY INTO (\S+) FROM @(\S+)/ FILES = \(([^)]*)\) .* FORCE = (TRUE|FALSE)$")
+
+
+class LocalSnowflake:
+    """In-process stand-in for a Snowflake account with one stage and table.
+
+    ``PUT`` copies the local Parquet file into the stage, ``COPY INTO`` appends
+    the rows of the listed staged files to the table and, like Snowflake, skips
+    files already loaded with the same content unless ``FORCE = TRUE``.
+    """
+
+    def __init__(self, put_delay: float = 0.0) -> None:
+        """Create an empty account."""
+        self.put_delay = put_delay
+        self.stage: dict[str, list[dict]] = {}
+        self.table: list[dict] = []
+        self.load_history: set[tuple[str, str]] = set()
+        self.copies: list[list[str]] = []
+        self.events: list[tuple[str, str]] = []
+        self.active_puts = 0
+        self.max_active_puts = 0
+        self.fail_copies = 0
+        self.drop_after_copy = 0
+        self._lock = threading.Lock()
+
+    def module(self) -> ModuleType:
+        """Return a ``snowflake.connector`` stand-in bound to this account."""
+        module = ModuleType("snowflake.connector")
+        module.connect = lambda **kwargs: SimpleNamespace(
+            cursor=lambda: SimpleNamespace(execute=self.execute, close=lambda: None),
+            close=lambda: None,
+        )
+        return module
+
+    def execute(self, sql: str) -> None:
+        """Run one ``PUT`` or ``COPY INTO`` statement."""
+        if match := _PUT_RE.match(sql):
+            self._put(match.group(1))
+        elif match := _COPY_RE.match(sql):
+            names = [name.strip(" '") for name in match.group(3).split(",")]
+            self._copy(names, force=match.group(4) == "TRUE")
+        else:
+            raise AssertionError(f"Unexpected statement: {sql}")
+
+    def _put(self, local_path: str) -> None:
+        with self._lock:
+            self.active_puts += 1
+            self.max_active_puts = max(self.max_active_puts, self.active_puts)
+            self.events.append(("put_start", local_path))
+        threading.Event().wait(self.put_delay)
+        rows = pq.read_table(local_path).to_pylist()
+        with self._lock:
+            self.stage[local_path.rsplit("/", 1)[-1]] = rows
+            self.active_puts -= 1
+            self.events.append(("put_end", local_path))
+
+    def _copy(self, names: list[str], *, force: bool) -> None:
+        with self._lock:
+            self.events.append(("copy", ",".join(names)))
+            if self.fail_copies:
+                self.fail_copies -= 1
+                raise RuntimeError("warehouse suspended")
+            self.copies.append(names)
+            for name in names:
+                loaded = (name, json.dumps(self.stage[name], sort_keys=True))
+                if force or loaded not in self.load_history:
+                    self.table.extend(self.stage[name])
+                    self.load_history.add(loaded)
+            if self.drop_after_copy:
+                self.drop_after_copy -= 1
+                raise ConnectionError("connection lost after COPY")
+
+
+@pytest.fixture
+def account(monkeypatch):
+    """Local Snowflake stand-in wired into the warehouse module."""
+    import imednet_sinks.warehouse as wh_mod
+
+    from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+    get_global_circuit_breaker().reset()
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    local = LocalSnowflake()
+    real_require = wh_mod._require_optional_dep
+
+    def fake_require(pkg, extras):
+        """Serve the stand-in connector and real pyarrow."""
+        return local.module() if pkg == "snowflake.connector" else real_require(pkg, extras)
+
+    monkeypatch.setattr(wh_mod, "_require_optional_dep", fake_require)
+    return local
+
+
+def _config(tmp_path, **overrides):
+    """Helper function to build a pipelined config staging into *tmp_path*."""
+    from imednet_sinks.warehouse import SnowflakeSinkConfig
+
+    values = {
+        "study_key": "STUDY1",
+        "account": "acct",
+        "user": "user",
+        "password": "secret",
+        "database": "DB",
+        "warehouse": "WH",
+        "stage": "STG",
+        "table": "TBL",
+        "local_staging_dir": str(tmp_path / "stage"),
+        "manifest_path": str(tmp_path / "manifest.jsonl"),
+        "pipelined": True,
+        "parallel_uploads": 4,
+        "files_per_copy": 3,
+        "retry_backoff": 0.0,
+    }
+    values.update(overrides)
+    return SnowflakeSinkConfig(**values)
+
+
+def _batch(index: int, size: int = 2, hr: int = 60) -> list[SimpleNamespace]:
+    """Helper function to build the records of batch *index*, with heart rates from *hr*."""
+    return [
+        SimpleNamespace(
+            record_id=index * size + i,
+            form_id=1,
+            visit_id=1,
+            subject_key="S",
+            record_data={"hr": hr + i},
+        )
+        for i in range(size)
+    ]
+
+
+def _export(config, batches) -> list[int]:
+    """Helper function to write *batches* through a pipelined sink."""
+    from imednet_sinks.warehouse import SnowflakeExportSink
+
+    with SnowflakeExportSink(config=config) as sink:
+        return [sink.write_batch(_batch(i), batch_id=f"STUDY1/records/{i}") for i in batches]
+
+
+def _export_checkpointed(config, count: int) -> list[int]:
+    """Helper function to write *count* batches through ``write_batch_checkpointed``."""
+    from imednet_sinks.warehouse import SnowflakeExportSink
+
+    with SnowflakeExportSink(config=config) as sink:
+        return [
+            sink.write_batch_checkpointed(_batch(i), batch_id=f"STUDY1/records/{i}")
+            for i in range(count)
+        ]
+
+
+def _export_killed(config, count: int) -> None:
+    """Helper function to load *count* checkpointed batches, then fail before the sink exits."""
+    from imednet_sinks.warehouse import SnowflakeExportSink
+
+    with SnowflakeExportSink(config=config) as sink:
+        for i in range(count):
+            sink.write_batch_checkpointed(_batch(i), batch_id=f"STUDY1/records/{i}")
+        sink.flush()
+        raise RuntimeError("killed")
+
+
+def _manifest(tmp_path) -> list[str]:
+    """Helper function to list the batch ids recorded in the manifest."""
+    lines = (tmp_path / "manifest.jsonl").read_text().splitlines()
+    return [json.loads(line)["batch_id"] for line in lines]
+
+
+def test_loads_staged_files_in_groups(account, tmp_path):
+    """Every batch is loaded once, several files per COPY INTO."""
+    assert _export(_config(tmp_path), range(7)) == [2] * 7
+
+    assert sorted(r["record_id"] for r in account.table) == list(range(14))
+    assert [len(names) for names in account.copies] == [3, 3, 1]
+    assert sorted(_manifest(tmp_path)) == sorted(f"STUDY1/records/{i}" for i in range(7))
+
+
+def test_uploads_run_in_parallel_and_overlap_loads(account, tmp_path):
+    """Files are staged concurrently and loading starts before staging ends."""
+    account.put_delay = 0.05
+
+    _export(_config(tmp_path, files_per_copy=2), range(8))
+
+    assert account.max_active_puts > 1
+    first_copy = next(i for i, (kind, _) in enumerate(account.events) if kind == "copy")
+    last_put = max(i for i, (kind, _) in enumerate(account.events) if kind == "put_end")
+    assert first_copy < last_put
+
+
+def test_rerun_loads_batches_whose_records_changed(account, tmp_path):
+    """A rerun skips unchanged batches in the manifest and loads changed and new ones."""
+    from imednet_sinks.warehouse import SnowflakeExportSink
+
+    _export(_config(tmp_path), range(3))
+    account.events.clear()
+
+    with SnowflakeExportSink(config=_config(tmp_path)) as sink:
+        written = [
+            sink.write_batch(_batch(i, hr=90 if i == 1 else 60), batch_id=f"STUDY1/records/{i}")
+            for i in range(4)
+        ]
+
+    assert written == [0, 2, 0, 2]
+    assert len([kind for kind, _ in account.events if kind == "put_start"]) == 2
+    assert sorted(r["record_data"]["hr"] for r in account.table)[-2:] == [90, 91]
+    assert len(account.table) == 10
+    assert _manifest(tmp_path).count("STUDY1/records/1") == 2
+
+
+def test_retried_copy_does_not_load_files_twice(account, tmp_path):
+    """A COPY that loaded but lost its reply is retried without duplicates."""
+    account.drop_after_copy = 1
+
+    _export(_config(tmp_path), range(3))
+
+    assert len(account.copies) == 2
+    assert sorted(r["record_id"] for r in account.table) == list(range(6))
+    assert len(_manifest(tmp_path)) == 3
+
+
+def test_failed_load_is_reported_and_loaded_on_rerun(account, tmp_path):
+    """A failed COPY raises from flush and leaves its batches out of the manifest."""
+    account.fail_copies = 100
+
+    with pytest.raises(ExportBatchError, match=r"STUDY1/records/0\.\.STUDY1/records/2"):
+        _export(_config(tmp_path), range(3))
+
+    assert account.table == []
+    assert not (tmp_path / "manifest.jsonl").exists()
+
+    account.fail_copies = 0
+    _export(_config(tmp_path), range(3))
+    assert sorted(r["record_id"] for r in account.table) == list(range(6))
+
+
+def test_checkpoints_are_committed_after_copy(account, tmp_path):
+    """Without a manifest, only batches whose COPY succeeded are checkpointed."""
+    from imednet.integrations.sink_base import BatchCheckpointStore
+
+    path = str(tmp_path / "checkpoints.sqlite")
+    config = _config(tmp_path, manifest_path=None, checkpoint_path=path)
+    account.fail_copies = 100
+
+    with pytest.raises(ExportBatchError):
+        _export_checkpointed(config, 3)
+    assert len(BatchCheckpointStore(path)) == 0
+
+    account.fail_copies = 0
+    with pytest.raises(RuntimeError, match="killed"):
+        _export_killed(config, 2)
+    entries = BatchCheckpointStore(path).entries()
+    assert {(c.sink, c.records) for c in entries} == {("snowflake:acct/DB.PUBLIC.TBL", 2)}
+    assert len(entries) == 2
+
+    assert _export_checkpointed(config, 4) == [0, 0, 2, 2]
+    assert len(account.table) == 8
+    assert len(BatchCheckpointStore(path)) == 0
+
+
+def test_pipelined_config_is_validated(tmp_path):
+    """Pipeline sizes must be positive and within Snowflake's FILES limit."""
+    with pytest.raises(ValueError, match="parallel_uploads"):
+        _config(tmp_path, parallel_uploads=0)
+    with pytest.raises(ValueError, match="files_per_copy"):
+        _config(tmp_path, files_per_copy=1001)
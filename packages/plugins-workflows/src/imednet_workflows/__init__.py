@@ -10,7 +10,7 @@ from imednet.spi.utils import (
     JobTimeoutError,
 )
 
-from .cached_loader import CachedRecordsLoader
+from .cached_loader import CachedRecordsLoader, ChangeEvent
 from .chunked_pipeline import ChunkedRecordPipeline, iter_chunks
 from .config_version_control import ConfigVersionStore
 from .duckdb_centralizer import DuckDBIngestionWorkflow
@@ -29,7 +29,14 @@ from .standards_validation import (
 from .state_ledger import ExtractionStateLedger, LedgerState, StreamState
 from .study_structure import async_get_study_structure, get_study_structure
 from .subject_data import SubjectDataWorkflow
-from .sync_worker import SyncWorker, SyncWorkerConfig
+from .sync_worker import (
+    StudySchedule,
+    SyncRunResult,
+    SyncScheduler,
+    SyncSchedulerConfig,
+    SyncWorker,
+    SyncWorkerConfig,
+)
 from .triage_store import TriageStore
 from .uat import UATSpecification
 
@@ -37,6 +44,7 @@ __all__ = [
     "AsyncJobPoller",
     "CachedRecordsLoader",
     "CategoricalNormalizer",
+    "ChangeEvent",
     "ChunkedRecordPipeline",
     "ConfigVersionStore",
     "DuckDBIngestionWorkflow",
@@ -59,7 +67,11 @@ __all__ = [
     "StandardsReadinessReport",
     "StandardsReadinessValidator",
     "StreamState",
+    "StudySchedule",
     "SubjectDataWorkflow",
+    "SyncRunResult",
+    "SyncScheduler",
+    "SyncSchedulerConfig",
     "SyncWorker",
     "SyncWorkerConfig",
     "TriageStore",
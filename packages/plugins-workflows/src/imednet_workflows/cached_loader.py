@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import re
 import sqlite3
 import threading
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from imednet.spi.models import Record
-from imednet.spi.utils import build_filter_string
+from imednet.spi.utils import build_filter_string, sqlite_connection
 
 from .chunked_pipeline import DEFAULT_CHUNK_SIZE
 
@@ -21,6 +26,38 @@ if TYPE_CHECKING:
 
 DEFAULT_CACHE_DIR = Path.home() / ".imednet" / "cache"
 
+ChangeOperation = Literal["insert", "update", "delete"]
+
+# Triggers keep the change feed in the same transaction as the cache write, so
+# a consumer can never observe a row change without its changelog entry.
+# Upserts that do not alter the payload are filtered out by the upsert itself.
+_CHANGELOG_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_record_cache_insert
+    AFTER INSERT ON record_cache
+    BEGIN
+        INSERT INTO record_changelog (study_key, record_id, form_key, operation, date_modified)
+        VALUES (new.study_key, new.record_id, new.form_key, 'insert', new.date_modified);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_record_cache_update
+    AFTER UPDATE ON record_cache
+    BEGIN
+        INSERT INTO record_changelog (study_key, record_id, form_key, operation, date_modified)
+        VALUES (new.study_key, new.record_id, new.form_key, 'update', new.date_modified);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_record_cache_delete
+    AFTER DELETE ON record_cache
+    BEGIN
+        INSERT INTO record_changelog (study_key, record_id, form_key, operation, date_modified)
+        VALUES (old.study_key, old.record_id, old.form_key, 'delete', old.date_modified);
+    END
+    """,
+)
+
 # Per-DB-path locks that serialise _initialise_cache across threads within the
 # same process.  Switching an SQLite database to WAL journal mode requires a
 # brief exclusive lock; if multiple threads attempt the switch simultaneously
@@ -39,11 +76,13 @@ def _get_db_init_lock(resolved_path: Path) -> threading.Lock:
         return _db_init_locks.setdefault(key, threading.Lock())
 
 
-def get_sqlite_connection(db_path: str | Path) -> sqlite3.Connection:
+def get_sqlite_connection(
+    db_path: str | Path, *, check_same_thread: bool = True
+) -> sqlite3.Connection:
     """Return a SQLite connection configured for concurrent cache access."""
     resolved_path = Path(db_path).expanduser()
     resolved_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(resolved_path, timeout=30.0)
+    conn = sqlite3.connect(resolved_path, timeout=30.0, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     # busy_timeout instructs SQLite to retry at the C level on SQLITE_BUSY
     # (e.g. during the WAL transition); this complements Python's connect
@@ -54,8 +93,145 @@ def get_sqlite_connection(db_path: str | Path) -> sqlite3.Connection:
     return conn
 
 
+def parse_cache_timestamp(value: str | None) -> datetime | None:
+    """Parse a cached ``date_modified`` string into an aware UTC datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _cache_row(record: Record) -> tuple[Any, ...]:
+    """Return the ``record_cache`` row of ``record``, as written by ``_upsert_rows``."""
+    date_modified = record.date_modified
+    return (
+        record.study_key,
+        record.record_id,
+        record.form_key,
+        (
+            date_modified.isoformat()
+            if date_modified is not None and hasattr(date_modified, "isoformat")
+            else (str(date_modified) if date_modified is not None else "")
+        ),
+        json.dumps(record.model_dump(mode="json", by_alias=True), sort_keys=True),
+    )
+
+
+def _payload_digest(payload: str) -> str:
+    """Return the SHA-256 hex digest of a cached payload."""
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def safe_study_component(study_key: str) -> str:
+    """Return ``study_key`` reduced to characters that are safe in a file name."""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", study_key)
+
+
+class _ReadConnectionPool:
+    """Reusable read-only cache connections, kept per database file.
+
+    Connections are handed to one caller at a time, so they are opened with
+    ``check_same_thread=False`` and may be reused by any thread. At most
+    ``max_idle`` idle connections are retained per file; extra connections are
+    closed when returned.
+    """
+
+    def __init__(self, max_idle: int) -> None:
+        if max_idle < 0:
+            raise ValueError("read_pool_size must not be negative")
+        self._max_idle = max_idle
+        self._idle: dict[Path, list[sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, db_path: Path) -> Iterator[sqlite3.Connection]:
+        """Check out a read connection for ``db_path`` and return it afterwards."""
+        conn = self._checkout(db_path)
+        try:
+            yield conn
+        finally:
+            self._checkin(db_path, conn)
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _checkout(self, db_path: Path) -> sqlite3.Connection:
+        with self._lock:
+            idle = self._idle.get(db_path)
+            if idle:
+                return idle.pop()
+        conn = get_sqlite_connection(db_path, check_same_thread=False)
+        conn.execute("PRAGMA query_only=ON;")
+        return conn
+
+    def _checkin(self, db_path: Path, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            idle = self._idle.setdefault(db_path, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+@dataclass(frozen=True, slots=True)
+class SyncStats:
+    """Outcome of a single incremental cache sync."""
+
+    study_key: str
+    delta_count: int
+    deleted_count: int
+    previous_high_water_mark: str | None
+    boundary_skipped: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CacheSummary:
+    """Aggregate view of a study's cached rows computed without decoding payloads."""
+
+    study_key: str
+    record_count: int
+    form_counts: dict[str, int] = field(default_factory=dict)
+    high_water_mark: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    """One entry of the record cache change feed.
+
+    ``record`` holds the current cached state of the row when requested; it is
+    ``None`` for deletions and for rows removed after the change was logged.
+    """
+
+    seq: int
+    study_key: str
+    record_id: int
+    form_key: str
+    operation: ChangeOperation
+    date_modified: str
+    record: Record | None = None
+
+
 class CachedRecordsLoader:
-    """Load study records through a local SQLite cache with incremental sync."""
+    """Load study records through a local SQLite cache with incremental sync.
+
+    By default all studies share one database file. With ``shard_by_study``
+    each study is stored in its own file next to ``db_path`` (for example
+    ``records_cache.PROT-01.sqlite3``), so syncs and readers for different
+    studies never contend on the same file lock or WAL. Reads reuse pooled
+    read-only connections; writes always use a dedicated connection.
+    """
 
     def __init__(
         self,
@@ -64,6 +240,8 @@ class CachedRecordsLoader:
         cache_dir: str | Path | None = None,
         database_name: str = "records_cache.sqlite3",
         retry_attempts: int = 3,
+        shard_by_study: bool = False,
+        read_pool_size: int = 4,
     ) -> None:
         """Initialize the cached records loader.
 
@@ -72,30 +250,108 @@ class CachedRecordsLoader:
             cache_dir: Directory to store the SQLite cache. Defaults to ~/.imednet/cache.
             database_name: Name of the SQLite database file.
             retry_attempts: Number of API retry attempts.
+            shard_by_study: Store each study in its own database file.
+            read_pool_size: Idle read connections retained per database file.
+                ``0`` opens a fresh connection for every read.
         """
         self._sdk = sdk
         base_dir = DEFAULT_CACHE_DIR if cache_dir is None else Path(cache_dir).expanduser()
         self.db_path = base_dir / database_name
         self._retry_attempts = retry_attempts
-        self._initialise_cache()
+        self._shard_by_study = shard_by_study
+        self._read_pool = _ReadConnectionPool(read_pool_size)
+        self._initialised_paths: set[Path] = set()
+        self._initialised_guard = threading.Lock()
+        if not shard_by_study:
+            self._initialise_cache(self.db_path)
+
+    def db_path_for(self, study_key: str) -> Path:
+        """Return the database file that stores ``study_key``."""
+        if not self._shard_by_study:
+            return self.db_path
+        return self.db_path.with_name(
+            f"{self.db_path.stem}.{safe_study_component(study_key)}{self.db_path.suffix}"
+        )
+
+    def close(self) -> None:
+        """Close pooled read connections."""
+        self._read_pool.close()
+
+    def __enter__(self) -> CachedRecordsLoader:
+        """Return the loader for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close pooled read connections on exit."""
+        self.close()
 
     def load_records(self, study_key: str, *, reconcile: bool = True) -> list[Record]:
         """Synchronise the cache for ``study_key`` and return cached records."""
         self.sync_records(study_key, reconcile=reconcile)
         return self.get_cached_records(study_key)
 
-    def sync_records(self, study_key: str, *, reconcile: bool = True) -> None:
-        """Synchronise the cache for ``study_key`` without materialising cached rows."""
-        conn = get_sqlite_connection(self.db_path)
+    def sync_records(self, study_key: str, *, reconcile: bool = True) -> SyncStats:
+        """Synchronise the cache for ``study_key`` without materialising cached rows.
+
+        The delta re-fetches records stamped with the high-water mark, since
+        more can be stamped with it after the previous sync. Those whose
+        payload matches the digest stored in the sync cursor are skipped
+        rather than upserted again.
+        """
+        conn = get_sqlite_connection(self._study_db(study_key))
         try:
             high_water_mark = self._get_high_water_mark(conn, study_key)
-            delta_records = self._fetch_delta_records(study_key, high_water_mark)
-            self._upsert_records(conn, delta_records)
+            boundary = self._get_sync_cursor(conn, study_key, high_water_mark)
+            fetched = [_cache_row(r) for r in self._fetch_delta_records(study_key, high_water_mark)]
+            delta_rows = [
+                row
+                for row in fetched
+                if row[3] != high_water_mark or boundary.get(row[1]) != _payload_digest(row[4])
+            ]
+            self._upsert_rows(conn, delta_rows)
+            deleted_count = 0
             if reconcile:
                 active_record_ids = self._fetch_active_record_ids(study_key)
-                self.reconcile_cache(conn, study_key, active_record_ids)
+                deleted_count = self.reconcile_cache(conn, study_key, active_record_ids)
+            self._store_sync_cursor(conn, study_key)
         finally:
             conn.close()
+        return SyncStats(
+            study_key=study_key,
+            delta_count=len(delta_rows),
+            deleted_count=deleted_count,
+            previous_high_water_mark=high_water_mark,
+            boundary_skipped=len(fetched) - len(delta_rows),
+        )
+
+    def summarize_cache(
+        self, study_key: str, *, conn: sqlite3.Connection | None = None
+    ) -> CacheSummary:
+        """Return record counts per form and the high-water mark for ``study_key``.
+
+        Only indexed columns are aggregated, so the cost is independent of
+        payload size and no ``Record`` objects are built.
+        """
+        with self._reader(study_key, conn) as reader:
+            rows = reader.execute(
+                """
+                SELECT form_key, COUNT(*) AS record_count, MAX(date_modified) AS max_modified
+                FROM record_cache
+                WHERE study_key = ?
+                GROUP BY form_key
+                ORDER BY form_key
+                """,
+                (study_key,),
+            ).fetchall()
+
+        form_counts = {cast(str, row["form_key"]): cast(int, row["record_count"]) for row in rows}
+        modified = [cast(str, row["max_modified"]) for row in rows if row["max_modified"]]
+        return CacheSummary(
+            study_key=study_key,
+            record_count=sum(form_counts.values()),
+            form_counts=form_counts,
+            high_water_mark=max(modified) if modified else None,
+        )
 
     def get_cached_records(
         self, study_key: str, *, conn: sqlite3.Connection | None = None
@@ -114,12 +370,8 @@ class CachedRecordsLoader:
         if chunk_size <= 0:
             raise ValueError("chunk_size must be greater than zero")
 
-        close_conn = False
-        if conn is None:
-            conn = get_sqlite_connection(self.db_path)
-            close_conn = True
-        try:
-            cursor = conn.execute(
+        with self._reader(study_key, conn) as reader:
+            cursor = reader.execute(
                 """
                 SELECT payload
                 FROM record_cache
@@ -134,14 +386,146 @@ class CachedRecordsLoader:
                     break
                 for row in rows:
                     yield Record.from_json(json.loads(cast(str, row["payload"])))
-        finally:
-            if close_conn:
-                conn.close()
+
+    def latest_change_seq(self, study_key: str) -> int:
+        """Return the newest change-feed sequence number for ``study_key`` (0 if none)."""
+        with self._reader(study_key) as conn:
+            row = conn.execute(
+                "SELECT MAX(seq) AS max_seq FROM record_changelog WHERE study_key = ?",
+                (study_key,),
+            ).fetchone()
+        return cast(int | None, row["max_seq"]) or 0
+
+    def iter_changes(
+        self,
+        study_key: str,
+        *,
+        since: int = 0,
+        limit: int | None = None,
+        with_records: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ChangeEvent]:
+        """Yield change-feed entries for ``study_key`` with ``seq`` greater than ``since``.
+
+        Entries are ordered by ``seq``. The change feed only covers writes made
+        after it was introduced, so a new consumer should take a full snapshot
+        via :meth:`iter_cached_records` and start from :meth:`latest_change_seq`.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than zero")
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than zero")
+
+        payload_column = "c.payload" if with_records else "NULL"
+        with self._reader(study_key) as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT l.seq, l.study_key, l.record_id, l.form_key, l.operation,
+                       l.date_modified, {payload_column} AS payload
+                FROM record_changelog AS l
+                LEFT JOIN record_cache AS c
+                    ON c.study_key = l.study_key AND c.record_id = l.record_id
+                WHERE l.study_key = ? AND l.seq > ?
+                ORDER BY l.seq
+                LIMIT ?
+                """,  # noqa: S608 - only a fixed column expression is interpolated
+                (study_key, since, -1 if limit is None else limit),
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    payload = row["payload"]
+                    yield ChangeEvent(
+                        seq=cast(int, row["seq"]),
+                        study_key=cast(str, row["study_key"]),
+                        record_id=cast(int, row["record_id"]),
+                        form_key=cast(str, row["form_key"]),
+                        operation=cast(ChangeOperation, row["operation"]),
+                        date_modified=cast(str, row["date_modified"]),
+                        record=(
+                            None
+                            if payload is None or row["operation"] == "delete"
+                            else Record.from_json(json.loads(cast(str, payload)))
+                        ),
+                    )
+
+    def get_consumer_offset(self, consumer: str, study_key: str) -> int:
+        """Return the last change-feed sequence committed by ``consumer`` (0 if none)."""
+        with self._reader(study_key) as conn:
+            row = conn.execute(
+                "SELECT last_seq FROM changefeed_offsets WHERE consumer = ? AND study_key = ?",
+                (consumer, study_key),
+            ).fetchone()
+        return 0 if row is None else cast(int, row["last_seq"])
+
+    def commit_consumer_offset(self, consumer: str, study_key: str, seq: int) -> None:
+        """Record that ``consumer`` has processed every change up to ``seq``.
+
+        Offsets only move forward; committing an older sequence is a no-op.
+        """
+        if seq < 0:
+            raise ValueError("seq must not be negative")
+        with sqlite_connection(self._study_db(study_key)) as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO changefeed_offsets (consumer, study_key, last_seq, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(consumer, study_key) DO UPDATE SET
+                    last_seq = MAX(last_seq, excluded.last_seq),
+                    updated_at = excluded.updated_at
+                """,
+                (consumer, study_key, seq),
+            )
+
+    def read_changes(
+        self,
+        consumer: str,
+        study_key: str,
+        *,
+        limit: int | None = None,
+        with_records: bool = True,
+    ) -> list[ChangeEvent]:
+        """Return changes not yet committed by ``consumer``.
+
+        The offset is not advanced; call :meth:`commit_consumer_offset` with the
+        last processed ``seq`` once the batch has been durably handled.
+        """
+        return list(
+            self.iter_changes(
+                study_key,
+                since=self.get_consumer_offset(consumer, study_key),
+                limit=limit,
+                with_records=with_records,
+            )
+        )
+
+    def prune_changelog(self, study_key: str, *, up_to_seq: int | None = None) -> int:
+        """Delete change-feed entries no longer needed and return how many were removed.
+
+        Without ``up_to_seq`` only entries already committed by every registered
+        consumer of ``study_key`` are removed.
+        """
+        with sqlite_connection(self._study_db(study_key)) as conn, conn:
+            if up_to_seq is None:
+                row = conn.execute(
+                    "SELECT MIN(last_seq) AS min_seq FROM changefeed_offsets WHERE study_key = ?",
+                    (study_key,),
+                ).fetchone()
+                up_to_seq = cast(int | None, row["min_seq"])
+                if up_to_seq is None:
+                    return 0
+            cursor = conn.execute(
+                "DELETE FROM record_changelog WHERE study_key = ? AND seq <= ?",
+                (study_key, up_to_seq),
+            )
+        return cursor.rowcount
 
     def reconcile_cache(
         self, conn: sqlite3.Connection, study_key: str, active_record_ids: set[int]
-    ) -> None:
-        """Prune records removed from the upstream EDC backend."""
+    ) -> int:
+        """Prune records removed from the upstream EDC backend and return the count."""
         local_rows = conn.execute(
             "SELECT record_id FROM record_cache WHERE study_key = ?",
             (study_key,),
@@ -154,12 +538,31 @@ class CachedRecordsLoader:
                     "DELETE FROM record_cache WHERE study_key = ? AND record_id = ?",
                     [(study_key, orphaned_id) for orphaned_id in orphaned_ids],
                 )
+        return len(orphaned_ids)
+
+    @contextmanager
+    def _reader(
+        self, study_key: str, conn: sqlite3.Connection | None = None
+    ) -> Iterator[sqlite3.Connection]:
+        """Yield ``conn`` if given, otherwise a pooled read connection for the study."""
+        if conn is not None:
+            yield conn
+            return
+        with self._read_pool.connection(self._study_db(study_key)) as pooled:
+            yield pooled
 
-    def _initialise_cache(self) -> None:
+    def _study_db(self, study_key: str) -> Path:
+        """Return the study's database path, creating its schema on first use."""
+        db_path = self.db_path_for(study_key)
+        if db_path not in self._initialised_paths:
+            self._initialise_cache(db_path)
+        return db_path
+
+    def _initialise_cache(self, db_path: Path) -> None:
         """Ensure the cache database and tables are created."""
-        resolved = Path(self.db_path).expanduser().resolve()
+        resolved = Path(db_path).expanduser().resolve()
         with _get_db_init_lock(resolved):
-            conn = get_sqlite_connection(self.db_path)
+            conn = get_sqlite_connection(db_path)
             try:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS record_cache (
@@ -175,9 +578,50 @@ class CachedRecordsLoader:
                     CREATE INDEX IF NOT EXISTS idx_record_cache_study_modified
                     ON record_cache (study_key, date_modified)
                     """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS record_changelog (
+                        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                        study_key TEXT NOT NULL,
+                        record_id INTEGER NOT NULL,
+                        form_key TEXT NOT NULL,
+                        operation TEXT NOT NULL,
+                        date_modified TEXT NOT NULL,
+                        logged_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                    )
+                    """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_record_changelog_study_seq
+                    ON record_changelog (study_key, seq)
+                    """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS changefeed_offsets (
+                        consumer TEXT NOT NULL,
+                        study_key TEXT NOT NULL,
+                        last_seq INTEGER NOT NULL,
+                        updated_at TEXT NOT NULL,
+                        PRIMARY KEY (consumer, study_key)
+                    )
+                    """)
+                columns = {row["name"] for row in conn.execute("PRAGMA table_info(sync_cursor)")}
+                if "observed_at" in columns:
+                    # Cursors from before boundary digests; they are rebuilt by the next sync.
+                    conn.execute("DROP TABLE sync_cursor")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS sync_cursor (
+                        study_key TEXT NOT NULL,
+                        record_id INTEGER NOT NULL,
+                        watermark TEXT NOT NULL,
+                        digest TEXT NOT NULL,
+                        PRIMARY KEY (study_key, record_id)
+                    )
+                    """)
+                for trigger in _CHANGELOG_TRIGGERS:
+                    conn.execute(trigger)
                 conn.commit()
             finally:
                 conn.close()
+        with self._initialised_guard:
+            self._initialised_paths.add(db_path)
 
     def _get_high_water_mark(self, conn: sqlite3.Connection, study_key: str) -> str | None:
         """Get the latest modification timestamp from the local cache for a study."""
@@ -189,13 +633,54 @@ class CachedRecordsLoader:
             return None
         return cast(str | None, row["max_date_modified"])
 
+    def _get_sync_cursor(
+        self, conn: sqlite3.Connection, study_key: str, high_water_mark: str | None
+    ) -> dict[int, str]:
+        """Return the payload digests of the records cached at ``high_water_mark``, by ID.
+
+        The cursor is written at the end of each sync; entries stored for
+        another watermark (e.g. after the cache was edited outside a sync)
+        are ignored, so those boundary records are upserted again.
+        """
+        if not high_water_mark:
+            return {}
+        rows = conn.execute(
+            "SELECT record_id, digest FROM sync_cursor WHERE study_key = ? AND watermark = ?",
+            (study_key, high_water_mark),
+        ).fetchall()
+        return {int(row["record_id"]): cast(str, row["digest"]) for row in rows}
+
+    def _store_sync_cursor(self, conn: sqlite3.Connection, study_key: str) -> None:
+        """Persist the IDs and payload digests of the records at the post-sync watermark."""
+        watermark = self._get_high_water_mark(conn, study_key)
+        with conn:
+            conn.execute("DELETE FROM sync_cursor WHERE study_key = ?", (study_key,))
+            if not watermark:
+                return
+            rows = conn.execute(
+                "SELECT record_id, payload FROM record_cache "
+                "WHERE study_key = ? AND date_modified = ?",
+                (study_key, watermark),
+            ).fetchall()
+            conn.executemany(
+                "INSERT INTO sync_cursor (study_key, record_id, watermark, digest) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (study_key, row["record_id"], watermark, _payload_digest(row["payload"]))
+                    for row in rows
+                ],
+            )
+
     def _fetch_delta_records(self, study_key: str, high_water_mark: str | None) -> list[Record]:
-        """Fetch records from the API that have been modified since the high water mark."""
+        """Fetch records from the API that have been modified since the high water mark.
+
+        The filter is inclusive because records can still be stamped with the
+        watermark second after the previous sync; ``sync_records`` drops the
+        boundary records the sync cursor shows are already cached.
+        """
         if not high_water_mark:
             return self._list_records(study_key=study_key, record_data_filter=None)
 
-        # Use >= to avoid missing updates that share the high-water-mark timestamp.
-        # _upsert_records keeps refresh idempotent by deduplicating on (study_key, record_id).
         delta_filter = build_filter_string({"date_modified": (">=", high_water_mark)})
         return self._list_records_with_filter_override(
             study_key=study_key,
@@ -243,23 +728,8 @@ class CachedRecordsLoader:
             ),
         )
 
-    def _upsert_records(self, conn: sqlite3.Connection, records: Iterable[Record]) -> None:
-        """Insert or update records in the local SQLite cache."""
-        payloads = [
-            (
-                record.study_key,
-                record.record_id,
-                record.form_key,
-                (
-                    record.date_modified.isoformat()
-                    if record.date_modified is not None
-                    and hasattr(record.date_modified, "isoformat")
-                    else (str(record.date_modified) if record.date_modified is not None else "")
-                ),
-                json.dumps(record.model_dump(mode="json", by_alias=True), sort_keys=True),
-            )
-            for record in records
-        ]
+    def _upsert_rows(self, conn: sqlite3.Connection, payloads: list[tuple[Any, ...]]) -> None:
+        """Insert or update ``_cache_row`` rows in the local SQLite cache."""
         if not payloads:
             return
 
@@ -272,6 +742,7 @@ class CachedRecordsLoader:
                     form_key = excluded.form_key,
                     date_modified = excluded.date_modified,
                     payload = excluded.payload
+                WHERE record_cache.payload IS NOT excluded.payload
                 """,
                 payloads,
             )
@@ -109,8 +109,11 @@ def setup_parser(subparsers: argparse._SubParsersAction[Any]) -> None:
         )
 
         if once:
-            count = worker.run_once()
-            print(f"Synced {count} cached records for study '{study_key}'.")
+            result = worker.run_once()
+            print(
+                f"Synced {result.record_count} cached records for study '{study_key}' "
+                f"({result.delta_count} changed, {result.deleted_count} removed)."
+            )
             return
 
         print(
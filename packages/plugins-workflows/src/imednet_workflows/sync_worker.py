@@ -2,18 +2,91 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from dataclasses import dataclass
+import random
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock
+from typing import Any
 
 from filelock import FileLock
 
-from .cached_loader import CachedRecordsLoader
+from .cached_loader import CachedRecordsLoader, parse_cache_timestamp, safe_study_component
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class SyncRunResult:
+    """Monitoring statistics for one completed sync cycle."""
+
+    study_key: str
+    record_count: int
+    form_counts: dict[str, int]
+    delta_count: int
+    deleted_count: int
+    high_water_mark: str | None
+    watermark_lag_seconds: float | None
+    duration_seconds: float
+
+    def as_log_extra(self) -> dict[str, Any]:
+        """Return the result as structured logging ``extra`` fields."""
+        return {
+            "study_key": self.study_key,
+            "record_count": self.record_count,
+            "form_count": len(self.form_counts),
+            "delta_count": self.delta_count,
+            "deleted_count": self.deleted_count,
+            "high_water_mark": self.high_water_mark,
+            "watermark_lag_seconds": self.watermark_lag_seconds,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+def _watermark_lag_seconds(high_water_mark: str | None, now: datetime) -> float | None:
+    """Return seconds between ``now`` and the cached high-water mark, if parseable."""
+    parsed = parse_cache_timestamp(high_water_mark)
+    if parsed is None:
+        return None
+    return max(0.0, (now - parsed).total_seconds())
+
+
+def _study_lock_path(db_path: str | Path, study_key: str) -> Path:
+    """Return the per-study lock file path next to the cache database.
+
+    :class:`SyncWorker` and :class:`SyncScheduler` take the same lock, so a
+    study is never synced by both at once.
+    """
+    return Path(f"{db_path}.{safe_study_component(study_key)}.lock")
+
+
+def _run_sync_cycle(
+    loader: CachedRecordsLoader, study_key: str, *, reconcile: bool, lock: FileLock
+) -> SyncRunResult:
+    """Sync ``study_key`` under ``lock`` and summarise the cache with aggregate queries."""
+    started = time.perf_counter()
+    with lock:
+        stats = loader.sync_records(study_key, reconcile=reconcile)
+        summary = loader.summarize_cache(study_key)
+    return SyncRunResult(
+        study_key=study_key,
+        record_count=summary.record_count,
+        form_counts=summary.form_counts,
+        delta_count=stats.delta_count,
+        deleted_count=stats.deleted_count,
+        high_water_mark=summary.high_water_mark,
+        watermark_lag_seconds=_watermark_lag_seconds(
+            summary.high_water_mark, datetime.now(timezone.utc)
+        ),
+        duration_seconds=time.perf_counter() - started,
+    )
+
+
 @dataclass(slots=True)
 class SyncWorkerConfig:
     """Configuration for a synchronization worker."""
@@ -44,24 +117,19 @@ class SyncWorker:
         self._loader = loader
         self._config = config
         self._stop_event = stop_event or Event()
-        lock_path = Path(f"{loader.db_path}.lock")
+        lock_path = _study_lock_path(loader.db_path, config.study_key)
         self._lock = FileLock(str(lock_path), timeout=config.lock_timeout_seconds)
 
-    def run_once(self) -> int:
-        """Run one idempotent cache sync cycle."""
-        with self._lock:
-            records = self._loader.load_records(
-                self._config.study_key,
-                reconcile=self._config.reconcile,
-            )
-        logger.info(
-            "sync cycle complete",
-            extra={
-                "study_key": self._config.study_key,
-                "record_count": len(records),
-            },
+    def run_once(self) -> SyncRunResult:
+        """Run one idempotent cache sync cycle and return its statistics."""
+        result = _run_sync_cycle(
+            self._loader,
+            self._config.study_key,
+            reconcile=self._config.reconcile,
+            lock=self._lock,
         )
-        return len(records)
+        logger.info("sync cycle complete", extra=result.as_log_extra())
+        return result
 
     def run_forever(self) -> None:
         """Run sync cycles until stopped."""
@@ -84,3 +152,262 @@ class SyncWorker:
     def stop(self) -> None:
         """Request graceful termination."""
         self._stop_event.set()
+
+
+@dataclass(slots=True)
+class StudySchedule:
+    """Per-study scheduling policy for :class:`SyncScheduler`.
+
+    Studies with a higher ``priority`` are synced first when several are due
+    at the same time and receive cycle-start tokens before lower-priority ones.
+    """
+
+    study_key: str
+    interval_seconds: int = 900
+    priority: int = 0
+    reconcile: bool = True
+
+
+@dataclass(slots=True)
+class SyncSchedulerConfig:
+    """Process-wide settings shared by every study driven by a scheduler.
+
+    ``max_cycle_starts_per_minute`` caps how many sync cycles start per
+    minute across all studies. It does not meter API requests: one cycle
+    issues as many paged requests as its delta needs.
+    """
+
+    max_workers: int = 4
+    jitter_ratio: float = 0.1
+    max_cycle_starts_per_minute: int | None = None
+    lock_timeout_seconds: int = 30
+    idle_wait_seconds: float = 60.0
+
+
+class _CycleStartBudget:
+    """Token bucket bounding how many sync cycles may start per minute."""
+
+    def __init__(self, per_minute: int, clock: Callable[[], float]) -> None:
+        if per_minute <= 0:
+            raise ValueError("max_cycle_starts_per_minute must be greater than zero")
+        self._capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._lock = Lock()
+
+    def try_acquire(self) -> bool:
+        """Consume one token if available without blocking."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    def seconds_until_available(self) -> float:
+        """Return the time until the next token becomes available."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (1.0 - self._tokens) / self._rate)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass(order=True, slots=True)
+class _ScheduledStudy:
+    due_at: float
+    sort_priority: int
+    sequence: int
+    schedule: StudySchedule = field(compare=False)
+
+
+class SyncScheduler:
+    """Drive incremental cache syncs for many studies from a single process.
+
+    All studies share one :class:`CachedRecordsLoader` (and therefore one SDK
+    client and connection pool). Each study is guarded by its own file lock,
+    follows its own interval and priority, and is rescheduled with random
+    jitter so studies that share an interval drift apart instead of syncing in
+    lockstep. An optional token bucket caps the number of sync cycles started
+    per minute across all studies; requests within a cycle are not metered.
+
+    Syncs run on one long-lived thread pool, and each study is rescheduled as
+    soon as its own cycle finishes, so a slow study never delays the others.
+    """
+
+    def __init__(
+        self,
+        loader: CachedRecordsLoader,
+        schedules: Iterable[StudySchedule],
+        *,
+        config: SyncSchedulerConfig | None = None,
+        stop_event: Event | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            loader: Cached records loader shared by every scheduled study.
+            schedules: Per-study intervals, priorities and reconcile flags.
+            config: Process-wide worker, jitter and cycle-start budget settings.
+            stop_event: Optional threading event to control scheduler termination.
+            clock: Monotonic clock used for scheduling; injectable for tests.
+            rng: Random source for jitter; injectable for deterministic tests.
+        """
+        self._loader = loader
+        self._config = config or SyncSchedulerConfig()
+        if self._config.max_workers <= 0:
+            raise ValueError("max_workers must be greater than zero")
+        if not 0.0 <= self._config.jitter_ratio < 1.0:
+            raise ValueError("jitter_ratio must be in the range [0, 1)")
+        self._stop_event = stop_event or Event()
+        self._clock = clock
+        self._rng = rng or random.Random()  # noqa: S311
+        self._budget = (
+            _CycleStartBudget(self._config.max_cycle_starts_per_minute, clock)
+            if self._config.max_cycle_starts_per_minute is not None
+            else None
+        )
+        self._locks: dict[str, FileLock] = {}
+        self._queue: list[_ScheduledStudy] = []
+        self._queue_lock = Lock()
+        self._sequence = 0
+        self._pool: ThreadPoolExecutor | None = None
+        self._wakeup = Event()
+
+        now = clock()
+        for schedule in schedules:
+            if schedule.study_key in self._locks:
+                raise ValueError(f"Duplicate schedule for study '{schedule.study_key}'")
+            if schedule.interval_seconds <= 0:
+                raise ValueError("interval_seconds must be greater than zero")
+            self._locks[schedule.study_key] = FileLock(
+                str(_study_lock_path(loader.db_path, schedule.study_key)),
+                timeout=self._config.lock_timeout_seconds,
+            )
+            # Stagger the first cycle so a fresh process does not hit every study at once.
+            initial_delay = self._rng.uniform(
+                0.0, schedule.interval_seconds * self._config.jitter_ratio
+            )
+            self._push(schedule, now + initial_delay)
+
+    @property
+    def study_keys(self) -> list[str]:
+        """Return the keys of all scheduled studies."""
+        return list(self._locks)
+
+    def run_pending(self) -> list[SyncRunResult]:
+        """Sync every study that is currently due and return their results.
+
+        Due studies are started in priority order and awaited. When the shared
+        cycle-start budget is exhausted, the remaining due studies stay queued for the
+        next call.
+        """
+        futures = self._start_due()
+        wait(futures)
+        return [result for future in futures if (result := future.result()) is not None]
+
+    def run_forever(self) -> None:
+        """Run scheduled sync cycles until stopped.
+
+        Due studies are started without waiting for the cycles already
+        running; the loop wakes up whenever a cycle finishes or the next
+        study falls due.
+        """
+        logger.info(
+            "sync scheduler started",
+            extra={"study_count": len(self._locks), "max_workers": self._config.max_workers},
+        )
+        try:
+            while not self._stop_event.is_set():
+                self._wakeup.clear()
+                self._start_due()
+                self._wakeup.wait(self._seconds_until_next())
+        finally:
+            self.close()
+        logger.info("sync scheduler stopped")
+
+    def stop(self) -> None:
+        """Request graceful termination."""
+        self._stop_event.set()
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """Wait for running sync cycles and release the worker threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _start_due(self) -> list[Future[SyncRunResult | None]]:
+        """Submit every due study the cycle-start budget allows, highest priority first."""
+        now = self._clock()
+        with self._queue_lock:
+            due: list[_ScheduledStudy] = []
+            while self._queue and self._queue[0].due_at <= now:
+                due.append(heapq.heappop(self._queue))
+            due.sort(key=lambda item: (item.sort_priority, item.due_at, item.sequence))
+            runnable: list[StudySchedule] = []
+            for item in due:
+                if self._budget is not None and not self._budget.try_acquire():
+                    heapq.heappush(self._queue, item)
+                    continue
+                runnable.append(item.schedule)
+
+        if not runnable:
+            return []
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._config.max_workers, thread_name_prefix="imednet-sync"
+            )
+        return [self._pool.submit(self._run_scheduled, schedule) for schedule in runnable]
+
+    def _run_scheduled(self, schedule: StudySchedule) -> SyncRunResult | None:
+        """Sync ``schedule`` on a pool thread and reschedule it once done."""
+        try:
+            return self._sync_study(schedule)
+        except Exception:
+            logger.exception("scheduled sync cycle failed", extra={"study_key": schedule.study_key})
+            return None
+        finally:
+            self._push(schedule, self._clock() + self._jittered(schedule.interval_seconds))
+            self._wakeup.set()
+
+    def _sync_study(self, schedule: StudySchedule) -> SyncRunResult:
+        """Run one incremental sync for ``schedule`` under its study lock."""
+        result = _run_sync_cycle(
+            self._loader,
+            schedule.study_key,
+            reconcile=schedule.reconcile,
+            lock=self._locks[schedule.study_key],
+        )
+        logger.info("scheduled sync cycle complete", extra=result.as_log_extra())
+        return result
+
+    def _push(self, schedule: StudySchedule, due_at: float) -> None:
+        with self._queue_lock:
+            self._sequence += 1
+            heapq.heappush(
+                self._queue, _ScheduledStudy(due_at, -schedule.priority, self._sequence, schedule)
+            )
+
+    def _jittered(self, interval_seconds: int) -> float:
+        spread = interval_seconds * self._config.jitter_ratio
+        with self._queue_lock:
+            return interval_seconds + self._rng.uniform(-spread, spread)
+
+    def _seconds_until_next(self) -> float:
+        with self._queue_lock:
+            next_due = self._queue[0].due_at if self._queue else None
+        if next_due is None:
+            return self._config.idle_wait_seconds
+        delay = max(0.0, next_due - self._clock())
+        if self._budget is not None and delay == 0.0:
+            # Due studies are waiting on the shared budget rather than the clock.
+            delay = self._budget.seconds_until_available()
+        return min(delay, self._config.idle_wait_seconds)
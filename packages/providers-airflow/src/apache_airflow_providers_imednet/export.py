@@ -27,6 +27,11 @@ def export_to_json(*args: Any, **kwargs: Any) -> None:
     return _base_export.export_to_json(*args, **kwargs)  # type: ignore
 
 
+def export_to_ndjson(*args: Any, **kwargs: Any) -> list[str]:
+    """Wrap :func:`imednet.spi.export.export_to_ndjson` for Airflow compatibility."""
+    return _base_export.export_to_ndjson(*args, **kwargs)  # type: ignore
+
+
 def export_to_sql(*args: Any, **kwargs: Any) -> None:
     """Wrap :func:`imednet.spi.export.export_to_sql` for Airflow compatibility."""
     return _base_export.export_to_sql(*args, **kwargs)  # type: ignore
@@ -41,6 +46,7 @@ __all__ = [
     "export_to_csv",
     "export_to_excel",
     "export_to_json",
+    "export_to_ndjson",
     "export_to_parquet",
     "export_to_sql",
     "export_to_sql_by_form",
@@ -34,6 +34,7 @@ _TABULAR_EXPORTS = {
     "parquet": export.export_to_parquet,
     "excel": export.export_to_excel,
     "json": export.export_to_json,
+    "ndjson": export.export_to_ndjson,
     "sql": export.export_to_sql,
     "duckdb": getattr(export, "export_to_duckdb", None),
 }
@@ -59,6 +60,7 @@ class ImednetExportOperator(BaseOperator):
         batch_size: int = 500,
         max_retries: int = 3,
         idempotent: bool = True,
+        checkpoint_path: str | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the operator.
@@ -72,6 +74,7 @@ class ImednetExportOperator(BaseOperator):
         :param batch_size: Number of records to read and write per batch.
         :param max_retries: Maximum number of export attempts.
         :param idempotent: Whether the export execution should be safely repeatable, automatically deduplicating or replacing existing outputs as appropriate.
+        :param checkpoint_path: SQLite file of batch checkpoints for sink destinations; a retried task skips the batches an earlier try committed.
         :param kwargs: Additional Airflow BaseOperator arguments.
         """
         super().__init__(**kwargs)
@@ -86,6 +89,7 @@ class ImednetExportOperator(BaseOperator):
         self.batch_size = batch_size
         self.max_retries = max_retries
         self.idempotent = idempotent
+        self.checkpoint_path = checkpoint_path
 
     def _get_sdk(self) -> ImednetSDK:
         """Resolve the SDK client from the configured Airflow connection at execute time."""
@@ -110,6 +114,7 @@ class ImednetExportOperator(BaseOperator):
                 max_retries=config.max_retries,
                 idempotent=config.idempotent,
                 extra=config.extra,
+                checkpoint_path=config.checkpoint_path,
                 account=self.export_kwargs.get("account", ""),
                 user=self.export_kwargs.get("user", ""),
                 password=self.export_kwargs.get("password", ""),
@@ -129,6 +134,7 @@ class ImednetExportOperator(BaseOperator):
                 max_retries=config.max_retries,
                 idempotent=config.idempotent,
                 extra=config.extra,
+                checkpoint_path=config.checkpoint_path,
                 uri=self.export_kwargs.get("uri", ""),
                 auth=self.export_kwargs.get("auth", ("", "")),
             )
@@ -142,6 +148,7 @@ class ImednetExportOperator(BaseOperator):
                 max_retries=config.max_retries,
                 idempotent=config.idempotent,
                 extra=config.extra,
+                checkpoint_path=config.checkpoint_path,
                 uri=self.export_kwargs.get("uri", ""),
                 database=self.export_kwargs.get("database", ""),
                 collection=self.export_kwargs.get("collection", ""),
@@ -181,6 +188,7 @@ class ImednetExportOperator(BaseOperator):
             max_retries=self.max_retries,
             idempotent=self.idempotent,
             extra=self._get_runtime_export_kwargs(),
+            checkpoint_path=self.checkpoint_path,
         )
 
         sink = self._resolve_sink(config)
@@ -188,12 +196,20 @@ class ImednetExportOperator(BaseOperator):
         if sink:
             # Single execution path for Sink-based destinations
             raw_records = sdk.records.list(study_key=self.study_key, record_data_filter=None)
-            records_list = list(
-                sink_base.apply_quality_gate(sdk, self.study_key, raw_records, config)
+            filtered_records = sink_base.apply_quality_gate(
+                sdk, self.study_key, raw_records, config
             )
+            # Adaptive batching and checkpoints are ExportSink features; other
+            # sinks get fixed batches written unconditionally.
+            if isinstance(sink, sink_base.ExportSink):
+                batch_size: Any = sink.next_batch_size
+                write_batch = sink.write_batch_checkpointed
+            else:
+                batch_size = config.batch_size
+                write_batch = sink.write_batch
             with sink:
-                for i, batch in enumerate(sink_base.iter_batches(records_list, config.batch_size)):
-                    sink.write_batch(batch, batch_id=f"{self.study_key}/batch/{i}")
+                for i, batch in enumerate(sink_base.iter_batches(filtered_records, batch_size)):
+                    write_batch(batch, batch_id=f"{self.study_key}/batch/{i}")
         else:
             # Execution path for legacy tabular functions
             # We dispatch to getattr so mocks in tests are preserved
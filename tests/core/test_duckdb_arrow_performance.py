@@ -0,0 +1,99 @@
+"""Benchmark typed Arrow DuckDB loads against the former pandas spool path."""
+
+import random
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from imednet.integrations.duckdb_arrow import arrow_columns, load_batches, rows_to_batch
+from imednet.integrations.export import _ArrowSpool
+from imednet.utils.pandas import mask_clinical_phi_frame
+
+pytestmark = pytest.mark.performance
+
+duckdb = pytest.importorskip("duckdb")
+
+_RECORDS = 4_000
+_VARIABLES = 200
+_CHUNK = 500
+_TYPES = ["integer", "float", "text", "boolean"]
+
+
+def _study() -> tuple[list[SimpleNamespace], list[dict]]:
+    rng = random.Random(38)
+    variables = [
+        SimpleNamespace(variable_name=f"VAR_{i}", label=None, variable_type=_TYPES[i % 4])
+        for i in range(_VARIABLES)
+    ]
+    samples = {
+        "integer": lambda: str(rng.randint(0, 1_000)),
+        "float": lambda: rng.random() * 100,
+        "text": lambda: rng.choice(["yes", "no", "unknown"]),
+        "boolean": lambda: rng.random() < 0.5,
+    }
+    rows = [
+        {
+            "recordId": i,
+            "subjectKey": f"S{i}",
+            "visitId": 1,
+            "formId": 1,
+            "recordStatus": "Complete",
+            "dateCreated": None,
+            **{
+                v.variable_name: samples[v.variable_type]() if rng.random() < 0.9 else None
+                for v in variables
+            },
+        }
+        for i in range(_RECORDS)
+    ]
+    return variables, rows
+
+
+def _chunks(rows: list[dict]):
+    for start in range(0, len(rows), _CHUNK):
+        yield rows[start : start + _CHUNK]
+
+
+def _legacy(conn, variables, rows) -> None:
+    """The former path: object-dtype frames spooled to Parquet, then scanned."""
+    names = list(rows[0])
+    with _ArrowSpool() as spool:
+        for chunk in _chunks(rows):
+            spool.append(mask_clinical_phi_frame(pd.DataFrame(chunk)[names]))
+        load_batches(conn, "legacy", spool.tables())
+
+
+def _arrow(conn, variables, rows) -> None:
+    columns = arrow_columns(variables)
+    load_batches(conn, "arrow", (rows_to_batch(chunk, columns) for chunk in _chunks(rows)))
+
+
+def _best_of(fn, repeats: int = 3) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_duckdb_arrow_load_benchmark(tmp_path) -> None:
+    variables, rows = _study()
+    conn = duckdb.connect(str(tmp_path / "bench.duckdb"))
+    try:
+        legacy = _best_of(lambda: _legacy(conn, variables, rows))
+        arrow = _best_of(lambda: _arrow(conn, variables, rows))
+        counts = [
+            conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+            for name in ("legacy", "arrow")
+        ]
+        types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info('arrow')").fetchall()}
+    finally:
+        conn.close()
+
+    print(f"duckdb load: pandas spool {legacy:.3f}s, typed arrow {arrow:.3f}s")
+    assert counts == [_RECORDS, _RECORDS]
+    assert types["VAR_0"] == "BIGINT"
+    assert arrow < legacy
@@ -0,0 +1,53 @@
+"""Compare peak memory of streaming Excel writes with a whole-frame ``to_excel``."""
+
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from imednet.integrations.excel import StreamingExcelWriter
+
+pytestmark = pytest.mark.performance
+
+pytest.importorskip("openpyxl")
+
+_ROWS = 2_000
+_COLUMNS = 10
+_CHUNK = 200
+
+
+def _chunk(start: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            f"VAR_{c}": [f"value {row}-{c}" for row in range(start, start + _CHUNK)]
+            for c in range(_COLUMNS)
+        }
+    )
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_excel_peak_memory(tmp_path) -> None:
+    def _whole_frame() -> None:
+        df = pd.concat([_chunk(start) for start in range(0, _ROWS, _CHUNK)], ignore_index=True)
+        df.to_excel(tmp_path / "whole.xlsx", index=False, engine="openpyxl")
+
+    def _streaming() -> None:
+        with StreamingExcelWriter(str(tmp_path / "stream.xlsx")) as writer:
+            for start in range(0, _ROWS, _CHUNK):
+                writer.write_frame("Sheet1", _chunk(start))
+
+    whole = _peak(_whole_frame)
+    streaming = _peak(_streaming)
+
+    print(
+        f"excel peak memory: to_excel {whole / 2**20:.1f} MiB, streaming {streaming / 2**20:.1f} MiB"
+    )
+    assert streaming * 5 < whole
@@ -0,0 +1,103 @@
+"""Benchmark the streaming long-format SQL writer against the pandas ``to_sql`` loop."""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from imednet.integrations.long_sql import iter_long_batches, write_long_table
+from imednet.utils.security import global_sensitivity_registry, mask_clinical_phi
+
+pytestmark = pytest.mark.performance
+
+_RECORDS = 2_000
+_VARIABLES = 25
+_CHUNK = 1_000
+
+
+def _records() -> list[SimpleNamespace]:
+    start = datetime(2024, 1, 1)
+    return [
+        SimpleNamespace(
+            record_id=i,
+            form_id=i % 7,
+            record_data={f"VAR_{v}": f"value {i}-{v}" for v in range(_VARIABLES)},
+            date_modified=start + timedelta(minutes=i),
+        )
+        for i in range(_RECORDS)
+    ]
+
+
+def _legacy_write(engine, table_name: str, records) -> None:
+    """The former implementation: row dicts flushed through ``DataFrame.to_sql``."""
+    rows: list[dict] = []
+    first = True
+    for rec in records:
+        for name, value in rec.record_data.items():
+            masked = (
+                "***MASKED***"
+                if global_sensitivity_registry.is_sensitive(name)
+                else mask_clinical_phi(value)
+            )
+            rows.append(
+                {
+                    "record_id": rec.record_id,
+                    "form_id": rec.form_id,
+                    "variable_name": name,
+                    "value": masked,
+                    "timestamp": rec.date_modified,
+                }
+            )
+            if len(rows) >= _CHUNK:
+                pd.DataFrame(rows).to_sql(
+                    table_name, engine, if_exists="replace" if first else "append", index=False
+                )
+                rows = []
+                first = False
+    if rows:
+        pd.DataFrame(rows).to_sql(
+            table_name, engine, if_exists="replace" if first else "append", index=False
+        )
+
+
+def _best_of(fn, repeats: int = 3) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _compare(url: str) -> tuple[float, float]:
+    records = _records()
+    engine = sa.create_engine(url)
+    try:
+        legacy = _best_of(lambda: _legacy_write(engine, "legacy", records))
+        streaming = _best_of(
+            lambda: write_long_table(engine, "streaming", iter_long_batches(records, _CHUNK))
+        )
+        with engine.connect() as conn:
+            counts = [
+                conn.execute(sa.text(f"SELECT COUNT(*) FROM {name}")).scalar()
+                for name in ("legacy", "streaming")
+            ]
+    finally:
+        engine.dispose()
+    assert counts == [_RECORDS * _VARIABLES] * 2
+    print(f"{url.split(':', maxsplit=1)[0]}: legacy {legacy:.3f}s, streaming {streaming:.3f}s")
+    return legacy, streaming
+
+
+def test_long_sql_sqlite_benchmark(tmp_path) -> None:
+    legacy, streaming = _compare(f"sqlite:///{tmp_path / 'long.db'}")
+    assert streaming < legacy
+
+
+def test_long_sql_duckdb_benchmark(tmp_path) -> None:
+    pytest.importorskip("duckdb_engine")
+    legacy, streaming = _compare(f"duckdb:///{tmp_path / 'long.duckdb'}")
+    assert streaming < legacy
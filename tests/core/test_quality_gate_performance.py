@@ -0,0 +1,79 @@
+"""Benchmark the columnar batch quality gate against scoring records one at a time."""
+
+import time
+
+import pytest
+
+from imednet.integrations.sink_base import SinkConfig, quality_gate_batch
+from imednet.models.variables import Variable
+from imednet.validation.cache import SchemaCache, calculate_readiness_score
+
+pytestmark = pytest.mark.performance
+
+_RECORDS = 20_000
+_FORMS = 4
+_VARIABLES = 30
+_BATCH = 500
+
+
+def _schema() -> SchemaCache:
+    cache = SchemaCache()
+    cache.populate(
+        Variable(
+            variable_name=f"VAR_{v}",
+            variable_type="integer" if v % 2 else "text",
+            form_id=f,
+            form_key=f"FORM_{f}",
+        )
+        for f in range(_FORMS)
+        for v in range(_VARIABLES)
+    )
+    return cache
+
+
+def _records() -> list[dict]:
+    return [
+        {
+            "record_id": i,
+            "form_id": i % _FORMS,
+            "data": {
+                f"VAR_{v}": (i if v % 2 else f"v{i}")
+                for v in range(_VARIABLES)
+                if (i + v) % 61  # leave a variable out of some records
+            },
+        }
+        for i in range(_RECORDS)
+    ]
+
+
+def _per_record(schema: SchemaCache, records: list[dict], threshold: float) -> list[dict]:
+    """The former gate: one readiness score, with reasons, per record."""
+    kept = []
+    for record in records:
+        fk = schema.form_key_from_id(record["form_id"])
+        score, _ = calculate_readiness_score(schema, fk, record["data"])
+        if score >= threshold:
+            kept.append(record)
+    return kept
+
+
+def test_batch_quality_gate_speed(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level("WARNING")  # time the scoring, not per-record drop logging
+    schema = _schema()
+    records = _records()
+    config = SinkConfig("S", quality_gate_enabled=True, min_schema_readiness_score=100.0)
+
+    start = time.perf_counter()
+    expected = _per_record(schema, records, config.min_schema_readiness_score)
+    per_record = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kept = []
+    for offset in range(0, _RECORDS, _BATCH):
+        kept.extend(quality_gate_batch(schema, records[offset : offset + _BATCH], config))
+    batched = time.perf_counter() - start
+
+    print(f"quality gate: per-record {per_record:.2f}s, batched {batched:.2f}s")
+    assert kept == expected
+    assert 0 < len(kept) < _RECORDS
+    assert batched < per_record
@@ -62,19 +62,19 @@ def sqlite_env(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def _setup_per_form_mapper(monkeypatch: pytest.MonkeyPatch) -> None:
     """Helper function to  setup per form mapper."""
-    form1_vars = [MagicMock(variable_name=f"v{i}", label=f"v{i}") for i in range(1500)]
-    form2_vars = [MagicMock(variable_name=f"w{i}", label=f"w{i}") for i in range(600)]
+    form1_vars = [MagicMock(variable_name=f"v{i}", label=f"v{i}", form_id=1) for i in range(1500)]
+    form2_vars = [MagicMock(variable_name=f"w{i}", label=f"w{i}", form_id=2) for i in range(600)]
     sdk = MagicMock()
     sdk.forms.list.return_value = [
         MagicMock(form_id=1, form_key="F1"),
         MagicMock(form_id=2, form_key="F2"),
     ]
-    sdk.variables.list.side_effect = [form1_vars, form2_vars]
+    sdk.variables.list.return_value = form1_vars + form2_vars
 
     mapper_inst = MagicMock()
     mapper_inst._fetch_variable_metadata.return_value = (["c1"], {"c1": "c1"})
     mapper_inst._build_record_model.return_value = object()
-    mapper_inst._fetch_records.side_effect = [MagicMock(), MagicMock()]
+    mapper_inst._iter_records.return_value = [MagicMock(form_id=1), MagicMock(form_id=2)]
     rows1 = [{f"v{i}": i for i in range(1500)}]
     rows2 = [{f"w{i}": i for i in range(600)}]
     mapper_inst._parse_records.side_effect = [(rows1, 0), (rows2, 0)]
@@ -188,7 +188,6 @@ def test_sync_worker_respects_reconcile_false(tmp_path: Path) -> None:
     """When reconcile=False the loader is called with reconcile=False."""
     loader = MagicMock()
     loader.db_path = tmp_path / "records.sqlite3"
-    loader.load_records.return_value = []
 
     worker = SyncWorker(
         loader,
@@ -196,7 +195,7 @@ def test_sync_worker_respects_reconcile_false(tmp_path: Path) -> None:
     )
     worker.run_once()
 
-    loader.load_records.assert_called_once_with("PROT-01", reconcile=False)
+    loader.sync_records.assert_called_once_with("PROT-01", reconcile=False)
 
 
 def test_sync_worker_config_defaults() -> None:
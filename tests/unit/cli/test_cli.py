@@ -345,6 +345,30 @@ def test_export_json_calls_helper(
     func.assert_called_once_with(sdk, "STUDY", "out.json")
 
 
+def test_export_ndjson_calls_helper(
+    runner: CliRunner, sdk: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that export ndjson calls helper."""
+    func = MagicMock()
+    monkeypatch.setattr(export_mod, "export_to_ndjson", func)
+    monkeypatch.setattr(cli, "export_to_ndjson", export_mod.export_to_ndjson)
+    result = runner.invoke(
+        cli.app,
+        [
+            "export",
+            "ndjson",
+            "STUDY",
+            "out.ndjson.gz",
+            "--compression",
+            "gzip",
+            "--max-bytes",
+            "64",
+        ],
+    )
+    assert result.exit_code == 0
+    func.assert_called_once_with(sdk, "STUDY", "out.ndjson.gz", compression="gzip", max_bytes=64)
+
+
 def test_export_duckdb_calls_helper(
     runner: CliRunner, sdk: MagicMock, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -647,7 +671,7 @@ def test_sync_worker_once_command(
 ) -> None:
     """Test that sync worker once command."""
     worker = MagicMock()
-    worker.run_once.return_value = 42
+    worker.run_once.return_value = MagicMock(record_count=42, delta_count=3, deleted_count=1)
     loader_cls = MagicMock()
     monkeypatch.setattr("imednet_workflows.cached_loader.CachedRecordsLoader", loader_cls)
     monkeypatch.setattr("imednet_workflows.cli.SyncWorker", MagicMock(return_value=worker))
@@ -660,6 +684,7 @@ def test_sync_worker_once_command(
     loader_cls.assert_called_once_with(sdk)
     worker.run_once.assert_called_once_with()
     assert "Synced 42 cached records" in result.stdout
+    assert "(3 changed, 1 removed)" in result.stdout
 
 
 def test_sync_worker_command_handles_keyboard_interrupt(
@@ -61,6 +61,7 @@ EXPORT_FUNCTIONS = [
     "export_to_parquet",
     "export_to_excel",
     "export_to_json",
+    "export_to_ndjson",
     "export_to_sql",
     "export_to_sql_by_form",
 ]
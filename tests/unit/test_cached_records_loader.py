@@ -153,3 +153,230 @@ def test_sync_records_handles_empty_delta_without_reconciliation(tmp_path: Path)
         "filter": 'dateModified>="2024-01-01 00:00:00+00:00"',
         "record_data_filter": None,
     }
+
+
+def test_sync_records_reports_delta_and_deletions(tmp_path: Path) -> None:
+    """Test that sync records reports delta size and pruned rows."""
+    sdk = MagicMock()
+    first = [_record(1, "2024-01-01 00:00:00+00:00"), _record(2, "2024-01-02 00:00:00+00:00")]
+    sdk.get_records.side_effect = [first, first, [first[1]]]
+    sdk.records.list.side_effect = [[first[1]]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+
+    initial = loader.sync_records("STUDY")
+    delta = loader.sync_records("STUDY")
+
+    assert (initial.delta_count, initial.deleted_count) == (2, 0)
+    assert initial.previous_high_water_mark is None
+    assert (delta.delta_count, delta.boundary_skipped, delta.deleted_count) == (0, 1, 1)
+    assert delta.previous_high_water_mark == "2024-01-02 00:00:00+00:00"
+
+
+def test_summarize_cache_counts_per_form_without_decoding(tmp_path: Path) -> None:
+    """Test that summarize cache aggregates counts and the high-water mark."""
+    sdk = MagicMock()
+    records = [
+        _record(1, "2024-01-01 00:00:00+00:00"),
+        _record(2, "2024-01-03 00:00:00+00:00"),
+        _record(3, "2024-01-02 00:00:00+00:00").model_copy(update={"form_key": "AE"}),
+    ]
+    sdk.get_records.side_effect = [records]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+    loader.sync_records("STUDY", reconcile=False)
+
+    summary = loader.summarize_cache("STUDY")
+
+    assert summary.record_count == 3
+    assert summary.form_counts == {"AE": 1, "FORM": 2}
+    assert summary.high_water_mark == "2024-01-03 00:00:00+00:00"
+    assert loader.summarize_cache("OTHER").record_count == 0
+
+
+def test_change_feed_records_inserts_updates_and_deletes(tmp_path: Path) -> None:
+    """Test that the change feed captures each cache mutation in sequence."""
+    sdk = MagicMock()
+    first = [_record(1, "2024-01-01 00:00:00+00:00"), _record(2, "2024-01-02 00:00:00+00:00")]
+    updated = _record(2, "2024-01-03 00:00:00+00:00")
+    sdk.get_records.side_effect = [first, first, [updated]]
+    sdk.records.list.side_effect = [[first[1], updated]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+
+    loader.sync_records("STUDY")
+    loader.sync_records("STUDY")
+
+    changes = list(loader.iter_changes("STUDY"))
+    assert [(c.operation, c.record_id) for c in changes] == [
+        ("insert", 1),
+        ("insert", 2),
+        ("update", 2),
+        ("delete", 1),
+    ]
+    assert [c.seq for c in changes] == sorted(c.seq for c in changes)
+    assert loader.latest_change_seq("STUDY") == changes[-1].seq
+
+
+def test_change_feed_skips_unchanged_boundary_upserts(tmp_path: Path) -> None:
+    """Test that re-fetched identical records do not produce change entries."""
+    sdk = MagicMock()
+    record = _record(1, "2024-01-01 00:00:00+00:00")
+    sdk.get_records.side_effect = [[record]]
+    sdk.records.list.side_effect = [[record]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+
+    loader.sync_records("STUDY", reconcile=False)
+    loader.sync_records("STUDY", reconcile=False)
+
+    assert [c.operation for c in loader.iter_changes("STUDY")] == ["insert"]
+
+
+def test_change_feed_consumer_offsets(tmp_path: Path) -> None:
+    """Test that consumers read only uncommitted changes and offsets only advance."""
+    sdk = MagicMock()
+    sdk.get_records.side_effect = [
+        [_record(1, "2024-01-01 00:00:00+00:00"), _record(2, "2024-01-02 00:00:00+00:00")]
+    ]
+    sdk.records.list.side_effect = [[_record(3, "2024-01-03 00:00:00+00:00")]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+    loader.sync_records("STUDY", reconcile=False)
+
+    batch = loader.read_changes("exports", "STUDY")
+    assert [c.record_id for c in batch] == [1, 2]
+    assert batch[0].record is not None
+    assert batch[0].record.record_data == {"value": 1}
+    loader.commit_consumer_offset("exports", "STUDY", batch[-1].seq)
+    loader.commit_consumer_offset("exports", "STUDY", batch[0].seq)
+
+    loader.sync_records("STUDY", reconcile=False)
+
+    assert [c.record_id for c in loader.read_changes("exports", "STUDY")] == [3]
+    assert [c.record_id for c in loader.read_changes("duckdb", "STUDY", limit=1)] == [1]
+    assert loader.get_consumer_offset("exports", "STUDY") == batch[-1].seq
+
+
+def test_prune_changelog_respects_slowest_consumer(tmp_path: Path) -> None:
+    """Test that pruning only removes entries committed by every consumer."""
+    sdk = MagicMock()
+    sdk.get_records.side_effect = [
+        [_record(1, "2024-01-01 00:00:00+00:00"), _record(2, "2024-01-02 00:00:00+00:00")]
+    ]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+    loader.sync_records("STUDY", reconcile=False)
+    first, second = list(loader.iter_changes("STUDY"))
+
+    assert loader.prune_changelog("STUDY") == 0
+    loader.commit_consumer_offset("fast", "STUDY", second.seq)
+    loader.commit_consumer_offset("slow", "STUDY", first.seq)
+
+    assert loader.prune_changelog("STUDY") == 1
+    assert [c.seq for c in loader.iter_changes("STUDY")] == [second.seq]
+
+
+def test_shard_by_study_stores_each_study_in_its_own_file(tmp_path: Path) -> None:
+    """Test that sharded loaders write each study to a separate database file."""
+    sdk = MagicMock()
+    sdk.get_records.side_effect = [
+        [_record(1, "2024-01-01 00:00:00+00:00")],
+        [
+            _record(2, "2024-01-02 00:00:00+00:00").model_copy(update={"study_key": "OTHER/1"}),
+        ],
+    ]
+    with CachedRecordsLoader(sdk, cache_dir=tmp_path, shard_by_study=True) as loader:
+        loader.sync_records("STUDY", reconcile=False)
+        loader.sync_records("OTHER/1", reconcile=False)
+
+        assert loader.db_path_for("STUDY") == tmp_path / "records_cache.STUDY.sqlite3"
+        assert loader.db_path_for("OTHER/1") == tmp_path / "records_cache.OTHER_1.sqlite3"
+        assert not loader.db_path.exists()
+        assert [r.record_id for r in loader.iter_cached_records("STUDY")] == [1]
+        assert [r.record_id for r in loader.iter_cached_records("OTHER/1")] == [2]
+        assert loader.summarize_cache("OTHER/1").record_count == 1
+
+    with get_sqlite_connection(tmp_path / "records_cache.STUDY.sqlite3") as conn:
+        study_keys = {row[0] for row in conn.execute("SELECT study_key FROM record_cache")}
+    assert study_keys == {"STUDY"}
+
+
+def test_read_pool_reuses_read_only_connections(tmp_path: Path) -> None:
+    """Test that reads reuse pooled read-only connections across calls."""
+    import sqlite3
+
+    sdk = MagicMock()
+    sdk.get_records.side_effect = [[_record(1, "2024-01-01 00:00:00+00:00")]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path, read_pool_size=1)
+    loader.sync_records("STUDY", reconcile=False)
+
+    with loader._reader("STUDY") as first:
+        pass
+    with loader._reader("STUDY") as second:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            second.execute("DELETE FROM record_cache")
+    assert first is second
+    assert loader.get_cached_records("STUDY")[0].record_id == 1
+    loader.close()
+
+
+def test_delta_skips_boundary_records_already_cached(tmp_path: Path) -> None:
+    """Test that re-fetched boundary records are only upserted when new or changed."""
+    sdk = MagicMock()
+    bulk = [_record(record_id, "2024-01-01 00:00:00+00:00") for record_id in (1, 2, 3)]
+    changed = bulk[1].model_copy(update={"record_data": {"value": 20}})
+    late = _record(4, "2024-01-01 00:00:00+00:00")
+    sdk.get_records.side_effect = [bulk]
+    sdk.records.list.side_effect = [bulk, [bulk[0], changed, bulk[2], late]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+    upserted: list[list[int]] = []
+    upsert_rows = loader._upsert_rows
+
+    def _spy(conn, rows):
+        upserted.append([row[1] for row in rows])
+        upsert_rows(conn, rows)
+
+    loader._upsert_rows = _spy  # type: ignore[method-assign]
+
+    loader.sync_records("STUDY", reconcile=False)
+    unchanged = loader.sync_records("STUDY", reconcile=False)
+    moved = loader.sync_records("STUDY", reconcile=False)
+
+    stored = loader.summarize_cache("STUDY").high_water_mark
+    filters = [call.kwargs["filter"] for call in sdk.records.list.call_args_list]
+    assert filters == [f'dateModified>="{stored}"'] * 2
+    assert upserted == [[1, 2, 3], [], [2, 4]]
+    assert (unchanged.delta_count, unchanged.boundary_skipped) == (0, 3)
+    assert (moved.delta_count, moved.boundary_skipped) == (2, 2)
+    operations = [(c.record_id, c.operation) for c in loader.iter_changes("STUDY")]
+    assert operations[3:] == [(2, "update"), (4, "insert")]
+
+
+def test_naive_watermark_is_sent_as_stamped(tmp_path: Path) -> None:
+    """Test that a naive server watermark is filtered on and matched without a time zone."""
+    sdk = MagicMock()
+    stamped = _record(1, "2024-01-01 09:30:00")
+    sdk.get_records.side_effect = [[stamped]]
+    sdk.records.list.side_effect = [[stamped]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+
+    loader.sync_records("STUDY", reconcile=False)
+    again = loader.sync_records("STUDY", reconcile=False)
+
+    stored = loader.summarize_cache("STUDY").high_water_mark
+    assert stored is not None and "+" not in stored
+    assert sdk.records.list.call_args.kwargs["filter"] == f'dateModified>="{stored}"'
+    assert (again.delta_count, again.boundary_skipped) == (0, 1)
+
+
+def test_boundary_is_upserted_again_without_sync_cursor(tmp_path: Path) -> None:
+    """Test that boundary records without a stored digest are upserted, not skipped."""
+    sdk = MagicMock()
+    stamped = _record(1, "2024-01-01 00:00:00+00:00")
+    sdk.get_records.side_effect = [[stamped]]
+    sdk.records.list.side_effect = [[stamped]]
+    loader = CachedRecordsLoader(sdk, cache_dir=tmp_path)
+    loader.sync_records("STUDY", reconcile=False)
+
+    with get_sqlite_connection(loader.db_path) as conn:
+        conn.execute("DELETE FROM sync_cursor")
+        conn.commit()
+    again = loader.sync_records("STUDY", reconcile=False)
+
+    assert (again.delta_count, again.boundary_skipped) == (1, 0)
+    assert [c.operation for c in loader.iter_changes("STUDY")] == ["insert"]
@@ -1,11 +1,18 @@
 """Unit tests for the export dispatcher and registry."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from imednet.integrations.dispatcher import export, register_sink_target, register_tabular_target
-from imednet.integrations.sink_base import ExportSink
+from imednet.integrations.dispatcher import (
+    export,
+    export_async,
+    register_async_sink_target,
+    register_sink_target,
+    register_tabular_target,
+)
+from imednet.integrations.sink_base import AsyncExportSink, ExportSink
 
 
 class DummySink(ExportSink):
@@ -217,3 +224,434 @@ def test_export_sink_routing_with_explicit_config(mock_quality_gate, mock_iter_b
     total = export("dummy_sink", sdk_mock, "STUDY_CFG", config=cfg)
 
     assert total == 1
+
+
+class RecordingSink(DummySink):
+    """A dummy sink that records each batch and the records fetched before it."""
+
+    fetched: list = []
+    batches: list = []
+
+    def write_batch(self, records, *, batch_id):
+        """Record the batch alongside how many records had been fetched."""
+        RecordingSink.batches.append((batch_id, list(records), len(RecordingSink.fetched)))
+        return len(records)
+
+
+def _recording_sink():
+    """Helper function to register a fresh RecordingSink."""
+    RecordingSink.fetched = []
+    RecordingSink.batches = []
+    register_sink_target("recording_sink", RecordingSink)
+
+
+def test_export_sink_streams_batches():
+    """Test that batches are written before the record source is exhausted."""
+    _recording_sink()
+
+    def records():
+        for i in range(5):
+            RecordingSink.fetched.append(i)
+            yield {"id": i}
+
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = records()
+
+    total = export("recording_sink", sdk_mock, "STUDY3", batch_size=2)
+
+    assert total == 5
+    assert RecordingSink.batches == [
+        ("STUDY3/records/0", [{"id": 0}, {"id": 1}], 2),
+        ("STUDY3/records/1", [{"id": 2}, {"id": 3}], 4),
+        ("STUDY3/records/2", [{"id": 4}], 5),
+    ]
+
+
+def test_export_asks_sink_for_each_batch_size():
+    """Test that adaptive sinks choose the size of every batch."""
+    _recording_sink()
+
+    class GrowingSink(RecordingSink):
+        """A sink doubling its batch size after every batch."""
+
+        def next_batch_size(self):
+            """Return 1, 2, 4, ... records."""
+            return 2 ** len(RecordingSink.batches)
+
+    register_sink_target("growing_sink", GrowingSink)
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = iter([{"id": i} for i in range(7)])
+
+    assert export("growing_sink", sdk_mock, "STUDY3") == 7
+    assert [len(records) for _, records, _ in RecordingSink.batches] == [1, 2, 4]
+
+
+def test_export_resumes_from_checkpoints(tmp_path):
+    """Test that a rerun with checkpoints writes only the batches not yet committed."""
+    _recording_sink()
+    path = str(tmp_path / "checkpoints.sqlite")
+
+    class FlakySink(RecordingSink):
+        """A sink failing its third batch once."""
+
+        def write_batch(self, records, *, batch_id):
+            """Fail ``STUDY3/records/2`` on the first run."""
+            if batch_id == "STUDY3/records/2" and not RecordingSink.fetched:
+                RecordingSink.fetched.append(batch_id)
+                raise ConnectionError("connection reset")
+            return super().write_batch(records, batch_id=batch_id)
+
+    register_sink_target("flaky_sink", FlakySink)
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.side_effect = lambda **_: iter([{"id": i} for i in range(7)])
+
+    with pytest.raises(ConnectionError):
+        export("flaky_sink", sdk_mock, "STUDY3", batch_size=2, checkpoint_path=path)
+    RecordingSink.batches = []
+
+    assert export("flaky_sink", sdk_mock, "STUDY3", batch_size=2, checkpoint_path=path) == 3
+    assert [batch_id for batch_id, _, _ in RecordingSink.batches] == [
+        "STUDY3/records/2",
+        "STUDY3/records/3",
+    ]
+    RecordingSink.batches = []
+
+    assert export("flaky_sink", sdk_mock, "STUDY3", batch_size=2, checkpoint_path=path) == 7
+    assert len(RecordingSink.batches) == 4
+
+
+def test_export_rejects_async_record_source():
+    """Test that a synchronous export refuses records from an async SDK."""
+    register_sink_target("dummy_sink", DummySink)
+
+    async def records():
+        yield {"id": 1}
+
+    sdk_mock = MagicMock()
+    source = records()
+    sdk_mock.records.list.return_value = source
+
+    with pytest.raises(TypeError, match="export_async"):
+        export("dummy_sink", sdk_mock, "STUDY4")
+    asyncio.run(source.aclose())
+
+
+def test_export_async_streams_async_records():
+    """Test that export_async writes batches while an async source is consumed."""
+    _recording_sink()
+
+    async def records():
+        for i in range(3):
+            RecordingSink.fetched.append(i)
+            yield {"id": i}
+
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = records()
+
+    total = asyncio.run(export_async("recording_sink", sdk_mock, "STUDY5", batch_size=2))
+
+    assert total == 3
+    assert RecordingSink.batches == [
+        ("STUDY5/records/0", [{"id": 0}, {"id": 1}], 2),
+        ("STUDY5/records/1", [{"id": 2}], 3),
+    ]
+
+
+def test_export_async_runs_sync_sources_and_tabular_targets():
+    """Test that export_async delegates synchronous work to the sync paths."""
+    _recording_sink()
+    register_tabular_target("dummy_tab", dummy_tabular)
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = [{"id": 1}, {"id": 2}]
+
+    assert asyncio.run(export_async("recording_sink", sdk_mock, "STUDY6")) == 2
+    result = asyncio.run(export_async("dummy_tab", sdk_mock, "STUDY6", my_arg=1))
+    assert result["kwargs"] == {"my_arg": 1}
+
+
+class AsyncRecordingSink(AsyncExportSink):
+    """An async sink taking a little time per batch and recording overlap."""
+
+    events: list = []
+    active = 0
+    max_active = 0
+
+    async def write_batch(self, records, *, batch_id):
+        """Record the batch and how many writes were running alongside it."""
+        cls = AsyncRecordingSink
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        await asyncio.sleep(0.01)
+        if batch_id in self.config.extra.get("fail_on", ()):
+            cls.active -= 1
+            raise RuntimeError("write failed")
+        cls.events.append((batch_id, [r["id"] for r in records]))
+        cls.active -= 1
+        return len(records)
+
+    async def flush(self):
+        """Record the flush."""
+        AsyncRecordingSink.events.append("flush")
+
+    async def close(self):
+        """Record the close."""
+        AsyncRecordingSink.events.append("close")
+
+
+def _async_records(count):
+    """Helper function to build an SDK mock listing ``count`` records asynchronously."""
+
+    async def records():
+        for i in range(count):
+            await asyncio.sleep(0)
+            yield {"id": i}
+
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = records()
+    return sdk_mock
+
+
+def _async_recording_sink():
+    """Helper function to register a fresh AsyncRecordingSink."""
+    AsyncRecordingSink.events = []
+    AsyncRecordingSink.active = AsyncRecordingSink.max_active = 0
+    register_async_sink_target("async_sink", AsyncRecordingSink)
+
+
+def test_export_async_prefers_async_sink():
+    """Test that a registered async sink writes batches on the event loop."""
+    _async_recording_sink()
+
+    total = asyncio.run(export_async("async_sink", _async_records(5), "STUDY7", batch_size=2))
+
+    assert total == 5
+    assert AsyncRecordingSink.events == [
+        ("STUDY7/records/0", [0, 1]),
+        ("STUDY7/records/1", [2, 3]),
+        ("STUDY7/records/2", [4]),
+        "flush",
+        "close",
+    ]
+    assert AsyncRecordingSink.max_active == 1
+
+
+def test_export_async_overlaps_fetches_and_writes():
+    """Test that pending batch writes run while later pages are fetched."""
+    _async_recording_sink()
+
+    total = asyncio.run(
+        export_async(
+            "async_sink", _async_records(12), "STUDY8", batch_size=2, max_pending_batches=3
+        )
+    )
+
+    assert total == 12
+    assert 1 < AsyncRecordingSink.max_active <= 3
+    written = sorted(event[0] for event in AsyncRecordingSink.events[:-2])
+    assert written == sorted(f"STUDY8/records/{i}" for i in range(6))
+    assert AsyncRecordingSink.events[-2:] == ["flush", "close"]
+
+
+def test_export_async_failed_write_cancels_pending_and_closes():
+    """Test that a failing write stops the export without flushing."""
+    _async_recording_sink()
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        asyncio.run(
+            export_async(
+                "async_sink",
+                _async_records(12),
+                "STUDY9",
+                batch_size=2,
+                max_pending_batches=2,
+                extra={"fail_on": {"STUDY9/records/1"}},
+            )
+        )
+
+    assert AsyncRecordingSink.events[-1] == "close"
+    assert "flush" not in AsyncRecordingSink.events
+    with pytest.raises(ValueError, match="max_pending_batches"):
+        asyncio.run(export_async("async_sink", _async_records(1), "S", max_pending_batches=-1))
+
+
+class FanOutSink(DummySink):
+    """A dummy sink whose behaviour is set per target through its config extras."""
+
+    def write_batch(self, records, *, batch_id):
+        """Write the batch, failing or waiting first when configured to."""
+        extra = self.config.extra
+        if batch_id in extra.get("fail_on", ()):
+            raise RuntimeError(f"{extra['name']} failed")
+        if "gate" in extra:
+            extra["gate"].wait(timeout=5)
+        extra["log"].append((extra["name"], batch_id, [r["id"] for r in records]))
+        return len(records)
+
+
+def _fanout_configs(study_key, log, **extras):
+    """Helper function to register two fan-out sinks and build their configs."""
+    from imednet.integrations.sink_base import SinkConfig
+
+    register_sink_target("fan_a", FanOutSink)
+    register_sink_target("fan_b", FanOutSink)
+    return {
+        target: SinkConfig(study_key, extra={"name": target, "log": log, **extras.get(target, {})})
+        for target in ("fan_a", "fan_b")
+    }
+
+
+def test_export_fanout_fetches_once_for_all_sinks():
+    """Test that every sink receives every batch from a single fetch."""
+    from imednet.integrations.dispatcher import export_fanout
+
+    log = []
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = iter([{"id": i} for i in range(3)])
+
+    outcomes = export_fanout(
+        ["fan_a", "fan_b"],
+        sdk_mock,
+        "FAN1",
+        configs=_fanout_configs("FAN1", log),
+        batch_size=2,
+    )
+
+    sdk_mock.records.list.assert_called_once()
+    assert {t: (o.ok, o.written, o.batches) for t, o in outcomes.items()} == {
+        "fan_a": (True, 3, 2),
+        "fan_b": (True, 3, 2),
+    }
+    for target in ("fan_a", "fan_b"):
+        assert [entry[1:] for entry in log if entry[0] == target] == [
+            ("FAN1/records/0", [0, 1]),
+            ("FAN1/records/1", [2]),
+        ]
+
+
+def test_export_fanout_sinks_fail_independently():
+    """Test that a failing sink stops alone and reports the failed batch."""
+    from imednet.integrations.dispatcher import export_fanout
+
+    log = []
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = iter([{"id": i} for i in range(6)])
+    configs = _fanout_configs("FAN2", log, fan_a={"fail_on": {"FAN2/records/1"}})
+
+    outcomes = export_fanout(["fan_a", "fan_b"], sdk_mock, "FAN2", configs=configs, batch_size=2)
+
+    failed, healthy = outcomes["fan_a"], outcomes["fan_b"]
+    assert (failed.ok, failed.batches, failed.failed_batch_id) == (False, 1, "FAN2/records/1")
+    assert str(failed.exception) == "fan_a failed"
+    assert (healthy.ok, healthy.written) == (True, 6)
+
+
+def test_export_fanout_reports_skipped_batches(tmp_path):
+    """Test that batches skipped from checkpoints are reported apart from written ones."""
+    import dataclasses
+
+    from imednet.integrations.dispatcher import export_fanout
+
+    log = []
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.side_effect = lambda **_: iter([{"id": i} for i in range(4)])
+    path = str(tmp_path / "checkpoints.sqlite")
+    configs = _fanout_configs("FAN4", log, fan_a={"fail_on": {"FAN4/records/1"}})
+    configs["fan_a"] = dataclasses.replace(configs["fan_a"], checkpoint_path=path)
+    export_fanout(["fan_a", "fan_b"], sdk_mock, "FAN4", configs=configs, batch_size=2)
+    configs["fan_a"].extra["fail_on"] = set()
+
+    outcomes = export_fanout(["fan_a", "fan_b"], sdk_mock, "FAN4", configs=configs, batch_size=2)
+
+    assert {t: (o.ok, o.written, o.batches, o.skipped_batches) for t, o in outcomes.items()} == {
+        "fan_a": (True, 2, 1, 1),
+        "fan_b": (True, 4, 2, 0),
+    }
+
+
+def test_export_fanout_slow_sink_applies_backpressure():
+    """Test that the fetch waits while a slow sink has its queue full."""
+    import threading
+
+    from imednet.integrations.dispatcher import export_fanout
+
+    log = []
+    fetched = []
+    gate = threading.Event()
+
+    def records():
+        for i in range(6):
+            fetched.append(i)
+            yield {"id": i}
+
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = records()
+    configs = _fanout_configs("FAN3", log, fan_b={"gate": gate})
+
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(
+            export_fanout(
+                ["fan_a", "fan_b"],
+                sdk_mock,
+                "FAN3",
+                configs=configs,
+                batch_size=1,
+                max_pending_batches=1,
+            )
+        )
+    )
+    thread.start()
+    thread.join(timeout=0.3)
+
+    # fan_b holds one batch and has one queued, so the fetch stops before the end.
+    assert thread.is_alive()
+    assert len(fetched) < 6
+    gate.set()
+    thread.join(timeout=5)
+    assert result["fan_b"].written == 6
+
+
+def test_export_fanout_rejects_invalid_targets():
+    """Test that repeated and non-sink targets are rejected before fetching."""
+    from imednet.integrations.dispatcher import export_fanout
+
+    register_tabular_target("dummy_tab", dummy_tabular)
+    sdk_mock = MagicMock()
+
+    with pytest.raises(ValueError, match="unique"):
+        export_fanout(["dummy_sink", "dummy_sink"], sdk_mock, "FAN4")
+    with pytest.raises(ValueError, match="dummy_tab"):
+        export_fanout(["dummy_tab"], sdk_mock, "FAN4")
+    sdk_mock.records.list.assert_not_called()
+
+
+def test_export_fanout_fetch_error_closes_sinks_without_flush():
+    """Test that a failed fetch is raised once every sink has closed unflushed."""
+    from imednet.integrations.dispatcher import export_fanout
+
+    created = []
+
+    class TrackedSink(FanOutSink):
+        def __init__(self, config=None, **kwargs):
+            super().__init__(config, **kwargs)
+            created.append(self)
+
+    def records():
+        yield {"id": 0}
+        raise ConnectionError("page 2 unavailable")
+
+    register_sink_target("fan_tracked", TrackedSink)
+    sdk_mock = MagicMock()
+    sdk_mock.records.list.return_value = records()
+    configs = _fanout_configs("FAN5", [])
+
+    with pytest.raises(ConnectionError):
+        export_fanout(
+            ["fan_tracked"],
+            sdk_mock,
+            "FAN5",
+            configs={"fan_tracked": configs["fan_a"]},
+            batch_size=1,
+        )
+
+    assert [(sink.flushed, sink.closed) for sink in created] == [(False, True)]
@@ -0,0 +1,177 @@
+"""Unit tests for typed Arrow batches and DuckDB loads."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pytest
+
+import imednet.integrations.export as export_mod
+from imednet.integrations.duckdb_arrow import arrow_columns, load_batches, rows_to_batch
+
+
+def _variable(name: str, variable_type: str | None = None, label: str | None = None):
+    """Helper function to build a variable stub."""
+    return SimpleNamespace(
+        variable_name=name, variable_type=variable_type, label=label or name.title(), form_id=1
+    )
+
+
+def _types(columns) -> dict[str, str]:
+    """Helper function to map column names to their Arrow type names."""
+    return {c.field.name: str(c.field.type) for c in columns}
+
+
+def test_arrow_columns_follow_dataframe_layout() -> None:
+    """Metadata comes first, variables are typed and duplicate names dropped."""
+    columns = arrow_columns(
+        [
+            _variable("age", "integer"),
+            _variable("weight", "float"),
+            _variable("done", "boolean"),
+            _variable("AGE", "text"),
+            _variable("dob", "date"),
+            _variable("note"),
+        ]
+    )
+
+    assert _types(columns) == {
+        "recordId": "int64",
+        "subjectKey": "string",
+        "visitId": "int64",
+        "formId": "int64",
+        "recordStatus": "string",
+        "dateCreated": "string",
+        "age": "int64",
+        "weight": "double",
+        "done": "bool",
+        "dob": "string",
+        "note": "string",
+    }
+    assert [c.sensitive for c in columns if c.field.name == "dob"] == [True]
+
+
+def test_arrow_columns_use_labels_and_whitelist() -> None:
+    """Labels rename columns and the whitelist selects variables."""
+    columns = arrow_columns(
+        [_variable("a", "integer", "Alpha"), _variable("b", "integer", "Beta")],
+        use_labels=True,
+        variable_whitelist=["b"],
+    )
+
+    assert [(c.source, c.field.name) for c in columns][-1] == ("b", "Beta")
+    assert len(columns) == 7
+
+
+def test_rows_to_batch_types_values_losslessly() -> None:
+    """Values convert to the declared type only when nothing is lost."""
+    columns = arrow_columns(
+        [
+            _variable("count", "integer"),
+            _variable("ratio", "float"),
+            _variable("score", "integer"),
+            _variable("flag", "boolean"),
+            _variable("detail"),
+            _variable("dob"),
+        ]
+    )
+    rows = [
+        {"recordId": 1, "count": "7", "ratio": 1, "score": 2.5, "flag": True, "detail": {"ssn": 1}},
+        {"recordId": 2, "count": "", "ratio": 0.5, "score": 3, "flag": None, "detail": 4},
+    ]
+
+    batch = rows_to_batch(rows, columns)
+
+    assert batch.schema.field("count").type == pa.int64()
+    assert batch.column("count").to_pylist() == [7, None]
+    assert batch.column("ratio").to_pylist() == [1.0, 0.5]
+    assert batch.schema.field("score").type == pa.string()
+    assert batch.column("score").to_pylist() == ["2.5", "3"]
+    assert batch.column("flag").to_pylist() == [True, None]
+    detail = batch.column("detail").to_pylist()
+    assert json.loads(detail[0]) == {"ssn": "***MASKED***"}
+    assert detail[1] == "4"
+    assert batch.column("dob").to_pylist() == ["***MASKED***", "***MASKED***"]
+    assert batch.column("subjectKey").to_pylist() == [None, None]
+
+
+def test_load_batches_widens_columns(tmp_path: Path) -> None:
+    """Later batches that carry a column as another type widen the table."""
+    duckdb = pytest.importorskip("duckdb")
+    conn = duckdb.connect(str(tmp_path / "widen.duckdb"))
+    batches = [
+        pa.record_batch({"a": pa.array([1], pa.int64()), "b": pa.array([1], pa.int64())}),
+        pa.record_batch({"a": pa.array(["x"]), "b": pa.array([0.5])}),
+        pa.record_batch({"a": pa.array([2], pa.int64()), "b": pa.array([None], pa.null())}),
+    ]
+    try:
+        loaded = load_batches(conn, "t", batches)
+        schema = {row[1]: row[2] for row in conn.execute("PRAGMA table_info('t')").fetchall()}
+        rows = conn.execute("SELECT a, b FROM t").fetchall()
+    finally:
+        conn.close()
+
+    assert loaded == 3
+    assert schema == {"a": "VARCHAR", "b": "DOUBLE"}
+    assert rows == [("1", 1.0), ("x", 0.5), ("2", None)]
+
+
+def test_load_batches_without_batches_creates_nothing() -> None:
+    """An empty stream leaves the database untouched apart from the transaction."""
+    conn = MagicMock()
+
+    assert load_batches(conn, "t", iter(())) == 0
+    assert [c.args[0] for c in conn.execute.call_args_list] == ["BEGIN TRANSACTION", "COMMIT"]
+
+
+def test_export_to_duckdb_creates_typed_table(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tables are typed from variable metadata, even for columns empty in a chunk."""
+    duckdb = pytest.importorskip("duckdb")
+    record_mapper = pytest.importorskip("imednet_workflows.record_mapper").RecordMapper
+    sdk = MagicMock()
+    sdk.get_variables.return_value = [
+        _variable("age", "integer"),
+        _variable("weight", "float"),
+        _variable("note", "text"),
+    ]
+    records = [
+        SimpleNamespace(
+            record_id=i,
+            subject_key=f"S{i}",
+            visit_id=1,
+            form_id=1,
+            record_status="Complete",
+            date_created=None,
+            record_data={"age": str(30 + i), "weight": None if i < 2 else 70.5, "note": f"n{i}"},
+        )
+        for i in range(4)
+    ]
+    mapper = record_mapper(sdk)
+    mapper._iter_records = lambda *args, **kwargs: iter(records)
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper))
+    db_path = tmp_path / "typed.duckdb"
+
+    export_mod.export_to_duckdb(sdk, "STUDY", str(db_path), "records", batch_size=2)
+
+    conn = duckdb.connect(str(db_path))
+    try:
+        schema = {row[1]: row[2] for row in conn.execute("PRAGMA table_info('records')").fetchall()}
+        rows = conn.execute('SELECT "recordId", age, weight, note FROM records').fetchall()
+    finally:
+        conn.close()
+    assert schema["recordId"] == "BIGINT"
+    assert schema["age"] == "BIGINT"
+    assert schema["weight"] == "DOUBLE"
+    assert schema["note"] == "VARCHAR"
+    assert rows == [
+        (0, 30, None, "n0"),
+        (1, 31, None, "n1"),
+        (2, 32, 70.5, "n2"),
+        (3, 33, 70.5, "n3"),
+    ]
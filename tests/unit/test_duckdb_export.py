@@ -8,18 +8,27 @@ from typing import Any
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import imednet.integrations.export as export_mod
 
 
+def _stub_frames(monkeypatch: pytest.MonkeyPatch, *frames: pd.DataFrame) -> None:
+    """Helper function to stub the chunked Arrow batch iterator."""
+    batches = [pa.RecordBatch.from_pandas(df, preserve_index=False) for df in frames]
+    monkeypatch.setattr(
+        export_mod, "_iter_tabular_batches", lambda *args, **kwargs: enumerate(batches)
+    )
+
+
 def test_export_to_duckdb_happy_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that export to duckdb happy path."""
     duckdb = pytest.importorskip("duckdb")
 
     sdk = MagicMock()
     df = pd.DataFrame({"record_id": [1, 2], "answer": ["yes", "no"]})
-    monkeypatch.setattr(export_mod, "_prepare_export_df", MagicMock(return_value=df))
+    _stub_frames(monkeypatch, df)
 
     db_path = tmp_path / "study.duckdb"
     export_mod.export_to_duckdb(sdk, "STUDY", str(db_path), "records")
@@ -42,7 +51,7 @@ def test_export_to_duckdb_wide_dataframe(tmp_path: Path, monkeypatch: pytest.Mon
     sdk = MagicMock()
     wide_columns = [f"c{i}" for i in range(2101)]
     wide_df = pd.DataFrame([range(2101)], columns=wide_columns)
-    monkeypatch.setattr(export_mod, "_prepare_export_df", MagicMock(return_value=wide_df))
+    _stub_frames(monkeypatch, wide_df)
 
     db_path = tmp_path / "wide.duckdb"
     export_mod.export_to_duckdb(sdk, "STUDY", str(db_path), "wide_records")
@@ -58,6 +67,32 @@ def test_export_to_duckdb_wide_dataframe(tmp_path: Path, monkeypatch: pytest.Mon
     assert column_count == len(wide_columns)
 
 
+def test_export_to_duckdb_unifies_chunk_types(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that export to duckdb appends chunks whose column types drift."""
+    duckdb = pytest.importorskip("duckdb")
+
+    _stub_frames(
+        monkeypatch,
+        pd.DataFrame({"record_id": [1], "answer": [None]}),
+        pd.DataFrame({"record_id": [2], "answer": ["yes"]}),
+    )
+
+    db_path = tmp_path / "chunks.duckdb"
+    export_mod.export_to_duckdb(MagicMock(), "STUDY", str(db_path), "records", batch_size=1)
+
+    conn = duckdb.connect(str(db_path))
+    try:
+        schema = {row[1]: row[2] for row in conn.execute("PRAGMA table_info('records')").fetchall()}
+        rows = conn.execute("SELECT record_id, answer FROM records ORDER BY record_id").fetchall()
+    finally:
+        conn.close()
+
+    assert schema["answer"] == "VARCHAR"
+    assert rows == [(1, None), (2, "yes")]
+
+
 def test_export_to_duckdb_by_form_creates_per_form_tables(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -68,31 +103,57 @@ def test_export_to_duckdb_by_form_creates_per_form_tables(
     sdk.forms.list.return_value = [
         SimpleNamespace(form_id=1, form_key="FORM_A"),
         SimpleNamespace(form_id=2, form_key="FORM_B"),
+        SimpleNamespace(form_id=3, form_key="FORM_EMPTY"),
     ]
-
-    monkeypatch.setattr(
-        export_mod,
-        "_records_df",
-        MagicMock(
-            side_effect=[
-                pd.DataFrame({"record_id": [1], "value": ["A"]}),
-                pd.DataFrame({"record_id": [2], "value": ["B"]}),
-            ]
-        ),
-    )
+    sdk.variables.list.return_value = [
+        SimpleNamespace(variable_name="value", label="Value", form_id=1),
+        SimpleNamespace(variable_name="value", label="Value", form_id=2),
+        SimpleNamespace(variable_name="other", label="Other", form_id=3),
+    ]
+    records = [
+        SimpleNamespace(
+            record_id=record_id,
+            subject_key="S1",
+            visit_id=10,
+            form_id=form_id,
+            record_status="Complete",
+            date_created=None,
+            record_data={"value": value},
+        )
+        for record_id, form_id, value in [(1, 1, "A"), (2, 2, "B"), (3, 1, "C")]
+    ]
+    record_mapper = pytest.importorskip("imednet_workflows.record_mapper").RecordMapper
+    mapper = record_mapper(sdk)
+    iter_records = MagicMock(return_value=records)
+    monkeypatch.setattr(mapper, "_iter_records", iter_records)
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper))
 
     db_path = tmp_path / "forms.duckdb"
     export_mod.export_to_duckdb_by_form(sdk, "STUDY", str(db_path))
 
     conn = duckdb.connect(str(db_path))
     try:
-        table_a = conn.execute("SELECT record_id, value FROM FORM_A").fetchall()
-        table_b = conn.execute("SELECT record_id, value FROM FORM_B").fetchall()
+        table_a = conn.execute('SELECT "recordId", value FROM FORM_A').fetchall()
+        table_b = conn.execute('SELECT "recordId", value FROM FORM_B').fetchall()
+        columns_a = [row[1] for row in conn.execute("PRAGMA table_info('FORM_A')").fetchall()]
+        tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
     finally:
         conn.close()
 
-    assert table_a == [(1, "A")]
+    assert table_a == [(1, "A"), (3, "C")]
     assert table_b == [(2, "B")]
+    assert columns_a == [
+        "recordId",
+        "subjectKey",
+        "visitId",
+        "formId",
+        "recordStatus",
+        "dateCreated",
+        "value",
+    ]
+    assert "FORM_EMPTY" not in tables
+    iter_records.assert_called_once()
+    sdk.variables.list.assert_called_once()
 
 
 def test_export_to_duckdb_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -131,7 +192,7 @@ def test_export_to_duckdb_type_handling(tmp_path: Path, monkeypatch: pytest.Monk
             "note": ["first", "second"],
         }
     )
-    monkeypatch.setattr(export_mod, "_prepare_export_df", MagicMock(return_value=df))
+    _stub_frames(monkeypatch, df)
 
     db_path = tmp_path / "typed.duckdb"
     export_mod.export_to_duckdb(sdk, "STUDY", str(db_path), "typed_records")
@@ -164,7 +225,7 @@ def test_export_to_duckdb_connection_closed_on_error(
     """Test that export to duckdb connection closed on error."""
     sdk = MagicMock()
     df = pd.DataFrame({"a": [1]})
-    monkeypatch.setattr(export_mod, "_prepare_export_df", MagicMock(return_value=df))
+    _stub_frames(monkeypatch, df)
 
     conn = MagicMock()
     conn.execute.side_effect = RuntimeError("boom")
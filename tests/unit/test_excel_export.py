@@ -0,0 +1,194 @@
+"""Unit tests for streaming Excel exports."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+import imednet.integrations.export as export_mod
+from imednet.integrations.excel import StreamingExcelWriter, excel_sheet_name
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def _sheets(path: Path) -> dict[str, list[tuple]]:
+    """Helper function to read every sheet of a workbook."""
+    workbook = openpyxl.load_workbook(path)
+    return {ws.title: list(ws.values) for ws in workbook.worksheets}
+
+
+def test_excel_sheet_name_is_valid_and_unique() -> None:
+    """Titles drop invalid characters, fit 31 characters and never clash."""
+    assert excel_sheet_name("AE/SAE [v2]") == "AE_SAE _v2_"
+    assert excel_sheet_name("x" * 40) == "x" * 31
+    assert excel_sheet_name("x" * 40, part=3) == "x" * 27 + " (3)"
+    assert excel_sheet_name("FORM", ["form"]) == "FORM_2"
+    assert excel_sheet_name("", ["Sheet"]) == "Sheet_2"
+
+
+def test_writer_splits_sheets_at_row_limit(tmp_path: Path) -> None:
+    """A full sheet continues on a new sheet that repeats the header."""
+    path = tmp_path / "out.xlsx"
+    with StreamingExcelWriter(str(path), max_rows=3) as writer:
+        writer.write_frame("Data", pd.DataFrame({"a": [1, 2, 3]}))
+        writer.write_frame("Data", pd.DataFrame({"a": [4, 5]}))
+
+    assert _sheets(path) == {
+        "Data": [("a",), (1,), (2,)],
+        "Data (2)": [("a",), (3,), (4,)],
+        "Data (3)": [("a",), (5,)],
+    }
+
+
+def test_writer_rolls_over_to_new_workbooks(tmp_path: Path) -> None:
+    """With ``max_sheets`` reached, writing continues in the next workbook."""
+    path = tmp_path / "out.xlsx"
+    with StreamingExcelWriter(str(path), max_rows=2, max_sheets=2) as writer:
+        writer.write_frame("A", pd.DataFrame({"a": [1, 2]}))
+        writer.write_frame("B", pd.DataFrame({"b": [3]}))
+
+    assert writer.paths == [str(path), str(tmp_path / "out_2.xlsx")]
+    assert _sheets(path) == {"A": [("a",), (1,)], "A (2)": [("a",), (2,)]}
+    assert _sheets(tmp_path / "out_2.xlsx") == {"B": [("b",), (3,)]}
+
+
+def test_writer_converts_cells_like_pandas(tmp_path: Path) -> None:
+    """Missing values become empty cells and unsupported values text."""
+    path = tmp_path / "out.xlsx"
+    stamp = datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+    df = pd.DataFrame(
+        {
+            "n": [1.5, None],
+            "s": ["a\x01b", pd.NA],
+            "d": [{"k": 1}, stamp],
+        }
+    )
+    with StreamingExcelWriter(str(path)) as writer:
+        assert writer.write_frame("Sheet1", df) == 2
+
+    assert _sheets(path)["Sheet1"] == [
+        ("n", "s", "d"),
+        (1.5, "ab", "{'k': 1}"),
+        (None, None, "2024-03-01T10:00:00+00:00"),
+    ]
+
+
+def test_writer_rejects_changed_columns(tmp_path: Path) -> None:
+    """Every chunk of a sheet must share the header."""
+    with pytest.raises(ValueError, match="changed between chunks"):
+        with StreamingExcelWriter(str(tmp_path / "out.xlsx")) as writer:
+            writer.write_frame("Data", pd.DataFrame({"a": [1]}))
+            writer.write_frame("Data", pd.DataFrame({"b": [1]}))
+
+
+def test_writer_error_discards_saved_workbooks(tmp_path: Path) -> None:
+    """An error removes the workbooks already written by the export."""
+    with pytest.raises(RuntimeError):
+        with StreamingExcelWriter(str(tmp_path / "out.xlsx"), max_sheets=1) as writer:
+            writer.write_frame("A", pd.DataFrame({"a": [1]}))
+            writer.write_frame("B", pd.DataFrame({"b": [1]}))
+            assert (tmp_path / "out.xlsx").exists()
+            raise RuntimeError("boom")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def _study(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Helper function to serve two forms through a real RecordMapper."""
+    record_mapper = pytest.importorskip("imednet_workflows.record_mapper").RecordMapper
+    sdk = MagicMock()
+    sdk.forms.list.return_value = [
+        SimpleNamespace(form_id=1, form_key="DEMOGRAPHICS"),
+        SimpleNamespace(form_id=2, form_key="VITALS"),
+        SimpleNamespace(form_id=3, form_key="EMPTY"),
+    ]
+    variables = [
+        SimpleNamespace(variable_name="sex", label="Sex", form_id=1),
+        SimpleNamespace(variable_name="pulse", label="Pulse", form_id=2),
+    ]
+    sdk.variables.list.return_value = variables
+    sdk.get_variables.return_value = variables
+    records = [
+        SimpleNamespace(
+            record_id=i,
+            subject_key=f"S{i}",
+            visit_id=1,
+            form_id=1 if i % 2 else 2,
+            record_status="Complete",
+            date_created=None,
+            record_data={"sex": "=F"} if i % 2 else {"pulse": 60 + i},
+        )
+        for i in range(1, 6)
+    ]
+    mapper = record_mapper(sdk)
+    mapper._iter_records = lambda *args, **kwargs: iter(records)
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper))
+    monkeypatch.setattr(export_mod, "apply_quality_gate", lambda s, sk, rr, c: rr)
+    return sdk
+
+
+def test_export_to_excel_streams_chunks_across_sheets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Chunks are appended in order and split at the row limit."""
+    sdk = _study(monkeypatch)
+    path = tmp_path / "study.xlsx"
+
+    export_mod.export_to_excel(
+        sdk, "STUDY", str(path), batch_size=2, max_rows=4, sheet_name="Records"
+    )
+
+    sheets = _sheets(path)
+    assert list(sheets) == ["Records", "Records (2)"]
+    assert [row[0] for row in sheets["Records"]] == ["recordId", 1, 2, 3]
+    assert [row[0] for row in sheets["Records (2)"]] == ["recordId", 4, 5]
+    record = dict(zip(sheets["Records"][0], sheets["Records"][1]))
+    assert (record["sex"], record["pulse"]) == ("'=F", None)
+
+
+def test_export_to_excel_by_form_writes_one_sheet_per_form(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each form gets its own sheet, even without records."""
+    sdk = _study(monkeypatch)
+    path = tmp_path / "forms.xlsx"
+
+    export_mod.export_to_excel(sdk, "STUDY", str(path), by_form=True, batch_size=1)
+
+    sheets = _sheets(path)
+    assert list(sheets) == ["DEMOGRAPHICS", "VITALS", "EMPTY"]
+    assert sheets["DEMOGRAPHICS"][0][-1] == "sex"
+    assert [(row[0], row[-1]) for row in sheets["DEMOGRAPHICS"][1:]] == [
+        (1, "'=F"),
+        (3, "'=F"),
+        (5, "'=F"),
+    ]
+    assert [(row[0], row[-1]) for row in sheets["VITALS"][1:]] == [(2, 62), (4, 64)]
+    assert sheets["EMPTY"] == []
+
+
+def test_export_to_excel_without_records_writes_empty_sheet(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An export without rows still produces a workbook."""
+    sdk = _study(monkeypatch)
+    sdk.get_variables.return_value = []
+    monkeypatch.setattr(export_mod, "apply_quality_gate", lambda s, sk, rr, c: iter(()))
+    path = tmp_path / "empty.xlsx"
+
+    export_mod.export_to_excel(sdk, "STUDY", str(path))
+
+    assert _sheets(path) == {"Sheet1": []}
+
+
+def test_export_to_excel_rejects_unknown_options(tmp_path: Path) -> None:
+    """Options of the former pandas writer that no longer apply are refused."""
+    with pytest.raises(TypeError, match="freeze_panes"):
+        export_mod.export_to_excel(
+            MagicMock(), "STUDY", str(tmp_path / "x.xlsx"), freeze_panes=(1, 0)
+        )
@@ -0,0 +1,288 @@
+"""Unit tests for manifest-driven incremental tabular exports."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy as sa
+
+import imednet.integrations.export as export_mod
+
+
+def _record(record_id: int, minute: int, value: str = "v") -> SimpleNamespace:
+    """Helper function to build a record modified at ``minute`` past ten."""
+    return SimpleNamespace(
+        record_id=record_id,
+        subject_key=f"S{record_id}",
+        visit_id=1,
+        form_id=1,
+        record_status="Complete",
+        date_created=None,
+        date_modified=f"2024-03-01T10:{minute:02d}:00Z",
+        record_data={"value": f"{value}{record_id}"},
+    )
+
+
+class _Study:
+    """Serve a mutable set of records through a real RecordMapper."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, records: list[SimpleNamespace]):
+        record_mapper = pytest.importorskip("imednet_workflows.record_mapper").RecordMapper
+        self.records = records
+        self.filters: list[dict | None] = []
+        self.rejected: set[int] = set()
+        self.sdk = MagicMock()
+        self.sdk.forms.list.return_value = [SimpleNamespace(form_id=1, form_key="FORM_A")]
+        variables = [SimpleNamespace(variable_name="value", label="Value", form_id=1)]
+        self.sdk.variables.list.return_value = variables
+        self.sdk.get_variables.return_value = variables
+
+        def _iter_records(study_key, visit_key=None, extra_filters=None):
+            self.filters.append(extra_filters)
+            return iter(list(self.records))
+
+        def _mapper_factory(_sdk: object) -> object:
+            mapper = record_mapper(self.sdk)
+            mapper._iter_records = _iter_records
+            return mapper
+
+        monkeypatch.setattr(export_mod, "_record_mapper", lambda: _mapper_factory)
+        monkeypatch.setattr(
+            export_mod,
+            "apply_quality_gate",
+            lambda s, sk, rr, c: (r for r in rr if r.record_id not in self.rejected),
+        )
+
+    def replace(self, *records: SimpleNamespace) -> None:
+        """Swap in new versions of records, appending unknown ones."""
+        by_id = {r.record_id: r for r in self.records}
+        by_id.update({r.record_id: r for r in records})
+        self.records = list(by_id.values())
+
+
+def _csv_config(tmp_path: Path) -> export_mod.TabularSinkConfig:
+    """Helper function to build a CSV config with a manifest."""
+    return export_mod.TabularSinkConfig(
+        study_key="STUDY", batch_size=2, manifest_path=str(tmp_path / "out.manifest.jsonl")
+    )
+
+
+def _runs(path: Path) -> list[dict]:
+    """Helper function to read the run entries of a manifest."""
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    return [e for e in entries if e["batch_id"] == "STUDY/tabular/run"]
+
+
+def _csv_rows(path: Path) -> list[str]:
+    """Helper function to read the lines of a CSV export."""
+    return path.read_text().splitlines()
+
+
+def test_full_run_records_high_water_mark(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every run ends with a run entry holding the watermark and its records."""
+    study = _Study(monkeypatch, [_record(1, 5), _record(2, 9), _record(3, 9)])
+    out = tmp_path / "out.csv"
+
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+
+    [run] = _runs(tmp_path / "out.manifest.jsonl")
+    assert run["mode"] == "full"
+    assert run["row_count"] == 3
+    assert run["high_water_mark"] == "2024-03-01T10:09:00+00:00"
+    assert run["boundary_record_ids"] == [2, 3]
+    assert study.filters == [None]
+
+
+def test_incremental_csv_replaces_changed_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Changed and new records replace their rows; the rest are kept."""
+    study = _Study(monkeypatch, [_record(i, i) for i in range(1, 6)])
+    out = tmp_path / "out.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+
+    study.replace(_record(2, 30, "new"), _record(4, 31, "new"), _record(6, 31, "new"))
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    rows = _csv_rows(out)
+    assert rows[0].startswith("recordId,")
+    assert [r.split(",")[0] for r in rows[1:]] == ["1", "3", "5", "2", "4", "6"]
+    assert [r.split(",")[-1] for r in rows[1:]] == ["v1", "v3", "v5", "new2", "new4", "new6"]
+    full = tmp_path / "full.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(full))
+    assert sorted(_csv_rows(full)) == sorted(rows)
+
+    assert study.filters[1] == {"dateModified": (">=", "2024-03-01T10:05:00Z")}
+    incremental = _runs(tmp_path / "out.manifest.jsonl")[-1]
+    assert incremental["mode"] == "incremental"
+    assert incremental["row_count"] == 3
+    assert incremental["high_water_mark"] == "2024-03-01T10:31:00+00:00"
+    assert incremental["boundary_record_ids"] == [4, 6]
+
+
+def test_incremental_run_without_changes_leaves_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Records at the settled watermark are not exported again."""
+    study = _Study(monkeypatch, [_record(1, 1), _record(2, 2)])
+    out = tmp_path / "out.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+    before = out.read_text()
+
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    assert out.read_text() == before
+    assert len(_runs(tmp_path / "out.manifest.jsonl")) == 1
+    assert list(tmp_path.glob("tmp*")) == []
+
+
+def test_incremental_filter_uses_watermark_as_stamped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A naive server stamp is sent back unchanged, not as a UTC offset."""
+    records = [_record(1, 1), _record(2, 2)]
+    for record in records:
+        record.date_modified = record.date_modified.replace("T", " ").rstrip("Z")
+    study = _Study(monkeypatch, records)
+    out = tmp_path / "out.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    run = _runs(tmp_path / "out.manifest.jsonl")[0]
+    assert run["high_water_mark_raw"] == "2024-03-01 10:02:00"
+    assert study.filters[1] == {"dateModified": (">=", "2024-03-01 10:02:00")}
+
+
+def test_incremental_picks_up_late_records_at_watermark(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A record stamped with the watermark but not yet exported is included."""
+    study = _Study(monkeypatch, [_record(1, 1), _record(2, 2)])
+    out = tmp_path / "out.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+
+    study.replace(_record(3, 2))
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    assert [r.split(",")[0] for r in _csv_rows(out)[1:]] == ["1", "2", "3"]
+    assert _runs(tmp_path / "out.manifest.jsonl")[-1]["boundary_record_ids"] == [2, 3]
+
+
+def test_incremental_reexports_records_remodified_at_watermark(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A boundary record modified again within the watermark second is exported again."""
+    study = _Study(monkeypatch, [_record(1, 1), _record(2, 2)])
+    out = tmp_path / "out.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+
+    study.replace(_record(2, 2, "new"))
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    rows = _csv_rows(out)[1:]
+    assert [(r.split(",")[0], r.split(",")[-1]) for r in rows] == [("1", "v1"), ("2", "new2")]
+    run = _runs(tmp_path / "out.manifest.jsonl")[-1]
+    assert (run["mode"], run["row_count"], run["boundary_record_ids"]) == ("incremental", 1, [2])
+
+
+def test_incremental_csv_falls_back_when_columns_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A header that no longer matches the export triggers a full rewrite."""
+    study = _Study(monkeypatch, [_record(1, 1), _record(2, 2)])
+    out = tmp_path / "out.csv"
+    export_mod.export_to_csv(study.sdk, "STUDY", str(out), config=_csv_config(tmp_path))
+    rows = _csv_rows(out)
+    out.write_text("\n".join([rows[0] + ",extra"] + [r + ",x" for r in rows[1:]]) + "\n")
+
+    study.replace(_record(2, 9, "new"))
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    assert _csv_rows(out) == [rows[0], rows[1], rows[2].replace("v2", "new2")]
+    assert _runs(tmp_path / "out.manifest.jsonl")[-1]["mode"] == "full"
+
+
+def test_incremental_without_previous_run_exports_everything(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The first incremental run is a full export."""
+    study = _Study(monkeypatch, [_record(1, 1), _record(2, 2)])
+    out = tmp_path / "out.csv"
+
+    export_mod.export_to_csv(
+        study.sdk, "STUDY", str(out), config=_csv_config(tmp_path), incremental=True
+    )
+
+    assert len(_csv_rows(out)) == 3
+    assert study.filters == [None]
+    assert _runs(tmp_path / "out.manifest.jsonl")[-1]["mode"] == "full"
+
+
+def test_incremental_sql_upserts_changed_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """SQL targets delete and re-insert changed records only."""
+    study = _Study(monkeypatch, [_record(i, i) for i in range(1, 6)])
+    db_url = f"sqlite:///{tmp_path / 'out.db'}"
+    config = export_mod.TabularSinkConfig(
+        study_key="STUDY", batch_size=2, manifest_path=str(tmp_path / "sql.jsonl")
+    )
+    export_mod.export_to_sql(study.sdk, "STUDY", "records", db_url, config=config)
+
+    study.replace(_record(1, 20, "new"), _record(3, 21, "new"), _record(7, 21, "new"))
+    study.rejected = {3}
+    export_mod.export_to_sql(study.sdk, "STUDY", "records", db_url, config=config, incremental=True)
+
+    engine = sa.create_engine(db_url)
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sa.text('SELECT "recordId", value FROM records ORDER BY "recordId"')
+        ).all()
+    engine.dispose()
+    assert [tuple(r) for r in rows] == [(1, "new1"), (2, "v2"), (4, "v4"), (5, "v5"), (7, "new7")]
+    run = _runs(tmp_path / "sql.jsonl")[-1]
+    assert (run["mode"], run["row_count"], run["boundary_record_ids"]) == (
+        "incremental",
+        2,
+        [3, 7],
+    )
+
+
+def test_incremental_sql_without_table_exports_everything(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A manifest run for a table that no longer exists leads to a full export."""
+    study = _Study(monkeypatch, [_record(1, 1), _record(2, 2)])
+    config = export_mod.TabularSinkConfig(
+        study_key="STUDY", manifest_path=str(tmp_path / "sql.jsonl")
+    )
+    export_mod.export_to_sql(
+        study.sdk, "STUDY", "records", f"sqlite:///{tmp_path / 'a.db'}", config=config
+    )
+
+    db_url = f"sqlite:///{tmp_path / 'b.db'}"
+    export_mod.export_to_sql(study.sdk, "STUDY", "records", db_url, config=config, incremental=True)
+
+    engine = sa.create_engine(db_url)
+    with engine.connect() as conn:
+        count = conn.execute(sa.text("SELECT COUNT(*) FROM records")).scalar()
+    engine.dispose()
+    assert count == 2
+    assert study.filters[-1] is None
@@ -0,0 +1,231 @@
+"""Unit tests for the pipelined export stages."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy as sa
+
+import imednet.integrations.export as export_mod
+from imednet.integrations.export_pipeline import ExportPipelineConfig, iter_pipelined
+
+
+def _records(count: int) -> list[SimpleNamespace]:
+    """Helper function to build records spread across two forms."""
+    return [
+        SimpleNamespace(
+            record_id=i,
+            subject_key=f"S{i}",
+            visit_id=1,
+            form_id=1 + i % 2,
+            record_status="Complete",
+            date_created=None,
+            record_data={"value": f"v{i}", "score": i if i % 3 else None},
+        )
+        for i in range(count)
+    ]
+
+
+def _patch_mapper(monkeypatch: pytest.MonkeyPatch, records: list[SimpleNamespace]) -> MagicMock:
+    """Helper function to wire a real RecordMapper to canned metadata and records."""
+    record_mapper = pytest.importorskip("imednet_workflows.record_mapper").RecordMapper
+    sdk = MagicMock()
+    sdk.forms.list.return_value = [
+        SimpleNamespace(form_id=1, form_key="FORM_A"),
+        SimpleNamespace(form_id=2, form_key="FORM_B"),
+    ]
+    variables = [
+        SimpleNamespace(variable_name=name, label=name.title(), form_id=form_id)
+        for form_id in (1, 2)
+        for name in ("value", "score")
+    ]
+    sdk.variables.list.return_value = variables
+    sdk.get_variables.return_value = variables[:2]
+
+    def _mapper_factory(_sdk: object) -> object:
+        mapper = record_mapper(sdk)
+        mapper._iter_records = lambda *args, **kwargs: iter(records)
+        return mapper
+
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: _mapper_factory)
+    monkeypatch.setattr(export_mod, "apply_quality_gate", lambda s, sk, rr, c: rr)
+    return sdk
+
+
+def _manifest(path: Path) -> list[dict]:
+    """Helper function to read a manifest without its load timestamps."""
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    for entry in entries:
+        entry.pop("loaded_at")
+    return entries
+
+
+def test_iter_pipelined_preserves_source_order() -> None:
+    """Results come back in source order even when transforms finish out of order."""
+    config = ExportPipelineConfig(transform_workers=4, max_pending_batches=3)
+
+    def _slow_for_even(item: int) -> int:
+        time.sleep(0.01 if item % 2 == 0 else 0)
+        return item * 10
+
+    assert list(iter_pipelined(range(20), _slow_for_even, config)) == [i * 10 for i in range(20)]
+
+
+def test_iter_pipelined_bounds_fetch_ahead() -> None:
+    """The fetch stage never runs more than the configured window ahead of the writer."""
+    config = ExportPipelineConfig(transform_workers=2, max_pending_batches=2)
+    pulled = 0
+
+    def _source():
+        nonlocal pulled
+        for i in range(12):
+            pulled += 1
+            yield i
+
+    ahead = []
+    for consumed, _ in enumerate(iter_pipelined(_source(), lambda x: x, config), start=1):
+        time.sleep(0.02)
+        ahead.append(pulled - consumed)
+
+    # One batch may be held by the fetcher while it waits for a free slot.
+    assert max(ahead) <= config.max_pending_batches + 1
+
+
+def test_iter_pipelined_propagates_fetch_errors_after_earlier_results() -> None:
+    """A failing source surfaces in the caller once earlier batches are yielded."""
+
+    def _source():
+        yield 1
+        yield 2
+        raise RuntimeError("fetch failed")
+
+    results = []
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        for item in iter_pipelined(_source(), lambda x: x, ExportPipelineConfig()):
+            results.append(item)
+
+    assert results == [1, 2]
+
+
+def test_iter_pipelined_propagates_transform_errors() -> None:
+    """A failing transform is re-raised in the caller."""
+
+    def _transform(item: int) -> int:
+        if item == 3:
+            raise ValueError("bad batch")
+        return item
+
+    with pytest.raises(ValueError, match="bad batch"):
+        list(iter_pipelined(range(10), _transform, ExportPipelineConfig()))
+
+
+def test_iter_pipelined_close_stops_fetching() -> None:
+    """Closing the generator early stops and closes the source."""
+    closed = threading.Event()
+    pulled = 0
+
+    def _source():
+        nonlocal pulled
+        try:
+            for i in range(1000):
+                pulled += 1
+                yield i
+        finally:
+            closed.set()
+
+    stream = iter_pipelined(_source(), lambda x: x, ExportPipelineConfig(max_pending_batches=2))
+    assert [next(stream), next(stream)] == [0, 1]
+    stream.close()
+
+    assert closed.is_set()
+    assert pulled < 1000
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"transform_workers": 0}, "transform_workers"),
+        ({"max_pending_batches": 0}, "max_pending_batches"),
+    ],
+)
+def test_export_pipeline_config_validates_sizes(kwargs: dict, message: str) -> None:
+    """Stage sizes must be positive."""
+    with pytest.raises(ValueError, match=message):
+        ExportPipelineConfig(**kwargs)
+
+
+def test_pipelined_csv_export_matches_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Pipelined CSV exports write the same file and manifest as sequential ones."""
+    sdk = _patch_mapper(monkeypatch, _records(11))
+    outputs = {}
+    for mode, pipeline in (("seq", None), ("pipe", ExportPipelineConfig(transform_workers=3))):
+        path = tmp_path / f"{mode}.csv"
+        config = export_mod.TabularSinkConfig(
+            study_key="STUDY",
+            batch_size=2,
+            manifest_path=str(tmp_path / f"{mode}.manifest.jsonl"),
+        )
+        export_mod.export_to_csv(sdk, "STUDY", str(path), config=config, pipeline=pipeline)
+        outputs[mode] = (path.read_text(), _manifest(tmp_path / f"{mode}.manifest.jsonl"))
+
+    seq_csv, seq_manifest = outputs["seq"]
+    pipe_csv, pipe_manifest = outputs["pipe"]
+    assert pipe_csv == seq_csv
+    assert [{k: v for k, v in e.items() if k != "destination"} for e in pipe_manifest] == [
+        {k: v for k, v in e.items() if k != "destination"} for e in seq_manifest
+    ]
+    batches, run = pipe_manifest[:-1], pipe_manifest[-1]
+    assert [e["batch_id"] for e in batches] == [f"STUDY/tabular/{i}" for i in range(6)]
+    assert sum(e["row_count"] for e in batches) == run["row_count"] == 11
+    assert run["batch_id"] == "STUDY/tabular/run"
+
+
+def test_pipelined_sql_export_matches_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Pipelined SQL exports load the same rows and checksums as sequential ones."""
+    sdk = _patch_mapper(monkeypatch, _records(9))
+    monkeypatch.chdir(tmp_path)
+    db_url = f"sqlite:///{tmp_path / 'out.db'}"
+    for table, pipeline in (("seq", None), ("pipe", ExportPipelineConfig(transform_workers=2))):
+        config = export_mod.TabularSinkConfig(
+            study_key="STUDY", batch_size=4, manifest_path=f"{table}.jsonl"
+        )
+        export_mod.export_to_sql(sdk, "STUDY", table, db_url, config=config, pipeline=pipeline)
+
+    engine = sa.create_engine(db_url)
+    with engine.connect() as conn:
+        seq_rows = conn.execute(sa.text("SELECT * FROM seq")).all()
+        pipe_rows = conn.execute(sa.text("SELECT * FROM pipe")).all()
+    engine.dispose()
+    assert pipe_rows == seq_rows
+    assert len(pipe_rows) == 9
+    assert [
+        (e["batch_id"], e["row_count"], e["checksum"]) for e in _manifest(tmp_path / "pipe.jsonl")
+    ] == [(e["batch_id"], e["row_count"], e["checksum"]) for e in _manifest(tmp_path / "seq.jsonl")]
+
+
+def test_pipelined_sql_by_form_export(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Per-form SQL exports build forms on the pipeline and write every table."""
+    sdk = _patch_mapper(monkeypatch, _records(7))
+    db_url = f"sqlite:///{tmp_path / 'forms.db'}"
+
+    export_mod.export_to_sql_by_form(
+        sdk, "STUDY", db_url, pipeline=ExportPipelineConfig(transform_workers=2)
+    )
+
+    engine = sa.create_engine(db_url)
+    with engine.connect() as conn:
+        form_a = conn.execute(sa.text('SELECT "recordId" FROM "FORM_A"')).scalars().all()
+        form_b = conn.execute(sa.text('SELECT "recordId" FROM "FORM_B"')).scalars().all()
+    engine.dispose()
+    assert form_a == [0, 2, 4, 6]
+    assert form_b == [1, 3, 5]
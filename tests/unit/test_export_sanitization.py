@@ -69,6 +69,7 @@ def test_export_to_csv_sanitization(tmp_path, mock_record_mapper, monkeypatch):
 
 def test_export_to_excel_sanitization(tmp_path, mock_record_mapper, monkeypatch):
     """Test that Excel export sanitizes formulas."""
+    openpyxl = pytest.importorskip("openpyxl")
     df = pd.DataFrame({"safe": ["hello"], "unsafe": ["=cmd"], "num": [123]})
     mock_record_mapper(df)
     monkeypatch.setattr(export_mod, "apply_quality_gate", lambda s, sk, rr, c: rr)
@@ -76,23 +77,6 @@ def test_export_to_excel_sanitization(tmp_path, mock_record_mapper, monkeypatch)
     sdk = MagicMock()
     path = tmp_path / "out.xlsx"
 
-    # We need to inspect the DataFrame passed to to_excel, because reading xlsx requires openpyxl
-    # and might be complex to verify directly in test environment without full setup.
-    # Instead, we patch pd.DataFrame.to_excel to verify the dataframe state just before export.
-
-    captured_df = None
-
-    def mock_to_excel(self, excel_writer, index=False, **kwargs):
-        """Helper function to mock to excel."""
-        nonlocal captured_df
-        captured_df = self.copy()
-        # Call original to generate file if needed, but we can skip file generation
-        # for speed/dependency. Just creating an empty file to satisfy existence
-        # checks if any. However, export_mod doesn't check existence after.
-        # But we need to ensure the method signature matches.
-
-    monkeypatch.setattr(pd.DataFrame, "to_excel", mock_to_excel)
-
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
         export_mod.export_to_excel(sdk, "STUDY", str(path))
@@ -107,10 +91,10 @@ def test_export_to_excel_sanitization(tmp_path, mock_record_mapper, monkeypatch)
             f"Caught unexpected warnings: {[str(warn.message) for warn in relevant_warnings]}"
         )
 
-    assert captured_df is not None
-    assert captured_df["unsafe"].iloc[0] == "'=cmd"
-    assert captured_df["safe"].iloc[0] == "hello"
-    assert captured_df["num"].iloc[0] == 123
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    rows = list(workbook.active.values)
+    workbook.close()
+    assert rows == [("safe", "unsafe", "num"), ("hello", "'=cmd", 123)]
 
 
 def test_sanitization_does_not_affect_non_strings(tmp_path, mock_record_mapper, monkeypatch):
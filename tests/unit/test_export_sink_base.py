@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from types import ModuleType
 from unittest.mock import MagicMock
@@ -11,11 +12,21 @@ import pytest
 import imednet.integrations.sink_base as sink_base_mod
 from imednet.errors import ExportBatchError, ExportConfigurationError, ExportError
 from imednet.integrations.sink_base import (
+    AdaptiveBatchPolicy,
+    AdaptiveBatchSizer,
+    AsyncExportSink,
+    BatchCheckpointStore,
+    DeadLetterStore,
     ExportSink,
     SinkConfig,
+    SyncSinkAdapter,
     _redact_uri,
     _require_optional_dep,
+    aapply_quality_gate,
+    aiter_batches,
+    batch_digest,
     iter_batches,
+    quality_gate_batch,
 )
 
 # ---------------------------------------------------------------------------
@@ -119,6 +130,158 @@ class TestIterBatches:
         with pytest.raises(ValueError, match="batch_size"):
             list(iter_batches([1, 2], 0))
 
+    def test_consumes_iterators_one_batch_at_a_time(self):
+        """Test that a generator is only read as far as the current batch."""
+        consumed = []
+
+        def records():
+            for i in range(5):
+                consumed.append(i)
+                yield i
+
+        batches = iter_batches(records(), 2)
+        assert next(batches) == [0, 1]
+        assert consumed == [0, 1]
+        assert list(batches) == [[2, 3], [4]]
+
+    def test_async_batches_from_async_iterable(self):
+        """Test that aiter_batches groups an async iterable into lists."""
+
+        async def records():
+            for i in range(5):
+                yield i
+
+        async def collect(source):
+            return [batch async for batch in aiter_batches(source, 2)]
+
+        assert asyncio.run(collect(records())) == [[0, 1], [2, 3], [4]]
+        assert asyncio.run(collect(range(3))) == [[0, 1], [2]]
+
+    def test_callable_batch_size_is_asked_before_each_batch(self):
+        """Test that a callable batch size can change between batches."""
+        sizes = iter([1, 2, 3])
+        assert list(iter_batches(list(range(6)), lambda: next(sizes))) == [[0], [1, 2], [3, 4, 5]]
+        sizes = iter([3, 1, 2, 2])
+        assert list(iter_batches(iter(range(6)), lambda: next(sizes))) == [[0, 1, 2], [3], [4, 5]]
+
+
+class TestAsyncQualityGate:
+    """Test suite for aapply_quality_gate."""
+
+    def test_passes_all_records_when_disabled(self):
+        """Test that records stream through unchanged without a threshold."""
+
+        async def collect():
+            return [r async for r in aapply_quality_gate(MagicMock(), "S", [1, 2], SinkConfig("S"))]
+
+        assert asyncio.run(collect()) == [1, 2]
+
+    def test_filters_with_async_schema(self, monkeypatch):
+        """Test that an async SDK refreshes the schema with AsyncSchemaValidator."""
+        validator = MagicMock()
+        validator.schema = "schema"
+        refreshed = []
+
+        async def refresh(study_key):
+            refreshed.append(study_key)
+
+        validator.refresh = refresh
+        monkeypatch.setattr(
+            "imednet.validation.cache.AsyncSchemaValidator", MagicMock(return_value=validator)
+        )
+        monkeypatch.setattr(
+            sink_base_mod,
+            "quality_gate_batch",
+            lambda schema, batch, config: [r for r in batch if schema == "schema" and r % 2 == 0],
+        )
+        sdk = MagicMock(spec=["async_get_variables"])
+
+        async def records():
+            for i in range(4):
+                yield i
+
+        async def collect():
+            cfg = SinkConfig("S", quality_gate_enabled=True, min_schema_readiness_score=0.5)
+            return [r async for r in aapply_quality_gate(sdk, "S", records(), cfg)]
+
+        assert asyncio.run(collect()) == [0, 2]
+        assert refreshed == ["S"]
+
+
+def _per_record_gate(schema, record, config):
+    """Helper function reproducing the record-at-a-time gate decision."""
+    from imednet.validation.cache import calculate_readiness_score
+
+    if hasattr(record, "model_dump"):
+        rec = record.model_dump()
+    elif hasattr(record, "__dict__"):
+        rec = {"form_key": record.form_key, "form_id": record.form_id, "data": record.record_data}
+    else:
+        rec = record
+    fk = rec.get("formKey") or rec.get("form_key")
+    if not fk:
+        fk = schema.form_key_from_id(rec.get("formId") or rec.get("form_id") or 0)
+    if not fk:
+        return False
+    score, _ = calculate_readiness_score(schema, fk, rec.get("data", {}) or {})
+    return score >= config.min_schema_readiness_score
+
+
+class TestQualityGateBatch:
+    """Test suite for quality_gate_batch."""
+
+    @pytest.fixture
+    def schema(self):
+        """Schema cache with two forms."""
+        from imednet.models.variables import Variable
+        from imednet.validation.cache import SchemaCache
+
+        cache = SchemaCache()
+        cache.populate(
+            [
+                Variable(variable_name="age", variable_type="integer", form_id=1, form_key="DM"),
+                Variable(variable_name="sex", variable_type="text", form_id=1, form_key="DM"),
+                Variable(variable_name="hr", variable_type="integer", form_id=2, form_key="VS"),
+            ]
+        )
+        return cache
+
+    def test_same_decisions_as_per_record_gate(self, schema):
+        """Test that batch decisions match scoring each record on its own."""
+        from types import SimpleNamespace
+
+        from imednet.models.records import Record
+
+        records = [
+            {"formKey": "DM", "data": {"age": 30, "sex": "F"}},
+            {"form_id": 1, "data": {"age": "30", "sex": "F"}},
+            {"formId": 2, "data": {"hr": 70}},
+            {"form_key": "VS", "data": None},
+            {"formKey": "UNKNOWN", "data": {}},
+            {"formId": 99, "data": {"hr": 1}},
+            SimpleNamespace(form_key=None, form_id=2, record_data={"hr": 61}, record_id=7),
+            SimpleNamespace(form_key="DM", form_id=1, record_data={"age": 5}, record_id=8),
+            Record.model_validate({"recordId": 9, "formKey": "VS", "recordData": {"hr": 1}}),
+            {"formKey": "DM", "data": {"age": None, "sex": None, "bmi": 1}},
+        ]
+        for threshold in (0.0, 50.0, 100.0):
+            config = SinkConfig(
+                "S", quality_gate_enabled=True, min_schema_readiness_score=threshold
+            )
+            expected = [r for r in records if _per_record_gate(schema, r, config)]
+            assert quality_gate_batch(schema, records, config) == expected
+
+    def test_logs_reasons_for_dropped_records(self, schema, caplog):
+        """Test that dropped records are logged with their score and reasons."""
+        config = SinkConfig("S", quality_gate_enabled=True, min_schema_readiness_score=100.0)
+        records = [{"formKey": "DM", "data": {"age": "x"}, "record_id": 3}]
+
+        with caplog.at_level("INFO", logger=sink_base_mod.__name__):
+            assert quality_gate_batch(schema, records, config) == []
+
+        assert "Dropped record 3 (Score: 0.0 < 100.0)" in caplog.text
+        assert "Missing expected variable: sex" in caplog.text
+
 
 # ---------------------------------------------------------------------------
 # ExportSink (concrete stub for testing)
@@ -177,6 +340,506 @@ class TestExportSinkContextManager:
         assert sink.batches[0] == ([10, 20], "b2")
 
 
+class TestAdaptiveBatching:
+    """Test suite for adaptive batch sizing."""
+
+    def test_grows_towards_target_latency_within_bounds(self):
+        """Test that fast writes grow the size, at most by the growth factor."""
+        sizer = AdaptiveBatchSizer(AdaptiveBatchPolicy(target_latency=1.0), 500)
+
+        decision = sizer.observe("b0", 500, 0.05)
+
+        assert (decision.previous, decision.batch_size, decision.reason) == (500, 1000, "latency")
+        for i in range(1, 5):
+            sizer.observe(f"b{i}", sizer.batch_size, 0.0001 * sizer.batch_size)
+        assert sizer.batch_size == 5000
+        assert [d.batch_size for d in sizer.decisions] == [1000, 2000, 4000, 5000]
+
+    def test_slow_writes_shrink_to_target_latency(self):
+        """Test that a write slower than the target shrinks the size proportionally."""
+        sizer = AdaptiveBatchSizer(AdaptiveBatchPolicy(target_latency=1.0), 1000)
+
+        assert sizer.observe("b0", 1000, 4.0).batch_size == 250
+
+    def test_payload_bound_caps_size(self):
+        """Test that wide records keep batches within max_batch_bytes."""
+        policy = AdaptiveBatchPolicy(target_latency=1.0, max_batch_bytes=100_000)
+        sizer = AdaptiveBatchSizer(policy, 500)
+
+        decision = sizer.observe("b0", 500, 0.1, payload_bytes=500 * 1000)
+
+        assert (decision.batch_size, decision.reason) == (100, "payload")
+        assert decision.bytes_per_record == 1000
+
+    def test_retries_shrink_and_high_error_rate_stops_growth(self):
+        """Test that retried writes halve the size and errors then hold it."""
+        sizer = AdaptiveBatchSizer(AdaptiveBatchPolicy(target_latency=1.0), 1000)
+
+        decision = sizer.observe("b0", 1000, 0.1, attempts=2, failures=1)
+        assert (decision.batch_size, decision.reason) == (500, "errors")
+        assert sizer.observe("b1", 500, 0.01) is None
+        assert sizer.batch_size == 500
+
+    def test_small_changes_are_ignored(self):
+        """Test that resizes within ten percent are not made."""
+        sizer = AdaptiveBatchSizer(AdaptiveBatchPolicy(target_latency=1.0), 1000)
+
+        assert sizer.observe("b0", 1000, 0.95) is None
+        assert sizer.batch_size == 1000
+
+    def test_policy_is_validated(self):
+        """Test that inconsistent bounds and factors are rejected."""
+        with pytest.raises(ValueError, match="batch size bounds"):
+            AdaptiveBatchPolicy(min_batch_size=10, max_batch_size=5)
+        with pytest.raises(ValueError, match="shrink_factor"):
+            AdaptiveBatchPolicy(shrink_factor=1.0)
+
+    def test_sink_observes_retried_writes(self, monkeypatch):
+        """Test that _execute_with_retry reports attempts, latency and payload."""
+        from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+        get_global_circuit_breaker().reset()
+        monkeypatch.setattr("time.sleep", lambda _: None)
+        policy = AdaptiveBatchPolicy(min_batch_size=10, target_latency=60.0)
+        sink = _StubSink(SinkConfig(study_key="S", batch_size=200, adaptive_batching=policy))
+        calls = []
+
+        def flaky() -> int:
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError("reset")
+            return 200
+
+        rows = [{"id": i} for i in range(200)]
+        written = sink._execute_with_retry(
+            "export", "S/records/0", flaky, payload_bytes=sink._payload_bytes(rows)
+        )
+
+        assert written == 200
+        (decision,) = sink.batch_sizer.decisions
+        assert (decision.batch_id, decision.batch_size, decision.reason) == (
+            "S/records/0",
+            100,
+            "errors",
+        )
+        assert decision.error_rate == pytest.approx(0.3 * 0.5)
+        assert sink.next_batch_size() == 100
+
+    def test_disabled_by_default(self):
+        """Test that sinks use the configured batch size without a policy."""
+        sink = _StubSink(SinkConfig(study_key="S", batch_size=123))
+
+        assert sink.batch_sizer is None
+        assert sink.next_batch_size() == 123
+        assert sink._payload_bytes([{"id": 1}]) is None
+
+
+class _AsyncStubSink(AsyncExportSink):
+    """Minimal asynchronous sink failing once on ``flaky`` and always on ``broken`` batches."""
+
+    def __init__(self, config, flaky=(), broken=()):
+        """Initialize the test object."""
+        super().__init__(config)
+        self.flaky = set(flaky)
+        self.broken = set(broken)
+        self.events: list[str] = []
+
+    async def open(self):
+        """Record the connection."""
+        self.events.append("open")
+
+    async def write_batch(self, records, *, batch_id):
+        """Write through the async retry helper."""
+
+        async def attempt():
+            if batch_id in self.broken or batch_id in self.flaky:
+                self.flaky.discard(batch_id)
+                raise ConnectionError("reset")
+            self.events.append(batch_id)
+            return len(records)
+
+        return await self._aexecute_with_retry("export", batch_id, attempt)
+
+    async def flush(self):
+        """Record the flush."""
+        self.events.append("flush")
+
+    async def close(self):
+        """Record the close."""
+        self.events.append("close")
+
+
+class TestAsyncExportSink:
+    """Test suite for AsyncExportSink and SyncSinkAdapter."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_retries(self, monkeypatch):
+        """Reset the circuit breaker and skip retry waits."""
+        from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+        get_global_circuit_breaker().reset()
+        real_sleep = asyncio.sleep
+        monkeypatch.setattr(asyncio, "sleep", lambda _seconds: real_sleep(0))
+
+    def test_context_manager_opens_flushes_and_closes(self):
+        """Test that async with opens the sink and flushes and closes it on exit."""
+
+        async def run():
+            async with _AsyncStubSink(SinkConfig(study_key="S"), flaky={"b1"}) as sink:
+                assert await sink.write_batch([1, 2], batch_id="b1") == 2
+            return sink.events
+
+        assert asyncio.run(run()) == ["open", "b1", "flush", "close"]
+
+    def test_exhausted_retries_raise_batch_error_and_skip_flush(self):
+        """Test that a failing batch raises ExportBatchError and the sink is closed."""
+        sink = _AsyncStubSink(SinkConfig(study_key="S"), broken={"b1"})
+
+        async def run():
+            async with sink:
+                await sink.write_batch([1], batch_id="b1")
+
+        with pytest.raises(ExportBatchError, match="b1"):
+            asyncio.run(run())
+        assert sink.events == ["open", "close"]
+
+    def test_retries_feed_adaptive_batching(self):
+        """Test that async retries are reported like synchronous ones."""
+        policy = AdaptiveBatchPolicy(min_batch_size=10, target_latency=60.0)
+        config = SinkConfig(study_key="S", batch_size=100, adaptive_batching=policy)
+        sink = _AsyncStubSink(config, flaky={"b1"})
+
+        asyncio.run(sink.write_batch(list(range(100)), batch_id="b1"))
+
+        assert sink.next_batch_size() == 50
+
+    def test_adapter_runs_sync_sink_on_worker_threads(self):
+        """Test that SyncSinkAdapter delegates every call off the event loop."""
+        import threading
+
+        class ThreadRecordingSink(_StubSink):
+            def write_batch(self, records, *, batch_id):
+                self.thread = threading.current_thread()
+                return super().write_batch(records, batch_id=batch_id)
+
+        wrapped = ThreadRecordingSink(SinkConfig(study_key="S", batch_size=7))
+
+        async def run():
+            async with SyncSinkAdapter(wrapped) as sink:
+                assert sink.next_batch_size() == 7
+                return await sink.write_batch([1, 2, 3], batch_id="b1")
+
+        assert asyncio.run(run()) == 3
+        assert wrapped.thread is not threading.main_thread()
+        assert wrapped.flushed and wrapped.closed
+
+
+class _RejectingSink(ExportSink):
+    """Sink rejecting records with a negative ``v``, or every write during an outage."""
+
+    def __init__(self, config):
+        """Initialize the test object."""
+        super().__init__(config)
+        self.written: list[dict] = []
+        self.writes = 0
+        self.outage = False
+
+    def write_batch(self, records, *, batch_id):
+        """Write with record isolation."""
+        return self._execute_with_retry(
+            "export",
+            batch_id,
+            lambda: self._write(records),
+            records=records,
+            write_records=self._write,
+        )
+
+    def _write(self, records):
+        self.writes += 1
+        if self.outage:
+            raise ConnectionError("refused")
+        bad = [r["v"] for r in records if r["v"] < 0]
+        if bad:
+            raise ValueError(f"constraint violated by {bad}")
+        self.written.extend(records)
+        return len(records)
+
+    def flush(self):
+        """Nothing to flush."""
+
+    def close(self):
+        """Nothing to close."""
+
+
+class TestDeadLetters:
+    """Test suite for record isolation and the DeadLetterStore."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_retries(self, monkeypatch):
+        """Reset the circuit breaker and skip retry waits."""
+        from imednet.core.operations.circuit_breaker import get_global_circuit_breaker
+
+        get_global_circuit_breaker().reset()
+        monkeypatch.setattr("time.sleep", lambda _: None)
+        real_sleep = asyncio.sleep
+        monkeypatch.setattr(asyncio, "sleep", lambda _seconds: real_sleep(0))
+
+    def test_bad_records_are_isolated_and_stored(self, tmp_path):
+        """Test that a rejected record is dead-lettered and the rest of the batch written."""
+        path = tmp_path / "dead.sqlite"
+        sink = _RejectingSink(SinkConfig(study_key="S", dead_letter_path=str(path)))
+        records = [{"v": -i if i == 9 else i} for i in range(16)]
+
+        assert sink.write_batch(records, batch_id="S/records/0") == 15
+
+        assert sorted(r["v"] for r in sink.written) == [i for i in range(16) if i != 9]
+        assert sink.writes == 1 + 8
+        (entry,) = DeadLetterStore(path).entries()
+        assert (entry.sink, entry.study_key, entry.batch_id) == (
+            "_RejectingSink",
+            "S",
+            "S/records/0",
+        )
+        assert entry.record == {"v": -9}
+        assert entry.reason == "ValueError: constraint violated by [-9]"
+
+    def test_data_errors_are_isolated_without_retrying_the_batch(self, tmp_path):
+        """Test that a rejected batch is bisected after one attempt and keeps the breaker closed."""
+        from imednet.core.operations.circuit_breaker import (
+            CircuitState,
+            get_global_circuit_breaker,
+        )
+
+        path = tmp_path / "dead.sqlite"
+        sink = _RejectingSink(SinkConfig(study_key="S", dead_letter_path=str(path)))
+        full_batch_attempts = []
+        write = sink._write
+
+        def tracked(records):
+            if len(records) == 4:
+                full_batch_attempts.append(len(records))
+            return write(records)
+
+        sink._write = tracked
+        for i in range(8):
+            batch = [{"v": 4 * i + 1}, {"v": -1}, {"v": 4 * i + 2}, {"v": 4 * i + 3}]
+            assert sink.write_batch(batch, batch_id=f"S/records/{i}") == 3
+
+        assert full_batch_attempts == [4] * 8
+        assert get_global_circuit_breaker().state is CircuitState.CLOSED
+        assert len(DeadLetterStore(path)) == 8
+
+    def test_connection_errors_fail_the_batch(self, tmp_path):
+        """Test that failures not caused by the records are not isolated."""
+        path = tmp_path / "dead.sqlite"
+        sink = _RejectingSink(SinkConfig(study_key="S", dead_letter_path=str(path)))
+        sink.outage = True
+
+        with pytest.raises(ExportBatchError, match="S/records/0"):
+            sink.write_batch([{"v": 1}, {"v": 2}], batch_id="S/records/0")
+        assert len(DeadLetterStore(path)) == 0
+
+    def test_without_store_the_batch_fails(self):
+        """Test that isolation is only done when a dead-letter store is configured."""
+        sink = _RejectingSink(SinkConfig(study_key="S"))
+
+        with pytest.raises(ExportBatchError):
+            sink.write_batch([{"v": 1}, {"v": -1}], batch_id="S/records/0")
+        assert sink.written == []
+
+    def test_replay_restores_records_and_removes_them(self, tmp_path):
+        """Test that replayed records keep their type and are removed once written."""
+        from types import SimpleNamespace
+
+        from imednet.models import Record
+
+        store = DeadLetterStore(tmp_path / "dead.sqlite")
+        record = Record(record_id=7, form_id=2, record_data={"hr": 60})
+        store.add(
+            [record, SimpleNamespace(record_id=8)],
+            [ValueError("bad")] * 2,
+            sink="_StubSink",
+            study_key="S",
+            batch_id="S/records/0",
+        )
+        store.add([{"v": 1}], [ValueError("bad")], sink="Other", study_key="S", batch_id="b")
+        sink = _StubSink(SinkConfig(study_key="S"))
+
+        assert store.replay(sink) == 2
+
+        ((replayed, batch_id),) = sink.batches
+        assert batch_id == "S/dead-letters/1"
+        assert replayed[0] == record
+        assert replayed[1].record_id == 8
+        assert [entry.sink for entry in store.entries()] == ["Other"]
+
+    def test_async_sink_isolates_bad_records(self, tmp_path):
+        """Test that async retries isolate rejected records the same way."""
+
+        class AsyncRejectingSink(AsyncExportSink):
+            def __init__(self, config):
+                super().__init__(config)
+                self.sync = _RejectingSink(config)
+
+            async def write_batch(self, records, *, batch_id):
+                async def write(subset):
+                    return self.sync._write(subset)
+
+                return await self._aexecute_with_retry(
+                    "export", batch_id, lambda: write(records), records=records, write_records=write
+                )
+
+            async def flush(self):
+                pass
+
+            async def close(self):
+                pass
+
+        path = tmp_path / "dead.sqlite"
+        sink = AsyncRejectingSink(SinkConfig(study_key="S", dead_letter_path=str(path)))
+        records = [{"v": i} for i in range(1, 5)] + [{"v": -1}, {"v": -2}]
+
+        assert asyncio.run(sink.write_batch(records, batch_id="S/records/0")) == 4
+        assert [entry.record["v"] for entry in DeadLetterStore(path).entries()] == [-1, -2]
+
+
+class _CheckpointedSink(_StubSink):
+    """Stub sink failing on the batch ids in ``fail_on``; batches in ``pending`` are not durable."""
+
+    def __init__(self, config, fail_on=()):
+        """Initialize the test object."""
+        super().__init__(config)
+        self.fail_on = set(fail_on)
+        self.pending: set[str] = set()
+
+    def write_batch(self, records, *, batch_id):
+        """Fail the scheduled batch ids, write the others."""
+        if batch_id in self.fail_on:
+            raise ExportBatchError(f"Batch {batch_id!r} failed", batch_id=batch_id)
+        return super().write_batch(records, batch_id=batch_id)
+
+    def _durable(self, batch_id):
+        return batch_id not in self.pending
+
+
+def _export_batches(sink, batches):
+    """Helper function to write *batches* through ``write_batch_checkpointed`` in a context."""
+    with sink:
+        return [
+            sink.write_batch_checkpointed(batch, batch_id=f"S/records/{i}")
+            for i, batch in enumerate(batches)
+        ]
+
+
+class TestBatchCheckpoints:
+    """Test suite for resuming exports from a BatchCheckpointStore."""
+
+    def test_rerun_resumes_at_first_unconfirmed_batch(self, tmp_path):
+        """Test that a rerun skips the batches committed before the failure."""
+        config = SinkConfig(study_key="S", checkpoint_path=str(tmp_path / "ckpt.sqlite"))
+        batches = [[{"v": i}, {"v": -i}] for i in range(5)]
+        first = _CheckpointedSink(config, fail_on={"S/records/3"})
+
+        with pytest.raises(ExportBatchError, match="S/records/3"):
+            _export_batches(first, batches)
+        entries = BatchCheckpointStore(config.checkpoint_path).entries(study_key="S")
+        assert [(c.sink, c.batch_id, c.records) for c in entries] == [
+            ("_CheckpointedSink", f"S/records/{i}", 2) for i in range(3)
+        ]
+
+        rerun = _CheckpointedSink(config)
+        assert _export_batches(rerun, batches) == [0, 0, 0, 2, 2]
+        assert [batch_id for _, batch_id in rerun.batches] == ["S/records/3", "S/records/4"]
+        assert rerun.skipped_batches == [f"S/records/{i}" for i in range(3)]
+
+    def test_completed_export_clears_its_checkpoints(self, tmp_path):
+        """Test that checkpoints do not outlive an export that completed."""
+        config = SinkConfig(study_key="S", checkpoint_path=str(tmp_path / "ckpt.sqlite"))
+
+        assert _export_batches(_CheckpointedSink(config), [[1], [2]]) == [1, 1]
+        assert len(BatchCheckpointStore(config.checkpoint_path)) == 0
+
+        again = _CheckpointedSink(config)
+        assert _export_batches(again, [[1], [2]]) == [1, 1]
+        assert again.skipped_batches == []
+
+    def test_changed_batches_and_other_studies_are_written(self, tmp_path):
+        """Test that checkpoints only match the same content for the same study."""
+        path = str(tmp_path / "ckpt.sqlite")
+        for study_key in ("S", "T"):
+            failing = _CheckpointedSink(
+                SinkConfig(study_key=study_key, checkpoint_path=path),
+                fail_on={"S/records/2"},
+            )
+            with pytest.raises(ExportBatchError):
+                _export_batches(failing, [[1], [5], [7]])
+
+        sink = _CheckpointedSink(SinkConfig(study_key="S", checkpoint_path=path))
+        assert _export_batches(sink, [[1], [6], [7]]) == [0, 1, 1]
+
+        store = BatchCheckpointStore(path)
+        assert [c.study_key for c in store.entries()] == ["T", "T"]
+        assert store.clear("T") == 2
+
+    def test_unconfirmed_batches_are_not_committed_on_failure(self, tmp_path):
+        """Test that batches the sink has not confirmed are written again by the rerun."""
+        path = tmp_path / "ckpt.sqlite"
+        sink = _CheckpointedSink(SinkConfig(study_key="S", checkpoint_path=str(path)))
+        sink.pending = {"S/records/1"}
+
+        with pytest.raises(RuntimeError), sink:
+            sink.write_batch_checkpointed([1], batch_id="S/records/0")
+            sink.write_batch_checkpointed([2], batch_id="S/records/1")
+            raise RuntimeError("killed")
+        assert [c.batch_id for c in BatchCheckpointStore(path).entries()] == ["S/records/0"]
+
+        rerun = _CheckpointedSink(SinkConfig(study_key="S", checkpoint_path=str(path)))
+        assert _export_batches(rerun, [[1], [2]]) == [0, 1]
+        assert len(BatchCheckpointStore(path)) == 0
+
+    def test_skipped_batches_restore_adaptive_batch_size(self, tmp_path):
+        """Test that a skipped batch restores the batch size recorded after it."""
+        config = SinkConfig(
+            study_key="S",
+            batch_size=2,
+            checkpoint_path=str(tmp_path / "ckpt.sqlite"),
+            adaptive_batching=AdaptiveBatchPolicy(min_batch_size=1, max_batch_size=64),
+        )
+        first = _CheckpointedSink(config, fail_on={"S/records/1"})
+        first.batch_sizer.restore(8)
+        with pytest.raises(ExportBatchError):
+            _export_batches(first, [[1, 2], [3]])
+
+        rerun = _CheckpointedSink(config)
+        assert rerun.next_batch_size() == 2
+        assert _export_batches(rerun, [[1, 2]]) == [0]
+        assert rerun.next_batch_size() == 8
+
+    def test_digest_ignores_key_order_and_adapter_shares_checkpoints(self, tmp_path):
+        """Test that digests are content-based and SyncSinkAdapter checkpoints through the sink."""
+        from types import SimpleNamespace
+
+        assert batch_digest([{"a": 1, "b": 2}]) == batch_digest([{"b": 2, "a": 1}])
+        assert batch_digest([SimpleNamespace(a=1)]) != batch_digest([{"a": 1}])
+        assert batch_digest([1, 2]) != batch_digest([2, 1])
+
+        config = SinkConfig(study_key="S", checkpoint_path=str(tmp_path / "ckpt.sqlite"))
+        with pytest.raises(ExportBatchError):
+            _export_batches(_CheckpointedSink(config, fail_on={"S/records/1"}), [[1], [2]])
+        adapter = SyncSinkAdapter(_CheckpointedSink(config))
+
+        async def run():
+            async with adapter:
+                return [
+                    await adapter.write_batch_checkpointed(batch, batch_id=f"S/records/{i}")
+                    for i, batch in enumerate([[1], [2]])
+                ]
+
+        assert asyncio.run(run()) == [0, 1]
+        assert adapter.skipped_batches == ["S/records/0"]
+        assert len(BatchCheckpointStore(config.checkpoint_path)) == 0
+
+
 # ---------------------------------------------------------------------------
 # Error hierarchy
 # ---------------------------------------------------------------------------
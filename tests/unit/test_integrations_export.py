@@ -1,12 +1,16 @@
 """Unit tests for integrations export."""
 
+import io
+import json
 import sys
 from builtins import __import__ as builtin_import
 from datetime import datetime
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, call
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 import imednet.integrations.export as export_mod
@@ -70,57 +74,163 @@ def test_export_to_csv(monkeypatch):
     m_open.assert_any_call("out.csv", mode="w", encoding="utf-8")
 
 
-def test_export_to_excel(monkeypatch):
+def test_export_to_excel(monkeypatch, tmp_path):
     """Test that export to excel."""
+    openpyxl = pytest.importorskip("openpyxl")
     _df, mapper_cls, mapper_inst = _setup_mapper(monkeypatch)
     sdk = MagicMock()
+    path = tmp_path / "out.xlsx"
 
-    export_mod.export_to_excel(sdk, "STUDY", "out.xlsx")
+    export_mod.export_to_excel(sdk, "STUDY", str(path))
 
     mapper_cls.assert_called_once_with(sdk)
-    mapper_inst.dataframe.assert_called_once_with(
+    mapper_inst._fetch_variable_metadata.assert_called_once_with(
         "STUDY",
-        use_labels_as_columns=False,
         variable_whitelist=None,
         form_whitelist=None,
     )
-    pd.DataFrame.to_excel.assert_called_once_with("out.xlsx", index=False)
+    pd.DataFrame.to_excel.assert_not_called()
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    assert workbook.sheetnames == ["Sheet1"]
+    assert list(workbook["Sheet1"].values) == [("A",), (1,)]
+    workbook.close()
 
 
-def test_export_to_json(monkeypatch):
+def test_export_to_json(monkeypatch, tmp_path):
     """Test that export to json."""
-    df, mapper_cls, mapper_inst = _setup_mapper(monkeypatch)
-    df.where.return_value.to_dict.return_value = [{"A": 1}]
+    _df, mapper_cls, mapper_inst = _setup_mapper(monkeypatch)
     sdk = MagicMock()
+    out = tmp_path / "out.json"
 
-    export_mod.export_to_json(sdk, "STUDY", "out.json")
+    export_mod.export_to_json(sdk, "STUDY", str(out))
 
     mapper_cls.assert_called_once_with(sdk)
-    mapper_inst.dataframe.assert_called_once_with(
+    mapper_inst._fetch_variable_metadata.assert_called_once_with(
         "STUDY",
-        use_labels_as_columns=False,
         variable_whitelist=None,
         form_whitelist=None,
     )
+    mapper_inst.dataframe.assert_not_called()
+    assert json.loads(out.read_text()) == [{"A": 1}]
 
 
-def test_export_to_parquet(monkeypatch):
+def test_export_to_json_streams_chunks(monkeypatch, tmp_path):
+    """Test that export to json writes every chunk into one array."""
+    frames = [pd.DataFrame({"A": [1, 2]}), pd.DataFrame({"A": [None]})]
+    monkeypatch.setattr(
+        export_mod, "_iter_tabular_frames", lambda *args, **kwargs: enumerate(frames)
+    )
+    out = tmp_path / "out.json"
+
+    export_mod.export_to_json(MagicMock(), "STUDY", str(out), batch_size=2, indent=2)
+
+    assert json.loads(out.read_text()) == [{"A": 1}, {"A": 2}, {"A": None}]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"indent": 2},
+        {"indent": 0},
+        {"indent": "\t", "sort_keys": True},
+        {"separators": (",", ":")},
+        {"indent": 4, "separators": (";", "= ")},
+        {"ensure_ascii": False},
+    ],
+)
+@pytest.mark.parametrize(
+    "items",
+    [[], [{"a": 1}], [{"a": "x\ny", "b": [1, {"c": None}]}, {"a": "é"}, 3, "s"]],
+)
+def test_write_json_array_matches_json_dump(kwargs, items):
+    """Test that the streamed JSON array is byte-identical to json.dump."""
+    streamed = io.StringIO()
+    export_mod._write_json_array(streamed, iter(items), **kwargs)
+
+    assert streamed.getvalue() == json.dumps(items, **kwargs)
+
+
+def test_export_to_parquet(monkeypatch, tmp_path):
     """Test that export to parquet."""
     _df, mapper_cls, mapper_inst = _setup_mapper(monkeypatch)
+    mapper_inst._parse_records.return_value = ([{"recordId": 1, "A": 1}], 0)
     sdk = MagicMock()
+    sdk.get_variables.return_value = [
+        MagicMock(variable_name="A", label="A", form_id=1, variable_type="integer")
+    ]
+    out = tmp_path / "out.parquet"
 
-    export_mod.export_to_parquet(sdk, "STUDY", "out.parquet", compression="snappy")
+    export_mod.export_to_parquet(sdk, "STUDY", str(out), compression="snappy", engine="pyarrow")
 
     mapper_cls.assert_called_once_with(sdk)
-    mapper_inst.dataframe.assert_called_once_with(
-        "STUDY",
-        use_labels_as_columns=False,
-        variable_whitelist=None,
-        form_whitelist=None,
+    sdk.get_variables.assert_called_once_with(study_key="STUDY")
+    mapper_inst.dataframe.assert_not_called()
+    mapper_inst._build_dataframe.assert_not_called()
+    parquet_file = pq.ParquetFile(out)
+    assert parquet_file.metadata.row_group(0).column(0).compression == "SNAPPY"
+    assert str(parquet_file.schema_arrow.field("A").type) == "int64"
+    assert pq.read_table(out).select(["recordId", "A"]).to_pylist() == [{"recordId": 1, "A": 1}]
+    assert list(tmp_path.iterdir()) == [out]
+
+
+def _parquet_batches(monkeypatch, *frames):
+    """Helper function to stub the chunked Arrow batch iterator for Parquet."""
+    batches = [pa.RecordBatch.from_pandas(df, preserve_index=False) for df in frames]
+    monkeypatch.setattr(
+        export_mod, "_iter_tabular_batches", lambda *args, **kwargs: enumerate(batches)
     )
-    pd.DataFrame.to_parquet.assert_called_once_with(
-        "out.parquet", index=False, compression="snappy"
+
+
+def test_export_to_parquet_writes_row_group_per_chunk(monkeypatch, tmp_path):
+    """Test that chunks with drifting types share one unified Parquet schema."""
+    _parquet_batches(
+        monkeypatch,
+        pd.DataFrame({"id": [1, 2], "value": [None, None], "score": [1, 2]}),
+        pd.DataFrame({"id": [3], "value": ["text"], "score": [2.5]}),
+        pd.DataFrame({"id": [4], "value": ["more"], "score": [3.0]}),
     )
+    out = tmp_path / "out.parquet"
+
+    export_mod.export_to_parquet(MagicMock(), "STUDY", str(out), batch_size=2)
+
+    parquet_file = pq.ParquetFile(out)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert str(parquet_file.schema_arrow.field("value").type) == "string"
+    assert str(parquet_file.schema_arrow.field("score").type) == "double"
+    result = pd.read_parquet(out)
+    assert result["id"].tolist() == [1, 2, 3, 4]
+    assert result["value"].tolist() == [None, None, "text", "more"]
+    assert result["score"].tolist() == [1.0, 2.0, 2.5, 3.0]
+    assert list(tmp_path.iterdir()) == [out]
+
+
+def test_export_to_parquet_without_records_writes_empty_file(monkeypatch, tmp_path):
+    """Test that an export without records still produces a Parquet file."""
+    monkeypatch.setattr(export_mod, "_iter_tabular_batches", lambda *args, **kwargs: iter(()))
+    out = tmp_path / "out.parquet"
+
+    export_mod.export_to_parquet(MagicMock(), "STUDY", str(out))
+
+    assert pq.read_table(out).num_rows == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"partition_cols": ["formId"]}, "does not accept: partition_cols"),
+        ({"engine": "fastparquet"}, "engine='fastparquet'"),
+    ],
+)
+def test_export_to_parquet_rejects_unsupported_kwargs(monkeypatch, tmp_path, kwargs, match):
+    """Pandas-only options fail clearly instead of inside ParquetWriter."""
+    iterate = MagicMock()
+    monkeypatch.setattr(export_mod, "_iter_tabular_batches", iterate)
+
+    with pytest.raises(TypeError, match=match):
+        export_mod.export_to_parquet(MagicMock(), "STUDY", str(tmp_path / "out.parquet"), **kwargs)
+
+    iterate.assert_not_called()
 
 
 def test_export_to_sql(monkeypatch):
@@ -155,31 +265,67 @@ def test_export_to_sql(monkeypatch):
     assert kwargs["if_exists"] == "append"
 
 
+def _duckdb_frames(monkeypatch, *frames):
+    """Helper function to stub the chunked Arrow batch iterator."""
+    batches = [pa.RecordBatch.from_pandas(df, preserve_index=False) for df in frames]
+    frames_mock = MagicMock(side_effect=lambda *args, **kwargs: enumerate(batches))
+    monkeypatch.setattr(export_mod, "_iter_tabular_batches", frames_mock)
+    return frames_mock
+
+
 def test_export_to_duckdb(monkeypatch):
     """Test that export to duckdb."""
     sdk = MagicMock()
-    df = pd.DataFrame({"A": [1]})
-    monkeypatch.setattr(export_mod, "_prepare_export_df", MagicMock(return_value=df))
+    frames_mock = _duckdb_frames(monkeypatch, pd.DataFrame({"A": [1]}))
 
     conn = MagicMock()
     duckdb_module = ModuleType("duckdb")
     duckdb_module.connect = MagicMock(return_value=conn)
     monkeypatch.setitem(sys.modules, "duckdb", duckdb_module)
 
-    export_mod.export_to_duckdb(sdk, "STUDY", "out.duckdb", "my table")
+    export_mod.export_to_duckdb(sdk, "STUDY", "out.duckdb", "my table", batch_size=10)
 
+    config = frames_mock.call_args.args[2]
+    assert config.batch_size == 10
+    assert config.quality_gate_enabled is False
     duckdb_module.connect.assert_called_once_with("out.duckdb")
-    conn.register.assert_called_once_with("df", df)
-    conn.execute.assert_called_once_with('CREATE OR REPLACE TABLE "my table" AS SELECT * FROM "df"')
+    assert conn.register.call_args.args[0] == "df"
+    assert conn.register.call_args.args[1].to_pydict() == {"A": [1]}
+    assert conn.execute.call_args_list == [
+        call("BEGIN TRANSACTION"),
+        call('CREATE OR REPLACE TABLE "my table" AS SELECT * FROM "df"'),
+        call("COMMIT"),
+    ]
     conn.unregister.assert_called_once_with("df")
     conn.close.assert_called_once_with()
 
 
+def test_export_to_duckdb_appends_later_chunks(monkeypatch):
+    """Test that export to duckdb appends every chunk after the first."""
+    _duckdb_frames(monkeypatch, pd.DataFrame({"A": [1]}), pd.DataFrame({"A": [2]}))
+
+    conn = MagicMock()
+    duckdb_module = ModuleType("duckdb")
+    duckdb_module.connect = MagicMock(return_value=conn)
+    monkeypatch.setitem(sys.modules, "duckdb", duckdb_module)
+
+    export_mod.export_to_duckdb(MagicMock(), "STUDY", "out.duckdb", "records")
+
+    assert conn.execute.call_args_list == [
+        call("BEGIN TRANSACTION"),
+        call('CREATE OR REPLACE TABLE "records" AS SELECT * FROM "df"'),
+        call('INSERT INTO "records" SELECT * FROM "df"'),
+        call("COMMIT"),
+    ]
+    assert conn.unregister.call_args_list == [call("df"), call("df")]
+
+
 def test_export_to_duckdb_handles_wide_dataframe(monkeypatch):
     """Test that export to duckdb handles wide dataframe."""
     sdk = MagicMock()
     wide_df = pd.DataFrame([range(export_mod.MAX_SQLITE_COLUMNS + 50)])
-    monkeypatch.setattr(export_mod, "_prepare_export_df", MagicMock(return_value=wide_df))
+    wide_df.columns = wide_df.columns.astype(str)
+    _duckdb_frames(monkeypatch, wide_df)
 
     conn = MagicMock()
     duckdb_module = ModuleType("duckdb")
@@ -188,9 +334,9 @@ def test_export_to_duckdb_handles_wide_dataframe(monkeypatch):
 
     export_mod.export_to_duckdb(sdk, "STUDY", "wide.duckdb", "wide_table")
 
-    conn.register.assert_called_once_with("df", wide_df)
-    conn.execute.assert_called_once_with(
-        'CREATE OR REPLACE TABLE "wide_table" AS SELECT * FROM "df"'
+    assert conn.register.call_args.args[1].num_columns == export_mod.MAX_SQLITE_COLUMNS + 50
+    assert call('CREATE OR REPLACE TABLE "wide_table" AS SELECT * FROM "df"') in (
+        conn.execute.call_args_list
     )
 
 
@@ -344,9 +490,11 @@ def test_export_to_sql_by_form(monkeypatch):
         MagicMock(variable_name="B", label="B", form_id=2),
     ]
 
+    rec1 = MagicMock(form_id=1)
+    rec2 = MagicMock(form_id=2)
     mapper_inst = MagicMock()
     mapper_inst._build_record_model.return_value = object()
-    mapper_inst._fetch_records.side_effect = [MagicMock(), MagicMock()]
+    mapper_inst._iter_records.return_value = [rec2, rec1]
     mapper_inst._parse_records.side_effect = [([], 0), ([], 0)]
     df1 = MagicMock()
     df2 = MagicMock()
@@ -365,20 +513,70 @@ def test_export_to_sql_by_form(monkeypatch):
 
     mapper_cls.assert_called_once_with(sdk)
     assert sdk.variables.list.call_count == 1
+    mapper_inst._iter_records.assert_called_once_with("STUDY", extra_filters=None)
+    mapper_inst._fetch_records.assert_not_called()
+    assert [c.args[0] for c in mapper_inst._parse_records.call_args_list] == [[rec1], [rec2]]
     df1.to_sql.assert_called_once_with("F1", engine, if_exists="replace", index=False)
     df2.to_sql.assert_called_once_with("F2", engine, if_exists="replace", index=False)
 
 
+def test_route_form_records_spools_records_as_they_arrive(monkeypatch):
+    """Routed records are spilled to disk per form instead of buffered per study."""
+    sdk = MagicMock()
+    sdk.forms.list.return_value = [MagicMock(form_id=1), MagicMock(form_id=2)]
+    sdk.variables.list.return_value = []
+    records = [SimpleNamespace(form_id=1 + n % 2, n=n) for n in range(7)]
+    records.append(SimpleNamespace(form_id=9, n=7))
+    held: list[int] = []
+
+    def _iter_records(*_args, **_kwargs):
+        for record in records:
+            yield record
+            held.append(sum(map(len, spool_ref[0]._pending.values())))
+
+    spool_ref: list = []
+    real_init = export_mod._FormRecordSpool.__init__
+
+    def _init(self, *args, **kwargs):
+        real_init(self, *args, **kwargs)
+        spool_ref.append(self)
+
+    monkeypatch.setattr(export_mod._FormRecordSpool, "__init__", _init)
+    mapper = MagicMock()
+    mapper._iter_records.side_effect = _iter_records
+
+    forms, _, spool = export_mod._route_form_records(sdk, mapper, "STUDY", chunk_size=2)
+    try:
+        assert max(held) <= 2
+        chunks = {form.form_id: list(spool.iter_chunks(form.form_id)) for form in forms}
+    finally:
+        spool.close()
+
+    assert {k: [[r.n for r in c] for c in v] for k, v in chunks.items()} == {
+        1: [[0, 2], [4, 6]],
+        2: [[1, 3], [5]],
+    }
+
+
 def test_export_to_duckdb_by_form(monkeypatch):
     """Test that export to duckdb by form."""
     sdk = MagicMock()
     form1 = MagicMock(form_id=1, form_key="F1")
     form2 = MagicMock(form_id=2, form_key="F2")
-    sdk.forms.list.return_value = [form1, form2]
-    df1 = pd.DataFrame({"A": [1]})
-    df2 = pd.DataFrame({"B": [2]})
-    records_df_mock = MagicMock(side_effect=[df1, df2])
-    monkeypatch.setattr(export_mod, "_records_df", records_df_mock)
+    form3 = MagicMock(form_id=3, form_key="F3")
+    sdk.forms.list.return_value = [form1, form2, form3]
+    sdk.variables.list.return_value = [
+        MagicMock(variable_name="A", label="Label A", form_id=1, variable_type="integer"),
+        MagicMock(variable_name="B", label="Label B", form_id=2, variable_type="text"),
+        MagicMock(variable_name="C", label="Label C", form_id=2, variable_type="text"),
+    ]
+    mapper_inst = MagicMock()
+    mapper_inst._iter_records.return_value = [MagicMock(form_id=1), MagicMock(form_id=2)]
+    mapper_inst._parse_records.side_effect = [
+        ([{"recordId": 1, "A": "7"}], 0),
+        ([{"recordId": 2, "B": "b"}], 0),
+    ]
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper_inst))
 
     conn = MagicMock()
     duckdb_module = ModuleType("duckdb")
@@ -394,31 +592,65 @@ def test_export_to_duckdb_by_form(monkeypatch):
         form_whitelist=[1, 2],
     )
 
-    assert records_df_mock.call_args_list == [
-        call(
-            sdk,
-            "STUDY",
-            use_labels_as_columns=True,
-            variable_whitelist=["A", "B"],
-            form_whitelist=[1],
-        ),
-        call(
-            sdk,
-            "STUDY",
-            use_labels_as_columns=True,
-            variable_whitelist=["A", "B"],
-            form_whitelist=[2],
-        ),
+    sdk.variables.list.assert_called_once_with(study_key="STUDY", formIds=[1, 2])
+    mapper_inst._iter_records.assert_called_once_with(
+        "STUDY", extra_filters={"formIds": [1, 2], "variableNames": ["A", "B"]}
+    )
+    assert mapper_inst._build_record_model.call_args_list == [
+        call(["A"], {"A": "Label A"}),
+        call(["B"], {"B": "Label B"}),
     ]
-    assert conn.register.call_args_list == [call("df", df1), call("df", df2)]
+    mapper_inst._build_dataframe.assert_not_called()
+    registered = conn.register.call_args_list
+    assert [c.args[0] for c in registered] == ["df", "df"]
+    first, second = (c.args[1] for c in registered)
+    assert first.column_names[-1] == "Label A"
+    assert str(first.schema.field("Label A").type) == "int64"
+    assert first.column("Label A").to_pylist() == [7]
+    assert second.column("Label B").to_pylist() == ["b"]
     assert conn.execute.call_args_list == [
+        call("BEGIN TRANSACTION"),
         call('CREATE OR REPLACE TABLE "F1" AS SELECT * FROM "df"'),
+        call("COMMIT"),
+        call("BEGIN TRANSACTION"),
         call('CREATE OR REPLACE TABLE "F2" AS SELECT * FROM "df"'),
+        call("COMMIT"),
     ]
     assert conn.unregister.call_args_list == [call("df"), call("df")]
     conn.close.assert_called_once_with()
 
 
+def test_export_to_duckdb_by_form_streams_batches_into_load(monkeypatch):
+    """Each form's batches reach ``load_batches`` as they are parsed."""
+    sdk = MagicMock()
+    sdk.forms.list.return_value = [MagicMock(form_id=1, form_key="F1")]
+    sdk.variables.list.return_value = [
+        MagicMock(variable_name="A", label="A", form_id=1, variable_type="text")
+    ]
+    mapper_inst = MagicMock()
+    mapper_inst._iter_records.return_value = [SimpleNamespace(form_id=1) for _ in range(3)]
+    mapper_inst._parse_records.side_effect = lambda records, _model: (
+        [{"recordId": 1, "A": "a"}] * len(records),
+        0,
+    )
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper_inst))
+    duckdb_module = ModuleType("duckdb")
+    duckdb_module.connect = MagicMock(return_value=MagicMock())
+    monkeypatch.setitem(sys.modules, "duckdb", duckdb_module)
+    parsed_before_batch: list[int] = []
+
+    def _load_batches(_conn, table, batches):
+        assert table == "F1"
+        for _batch in batches:
+            parsed_before_batch.append(mapper_inst._parse_records.call_count)
+
+    monkeypatch.setattr(export_mod, "load_batches", _load_batches)
+
+    export_mod.export_to_duckdb_by_form(sdk, "STUDY", "forms.duckdb", batch_size=1)
+
+    assert parsed_before_batch == [1, 2, 3]
+
+
 def test_export_to_duckdb_by_form_import_error(monkeypatch):
     """Test that export to duckdb by form import error."""
 
@@ -441,47 +673,96 @@ def test_export_to_duckdb_by_form_import_error(monkeypatch):
         export_mod.export_to_duckdb_by_form(MagicMock(), "STUDY", "out.duckdb")
 
 
-def test_export_to_long_sql(monkeypatch):
-    """Test that export to long sql."""
-    sdk = MagicMock()
-    dt1 = datetime(2023, 1, 1)
-    dt2 = datetime(2023, 1, 2)
-    dt3 = datetime(2023, 1, 3)
-    records = [
-        MagicMock(record_id=1, form_id=10, record_data={"A": 1, "B": 2}, date_modified=dt1),
-        MagicMock(record_id=2, form_id=11, record_data={"C": 3}, date_modified=dt2),
-        MagicMock(record_id=3, form_id=12, record_data={"D": 4}, date_modified=dt3),
+def _long_sql_records() -> list[MagicMock]:
+    """Helper function to build records for long-format exports."""
+    return [
+        MagicMock(
+            record_id=1,
+            form_id=10,
+            record_data={"A": 1, "B": 2},
+            date_modified=datetime(2023, 1, 1),
+        ),
+        MagicMock(
+            record_id=2, form_id=11, record_data={"C": 3}, date_modified=datetime(2023, 1, 2)
+        ),
+        MagicMock(
+            record_id=3, form_id=12, record_data={"D": 4}, date_modified=datetime(2023, 1, 3)
+        ),
     ]
-    mapper_inst = MagicMock(_fetch_records=MagicMock(return_value=records))
-    mapper_cls = MagicMock(return_value=mapper_inst)
-    monkeypatch.setattr(export_mod, "_record_mapper", lambda: mapper_cls)
-
-    sa_module = ModuleType("sqlalchemy")
-    engine = MagicMock()
-    sa_module.create_engine = MagicMock(return_value=engine)
-    monkeypatch.setitem(sys.modules, "sqlalchemy", sa_module)
 
-    captured = []
 
-    def fake_to_sql(self, table, engine_arg, if_exists, index=False):
-        """Helper function to fake to sql."""
-        captured.append((self.copy(), if_exists))
+def _patch_long_sql_mapper(monkeypatch, records) -> MagicMock:
+    """Helper function to patch the record mapper used by long-format exports."""
+    mapper_inst = MagicMock()
+    mapper_inst._iter_records.return_value = iter(records)
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper_inst))
+    return mapper_inst
+
+
+def test_export_to_long_sql(monkeypatch, tmp_path):
+    """Test that export to long sql streams records into SQLite."""
+    import sqlalchemy as sa
+
+    mapper_inst = _patch_long_sql_mapper(monkeypatch, _long_sql_records())
+    db_url = f"sqlite:///{tmp_path / 'long.db'}"
+    engine = sa.create_engine(db_url)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE tbl (stale TEXT)")
+
+    export_mod.export_to_long_sql(MagicMock(), "STUDY", "tbl", db_url, chunk_size=2)
+
+    mapper_inst._iter_records.assert_called_once_with("STUDY")
+    with engine.connect() as conn:
+        rows = conn.execute(sa.text("SELECT * FROM tbl ORDER BY record_id, variable_name")).all()
+    engine.dispose()
+    assert [tuple(row) for row in rows] == [
+        (1, 10, "A", "1", "2023-01-01 00:00:00.000000"),
+        (1, 10, "B", "2", "2023-01-01 00:00:00.000000"),
+        (2, 11, "C", "3", "2023-01-02 00:00:00.000000"),
+        (3, 12, "D", "4", "2023-01-03 00:00:00.000000"),
+    ]
 
-    monkeypatch.setattr(pd.DataFrame, "to_sql", fake_to_sql)
 
-    export_mod.export_to_long_sql(sdk, "STUDY", "tbl", "sqlite://", chunk_size=2)
+def test_export_to_long_sql_masks_values(monkeypatch, tmp_path):
+    """Sensitive variables and nested PHI keys are masked in long-format rows."""
+    import sqlalchemy as sa
 
-    assert len(captured) == 2
-    assert list(captured[0][0].to_dict("records")) == [
-        {"record_id": 1, "form_id": 10, "variable_name": "A", "value": 1, "timestamp": dt1},
-        {"record_id": 1, "form_id": 10, "variable_name": "B", "value": 2, "timestamp": dt1},
+    records = [
+        MagicMock(
+            record_id=1,
+            form_id=10,
+            record_data={"email": "a@b.c", "notes": {"ssn": "123", "ok": "x"}, "empty": None},
+            date_modified="2023-01-01T00:00:00Z",
+        )
     ]
-    assert captured[0][1] == "replace"
-    assert list(captured[1][0].to_dict("records")) == [
-        {"record_id": 2, "form_id": 11, "variable_name": "C", "value": 3, "timestamp": dt2},
-        {"record_id": 3, "form_id": 12, "variable_name": "D", "value": 4, "timestamp": dt3},
+    _patch_long_sql_mapper(monkeypatch, records)
+    db_url = f"sqlite:///{tmp_path / 'long.db'}"
+
+    export_mod.export_to_long_sql(MagicMock(), "STUDY", "tbl", db_url)
+
+    engine = sa.create_engine(db_url)
+    with engine.connect() as conn:
+        rows = conn.execute(sa.text("SELECT variable_name, value, timestamp FROM tbl")).all()
+    engine.dispose()
+    assert [tuple(row) for row in rows] == [
+        ("email", "***MASKED***", "2023-01-01T00:00:00Z"),
+        ("notes", '{"ssn": "***MASKED***", "ok": "x"}', "2023-01-01T00:00:00Z"),
+        ("empty", None, "2023-01-01T00:00:00Z"),
     ]
-    assert captured[1][1] == "append"
+
+
+def test_export_to_long_sql_without_records_creates_nothing(monkeypatch, tmp_path):
+    """An empty study leaves the database untouched."""
+    import sqlalchemy as sa
+
+    _patch_long_sql_mapper(monkeypatch, [])
+    db_url = f"sqlite:///{tmp_path / 'long.db'}"
+
+    export_mod.export_to_long_sql(MagicMock(), "STUDY", "tbl", db_url)
+
+    engine = sa.create_engine(db_url)
+    assert not sa.inspect(engine).has_table("tbl")
+    engine.dispose()
 
 
 def test_records_df_missing_pandas(monkeypatch):
@@ -494,11 +775,17 @@ def test_records_df_missing_pandas(monkeypatch):
         export_mod._records_df(MagicMock(), "STUDY")
 
 
-def test_export_to_long_sql_missing_pandas(monkeypatch):
-    """Test that export to long sql missing pandas."""
+def test_export_to_long_sql_without_pandas(monkeypatch, tmp_path):
+    """Long-format exports no longer depend on pandas."""
+    import sqlalchemy as sa
+
     monkeypatch.setattr(export_mod, "pd", None)
-    with pytest.raises(
-        ImportError,
-        match=r"pandas is required for export_to_long_sql\. Install with \"pip install 'imednet\[export\]'\"\.",
-    ):
-        export_mod.export_to_long_sql(MagicMock(), "STUDY", "table", "sqlite://")
+    _patch_long_sql_mapper(monkeypatch, _long_sql_records())
+    db_url = f"sqlite:///{tmp_path / 'long.db'}"
+
+    export_mod.export_to_long_sql(MagicMock(), "STUDY", "table", db_url)
+
+    engine = sa.create_engine(db_url)
+    with engine.connect() as conn:
+        assert conn.execute(sa.text('SELECT COUNT(*) FROM "table"')).scalar() == 4
+    engine.dispose()
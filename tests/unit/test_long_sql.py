@@ -0,0 +1,145 @@
+"""Unit tests for the streaming long-format SQL writer."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pytest
+import sqlalchemy as sa
+
+from imednet.integrations import long_sql
+from imednet.integrations.long_sql import LongBatch, iter_long_batches, write_long_table
+
+
+def _record(record_id: int, data: dict, ts: object = None) -> MagicMock:
+    """Helper function to build a record stub."""
+    return MagicMock(
+        record_id=record_id, form_id=record_id * 10, record_data=data, date_modified=ts
+    )
+
+
+def _batch() -> LongBatch:
+    """Helper function to build a batch with awkward values."""
+    ts = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    return next(
+        iter_long_batches(
+            [_record(1, {"a": "tab\there", "b": "back\\slash\nline", "c": None}, ts)],
+            batch_rows=100,
+        )
+    )
+
+
+def _postgres_conn(driver: str) -> tuple[MagicMock, MagicMock]:
+    """Helper function to build a connection stub for the PostgreSQL dialect."""
+    from sqlalchemy.dialects import postgresql
+
+    conn = MagicMock()
+    conn.dialect = postgresql.dialect()
+    conn.dialect.driver = driver
+    cursor = conn.connection.driver_connection.cursor.return_value
+    return conn, cursor
+
+
+def test_iter_long_batches_keeps_records_whole() -> None:
+    """Batches flush after the record that reaches the threshold."""
+    records = [_record(1, {"a": 1, "b": 2, "c": 3}), _record(2, {}), _record(3, {"d": True})]
+
+    batches = list(iter_long_batches(records, batch_rows=2))
+
+    assert [len(b) for b in batches] == [3, 1]
+    assert batches[0].variable_name == ["a", "b", "c"]
+    assert batches[0].value == ["1", "2", "3"]
+    assert list(batches[1].rows()) == [(3, 30, "d", "True", None)]
+
+
+def test_iter_long_batches_rejects_empty_batches() -> None:
+    """A batch size below one is rejected."""
+    with pytest.raises(ValueError, match="batch_rows"):
+        list(iter_long_batches([], batch_rows=0))
+
+
+def test_write_long_table_types_timestamps(tmp_path) -> None:
+    """Datetime timestamps get a DateTime column and round-trip through SQLite."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'long.db'}")
+    ts = datetime(2024, 5, 1, 12, 30)
+
+    written = write_long_table(engine, "long", iter_long_batches([_record(1, {"a": "x"}, ts)], 10))
+
+    table = sa.Table("long", sa.MetaData(), autoload_with=engine)
+    with engine.connect() as conn:
+        rows = conn.execute(sa.select(table)).all()
+    engine.dispose()
+    assert written == 1
+    assert isinstance(table.c.timestamp.type, sa.DateTime)
+    assert [tuple(r) for r in rows] == [(1, 10, "a", "x", ts)]
+
+
+def test_executemany_fallback_matches_sqlite_fast_path(tmp_path) -> None:
+    """The generic executemany path stores the same rows as the SQLite fast path."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'long.db'}")
+    batch = _batch()
+    results = []
+    for name, loader in (("fast", long_sql._load_sqlite), ("generic", long_sql._load_executemany)):
+        table = long_sql.long_table(name, sa.MetaData(), batch)
+        with engine.begin() as conn:
+            table.create(conn)
+            loader(conn, table, batch)
+            results.append(conn.execute(sa.select(table)).all())
+    engine.dispose()
+
+    assert results[0] == results[1]
+    assert len(results[0]) == 3
+
+
+def test_psycopg2_copy_escapes_text_format() -> None:
+    """psycopg2 loads use COPY with escaped text-format rows."""
+    conn, cursor = _postgres_conn("psycopg2")
+    batch = _batch()
+    table = long_sql.long_table("long", sa.MetaData(), batch)
+
+    long_sql.load_long_batch(conn, table, batch)
+
+    statement, buffer = cursor.copy_expert.call_args.args
+    assert statement == "COPY long (record_id, form_id, variable_name, value, timestamp) FROM STDIN"
+    assert buffer.getvalue().splitlines() == [
+        "1\t10\ta\ttab\\there\t2024-05-01T12:30:00+00:00",
+        "1\t10\tb\tback\\\\slash\\nline\t2024-05-01T12:30:00+00:00",
+        "1\t10\tc\t\\N\t2024-05-01T12:30:00+00:00",
+    ]
+    cursor.close.assert_called_once()
+
+
+def test_psycopg3_copy_writes_rows() -> None:
+    """psycopg 3 loads stream rows through ``cursor.copy``."""
+    conn, cursor = _postgres_conn("psycopg")
+    batch = _batch()
+    table = long_sql.long_table("long", sa.MetaData(), batch)
+
+    long_sql.load_long_batch(conn, table, batch)
+
+    copy = cursor.copy.return_value.__enter__.return_value
+    assert [c.args[0] for c in copy.write_row.call_args_list] == list(batch.rows())
+    conn.execute.assert_not_called()
+
+
+def test_duckdb_loads_registered_arrow_batch() -> None:
+    """DuckDB loads register the batch as an Arrow table and insert from it."""
+    from sqlalchemy.dialects import postgresql
+
+    conn = MagicMock()
+    conn.dialect = postgresql.dialect()
+    conn.dialect.name = "duckdb"
+    raw = conn.connection.driver_connection
+    batch = _batch()
+    table = long_sql.long_table("long", sa.MetaData(), batch)
+
+    long_sql.load_long_batch(conn, table, batch)
+
+    alias, arrow_batch = raw.register.call_args.args
+    assert isinstance(arrow_batch, pa.Table)
+    assert arrow_batch.column_names == list(long_sql.LONG_COLUMNS)
+    assert arrow_batch.num_rows == 3
+    conn.exec_driver_sql.assert_called_once_with(f'INSERT INTO long SELECT * FROM {alias}')
+    raw.unregister.assert_called_once_with(alias)
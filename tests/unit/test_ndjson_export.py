@@ -0,0 +1,161 @@
+"""Unit tests for streaming NDJSON exports."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+import imednet.integrations.export as export_mod
+from imednet.integrations.ndjson import NDJSONWriter, rotated_path
+
+
+def _lines(path: Path) -> list[dict]:
+    """Helper function to parse the lines of a possibly compressed file."""
+    raw = path.read_bytes()
+    if path.suffix == ".gz":
+        raw = gzip.decompress(raw)
+    return [json.loads(line) for line in raw.decode("utf-8").splitlines()]
+
+
+def test_rotated_path_keeps_suffixes() -> None:
+    """Later files insert their index before the format and compression suffixes."""
+    assert rotated_path("out/records.ndjson", 1) == "out/records.ndjson"
+    assert rotated_path("out/records.ndjson", 2) == "out/records_2.ndjson"
+    assert rotated_path("out/records.ndjson.gz", 3) == "out/records_3.ndjson.gz"
+    assert rotated_path("out/records.zst", 2) == "out/records_2.zst"
+
+
+def test_writer_rotates_by_size(tmp_path: Path) -> None:
+    """A line that would take a file past ``max_bytes`` starts the next file."""
+    path = tmp_path / "rows.ndjson"
+    with NDJSONWriter(str(path), max_bytes=60) as writer:
+        written = writer.write_rows({"id": i, "value": "x" * 5} for i in range(5))
+
+    assert written == 5
+    assert writer.paths == [str(tmp_path / f"rows{s}.ndjson") for s in ("", "_2", "_3")]
+    assert [len(_lines(Path(p))) for p in writer.paths] == [2, 2, 1]
+    assert [row["id"] for p in writer.paths for row in _lines(Path(p))] == [0, 1, 2, 3, 4]
+
+
+def test_writer_gzip_files_are_complete_streams(tmp_path: Path) -> None:
+    """Each rotated gzip file decompresses on its own."""
+    path = tmp_path / "rows.ndjson.gz"
+    rows = [{"id": i, "text": f"päge {i}" * 5} for i in range(200)]
+    with NDJSONWriter(str(path), compression="gzip", max_bytes=1024) as writer:
+        writer.write_rows(rows)
+
+    assert len(writer.paths) > 1
+    assert [row for p in writer.paths for row in _lines(Path(p))] == rows
+
+
+def test_writer_zstd_round_trip(tmp_path: Path) -> None:
+    """Zstandard output decompresses to the original lines."""
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "rows.ndjson.zst"
+    with NDJSONWriter(str(path), compression="zstd") as writer:
+        writer.write({"id": 1})
+
+    with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as reader:
+        assert json.loads(reader.read()) == {"id": 1}
+
+
+def test_writer_validates_options(tmp_path: Path) -> None:
+    """Unknown compression and empty size limits are rejected."""
+    with pytest.raises(ValueError, match="compression"):
+        NDJSONWriter(str(tmp_path / "x"), compression="bz2")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="max_bytes"):
+        NDJSONWriter(str(tmp_path / "x"), max_bytes=0)
+
+
+def test_writer_gives_oversized_lines_their_own_file(tmp_path: Path) -> None:
+    """A line longer than ``max_bytes`` is written whole, without empty files."""
+    with NDJSONWriter(str(tmp_path / "rows.ndjson"), max_bytes=4) as writer:
+        writer.write_rows([{"a": 1}, {"a": 2}])
+
+    assert [_lines(Path(p)) for p in writer.paths] == [[{"a": 1}], [{"a": 2}]]
+
+
+def test_writer_error_removes_files(tmp_path: Path) -> None:
+    """An error leaves no partial output behind."""
+    with pytest.raises(RuntimeError):
+        with NDJSONWriter(str(tmp_path / "rows.ndjson"), max_bytes=1) as writer:
+            writer.write_rows([{"a": 1}, {"a": 2}])
+            raise RuntimeError("boom")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def _setup_frames(monkeypatch: pytest.MonkeyPatch, *frames: pd.DataFrame) -> dict:
+    """Helper function to serve ``frames`` as the tabular chunks of a study."""
+    calls: dict = {}
+
+    def _frames(sdk, study_key, config, sanitize=False, tracker=None):
+        calls["sanitize"] = sanitize
+        calls["batch_size"] = config.batch_size
+        yield from enumerate(frames)
+
+    monkeypatch.setattr(export_mod, "_iter_tabular_frames", _frames)
+    monkeypatch.setattr(export_mod, "_load_enrichment_pipeline", lambda study_key: None)
+    return calls
+
+
+def test_export_to_ndjson_streams_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every chunk row becomes one line with missing values as null."""
+    calls = _setup_frames(
+        monkeypatch,
+        pd.DataFrame({"recordId": [1, 2], "score": [1.5, None]}),
+        pd.DataFrame({"recordId": [3], "score": [2.0]}),
+    )
+    path = tmp_path / "study.ndjson.gz"
+
+    paths = export_mod.export_to_ndjson(
+        MagicMock(), "STUDY", str(path), compression="gzip", batch_size=2
+    )
+
+    assert paths == [str(path)]
+    assert _lines(path) == [
+        {"recordId": 1, "score": 1.5},
+        {"recordId": 2, "score": None},
+        {"recordId": 3, "score": 2.0},
+    ]
+    assert calls == {"sanitize": True, "batch_size": 2}
+
+
+def test_export_to_ndjson_applies_enrichment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rows pass through the study's enrichment pipeline like JSON exports."""
+    _setup_frames(monkeypatch, pd.DataFrame({"recordId": [1]}))
+    enrichment = MagicMock()
+    enrichment.process.side_effect = lambda rows: [{**r, "site": "A"} for r in rows]
+    monkeypatch.setattr(export_mod, "_load_enrichment_pipeline", lambda study_key: enrichment)
+    path = tmp_path / "study.ndjson"
+
+    export_mod.export_to_ndjson(MagicMock(), "STUDY", str(path), sanitize=False)
+
+    assert _lines(path) == [{"recordId": 1, "site": "A"}]
+
+
+def test_export_to_ndjson_masks_and_sanitizes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Real frames are masked and formula values are neutralised."""
+    mapper = MagicMock()
+    df = pd.DataFrame({"dob": ["1990-01-01"], "note": ["=cmd"]})
+    mapper._fetch_variable_metadata.return_value = (["dob", "note"], {})
+    mapper._iter_records.return_value = ["record"]
+    mapper._parse_records.return_value = ([{}], 0)
+    mapper._build_dataframe.return_value = df
+    monkeypatch.setattr(export_mod, "_record_mapper", lambda: MagicMock(return_value=mapper))
+    monkeypatch.setattr(export_mod, "apply_quality_gate", lambda s, sk, rr, c: rr)
+    monkeypatch.setattr(export_mod, "_load_enrichment_pipeline", lambda study_key: None)
+    path = tmp_path / "study.ndjson"
+
+    export_mod.export_to_ndjson(MagicMock(), "STUDY", str(path))
+
+    assert _lines(path) == [{"dob": "***MASKED***", "note": "'=cmd"}]
@@ -360,3 +360,36 @@ async def test_base_schema_cache_async_refresh() -> None:
     await cache.refresh(forms, variables, "STUDY")
     variables.list.assert_called_once_with(study_key="STUDY")
     assert "F1" in cache.forms
+
+
+def test_calculate_readiness_scores_matches_per_record_scores() -> None:
+    """Test that columnar scores equal calculate_readiness_score for every row."""
+    from imednet.validation.cache import (
+        SchemaCache,
+        calculate_readiness_score,
+        calculate_readiness_scores,
+    )
+
+    cache = SchemaCache()
+    cache.populate(
+        [
+            Variable(variable_name="age", variable_type="Integer", form_id=1, form_key="F1"),
+            Variable(variable_name="weight", variable_type="decimal", form_id=1, form_key="F1"),
+            Variable(variable_name="smoker", variable_type="BOOLEAN", form_id=1, form_key="F1"),
+            Variable(variable_name="note", variable_type="text", form_id=1, form_key="F1"),
+            Variable(variable_name="scan", variable_type="upload", form_id=1, form_key="F1"),
+            Variable(variable_name="free", variable_type="", form_id=1, form_key="F1"),
+        ]
+    )
+    rows = [
+        {},
+        {"age": 40, "weight": 70.5, "smoker": False, "note": "ok", "scan": None, "free": 1},
+        {"age": "40", "weight": True, "smoker": 0, "note": 3, "scan": "file", "extra": 1},
+        {"age": None, "weight": None, "smoker": None, "note": None, "free": None},
+        {"age": True, "weight": 70, "scan": {}},
+    ]
+
+    assert calculate_readiness_scores(cache, "F1", rows) == [
+        calculate_readiness_score(cache, "F1", row)[0] for row in rows
+    ]
+    assert calculate_readiness_scores(cache, "MISSING", rows[:2]) == [0.0, 0.0]
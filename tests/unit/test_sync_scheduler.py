@@ -0,0 +1,222 @@
+"""Unit tests for the multi-study sync scheduler."""
+
+from __future__ import annotations
+
+import random
+from threading import Event, Thread
+from unittest.mock import MagicMock
+
+import pytest
+
+from imednet_workflows.cached_loader import SyncStats
+from imednet_workflows.sync_worker import (
+    StudySchedule,
+    SyncScheduler,
+    SyncSchedulerConfig,
+    SyncWorker,
+    SyncWorkerConfig,
+)
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Initialize the test object."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+def _loader(tmp_path) -> MagicMock:
+    """Helper function to build a mock loader."""
+    loader = MagicMock()
+    loader.db_path = tmp_path / "records_cache.sqlite3"
+    return loader
+
+
+def _keys(results) -> list[str]:
+    """Helper function to extract study keys from sync results."""
+    return [result.study_key for result in results]
+
+
+def test_scheduler_runs_due_studies_in_priority_order(tmp_path) -> None:
+    """Due studies are synced highest priority first, once each."""
+    loader = _loader(tmp_path)
+    clock = _FakeClock()
+    scheduler = SyncScheduler(
+        loader,
+        [
+            StudySchedule("IDLE", interval_seconds=600, priority=0),
+            StudySchedule("HEAVY", interval_seconds=60, priority=10, reconcile=False),
+        ],
+        config=SyncSchedulerConfig(max_workers=1, jitter_ratio=0.0),
+        clock=clock,
+    )
+
+    synced = _keys(scheduler.run_pending())
+
+    assert synced == ["HEAVY", "IDLE"]
+    assert [c.args[0] for c in loader.sync_records.call_args_list] == ["HEAVY", "IDLE"]
+    assert loader.sync_records.call_args_list[0].kwargs == {"reconcile": False}
+    assert _keys(scheduler.run_pending()) == []
+
+
+def test_scheduler_honours_per_study_intervals(tmp_path) -> None:
+    """Each study is rescheduled on its own interval."""
+    loader = _loader(tmp_path)
+    clock = _FakeClock()
+    scheduler = SyncScheduler(
+        loader,
+        [StudySchedule("FAST", interval_seconds=60), StudySchedule("SLOW", interval_seconds=600)],
+        config=SyncSchedulerConfig(jitter_ratio=0.0),
+        clock=clock,
+    )
+    scheduler.run_pending()
+
+    clock.now = 61.0
+    assert _keys(scheduler.run_pending()) == ["FAST"]
+    clock.now = 601.0
+    assert sorted(_keys(scheduler.run_pending())) == ["FAST", "SLOW"]
+
+
+def test_scheduler_jitter_stays_within_bounds(tmp_path) -> None:
+    """Initial offsets and intervals are jittered within the configured ratio."""
+    clock = _FakeClock()
+    scheduler = SyncScheduler(
+        _loader(tmp_path),
+        [StudySchedule(f"S{i}", interval_seconds=100) for i in range(20)],
+        config=SyncSchedulerConfig(jitter_ratio=0.2),
+        clock=clock,
+        rng=random.Random(7),
+    )
+
+    offsets = [item.due_at for item in scheduler._queue]
+    assert all(0.0 <= offset <= 20.0 for offset in offsets)
+    assert len(set(offsets)) > 1
+
+    clock.now = 20.0
+    scheduler.run_pending()
+    assert all(100.0 <= item.due_at <= 140.0 for item in scheduler._queue)
+
+
+def test_scheduler_shared_cycle_start_budget_defers_low_priority(tmp_path) -> None:
+    """An exhausted cycle-start budget leaves lower-priority studies queued."""
+    loader = _loader(tmp_path)
+    clock = _FakeClock()
+    scheduler = SyncScheduler(
+        loader,
+        [
+            StudySchedule("LOW", priority=1),
+            StudySchedule("HIGH", priority=5),
+            StudySchedule("MID", priority=3),
+        ],
+        config=SyncSchedulerConfig(jitter_ratio=0.0, max_cycle_starts_per_minute=2),
+        clock=clock,
+    )
+
+    assert sorted(_keys(scheduler.run_pending())) == ["HIGH", "MID"]
+    assert _keys(scheduler.run_pending()) == []
+
+    clock.now = 30.0
+    assert _keys(scheduler.run_pending()) == ["LOW"]
+
+
+def test_scheduler_uses_per_study_lock_files(tmp_path) -> None:
+    """Each study gets its own lock file, shared with a SyncWorker for that study."""
+    loader = _loader(tmp_path)
+    scheduler = SyncScheduler(loader, [StudySchedule("PROT/01"), StudySchedule("PROT-02")])
+    worker = SyncWorker(loader, config=SyncWorkerConfig(study_key="PROT/01"))
+
+    lock_files = {lock.lock_file for lock in scheduler._locks.values()}
+    assert lock_files == {
+        f"{tmp_path / 'records_cache.sqlite3'}.PROT_01.lock",
+        f"{tmp_path / 'records_cache.sqlite3'}.PROT-02.lock",
+    }
+    assert worker._lock.lock_file == scheduler._locks["PROT/01"].lock_file
+
+
+def test_scheduler_rejects_duplicate_studies(tmp_path) -> None:
+    """A study may only be scheduled once."""
+    with pytest.raises(ValueError, match="Duplicate schedule"):
+        SyncScheduler(_loader(tmp_path), [StudySchedule("A"), StudySchedule("A")])
+
+
+def test_scheduler_failure_does_not_block_other_studies(tmp_path) -> None:
+    """A failing study is logged and rescheduled without affecting the rest."""
+    loader = _loader(tmp_path)
+
+    def _sync(study_key: str, *, reconcile: bool) -> SyncStats:
+        """Helper function to fail one study."""
+        if study_key == "BROKEN":
+            raise RuntimeError("boom")
+        return SyncStats(study_key, 0, 0, None)
+
+    loader.sync_records.side_effect = _sync
+    scheduler = SyncScheduler(
+        loader,
+        [StudySchedule("BROKEN"), StudySchedule("OK")],
+        config=SyncSchedulerConfig(jitter_ratio=0.0),
+        clock=_FakeClock(),
+    )
+
+    assert _keys(scheduler.run_pending()) == ["OK"]
+    assert len(scheduler._queue) == 2
+
+
+def test_scheduler_run_forever_stops_gracefully(tmp_path) -> None:
+    """run_forever exits once the stop event is set."""
+    loader = _loader(tmp_path)
+    stop_event = Event()
+
+    def _sync(study_key: str, *, reconcile: bool) -> SyncStats:
+        """Helper function to stop after the first cycle."""
+        stop_event.set()
+        return SyncStats(study_key, 0, 0, None)
+
+    loader.sync_records.side_effect = _sync
+    scheduler = SyncScheduler(
+        loader,
+        [StudySchedule("PROT-01", interval_seconds=60)],
+        config=SyncSchedulerConfig(jitter_ratio=0.0),
+        stop_event=stop_event,
+    )
+
+    scheduler.run_forever()
+
+    loader.sync_records.assert_called_once_with("PROT-01", reconcile=True)
+
+
+def test_scheduler_slow_study_does_not_delay_others(tmp_path) -> None:
+    """run_forever keeps syncing other studies while one study's cycle is still running."""
+    loader = _loader(tmp_path)
+    release = Event()
+    fast_cycles: list[str] = []
+    scheduler: SyncScheduler
+
+    def _sync(study_key: str, *, reconcile: bool) -> SyncStats:
+        """Helper function to block SLOW until FAST has synced twice."""
+        if study_key == "SLOW":
+            release.wait(30)
+        else:
+            fast_cycles.append(study_key)
+            if len(fast_cycles) == 2:
+                release.set()
+                scheduler.stop()
+        return SyncStats(study_key, 0, 0, None)
+
+    loader.sync_records.side_effect = _sync
+    scheduler = SyncScheduler(
+        loader,
+        [StudySchedule("SLOW", interval_seconds=3600), StudySchedule("FAST", interval_seconds=1)],
+        config=SyncSchedulerConfig(max_workers=2, jitter_ratio=0.0),
+    )
+    thread = Thread(target=scheduler.run_forever)
+    thread.start()
+    thread.join(10)
+    release.set()
+
+    assert not thread.is_alive()
+    assert fast_cycles == ["FAST", "FAST"]
@@ -2,30 +2,60 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from threading import Event
 from unittest.mock import MagicMock
 
+from imednet_workflows.cached_loader import CacheSummary, SyncStats
 from imednet_workflows.sync_worker import SyncWorker, SyncWorkerConfig
 
 
-def test_sync_worker_run_once_syncs_with_lock(tmp_path) -> None:
-    """Test that sync worker run once syncs with lock."""
+def _mock_loader(tmp_path, *, high_water_mark: str | None = None) -> MagicMock:
+    """Helper function to build a loader mock with cheap summary results."""
     loader = MagicMock()
     loader.db_path = tmp_path / "records_cache.sqlite3"
-    loader.load_records.return_value = [MagicMock(), MagicMock()]
+    loader.sync_records.return_value = SyncStats("PROT-01", 1, 0, None)
+    loader.summarize_cache.return_value = CacheSummary(
+        "PROT-01", 2, {"AE": 1, "DM": 1}, high_water_mark
+    )
+    return loader
+
+
+def test_sync_worker_run_once_syncs_with_lock(tmp_path) -> None:
+    """Test that sync worker run once syncs with lock."""
+    loader = _mock_loader(tmp_path)
 
     worker = SyncWorker(loader, config=SyncWorkerConfig(study_key="PROT-01", interval_seconds=1))
 
-    synced_count = worker.run_once()
+    result = worker.run_once()
 
-    assert synced_count == 2
-    loader.load_records.assert_called_once_with("PROT-01", reconcile=True)
+    assert result.record_count == 2
+    assert result.form_counts == {"AE": 1, "DM": 1}
+    assert result.delta_count == 1
+    assert result.deleted_count == 0
+    loader.sync_records.assert_called_once_with("PROT-01", reconcile=True)
+    loader.summarize_cache.assert_called_once_with("PROT-01")
+    loader.load_records.assert_not_called()
+    loader.get_cached_records.assert_not_called()
+
+
+def test_sync_worker_run_once_reports_watermark_lag(tmp_path) -> None:
+    """The watermark lag is measured from the newest cached dateModified."""
+    modified = datetime.now(timezone.utc) - timedelta(hours=1)
+    loader = _mock_loader(tmp_path, high_water_mark=modified.isoformat())
+    worker = SyncWorker(loader, config=SyncWorkerConfig(study_key="PROT-01"))
+
+    result = worker.run_once()
+
+    assert result.high_water_mark == modified.isoformat()
+    assert result.watermark_lag_seconds is not None
+    assert 3590 <= result.watermark_lag_seconds <= 3700
+    assert result.as_log_extra()["form_count"] == 2
 
 
 def test_sync_worker_run_forever_stops_gracefully(tmp_path) -> None:
     """Test that sync worker run forever stops gracefully."""
-    loader = MagicMock()
-    loader.db_path = tmp_path / "records_cache.sqlite3"
+    loader = _mock_loader(tmp_path)
     stop_event = Event()
     worker = SyncWorker(
         loader,
@@ -33,12 +63,12 @@ def test_sync_worker_run_forever_stops_gracefully(tmp_path) -> None:
         stop_event=stop_event,
     )
 
-    def _stop_after_first_cycle(*args, **kwargs) -> list[MagicMock]:
+    def _stop_after_first_cycle(*args, **kwargs) -> SyncStats:
         """Helper function to  stop after first cycle."""
         stop_event.set()
-        return []
+        return SyncStats("PROT-01", 0, 0, None)
 
-    loader.load_records.side_effect = _stop_after_first_cycle
+    loader.sync_records.side_effect = _stop_after_first_cycle
     worker.run_forever()
 
-    loader.load_records.assert_called_once_with("PROT-01", reconcile=True)
+    loader.sync_records.assert_called_once_with("PROT-01", reconcile=True)
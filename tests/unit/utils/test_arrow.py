@@ -1,11 +1,22 @@
 """Unit tests for arrow."""
 
-from datetime import datetime, timezone
+import random
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 
 import pyarrow as pa
+import pytest
 from pydantic import BaseModel
 
-from imednet.utils.arrow import to_arrow_table
+from imednet.models.variables import Variable
+from imednet.utils.arrow import (
+    ArrowTableBuilder,
+    _coerce_column,
+    _column_array,
+    arrow_schema_for_form,
+    to_arrow_table,
+)
+from imednet.validation.cache import SchemaCache
 
 
 def test_to_arrow_table_empty_records_returns_empty_table() -> None:
@@ -71,3 +82,128 @@ def test_to_arrow_table_accepts_pydantic_like_records() -> None:
     assert table.column("systolic").to_pylist() == [120.0, None]
     assert table.column("missing_vector").to_pylist() == [None, None]
     assert table.schema.field("missing_vector").type == pa.null()
+
+
+_TYPES = [
+    pa.int64(),
+    pa.float64(),
+    pa.bool_(),
+    pa.string(),
+    pa.large_string(),
+    pa.binary(),
+    pa.timestamp("us"),
+    pa.timestamp("us", tz="UTC"),
+    pa.timestamp("ms", tz="Europe/Paris"),
+    pa.null(),
+    pa.list_(pa.string()),
+]
+_VALUES = [
+    None,
+    "",
+    "x",
+    "true",
+    "no",
+    "1.5",
+    0,
+    1,
+    2,
+    -7,
+    2**70,
+    1.5,
+    float("nan"),
+    True,
+    False,
+    Decimal("2.5"),
+    date(2025, 1, 1),
+    datetime(2025, 1, 1, 8, 30),
+    datetime(2025, 1, 1, 8, 30, tzinfo=timezone(timedelta(hours=-5))),
+    ["a", "b"],
+    b"raw",
+]
+
+
+def _reference_column(values: list, target_type: pa.DataType) -> pa.Array:
+    """Reference implementation: the per-cell normalization and coercion."""
+    return _coerce_column(values, target_type)
+
+
+@pytest.mark.parametrize("target_type", _TYPES, ids=str)
+def test_bulk_columns_match_per_cell_conversion(target_type: pa.DataType) -> None:
+    """Bulk column conversion gives the same arrays, or errors, as the per-cell path."""
+    rng = random.Random(f"arrow-{target_type}")
+    pools = [[value] * 3 for value in _VALUES]
+    pools += [[rng.choice(_VALUES) for _ in range(rng.randint(0, 6))] for _ in range(300)]
+    for values in pools:
+        try:
+            expected = _reference_column(values, target_type)
+        except Exception as exc:
+            with pytest.raises(type(exc)):
+                _column_array(values, target_type)
+            continue
+        actual = _column_array(values, target_type)
+        assert actual.type == expected.type
+        assert actual.to_pylist() == expected.to_pylist() or (
+            actual.is_null().equals(expected.is_null())
+            and str(actual.to_pylist()) == str(expected.to_pylist())
+        ), values
+
+
+def test_arrow_table_builder_appends_batches_incrementally() -> None:
+    """Appended batches are returned as they are built and combine into one table."""
+    schema = pa.schema([("subject_key", pa.string()), ("score", pa.float64())])
+    batches = [
+        [{"subject_key": "S1", "score": 1}, {"subject_key": "", "score": "2.5"}],
+        [],
+        [{"subject_key": "S3"}],
+    ]
+    builder = ArrowTableBuilder(schema)
+
+    returned = [builder.append(batch) for batch in batches]
+    table = builder.build()
+
+    assert [batch.num_rows for batch in returned] == [2, 0, 1]
+    assert builder.num_rows == 3
+    assert table.schema == schema
+    assert table.equals(to_arrow_table([r for batch in batches for r in batch], schema=schema))
+    assert table.column("subject_key").to_pylist() == ["S1", None, "S3"]
+    assert table.column("score").to_pylist() == [1.0, 2.5, None]
+
+
+def test_arrow_table_builder_streaming_mode_does_not_retain_batches() -> None:
+    """Builders created for streaming cannot build a table."""
+    builder = ArrowTableBuilder(pa.schema([("a", pa.int64())]), keep_batches=False)
+
+    assert builder.append([{"a": 1}]).num_rows == 1
+    with pytest.raises(RuntimeError, match="keep_batches"):
+        builder.build()
+
+
+def test_arrow_schema_for_form_uses_variable_types() -> None:
+    """Variable types in the schema cache map to Arrow field types."""
+    cache = SchemaCache()
+    cache.populate(
+        [
+            Variable(variable_name="age", variable_type="integer", form_id=1, form_key="F1"),
+            Variable(variable_name="weight", variable_type="Decimal", form_id=1, form_key="F1"),
+            Variable(variable_name="smoker", variable_type="BOOLEAN", form_id=1, form_key="F1"),
+            Variable(variable_name="visit_date", variable_type="date", form_id=1, form_key="F1"),
+            Variable(variable_name="notes", variable_type="memo", form_id=1, form_key="F1"),
+            Variable(variable_name="other", variable_type="text", form_id=2, form_key="F2"),
+        ]
+    )
+
+    schema = arrow_schema_for_form(
+        cache, "F1", base_fields=[pa.field("record_id", pa.int64()), pa.field("age", pa.string())]
+    )
+
+    assert schema == pa.schema(
+        [
+            ("record_id", pa.int64()),
+            ("age", pa.string()),
+            ("weight", pa.float64()),
+            ("smoker", pa.bool_()),
+            ("visit_date", pa.string()),
+            ("notes", pa.string()),
+        ]
+    )
+    assert arrow_schema_for_form(cache, "missing") == pa.schema([])
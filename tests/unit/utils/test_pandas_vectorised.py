@@ -0,0 +1,153 @@
+"""Differential tests for the column-level masking and sanitisation helpers."""
+
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from imednet.utils.pandas import mask_clinical_phi_frame, sanitize_csv_formula_frame
+from imednet.utils.security import (
+    global_sensitivity_registry,
+    mask_clinical_phi,
+    sanitize_csv_formula,
+)
+
+_WHITESPACE = [chr(cp) for cp in range(sys.maxunicode + 1) if chr(cp).isspace()]
+_TRIGGERS = ["=", "+", "-", "@"]
+
+
+def _scalar_mask(df: pd.DataFrame) -> pd.DataFrame:
+    """Reference implementation: the former per-cell masking loop."""
+    sensitive = [col for col in df.columns if global_sensitivity_registry.is_sensitive(str(col))]
+    for col in sensitive:
+        df[col] = "***MASKED***"
+    for col in df.drop(columns=sensitive).select_dtypes(include=[object]).columns:
+        df[col] = df[col].apply(mask_clinical_phi)
+    return df
+
+
+def _scalar_sanitize(df: pd.DataFrame) -> pd.DataFrame:
+    """Reference implementation: the former per-cell sanitisation loop."""
+    for col in df.select_dtypes(include=[object]).columns:
+        df[col] = df[col].apply(sanitize_csv_formula)
+    return df
+
+
+def _random_text(rng: random.Random) -> str:
+    """Helper function to build strings that may or may not look like formulas."""
+    prefix = "".join(rng.choice(_WHITESPACE) for _ in range(rng.randint(0, 2)))
+    head = rng.choice([*_TRIGGERS, "a", "1", "'", "\u200b", "", " ="])
+    return prefix + head + rng.choice(["", "SUM(A1)", "cmd|' /C calc'!A0", "x\ny"])
+
+
+def _random_cell(rng: random.Random) -> object:
+    """Helper function to build a cell of any type an export frame can hold."""
+    choice = rng.randrange(10)
+    if choice < 5:
+        return _random_text(rng)
+    if choice == 5:
+        return rng.choice([None, np.nan, pd.NA, pd.NaT])
+    if choice == 6:
+        return rng.choice([1, 2.5, True])
+    if choice == 7:
+        return [_random_text(rng), {"ssn": "123", "note": _random_text(rng)}]
+    if choice == 8:
+        return {"email": "a@b.c", "nested": (_random_text(rng),)}
+    return (_random_text(rng), None)
+
+
+def _frames() -> list[pd.DataFrame]:
+    """Helper function to build frames covering every column kind."""
+    rng = random.Random(20240501)
+    rows = 40
+    frames = [
+        pd.DataFrame(
+            {
+                "text": [_random_text(rng) for _ in range(rows)],
+                "text_with_nulls": [
+                    _random_text(rng) if i % 3 else rng.choice([None, np.nan, pd.NA])
+                    for i in range(rows)
+                ],
+                "mixed": [_random_cell(rng) for _ in range(rows)],
+                "checkbox": [[_random_text(rng)] if i % 2 else None for i in range(rows)],
+                "none_only": [None] * rows,
+                "na_only": pd.Series([pd.NA] * rows, dtype=object),
+                "nan_and_none": pd.Series([np.nan, None] * (rows // 2), dtype=object),
+                "nat_only": pd.Series([pd.NaT] * rows, dtype=object),
+                "ints_as_object": pd.Series(range(rows), dtype=object),
+                "number": np.arange(rows, dtype=float),
+                "email": ["person@example.org"] * rows,
+                "subject_key": ["=S-001"] * rows,
+            }
+        ),
+        pd.DataFrame({"empty": pd.Series([], dtype=object)}),
+    ]
+    for col_count in (1, 5):
+        frames.append(
+            pd.DataFrame(
+                {f"c{i}": [_random_cell(rng) for _ in range(rows)] for i in range(col_count)}
+            )
+        )
+    return frames
+
+
+@pytest.mark.parametrize("frame", _frames())
+def test_mask_clinical_phi_frame_matches_scalar(frame: pd.DataFrame) -> None:
+    """Vectorised masking gives the same values and dtypes as the scalar loop."""
+    expected = _scalar_mask(frame.copy())
+
+    result = mask_clinical_phi_frame(frame.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("frame", _frames())
+def test_sanitize_csv_formula_frame_matches_scalar(frame: pd.DataFrame) -> None:
+    """Vectorised sanitisation gives the same values and dtypes as the scalar loop."""
+    expected = _scalar_sanitize(frame.copy())
+
+    result = sanitize_csv_formula_frame(frame.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("space", _WHITESPACE)
+@pytest.mark.parametrize("trigger", _TRIGGERS)
+def test_sanitize_frame_treats_unicode_whitespace_like_lstrip(space: str, trigger: str) -> None:
+    """Every whitespace character stripped by ``str.lstrip`` is skipped by the kernel."""
+    values = [f"{space}{trigger}1", f"{space}x{trigger}", "\u200b" + trigger]
+    frame = pd.DataFrame({"value": values})
+
+    result = sanitize_csv_formula_frame(frame)
+
+    assert result["value"].tolist() == [sanitize_csv_formula(v) for v in values]
+
+
+def test_mask_frame_respects_registry_updates() -> None:
+    """Columns added to the sensitivity registry are masked wholesale."""
+    global_sensitivity_registry.add_sensitive_key("site_notes")
+    try:
+        frame = pd.DataFrame({"site_notes": ["private", None], "other": ["kept", "also"]})
+
+        result = mask_clinical_phi_frame(frame)
+    finally:
+        global_sensitivity_registry.remove_sensitive_key("site_notes")
+
+    assert result["site_notes"].tolist() == ["***MASKED***", "***MASKED***"]
+    assert result["other"].tolist() == ["kept", "also"]
+
+
+@pytest.mark.parametrize("block_pyarrow", [False, True])
+def test_sanitize_frame_without_arrow_kernel(monkeypatch, block_pyarrow: bool) -> None:
+    """The pandas fallback and unencodable strings give the scalar result."""
+    if block_pyarrow:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.compute", None)
+    values = ["\ud800=x", " =\ud800", "　@x", "safe", None]
+    frame = pd.DataFrame({"value": values})
+
+    result = sanitize_csv_formula_frame(frame)
+
+    assert result["value"].tolist() == [sanitize_csv_formula(v) for v in values]